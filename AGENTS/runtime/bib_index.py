@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Streaming BibTeX reader with a persistent key -> byte-offset index.
+
+`iter_raw_entries` reads a .bib file in fixed-size chunks and yields entries
+lazily in one linear pass (brace depth is tracked with a compiled regex, never
+by re-slicing the remainder of the file). Field values are only decoded and
+split when `parse_fields` is called for an entry that is actually used.
+
+`load_index` keeps {key: [offset, length, type]} per .bib under
+AGENTS/cache/bib_index/, revalidated by size and mtime, so `lookup` can seek
+straight to the cited keys of a large shared library.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+import jsonio
+
+INDEX_VERSION = 1
+CHUNK_SIZE = 1 << 20
+HEADER_LOOKBACK = 256
+DEFAULT_CACHE_ROOT = Path(__file__).resolve().parents[1] / "cache" / "bib_index"
+HEADER_RE = re.compile(rb"@\s*([A-Za-z]+)\s*\{")
+BRACE_RE = re.compile(rb"[{}]")
+FIELD_RE = re.compile(
+    r"([A-Za-z][A-Za-z0-9_\-]*)\s*=\s*(\{(?:[^{}]|\{[^{}]*\})*\}|\"(?:[^\"\\]|\\.)*\"|[^,]+)",
+    flags=re.S,
+)
+NON_ENTRY_TYPES = {"comment", "preamble", "string"}
+
+
+@dataclass
+class RawBibEntry:
+    bibkey: str
+    entry_type: str
+    offset: int
+    length: int
+    body: bytes
+
+
+def _entry(entry_type: bytes, body: bytes, offset: int, length: int) -> Optional[RawBibEntry]:
+    kind = entry_type.decode("ascii").lower()
+    comma = body.find(b",")
+    if kind in NON_ENTRY_TYPES or comma == -1:
+        return None
+    key = body[:comma].strip().decode("utf-8", errors="ignore")
+    return RawBibEntry(bibkey=key, entry_type=kind, offset=offset, length=length, body=body[comma + 1:])
+
+
+def iter_stream(f: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[RawBibEntry]:
+    buf = b""
+    base = 0  # file offset of buf[0]
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buf, eof
+        data = f.read(chunk_size)
+        if not data:
+            eof = True
+            return False
+        buf += data
+        return True
+
+    fill()
+    while True:
+        m = HEADER_RE.search(buf, pos)
+        if m is None:
+            if eof:
+                return
+            keep = max(pos, len(buf) - HEADER_LOOKBACK)
+            buf, base, pos = buf[keep:], base + keep, 0
+            fill()
+            continue
+        depth = 1
+        j = m.end()
+        while depth:
+            for bm in BRACE_RE.finditer(buf, j):
+                depth += 1 if bm.group() == b"{" else -1
+                if depth == 0:
+                    j = bm.end()
+                    break
+            else:
+                j = len(buf)
+                if not fill():
+                    break
+        body = buf[m.end():j - 1] if depth == 0 else buf[m.end():j]
+        entry = _entry(m.group(1), body.strip(), base + m.start(), j - m.start())
+        if entry is not None:
+            yield entry
+        pos = j
+        if pos > chunk_size:
+            buf, base, pos = buf[pos:], base + pos, 0
+
+
+def iter_raw_entries(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[RawBibEntry]:
+    with path.open("rb") as f:
+        yield from iter_stream(f, chunk_size)
+
+
+def parse_fields(entry: RawBibEntry) -> Dict[str, str]:
+    """Raw field values with the outer braces/quotes removed; LaTeX cleanup is left to the caller."""
+    fields: Dict[str, str] = {}
+    for fm in FIELD_RE.finditer(entry.body.decode("utf-8", errors="ignore")):
+        raw = fm.group(2).strip().strip(",")
+        if raw.startswith("{") and raw.endswith("}"):
+            raw = raw[1:-1]
+        elif raw.startswith('"') and raw.endswith('"'):
+            raw = raw[1:-1]
+        fields[fm.group(1).lower()] = raw
+    return fields
+
+
+def cache_root_from_env() -> Optional[Path]:
+    raw = os.environ.get("BIB_INDEX_CACHE", "").strip()
+    if raw.lower() in {"off", "0", "none"}:
+        return None
+    return Path(raw) if raw else DEFAULT_CACHE_ROOT
+
+
+def index_path(cache_root: Path, bib: Path) -> Path:
+    return cache_root / f"{hashlib.sha256(str(bib).encode('utf-8')).hexdigest()[:16]}.json"
+
+
+def build_index(bib: Path) -> Dict[str, Any]:
+    st = bib.stat()
+    entries: Dict[str, List[Any]] = {}
+    for e in iter_raw_entries(bib):
+        entries[e.bibkey] = [e.offset, e.length, e.entry_type]
+    return {
+        "version": INDEX_VERSION,
+        "path": str(bib),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "entries": entries,
+    }
+
+
+def load_index(bib: Path, cache_root: Optional[Path] = None) -> Dict[str, Any]:
+    """Index for bib, rebuilt with one streaming pass when missing or stale."""
+    bib = bib.resolve()
+    root = cache_root if cache_root is not None else cache_root_from_env()
+    if root is None:
+        return build_index(bib)
+    p = index_path(root, bib)
+    st = bib.stat()
+    try:
+        idx = jsonio.read_json(p)
+        if (
+            idx.get("version") == INDEX_VERSION
+            and idx.get("size") == st.st_size
+            and idx.get("mtime_ns") == st.st_mtime_ns
+        ):
+            return idx
+    except Exception:
+        pass
+    idx = build_index(bib)
+    jsonio.write_json(p, idx, compact=True)
+    return idx
+
+
+def lookup(bib: Path, keys: Iterable[str], index: Optional[Dict[str, Any]] = None) -> List[RawBibEntry]:
+    """Entries for the requested keys, in file order, read by seeking to their indexed offsets."""
+    idx = index if index is not None else load_index(bib)
+    table = idx.get("entries", {})
+    spans = sorted({tuple(table[k][:2]) for k in keys if k in table})
+    out: List[RawBibEntry] = []
+    with bib.open("rb") as f:
+        for offset, length in spans:
+            f.seek(offset)
+            m = HEADER_RE.match(f.read(length))
+            if m is None:
+                continue
+            data = m.string
+            body = data[m.end():-1] if data.endswith(b"}") else data[m.end():]
+            entry = _entry(m.group(1), body.strip(), offset, length)
+            if entry is not None:
+                out.append(entry)
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="bib_index")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    pi = sub.add_parser("index")
+    pi.add_argument("--bib", required=True)
+    pl = sub.add_parser("lookup")
+    pl.add_argument("--bib", required=True)
+    pl.add_argument("keys", nargs="+")
+    args = parser.parse_args()
+
+    bib = Path(args.bib)
+    if args.cmd == "index":
+        idx = load_index(bib)
+        print(f"BIB_ENTRIES={len(idx['entries'])}")
+        print(f"BIB_INDEX={index_path(cache_root_from_env() or DEFAULT_CACHE_ROOT, bib.resolve())}")
+        return 0
+    if args.cmd == "lookup":
+        found = lookup(bib.resolve(), args.keys)
+        for e in found:
+            print(json.dumps({"key": e.bibkey, "type": e.entry_type, "offset": e.offset, "fields": parse_fields(e)}))
+        missing = sorted(set(args.keys) - {e.bibkey for e in found})
+        for k in missing:
+            print(f"MISSING={k}")
+        return 0
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
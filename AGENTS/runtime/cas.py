@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Content-addressed store for staged and promoted files.
+
+Objects live read-only (0444) under AGENTS/cache/cas/objects/<sha[:2]>/<sha[2:]>,
+one per distinct content. GATE staging (tree_sync.py) places read-only (0444)
+files from their object, by reflink or else hard link, so re-staging
+identical bytes costs no space. One inode cannot carry two modes, so any
+other source mode (an executable script, a writable file) needs a private
+reflink or copy anyway: those are placed straight from the source and only
+recorded as holders, without writing an object that would double their size
+on filesystems without reflink. Promotion (promote_apply.py) records what it
+copies to USER/ the same way and never hard-links there, because USER/ files
+are edited by hand.
+
+refs.sqlite maps each holder (the absolute path of a staged or promoted
+file) to its object, with the size/mtime/inode it had when written. The
+refcount of an object is its number of holders. known_digest() trusts a
+holder whose stat is unchanged, so verification and promotion only hash
+files that changed. CAS_STORE points the store elsewhere; "off" disables it.
+
+  python3 cas.py stats                  # objects, bytes, holders
+  python3 cas.py verify [--prefix P]    # hash only holders whose stat changed
+  python3 cas.py gc                     # drop objects no holder references
+"""
+import argparse
+import os
+import shutil
+import sqlite3
+import stat
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tree_sync import place_file, sha256_file
+
+DEFAULT_CAS_ROOT = Path(__file__).resolve().parents[1] / "cache" / "cas"
+OBJECT_PERM = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS refs (
+    holder   TEXT PRIMARY KEY,
+    sha256   TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ino      INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS refs_sha256 ON refs (sha256);
+"""
+
+
+def cas_root_from_env() -> Optional[Path]:
+    raw = os.environ.get("CAS_STORE", "").strip()
+    if raw.lower() in {"off", "0", "none"}:
+        return None
+    return Path(raw) if raw else DEFAULT_CAS_ROOT
+
+
+def _holder(path: Path) -> str:
+    return os.path.abspath(path)
+
+
+class Store:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.objects = root / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(root / "refs.sqlite"), timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "Store":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if exc[0] is None:
+            self.db.commit()
+        self.close()
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest[2:]
+
+    def put(self, path: Path, digest: Optional[str] = None) -> str:
+        """Store path's content (if new) and return its sha256."""
+        digest = digest or sha256_file(path)
+        obj = self.object_path(digest)
+        if not obj.exists():
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            tmp = obj.with_name(f".{obj.name}.{os.getpid()}")
+            try:
+                shutil.copyfile(path, tmp)
+                if sha256_file(tmp) != digest:
+                    raise OSError(f"{path} changed while being stored")
+                os.chmod(tmp, OBJECT_PERM)
+                os.replace(tmp, obj)
+            finally:
+                tmp.unlink(missing_ok=True)
+        return digest
+
+    def materialize(self, digest: str, dst: Path, mode: str = "auto") -> str:
+        """Place an object at dst (reflink, else hard link for mode auto) and record dst as a holder."""
+        method = place_file(self.object_path(digest), dst, mode)
+        self.add_ref(dst, digest)
+        return method
+
+    def stage(self, src: Path, dst: Path, digest: str, mode: str = "auto", perm: int = OBJECT_PERM) -> str:
+        """Place src at dst with permission bits perm and record dst as a holder.
+
+        Only perm 0444 goes through an object, so identical content shares its
+        inode; any other perm is reflinked or copied from src without one.
+        """
+        if perm == OBJECT_PERM:
+            return self.materialize(self.put(src, digest), dst, mode)
+        method = place_file(src, dst, "reflink" if mode in {"auto", "reflink"} else "copy")
+        os.chmod(dst, perm)
+        self.add_ref(dst, digest)
+        return method
+
+    def add_ref(self, path: Path, digest: str) -> None:
+        st = os.stat(path)
+        self.db.execute(
+            "INSERT OR REPLACE INTO refs (holder, sha256, size, mtime_ns, ino) VALUES (?, ?, ?, ?, ?)",
+            (_holder(path), digest, st.st_size, st.st_mtime_ns, st.st_ino),
+        )
+
+    def drop_refs(self, paths: Iterable[Path]) -> None:
+        self.db.executemany("DELETE FROM refs WHERE holder = ?", [(_holder(p),) for p in paths])
+
+    def known_digest(self, path: Path) -> Optional[str]:
+        """The recorded sha256 of a holder whose size, mtime and inode are unchanged, else None."""
+        row = self.db.execute("SELECT sha256, size, mtime_ns, ino FROM refs WHERE holder = ?", (_holder(path),)).fetchone()
+        if row is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if (st.st_size, st.st_mtime_ns, st.st_ino) != (row[1], row[2], row[3]):
+            return None
+        return str(row[0])
+
+    def refcount(self, digest: str) -> int:
+        return int(self.db.execute("SELECT COUNT(*) FROM refs WHERE sha256 = ?", (digest,)).fetchone()[0])
+
+    def verify(self, prefix: str = "") -> Dict[str, List[str]]:
+        """Holders that are missing or whose content no longer matches their object."""
+        out: Dict[str, List[str]] = {"missing": [], "modified": [], "rehashed": []}
+        rows = self.db.execute(
+            "SELECT holder, sha256, size, mtime_ns, ino FROM refs WHERE holder >= ? AND holder < ? ORDER BY holder",
+            (prefix, prefix + "\U0010ffff"),
+        ).fetchall()
+        for holder, digest, size, mtime_ns, ino in rows:
+            try:
+                st = os.stat(holder)
+            except OSError:
+                out["missing"].append(holder)
+                continue
+            if (st.st_size, st.st_mtime_ns, st.st_ino) == (size, mtime_ns, ino):
+                continue
+            out["rehashed"].append(holder)
+            if sha256_file(Path(holder)) != digest:
+                out["modified"].append(holder)
+        return out
+
+    def gc(self) -> Tuple[int, int]:
+        """Remove holders that no longer exist, then objects nobody references; returns (objects, bytes)."""
+        gone = [Path(h) for (h,) in self.db.execute("SELECT holder FROM refs") if not os.path.lexists(h)]
+        self.drop_refs(gone)
+        live = {d for (d,) in self.db.execute("SELECT DISTINCT sha256 FROM refs")}
+        removed = freed = 0
+        for sub in sorted(self.objects.iterdir()):
+            for obj in sorted(sub.iterdir()):
+                if obj.name.startswith(".") or sub.name + obj.name in live:
+                    continue
+                freed += obj.stat().st_size
+                obj.unlink()
+                removed += 1
+        self.db.commit()
+        return removed, freed
+
+    def stats(self) -> Dict[str, int]:
+        objects = size = 0
+        for sub in self.objects.iterdir():
+            for obj in sub.iterdir():
+                if not obj.name.startswith("."):
+                    objects += 1
+                    size += obj.stat().st_size
+        holders = int(self.db.execute("SELECT COUNT(*) FROM refs").fetchone()[0])
+        return {"objects": objects, "bytes": size, "holders": holders}
+
+
+def open_store() -> Optional[Store]:
+    root = cas_root_from_env()
+    return Store(root) if root is not None else None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="cas")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("stats", help="Print object, byte and holder counts.")
+    pv = sub.add_parser("verify", help="Check holders; only files whose stat changed are hashed.")
+    pv.add_argument("--prefix", default="", help="Only holders under this path.")
+    sub.add_parser("gc", help="Drop vanished holders and unreferenced objects.")
+    args = parser.parse_args()
+
+    store = open_store()
+    if store is None:
+        print("CAS_STORE=off", file=sys.stderr)
+        return 2
+    with store:
+        if args.cmd == "stats":
+            s = store.stats()
+            print(f"CAS_OBJECTS={s['objects']} CAS_BYTES={s['bytes']} CAS_HOLDERS={s['holders']}")
+            return 0
+        if args.cmd == "verify":
+            prefix = os.path.abspath(args.prefix) if args.prefix else ""
+            out = store.verify(prefix)
+            for key in ("missing", "modified"):
+                for holder in out[key]:
+                    print(f"{key.upper()}={holder}")
+            print(f"CAS_VERIFY_REHASHED={len(out['rehashed'])} MISSING={len(out['missing'])} MODIFIED={len(out['modified'])}")
+            return 1 if out["missing"] or out["modified"] else 0
+        removed, freed = store.gc()
+        print(f"CAS_GC_OBJECTS={removed} CAS_GC_BYTES={freed}")
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
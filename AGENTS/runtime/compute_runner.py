@@ -8,7 +8,18 @@ import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import jsonio
+from sidecars import collect as collect_sidecars
+from sidecars import sidecar_paths
+from toolchain import Probe, probe_versions
+from wolfram_backend import resolve as resolve_wolfram
+
+RUN_CACHE_VERSION = 1
+DEFAULT_RUN_CACHE_ROOT = Path(__file__).resolve().parents[1] / "cache" / "compute_runs"
+DEFAULT_RUN_CACHE_MAX_ENTRIES = 200
+CACHED_FILES = ("result.json", "backend_payload.json")
 
 
 def now_utc() -> str:
@@ -37,7 +48,7 @@ def file_info(path: Path) -> Dict[str, Any]:
 def load_spec(spec_path: Path) -> Dict[str, Any]:
     text = spec_path.read_text(encoding="utf-8")
     try:
-        return json.loads(text)
+        return jsonio.loads(text)
     except json.JSONDecodeError:
         # Optional fallback if someone writes YAML and PyYAML exists.
         try:
@@ -51,24 +62,149 @@ def load_spec(spec_path: Path) -> Dict[str, Any]:
         raise RuntimeError(f"Unable to parse spec: {spec_path}")
 
 
-def cmd_version(cmd: List[str]) -> str:
+def run_cache_root_from_env() -> Optional[Path]:
+    raw = os.environ.get("COMPUTE_RUN_CACHE", "").strip()
+    if raw.lower() in {"off", "0", "none"}:
+        return None
+    return Path(raw) if raw else DEFAULT_RUN_CACHE_ROOT
+
+
+def run_cache_max_entries() -> int:
+    try:
+        return max(int(os.environ.get("COMPUTE_RUN_CACHE_MAX", "")), 0)
+    except ValueError:
+        return DEFAULT_RUN_CACHE_MAX_ENTRIES
+
+
+def run_cache_key(
+    backend: str, entry_path: Path, spec: Dict[str, Any], inputs: List[Dict[str, Any]], versions: Dict[str, str]
+) -> str:
+    """Content key of a run: same backend, entry script, spec, input bytes and toolchain give the same key."""
+    material = {
+        "version": RUN_CACHE_VERSION,
+        "backend": backend,
+        "entry_sha256": sha256_file(entry_path) if entry_path.is_file() else "",
+        "spec": spec,
+        "inputs": [[x.get("name", ""), x["exists"], x["sha256"]] for x in inputs],
+        "versions": versions,
+    }
+    blob = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def run_cache_lookup(cache_root: Path, key: str) -> Optional[Path]:
+    entry_dir = cache_root / key[:2] / key
+    if not (entry_dir / "provenance.json").is_file() or not (entry_dir / "result.json").is_file():
+        return None
+    os.utime(entry_dir / "provenance.json")
+    return entry_dir
+
+
+def run_cache_store(
+    cache_root: Path, key: str, outputs_dir: Path, provenance: Dict[str, Any], sidecars: List[Dict[str, Any]]
+) -> None:
+    entry_dir = cache_root / key[:2] / key
+    tmp = entry_dir.with_name(f"{key}.tmp.{os.getpid()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    for name in CACHED_FILES:
+        if (outputs_dir / name).is_file():
+            shutil.copy2(outputs_dir / name, tmp / name)
+    for src in sidecar_paths(outputs_dir, sidecars):
+        dst = tmp / src.relative_to(outputs_dir)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dst)
+    jsonio.write_json(tmp / "provenance.json", provenance, compact=True)
+    shutil.rmtree(entry_dir, ignore_errors=True)
     try:
-        out = subprocess.run(cmd, check=False, capture_output=True, text=True)
-        val = (out.stdout or out.stderr).strip().splitlines()
-        return val[0] if val else "unknown"
-    except Exception:
-        return "unavailable"
+        tmp.replace(entry_dir)
+    except OSError:
+        # A concurrent run stored the same key first; either copy is valid.
+        shutil.rmtree(tmp, ignore_errors=True)
+    run_cache_evict(cache_root, run_cache_max_entries())
 
 
-def write_json(path: Path, obj: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+def run_cache_evict(cache_root: Path, max_entries: int) -> int:
+    """Drop least recently used entries beyond max_entries; returns how many were removed."""
+    entries = []
+    for marker in cache_root.glob("*/*/provenance.json"):
+        try:
+            entries.append((marker.stat().st_mtime, marker.parent))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    for _, entry_dir in entries[max_entries:]:
+        shutil.rmtree(entry_dir, ignore_errors=True)
+    return max(len(entries) - max_entries, 0)
+
+
+def write_hashes(outputs_dir: Path, inputs: List[Dict[str, Any]], sidecars: List[Dict[str, Any]]) -> None:
+    outputs = [file_info(outputs_dir / "result.json")]
+    if (outputs_dir / "backend_payload.json").exists():
+        outputs.append(file_info(outputs_dir / "backend_payload.json"))
+    # Sidecar hashes were taken while summarizing; do not read large blobs twice.
+    for rec in sidecars:
+        outputs.append(
+            {"path": str(outputs_dir / rec["path"]), "exists": True, "bytes": rec["bytes"], "sha256": rec["sha256"]}
+        )
+
+    hashes = {
+        "generated_at_utc": now_utc(),
+        "inputs": inputs,
+        "outputs": outputs,
+    }
+    jsonio.write_json(outputs_dir / "hashes.json", hashes)
+
+
+def materialize_cached(
+    entry_dir: Path,
+    cache_key: str,
+    task_id: str,
+    inputs: List[Dict[str, Any]],
+    outputs_dir: Path,
+    commands_log: Path,
+    started: str,
+    t0: dt.datetime,
+) -> int:
+    provenance = jsonio.read_json(entry_dir / "provenance.json")
+    result = jsonio.read_json(entry_dir / "result.json")
+    (outputs_dir / "backend_payload.json").unlink(missing_ok=True)
+    if (entry_dir / "backend_payload.json").is_file():
+        shutil.copyfile(entry_dir / "backend_payload.json", outputs_dir / "backend_payload.json")
+    sidecars = result.get("sidecars", [])
+    for dst in sidecar_paths(outputs_dir, sidecars):
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(entry_dir / dst.relative_to(outputs_dir), dst)
+
+    command = f"reuse {cache_key} from task {provenance.get('task_id', '')}"
+    commands_log.open("a", encoding="utf-8").write(command + "\n")
+    meta = result.setdefault("meta", {})
+    meta.update(
+        {
+            "task_id": task_id,
+            "started_at_utc": started,
+            "finished_at_utc": now_utc(),
+            "duration_seconds": max((dt.datetime.now(dt.timezone.utc) - t0).total_seconds(), 0.0),
+            "commands": [command],
+            "reused_from": provenance,
+        }
+    )
+    result["inputs"] = inputs
+    jsonio.write_json(outputs_dir / "result.json", result)
+    write_hashes(outputs_dir, inputs, sidecars)
+    print(f"COMPUTE_RUN_CACHE=hit key={cache_key} from_task={provenance.get('task_id', '')}")
+    return 0
 
 
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--root", required=True, help="Path to AGENTS directory")
     parser.add_argument("--task", required=True, help="task_id")
+    parser.add_argument(
+        "--reuse",
+        action="store_true",
+        help="Materialize a cached result of an identical earlier run instead of running the backend",
+    )
     args = parser.parse_args()
 
     agents_root = Path(args.root).resolve()
@@ -98,17 +234,29 @@ def main() -> int:
     started = now_utc()
     t0 = dt.datetime.now(dt.timezone.utc)
 
-    versions = {
-        "python": cmd_version([sys.executable, "--version"]),
-        "wolframscript": cmd_version(["wolframscript", "-version"])
-        if shutil.which("wolframscript")
-        else "unavailable",
-    }
+    wolfram = resolve_wolfram() if backend == "wolfram" else None
+    probes = {"python": Probe([sys.executable, "--version"]), "wolframscript": Probe(["wolframscript", "-version"])}
+    if wolfram is not None and wolfram.label != "wolframscript":
+        probes[wolfram.label] = Probe(wolfram.version_argv)
+    versions = probe_versions(probes)
 
     result_path = outputs_dir / "result.json"
-    hashes_path = outputs_dir / "hashes.json"
     backend_payload_path = outputs_dir / "backend_payload.json"
 
+    inputs = []
+    for item in spec.get("inputs", []):
+        path = agents_root.parent / item.get("path", "")
+        info = file_info(path)
+        info["name"] = item.get("name", "input")
+        inputs.append(info)
+
+    entry_name = "main.wl" if backend == "wolfram" else "main.py"
+    cache_root = run_cache_root_from_env()
+    cache_key = run_cache_key(backend, work_compute / entry_name, spec, inputs, versions)
+    hit = run_cache_lookup(cache_root, cache_key) if cache_root is not None and args.reuse else None
+    if hit is not None:
+        return materialize_cached(hit, cache_key, task_id, inputs, outputs_dir, commands_log, started, t0)
+
     command = ""
     backend_available = True
     status = "ok"
@@ -117,6 +265,7 @@ def main() -> int:
     env = os.environ.copy()
     env["COMPUTE_SPEC_JSON"] = json.dumps(spec)
     env["COMPUTE_BACKEND_OUTPUT"] = str(backend_payload_path)
+    env["COMPUTE_SIDECAR_DIR"] = str(outputs_dir / "sidecars")
 
     if backend == "python":
       entry_path = work_compute / "main.py"
@@ -133,16 +282,17 @@ def main() -> int:
               status = "failed"
     elif backend == "wolfram":
       entry_path = work_compute / "main.wl"
-      command = f"wolframscript -file {entry_path}"
+      wolfram_cmd = wolfram.command(entry_path) if wolfram is not None else ["wolframscript", "-file", str(entry_path)]
+      command = " ".join(wolfram_cmd)
       commands_log.open("a", encoding="utf-8").write(command + "\n")
-      if not shutil.which("wolframscript"):
+      if wolfram is None:
           backend_available = False
           status = "unavailable"
       elif not entry_path.exists():
           backend_available = False
           status = "failed"
       else:
-          proc = subprocess.run(["wolframscript", "-file", str(entry_path)], env=env, capture_output=True, text=True)
+          proc = subprocess.run(wolfram_cmd, env=env, capture_output=True, text=True)
           (logs_dir / "backend.stdout.log").write_text(proc.stdout or "", encoding="utf-8")
           (logs_dir / "backend.stderr.log").write_text(proc.stderr or "", encoding="utf-8")
           if proc.returncode != 0:
@@ -154,25 +304,23 @@ def main() -> int:
 
     if backend_payload_path.exists():
         try:
-            backend_payload = json.loads(backend_payload_path.read_text(encoding="utf-8"))
+            backend_payload = jsonio.read_json(backend_payload_path, fields=("results", "sanity_checks", "sidecars"))
         except Exception:
             backend_payload = {}
 
-    inputs = []
-    for item in spec.get("inputs", []):
-        path = agents_root.parent / item.get("path", "")
-        info = file_info(path)
-        info["name"] = item.get("name", "input")
-        inputs.append(info)
-
     results = backend_payload.get("results", {}) if isinstance(backend_payload, dict) else {}
     sanity_checks = backend_payload.get("sanity_checks", []) if isinstance(backend_payload, dict) else []
+    sidecars, sidecar_failures = collect_sidecars(outputs_dir, backend_payload)
+    if sidecar_failures:
+        sanity_checks = [*sanity_checks, *sidecar_failures]
+        if status == "ok":
+            status = "failed"
     if status == "unavailable":
         sanity_checks = [
             {
                 "name": "backend_available",
                 "passed": False,
-                "detail": "wolframscript not installed or not on PATH",
+                "detail": "no Wolfram backend (wolframscript/WolframKernel not on PATH, or WOLFRAM_BACKEND unavailable)",
             }
         ]
 
@@ -204,18 +352,25 @@ def main() -> int:
         "uncertainty": uncertainty,
         "sanity_checks": sanity_checks,
     }
-    write_json(result_path, result)
-
-    outputs = [file_info(result_path)]
-    if backend_payload_path.exists():
-        outputs.append(file_info(backend_payload_path))
-
-    hashes = {
-        "generated_at_utc": now_utc(),
-        "inputs": inputs,
-        "outputs": outputs,
-    }
-    write_json(hashes_path, hashes)
+    if sidecars:
+        result["sidecars"] = sidecars
+    jsonio.write_json(result_path, result)
+    write_hashes(outputs_dir, inputs, sidecars)
+
+    if cache_root is not None and status == "ok":
+        provenance = {
+            "cache_key": cache_key,
+            "task_id": task_id,
+            "job_name": result["meta"]["job_name"],
+            "backend": backend,
+            "finished_at_utc": result["meta"]["finished_at_utc"],
+            "result": f"AGENTS/tasks/{task_id}/outputs/compute/result.json",
+        }
+        try:
+            run_cache_store(cache_root, cache_key, outputs_dir, provenance, sidecars)
+            print(f"COMPUTE_RUN_CACHE=stored key={cache_key}")
+        except OSError as exc:
+            print(f"compute run cache not written: {exc}", file=sys.stderr)
 
     return 0
 
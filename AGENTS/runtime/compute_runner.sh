@@ -3,6 +3,7 @@ set -euo pipefail
 
 ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
 TASK_ID=""
+REUSE_ARGS=()
 
 while [[ $# -gt 0 ]]; do
   case "$1" in
@@ -10,6 +11,10 @@ while [[ $# -gt 0 ]]; do
       TASK_ID="${2:-}"
       shift 2
       ;;
+    --reuse)
+      REUSE_ARGS=(--reuse)
+      shift
+      ;;
     *)
       echo "Unknown arg: $1" >&2
       exit 2
@@ -18,7 +23,7 @@ while [[ $# -gt 0 ]]; do
 done
 
 if [[ -z "$TASK_ID" ]]; then
-  echo "Usage: bash AGENTS/runtime/compute_runner.sh --task <task_id>" >&2
+  echo "Usage: bash AGENTS/runtime/compute_runner.sh --task <task_id> [--reuse]" >&2
   exit 2
 fi
 
@@ -36,5 +41,5 @@ CMD_LOG="$LOG_DIR/commands.txt"
 
 exec >> "$STDOUT_LOG" 2>> "$STDERR_LOG"
 
-echo "python3 $ROOT/runtime/compute_runner.py --root $ROOT --task $TASK_ID" >> "$CMD_LOG"
-python3 "$ROOT/runtime/compute_runner.py" --root "$ROOT" --task "$TASK_ID"
+echo "python3 $ROOT/runtime/compute_runner.py --root $ROOT --task $TASK_ID ${REUSE_ARGS[*]}" >> "$CMD_LOG"
+python3 "$ROOT/runtime/compute_runner.py" --root "$ROOT" --task "$TASK_ID" "${REUSE_ARGS[@]}"
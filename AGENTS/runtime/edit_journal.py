@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""Edit journal for writer shadow trees.
+
+Writer skills `record` each file they add, edit or delete in the shadow paper
+tree. `emit` then builds patch.diff from the journaled files only, using an
+in-process Myers diff, and fills `edited_files` in files_manifest.json from the
+same journal, so patch time scales with the edits rather than the paper size.
+`emit --check-unjournaled` additionally stat-walks the whole shadow against its
+snapshot manifest and patches files that were changed without a journal entry.
+`paper_shadow.py snapshot` starts a new journal.
+"""
+import argparse
+import difflib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from paper_shadow import default_manifest, journal_path, load_manifest, touched_files
+
+CHANGE_TYPES = ("add", "edit", "delete")
+CONTEXT_LINES = 3
+# Myers keeps one V snapshot per edit distance, so cost grows with D^2; larger
+# rewrites fall back to difflib, which is near-linear but not always minimal.
+MYERS_MAX_D = 500
+Opcode = Tuple[str, int, int, int, int]
+
+
+def record(dest: Path, rel: str, change_type: str, purpose: str, risk_level: str = "low") -> Dict[str, str]:
+    if change_type not in CHANGE_TYPES:
+        raise ValueError(f"unsupported change_type: {change_type}")
+    entry = {"path": rel, "change_type": change_type, "purpose": purpose, "risk_level": risk_level}
+    with journal_path(dest).open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def load_journal(dest: Path) -> List[Dict[str, str]]:
+    p = journal_path(dest)
+    if not p.exists():
+        return []
+    merged: Dict[str, Dict[str, str]] = {}
+    for line in p.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        rel = str(entry.get("path", ""))
+        prev = merged.get(rel)
+        if prev and prev["change_type"] == "add" and entry.get("change_type") == "edit":
+            entry["change_type"] = "add"
+        merged[rel] = entry if not prev else {**prev, **entry}
+    return list(merged.values())
+
+
+def _myers(a: Sequence[str], b: Sequence[str], max_d: int = MYERS_MAX_D) -> Optional[List[Tuple[str, int, int]]]:
+    """Shortest edit script as (tag, i, j) steps (equal/delete/insert), or None if it needs more than max_d edits."""
+    n, m = len(a), len(b)
+    v: Dict[int, int] = {1: 0}
+    trace: List[Dict[int, int]] = []
+    for d in range(min(n + m, max_d) + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m)
+    return None
+
+
+def _backtrack(trace: List[Dict[int, int]], n: int, m: int) -> List[Tuple[str, int, int]]:
+    x, y = n, m
+    steps: List[Tuple[str, int, int]] = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            steps.append(("equal", x - 1, y - 1))
+            x -= 1
+            y -= 1
+        if d > 0:
+            steps.append(("insert", x, y - 1) if x == prev_x else ("delete", x - 1, y))
+        x, y = prev_x, prev_y
+    steps.reverse()
+    return steps
+
+
+def myers_opcodes(a: Sequence[str], b: Sequence[str]) -> List[Opcode]:
+    """difflib-style opcodes from a Myers diff, after trimming the common prefix and suffix.
+
+    Above MYERS_MAX_D edits the middle is diffed by difflib.SequenceMatcher instead.
+    """
+    n, m = len(a), len(b)
+    pre = 0
+    while pre < n and pre < m and a[pre] == b[pre]:
+        pre += 1
+    suf = 0
+    while suf < n - pre and suf < m - pre and a[n - 1 - suf] == b[m - 1 - suf]:
+        suf += 1
+    codes: List[Opcode] = []
+    if pre:
+        codes.append(("equal", 0, pre, 0, pre))
+    steps = _myers(a[pre:n - suf], b[pre:m - suf])
+    if steps is None:
+        matcher = difflib.SequenceMatcher(None, a[pre:n - suf], b[pre:m - suf])
+        codes.extend((tag, i1 + pre, i2 + pre, j1 + pre, j2 + pre) for tag, i1, i2, j1, j2 in matcher.get_opcodes())
+        steps = []
+    for tag, i, j in steps:
+        i += pre
+        j += pre
+        if codes and codes[-1][0] == tag:
+            t, i1, i2, j1, j2 = codes[-1]
+            codes[-1] = (t, i1, i2 + (tag != "insert"), j1, j2 + (tag != "delete"))
+        else:
+            codes.append((tag, i, i + (tag != "insert"), j, j + (tag != "delete")))
+    if suf:
+        codes.append(("equal", n - suf, n, m - suf, m))
+    return codes
+
+
+def grouped_opcodes(codes: List[Opcode], n: int = CONTEXT_LINES) -> Iterator[List[Opcode]]:
+    if not codes:
+        return
+    codes = list(codes)
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = (tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2)
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = (tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n))
+    group: List[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > n + n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _range(start: int, stop: int) -> str:
+    length = stop - start
+    if length == 1:
+        return str(start + 1)
+    return f"{start if not length else start + 1},{length}"
+
+
+def _line(prefix: str, text: str) -> str:
+    if text.endswith("\n"):
+        return prefix + text
+    return f"{prefix}{text}\n\\ No newline at end of file\n"
+
+
+def unified_diff(a: List[str], b: List[str], a_label: str, b_label: str) -> str:
+    out: List[str] = []
+    for group in grouped_opcodes(myers_opcodes(a, b)):
+        if not out:
+            out.append(f"--- {a_label}\n+++ {b_label}\n")
+        first, last = group[0], group[-1]
+        out.append(f"@@ -{_range(first[1], last[2])} +{_range(first[3], last[4])} @@\n")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                out.extend(_line(" ", x) for x in a[i1:i2])
+                continue
+            if tag in {"replace", "delete"}:
+                out.extend(_line("-", x) for x in a[i1:i2])
+            if tag in {"replace", "insert"}:
+                out.extend(_line("+", x) for x in b[j1:j2])
+    return "".join(out)
+
+
+def _read_lines(path: Path) -> Optional[List[str]]:
+    """Text lines with endings kept; [] for a missing file, None for binary content."""
+    if not path.is_file():
+        return []
+    data = path.read_bytes()
+    if b"\0" in data:
+        return None
+    try:
+        return data.decode("utf-8").splitlines(keepends=True)
+    except UnicodeDecodeError:
+        return None
+
+
+def file_patch(src: Path, dest: Path, rel: str, label_root: str) -> str:
+    a_path = src / rel
+    b_path = dest / rel
+    a_label = f"a/{label_root}/{rel}" if a_path.exists() else "/dev/null"
+    b_label = f"b/{label_root}/{rel}" if b_path.exists() else "/dev/null"
+    a_lines = _read_lines(a_path)
+    b_lines = _read_lines(b_path)
+    if a_lines is None or b_lines is None:
+        if a_path.is_file() and b_path.is_file() and a_path.read_bytes() == b_path.read_bytes():
+            return ""
+        return f"diff -ruN a/{label_root}/{rel} b/{label_root}/{rel}\nBinary files {a_label} and {b_label} differ\n"
+    body = unified_diff(a_lines, b_lines, a_label, b_label)
+    if not body:
+        return ""
+    return f"diff -ruN a/{label_root}/{rel} b/{label_root}/{rel}\n{body}"
+
+
+def unjournaled_changes(dest: Path, journaled: List[str]) -> List[Tuple[str, str]]:
+    snapshot = default_manifest(dest)
+    if not snapshot.exists():
+        return []
+    known = set(journaled)
+    return [(rel, kind) for rel, kind in touched_files(load_manifest(snapshot)) if rel not in known]
+
+
+def emit(
+    src: Path, dest: Path, patch_path: Path, manifest_path: Path, label_root: str, check_unjournaled: bool = False
+) -> Dict[str, Any]:
+    entries = load_journal(dest)
+    unjournaled = unjournaled_changes(dest, [e["path"] for e in entries]) if check_unjournaled else []
+    for rel, kind in unjournaled:
+        print(f"edit_journal: unjournaled shadow change: {rel}", file=sys.stderr)
+        entries.append(
+            {
+                "path": rel,
+                "change_type": kind,
+                "purpose": "Unjournaled change detected in shadow tree",
+                "risk_level": "unknown",
+            }
+        )
+
+    edited: List[Dict[str, str]] = []
+    chunks: List[str] = []
+    for entry in entries:
+        chunk = file_patch(src, dest, entry["path"], label_root)
+        if chunk:
+            chunks.append(chunk)
+            edited.append(entry)
+    patch_path.parent.mkdir(parents=True, exist_ok=True)
+    patch_path.write_text("".join(chunks), encoding="utf-8")
+
+    obj: Dict[str, Any] = {}
+    if manifest_path.exists():
+        obj = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if "edited_files" in obj:
+        obj["edited_files"] = edited
+    else:
+        ordered: Dict[str, Any] = {}
+        for key, value in obj.items():
+            ordered[key] = value
+            if key == "shadow_root":
+                ordered["edited_files"] = edited
+        ordered.setdefault("edited_files", edited)
+        obj = ordered
+    tmp = manifest_path.with_suffix(manifest_path.suffix + ".tmp")
+    tmp.write_text(json.dumps(obj, indent=2) + "\n", encoding="utf-8")
+    tmp.replace(manifest_path)
+    return {"edited": edited, "patched_files": len(chunks)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="edit_journal")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    pr = sub.add_parser("record")
+    pr.add_argument("--dest", required=True)
+    pr.add_argument("--path", required=True)
+    pr.add_argument("--change-type", required=True, choices=CHANGE_TYPES)
+    pr.add_argument("--purpose", required=True)
+    pr.add_argument("--risk-level", default="low")
+
+    pe = sub.add_parser("emit")
+    pe.add_argument("--src", required=True)
+    pe.add_argument("--dest", required=True)
+    pe.add_argument("--patch", required=True)
+    pe.add_argument("--manifest", required=True)
+    pe.add_argument("--label-root", default="USER/paper")
+    pe.add_argument("--check-unjournaled", action="store_true", help="Also walk the shadow for unjournaled changes.")
+    args = parser.parse_args()
+
+    dest = Path(args.dest)
+    if args.cmd == "record":
+        entry = record(dest, args.path, args.change_type, args.purpose, args.risk_level)
+        print(f"JOURNAL_{entry['change_type'].upper()}={entry['path']}")
+        return 0
+    if args.cmd == "emit":
+        out = emit(
+            Path(args.src), dest, Path(args.patch), Path(args.manifest), args.label_root.strip("/"), args.check_unjournaled
+        )
+        print(f"PATCH_FILES={out['patched_files']} EDITED_FILES={len(out['edited'])}")
+        return 0
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
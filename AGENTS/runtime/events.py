@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Machine-readable event stream for agenthub, bart and skill scripts.
+
+With `--events jsonl`, agenthub (and bart) write one JSON object per line to a
+dedicated file descriptor (--events-fd, default 3) as things happen, so an
+orchestrator can follow a run without scraping stdout. The fd number travels
+to child processes in AGENTHUB_EVENTS_FD (the fd itself must be passed with
+pass_fds()); bash skills emit through events.sh, Python through emit(). With no
+events fd configured every call here is a no-op.
+
+Every event has v, ts, seq, pid, source and event; the event types are:
+
+  run_start    name, task_id, ...         agenthub command started
+  phase_start  phase, ...                 route, preflight, skill_run, stage, ...
+  phase_end    phase, status, duration_ms
+  marker       key, value                 a KEY=VALUE line from skill output
+  stop         reason                     STOP_REASON, from agenthub or a skill
+  artifact     kind, path                 task, report, output, staged_dir, ...
+  run_end      name, status, duration_ms
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+ENV_FD = "AGENTHUB_EVENTS_FD"
+ENV_SOURCE = "AGENTHUB_EVENTS_SOURCE"
+VERSION = 1
+_SEQ = 0
+
+
+def fd() -> Optional[int]:
+    raw = os.environ.get(ENV_FD, "").strip()
+    return int(raw) if raw.isdigit() else None
+
+
+def enabled() -> bool:
+    return fd() is not None
+
+
+def configure(events_fd: int, source: str) -> None:
+    """Send this process's events (and those of children given pass_fds()) to events_fd; OSError if it is not open."""
+    os.fstat(events_fd)
+    os.environ[ENV_FD] = str(events_fd)
+    os.environ[ENV_SOURCE] = source
+
+
+def pass_fds() -> Tuple[int, ...]:
+    n = fd()
+    return (n,) if n is not None else ()
+
+
+def now_utc() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def write_line(line: str, to: Optional[int] = None) -> None:
+    """Write one already-encoded event line to `to` (default: the configured fd).
+
+    A single write keeps lines whole on a pipe shared with child processes.
+    """
+    n = fd() if to is None else to
+    if n is None:
+        return
+    try:
+        os.write(n, line.rstrip("\n").encode("utf-8") + b"\n")
+    except OSError:
+        # The reader went away; an orchestrator crash must not fail the run.
+        if to is None:
+            os.environ.pop(ENV_FD, None)
+
+
+def emit(event: str, **fields: Any) -> None:
+    global _SEQ
+    if not enabled():
+        return
+    _SEQ += 1
+    record: Dict[str, Any] = {
+        "v": VERSION,
+        "ts": now_utc(),
+        "seq": _SEQ,
+        "pid": os.getpid(),
+        "source": os.environ.get(ENV_SOURCE, "") or "python",
+        "event": event,
+    }
+    record.update({k: v for k, v in fields.items() if v is not None})
+    write_line(json.dumps(record, separators=(",", ":"), default=str))
+
+
+class Phase:
+    """Timing of one phase_start/phase_end pair."""
+
+    def __init__(self, name: str, **attrs: Any) -> None:
+        self.name = name
+        self._t0 = time.perf_counter()
+        emit("phase_start", phase=name, **attrs)
+
+    def end(self, status: str = "ok") -> None:
+        emit("phase_end", phase=self.name, status=status, duration_ms=round((time.perf_counter() - self._t0) * 1000, 3))
+
+
+def iter_events(stream: Any) -> Iterator[Dict[str, Any]]:
+    """Decoded events from a binary or text line stream; malformed lines are skipped."""
+    for raw in stream:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8", errors="replace")
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            rec = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(rec, dict) and rec.get("event"):
+            yield rec
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="events")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    pe = sub.add_parser("emit", help="Emit one event with key=value fields.")
+    pe.add_argument("event")
+    pe.add_argument("fields", nargs="*")
+    args = parser.parse_args()
+
+    if args.cmd == "emit":
+        fields: Dict[str, Any] = {}
+        for item in args.fields:
+            key, sep, value = item.partition("=")
+            if not sep:
+                print(f"events emit: expected key=value, got {item!r}", file=sys.stderr)
+                return 2
+            fields[key] = value
+        emit(args.event, **fields)
+        return 0
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,40 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Event stream for skill scripts; same line format as events.py.
+# No-op unless AGENTHUB_EVENTS_FD is set by an `agenthub --events jsonl` run.
+# usage: events_emit <event> [key=value ...]    e.g. events_emit artifact kind=report path=...
+
+EVENTS_SEQ=0
+
+events_json_str() {
+  local s="${1//\\/\\\\}"
+  s="${s//\"/\\\"}"
+  s="${s//$'\n'/\\n}"
+  s="${s//$'\r'/\\r}"
+  s="${s//$'\t'/\\t}"
+  printf '"%s"' "$s"
+}
+
+events_emit() {
+  local fd="${AGENTHUB_EVENTS_FD:-}"
+  [[ "$fd" =~ ^[0-9]+$ ]] || return 0
+  local event="$1"
+  shift
+  local now="${EPOCHREALTIME:-}" ts kv key
+  if [[ -n "$now" ]]; then
+    ts="$(TZ=UTC printf '%(%Y-%m-%dT%H:%M:%S)T' "${now%[.,]*}").${now#*[.,]}"
+    ts="${ts:0:23}Z"
+  else
+    ts="$(date -u +%Y-%m-%dT%H:%M:%S.000Z)"
+  fi
+  EVENTS_SEQ=$((EVENTS_SEQ + 1))
+  local line
+  line="{\"v\":1,\"ts\":\"$ts\",\"seq\":$EVENTS_SEQ,\"pid\":$$,\"source\":$(events_json_str "skill:${SKILL:-shell}"),\"event\":$(events_json_str "$event")"
+  for kv in "$@"; do
+    key="${kv%%=*}"
+    line+=",$(events_json_str "$key"):$(events_json_str "${kv#*=}")"
+  done
+  # One printf per line keeps events whole on a pipe shared with other writers.
+  printf '%s}\n' "$line" >&"$fd" 2>/dev/null || true
+}
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Reading and writing JSON artifacts.
+
+Pretty output (the default) is always produced by the stdlib encoder with
+indent=2, so human-reviewed and tracked files (request.json, meta.json,
+skills_index.json, result.json, paper_profile.json, ...) stay byte-identical
+to json.dumps(obj, indent=2). compact=True is for machine-only files (caches,
+raw_candidates.jsonl) and uses orjson when installed: UTF-8 instead of \\u
+escapes, and non-finite floats become null. Every write goes through a
+temporary file and os.replace, so readers never see a half-written file.
+
+Decoding uses orjson (or msgspec) when installed and falls back to the stdlib
+for anything they reject, such as NaN literals. read_json(path, fields=...)
+keeps only the named top-level keys; with msgspec the other subtrees are
+skipped without building Python objects.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+_PARTIAL_TYPES: Dict[Tuple[str, ...], Any] = {}
+
+
+def dumps(obj: Any, compact: bool = False, ensure_ascii: bool = True) -> str:
+    if not compact:
+        return json.dumps(obj, indent=2, ensure_ascii=ensure_ascii)
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=ensure_ascii)
+
+
+def loads(data: Any) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def _partial_type(fields: Tuple[str, ...]) -> Any:
+    # Attribute names are positional so keys need not be identifiers; rename maps them back.
+    typ = _PARTIAL_TYPES.get(fields)
+    if typ is None:
+        attrs = [f"f{i}" for i in range(len(fields))]
+        typ = msgspec.defstruct(
+            "Partial", [(a, Any, msgspec.UNSET) for a in attrs], rename=dict(zip(attrs, fields))
+        )
+        _PARTIAL_TYPES[fields] = typ
+    return typ
+
+
+def loads_fields(data: bytes, fields: Sequence[str]) -> Dict[str, Any]:
+    """The named top-level keys of a JSON object; absent keys are left out."""
+    fields = tuple(fields)
+    if msgspec is not None:
+        try:
+            partial = msgspec.json.decode(data, type=_partial_type(fields))
+            values = (getattr(partial, f"f{i}") for i in range(len(fields)))
+            return {f: v for f, v in zip(fields, values) if v is not msgspec.UNSET}
+        except (msgspec.DecodeError, msgspec.ValidationError):
+            pass
+    obj = loads(data)
+    if not isinstance(obj, dict):
+        raise ValueError("expected a JSON object")
+    return {f: obj[f] for f in fields if f in obj}
+
+
+def read_json(path: Path, fields: Optional[Sequence[str]] = None) -> Any:
+    data = Path(path).read_bytes()
+    if fields is not None:
+        return loads_fields(data, fields)
+    return loads(data)
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp.{os.getpid()}")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def write_json(
+    path: Path, obj: Any, compact: bool = False, ensure_ascii: bool = True, trailing_newline: bool = False
+) -> None:
+    text = dumps(obj, compact=compact, ensure_ascii=ensure_ascii)
+    _atomic_write(path, text + "\n" if trailing_newline else text)
+
+
+def iter_jsonl(path: Path) -> Iterator[Any]:
+    with Path(path).open("rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield loads(line)
+
+
+def read_jsonl(path: Path) -> List[Any]:
+    return list(iter_jsonl(path))
+
+
+def write_jsonl(path: Path, rows: Iterable[Any], compact: bool = True) -> None:
+    _atomic_write(path, "".join(dumps(r, compact=compact) + "\n" for r in rows))
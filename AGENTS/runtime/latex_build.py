@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Incremental latexmk builds for writer checks.
+
+Each paper gets a slot under AGENTS/cache/latex/ holding the aux/bbl/fls/
+fdb_latexmk files (and the PDF) from its last successful build, plus the
+source-file hashes that build saw. Before a build the slot seeds the shadow
+tree so latexmk only reruns what changed; when the sources hash exactly as
+last time the cached PDF is reused and latexmk is not run at all. The cache is
+shared by all writer skills building the same USER/paper.
+
+Only files named after the main file (main.aux, main.pdf, ...) are build
+outputs; everything else, including PDF figures, is a source. Outputs copied
+in from USER/paper (a stale main.pdf or main.aux) are never hashed, and
+symlinked outputs are replaced by private copies before latexmk runs, so no
+write can reach USER/paper. Other shadow files are already private copies.
+
+Source digests are cached per USER/paper file stat recorded in the snapshot
+manifest: every snapshot is a fresh copy with new inodes, but a file nobody
+touched since is not read again.
+"""
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from paper_shadow import default_manifest, stat_entry
+from tree_sync import plain_copy, sha256_file
+
+STATE_VERSION = 1
+ARTIFACT_SUFFIXES = (
+    ".aux", ".bbl", ".blg", ".fls", ".fdb_latexmk", ".toc", ".out", ".lof", ".lot",
+    ".bcf", ".run.xml", ".nav", ".snm", ".xdv", ".synctex.gz", ".pdf", ".log",
+)
+# A .bbl shipped with the paper (e.g. an arXiv source without its .bib) is a source.
+SOURCE_ARTIFACT_SUFFIXES = (".bbl",)
+PASS_RE = re.compile(r"^Run number \d+ of rule '(?:pdf|lua|xe)?latex", re.MULTILINE)
+
+
+def slot_dir(cache_root: Path, paper_id: str, main: str) -> Path:
+    key = hashlib.sha256(f"{paper_id}\0{main}".encode("utf-8")).hexdigest()[:16]
+    return cache_root / key
+
+
+@contextmanager
+def slot_lock(slot: Path) -> Iterator[None]:
+    slot.mkdir(parents=True, exist_ok=True)
+    with (slot / ".lock").open("w") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def is_output(rel: str, main: str) -> bool:
+    """True for `<main stem><suffix>`, the files latexmk writes for `main`."""
+    stem = Path(main).with_suffix("").as_posix()
+    return rel.startswith(stem) and rel[len(stem):] in ARTIFACT_SUFFIXES
+
+
+def load_state(slot: Path) -> Dict[str, Any]:
+    p = slot / "state.json"
+    try:
+        obj = json.loads(p.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return obj if isinstance(obj, dict) and obj.get("version") == STATE_VERSION else {}
+
+
+def snapshot_files(paper: Path) -> Dict[str, Any]:
+    """Per-file entries of the shadow's snapshot manifest, or {} for a plain directory."""
+    try:
+        files = json.loads(default_manifest(paper).read_text(encoding="utf-8")).get("files", {})
+    except Exception:
+        return {}
+    return files if isinstance(files, dict) else {}
+
+
+def source_files(paper: Path, main: str, snap: Dict[str, Any]) -> List[str]:
+    """Files that are not build outputs; only a snapshotted .bbl counts as a source despite its name."""
+    out: List[str] = []
+    for dirpath, dirnames, filenames in os.walk(paper):
+        dirnames.sort()
+        for name in sorted(filenames):
+            rel = (Path(dirpath) / name).relative_to(paper).as_posix()
+            if not is_output(rel, main) or (rel in snap and rel.endswith(SOURCE_ARTIFACT_SUFFIXES)):
+                out.append(rel)
+    return out
+
+
+def detach_outputs(paper: Path, main: str, sources: List[str]) -> List[str]:
+    """Replace symlinked outputs with private copies so latexmk cannot write through them."""
+    source_set = set(sources)
+    outputs: List[str] = []
+    for dirpath, dirnames, filenames in os.walk(paper):
+        for name in filenames:
+            p = Path(dirpath) / name
+            rel = p.relative_to(paper).as_posix()
+            if rel in source_set or not is_output(rel, main) or not p.is_symlink():
+                continue
+            if p.exists():
+                plain_copy(p, p)
+            else:
+                p.unlink()
+            outputs.append(rel)
+    return outputs
+
+
+def hash_sources(paper: Path, rels: List[str], snap: Dict[str, Any], stat_cache: Dict[str, Any]) -> Dict[str, str]:
+    """sha256 per source file; a file unchanged since the snapshot reuses the digest cached for its USER/paper stat."""
+    hashes: Dict[str, str] = {}
+    for rel in rels:
+        entry = snap.get(rel)
+        sig = None
+        if isinstance(entry, dict) and isinstance(entry.get("src"), dict):
+            cur = stat_entry(paper / rel)
+            if all(cur[k] == entry.get(k) for k in ("ino", "size", "mtime_ns")):
+                sig = [entry["src"].get(k) for k in ("ino", "size", "mtime_ns")]
+        prev = stat_cache.get(rel)
+        if sig is not None and isinstance(prev, dict) and prev.get("sig") == sig:
+            hashes[rel] = str(prev["sha256"])
+        else:
+            hashes[rel] = sha256_file(paper / rel)
+        if sig is not None:
+            stat_cache[rel] = {"sig": sig, "sha256": hashes[rel]}
+    return hashes
+
+
+def seed(slot: Path, paper: Path, artifacts: List[str], sources: List[str]) -> int:
+    """Copy cached build products into the shadow; sources are never overwritten."""
+    source_set = set(sources)
+    seeded = 0
+    for rel in artifacts:
+        if rel in source_set:
+            continue
+        src = slot / "artifacts" / rel
+        dst = paper / rel
+        if src.is_file():
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            plain_copy(src, dst)
+            seeded += 1
+    return seeded
+
+
+def store(slot: Path, paper: Path, sources: List[str]) -> List[str]:
+    """Cache every file the build left besides its sources (outputs and converted figures)."""
+    source_set = set(sources)
+    artifacts: List[str] = []
+    tmp = slot / f"artifacts.tmp.{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    for dirpath, dirnames, filenames in os.walk(paper):
+        dirnames.sort()
+        for name in sorted(filenames):
+            p = Path(dirpath) / name
+            rel = p.relative_to(paper).as_posix()
+            if rel in source_set or p.is_symlink():
+                continue
+            (tmp / rel).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(p, tmp / rel)
+            artifacts.append(rel)
+    tmp.mkdir(parents=True, exist_ok=True)
+    old = slot / f"artifacts.old.{os.getpid()}"
+    if (slot / "artifacts").exists():
+        (slot / "artifacts").rename(old)
+    tmp.rename(slot / "artifacts")
+    shutil.rmtree(old, ignore_errors=True)
+    return artifacts
+
+
+def write_state(slot: Path, state: Dict[str, Any]) -> None:
+    tmp = slot / "state.json.tmp"
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(slot / "state.json")
+
+
+def run_latexmk(paper: Path, main: str, log: Path) -> Dict[str, Any]:
+    t0 = time.monotonic()
+    with log.open("w", encoding="utf-8") as out:
+        proc = subprocess.run(
+            ["latexmk", "-pdf", "-interaction=nonstopmode", main],
+            cwd=str(paper),
+            stdout=out,
+            stderr=subprocess.STDOUT,
+        )
+    seconds = time.monotonic() - t0
+    passes = len(PASS_RE.findall(log.read_text(encoding="utf-8", errors="replace")))
+    return {"rc": proc.returncode, "seconds": seconds, "passes": passes}
+
+
+def build(paper: Path, main: str, paper_id: str, cache_root: Path, log: Path) -> Dict[str, Any]:
+    slot = slot_dir(cache_root, paper_id, main)
+    with slot_lock(slot):
+        state = load_state(slot)
+        stat_cache = state.get("stat_cache", {}) if isinstance(state.get("stat_cache"), dict) else {}
+        snap = snapshot_files(paper)
+        sources = source_files(paper, main, snap)
+        hashes = hash_sources(paper, sources, snap, stat_cache)
+        detach_outputs(paper, main, sources)
+        artifacts = [str(x) for x in state.get("artifacts", [])]
+        pdf = str(Path(main).with_suffix(".pdf"))
+        if state and state.get("sources") == hashes and pdf in artifacts:
+            seed(slot, paper, artifacts, sources)
+            log.write_text(f"latex_build: sources unchanged since last successful build; reused {slot}\n", encoding="utf-8")
+            return {"status": "ok", "cache": "hit", "seconds": 0.0, "passes": 0}
+        seeded = seed(slot, paper, artifacts, sources)
+        result = run_latexmk(paper, main, log)
+        status = "ok" if result["rc"] == 0 else "fail"
+        if status == "ok":
+            artifacts = store(slot, paper, sources)
+            state = {"version": STATE_VERSION, "main": main, "sources": hashes, "artifacts": artifacts}
+        state["stat_cache"] = stat_cache
+        state["version"] = STATE_VERSION
+        write_state(slot, state)
+    return {
+        "status": status,
+        "cache": "seeded" if seeded else "cold",
+        "seconds": round(result["seconds"], 3),
+        "passes": result["passes"],
+    }
+
+
+def update_manifest(manifest: Path, main: str, log_rel: str, result: Dict[str, Any]) -> None:
+    obj = json.loads(manifest.read_text(encoding="utf-8"))
+    checks = obj.get("build_checks")
+    if not isinstance(checks, list):
+        checks = []
+    entry: Optional[Dict[str, Any]] = next((c for c in checks if isinstance(c, dict) and c.get("name") == "latexmk"), None)
+    if entry is None:
+        entry = {"name": "latexmk", "log_path": log_rel}
+        checks.append(entry)
+    entry["cmd"] = f"latexmk -pdf -interaction=nonstopmode {main}"
+    entry["status"] = result["status"]
+    entry["duration_s"] = result["seconds"]
+    entry["passes"] = result["passes"]
+    entry["cache"] = result["cache"]
+    obj["build_checks"] = checks
+    tmp = manifest.with_suffix(manifest.suffix + ".tmp")
+    tmp.write_text(json.dumps(obj, indent=2) + "\n", encoding="utf-8")
+    tmp.replace(manifest)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="latex_build")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    pb = sub.add_parser("build")
+    pb.add_argument("--paper", required=True)
+    pb.add_argument("--main", default="main.tex")
+    pb.add_argument("--paper-id", required=True, help="Stable identity of the paper, e.g. the USER/paper path.")
+    pb.add_argument("--cache-root", required=True)
+    pb.add_argument("--log", required=True)
+    pb.add_argument("--manifest", default="")
+    pb.add_argument("--log-rel", default="")
+    args = parser.parse_args()
+
+    if args.cmd == "build":
+        paper = Path(args.paper).resolve()
+        log = Path(args.log)
+        log.parent.mkdir(parents=True, exist_ok=True)
+        paper_id = str(Path(args.paper_id).resolve())
+        result = build(paper, args.main, paper_id, Path(args.cache_root), log)
+        if args.manifest and Path(args.manifest).is_file():
+            update_manifest(Path(args.manifest), args.main, args.log_rel or str(log), result)
+        print(f"LATEXMK_STATUS={result['status']}")
+        print(f"LATEXMK_PASSES={result['passes']}")
+        print(f"LATEXMK_SECONDS={result['seconds']}")
+        print(f"LATEX_CACHE={result['cache']}")
+        return 0
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Copy-on-write shadow workspaces for writer skills.
+
+`snapshot` materializes USER/paper into a task-local shadow tree: files are
+reflinked when the filesystem supports it (btrfs, XFS, APFS), so bulk assets
+cost no space. Elsewhere (e.g. ext4) every snapshot is a full copy of the
+paper. The shadow is written to by skills and latexmk, so files are never
+hard-linked: every shadow file has its own inode and no write, in place or by
+rename, can reach USER/paper. A snapshot manifest records the inode and stat
+of every shadow file, so `touched_files` only has to stat the tree to find
+what changed.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from tree_sync import iter_source_dirs, iter_source_files, place_symlink, plain_copy, try_reflink
+
+MANIFEST_VERSION = 1
+
+
+def place(src: Path, dst: Path) -> str:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if try_reflink(src, dst):
+        return "reflink"
+    plain_copy(src, dst)
+    return "copy"
+
+
+def stat_entry(path: Path) -> Dict[str, int]:
+    st = path.lstat()
+    return {"ino": st.st_ino, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def default_manifest(dest: Path) -> Path:
+    return dest.parent / f".{dest.name}.shadow.json"
+
+
+def journal_path(dest: Path) -> Path:
+    """Edit journal kept by edit_journal.py; a fresh snapshot starts a fresh journal."""
+    return dest.parent / f".{dest.name}.journal.jsonl"
+
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    obj = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(obj, dict) or obj.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"unsupported shadow manifest: {path}")
+    return obj
+
+
+def snapshot(src: Path, dest: Path, manifest_path: Path) -> Dict[str, int]:
+    """Replace `dest` with a fresh shadow of `src`; refuses a dest that would remove src or the cwd."""
+    for protected in (src, Path.cwd().resolve()):
+        if dest == protected or dest in protected.parents or src in dest.parents:
+            raise ValueError(f"refusing to replace {dest}: it overlaps {protected}")
+    if dest.is_dir() and not dest.is_symlink():
+        shutil.rmtree(dest)
+    elif dest.exists() or dest.is_symlink():
+        dest.unlink()
+    dest.mkdir(parents=True)
+    journal_path(dest).unlink(missing_ok=True)
+    files: Dict[str, Any] = {}
+    counts = {"reflink": 0, "copy": 0, "symlink": 0}
+    for rel_dir in iter_source_dirs(src, "."):
+        (dest / rel_dir).mkdir(parents=True, exist_ok=True)
+    for file_src, rel in iter_source_files(src, "."):
+        rel = rel[2:]
+        dst = dest / rel
+        if file_src.is_symlink():
+            place_symlink(file_src, dst)
+            method = "symlink"
+            src_entry = None
+        else:
+            src_entry = stat_entry(file_src)
+            method = place(file_src, dst)
+            if stat_entry(file_src) != src_entry:
+                src_entry = None
+        counts[method] += 1
+        entry: Dict[str, Any] = dict(stat_entry(dst))
+        entry["method"] = method
+        if src_entry is not None:
+            # Stat of the USER/paper file the copy was taken from, stable across snapshots.
+            entry["src"] = src_entry
+        files[rel] = entry
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": MANIFEST_VERSION, "src": str(src), "dest": str(dest), "files": files}
+    manifest_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    return counts
+
+
+def touched_files(manifest: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Return (rel, kind) for shadow files that differ from the snapshot (kind: add/edit/delete)."""
+    dest = Path(manifest["dest"])
+    files: Dict[str, Any] = manifest.get("files", {})
+    out: List[Tuple[str, str]] = []
+    seen = set()
+    for dirpath, dirnames, filenames in os.walk(dest):
+        dirnames.sort()
+        base = Path(dirpath)
+        for name in sorted(filenames) + [d for d in dirnames if (base / d).is_symlink()]:
+            p = base / name
+            rel = p.relative_to(dest).as_posix()
+            seen.add(rel)
+            prev = files.get(rel)
+            if prev is None:
+                out.append((rel, "add"))
+                continue
+            cur = stat_entry(p)
+            if any(cur[k] != prev.get(k) for k in ("ino", "size", "mtime_ns")):
+                out.append((rel, "edit"))
+    for rel in sorted(set(files) - seen):
+        out.append((rel, "delete"))
+    return sorted(out)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="paper_shadow")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    ps = sub.add_parser("snapshot")
+    ps.add_argument("--src", required=True)
+    ps.add_argument("--dest", required=True)
+    ps.add_argument("--manifest", default="")
+    args = parser.parse_args()
+
+    if args.cmd == "snapshot":
+        src = Path(args.src)
+        if not src.is_dir():
+            print(f"Missing required input directory: {src}", file=sys.stderr)
+            return 2
+        if not args.dest:
+            print("paper_shadow: --dest must not be empty", file=sys.stderr)
+            return 2
+        dest = Path(args.dest)
+        manifest_path = Path(args.manifest) if args.manifest else default_manifest(dest)
+        try:
+            c = snapshot(src.resolve(), dest.resolve(), manifest_path)
+        except ValueError as exc:
+            print(f"paper_shadow: {exc}", file=sys.stderr)
+            return 2
+        total = sum(c.values())
+        print(
+            f"SHADOW_FILES={total} REFLINK={c['reflink']} COPY={c['copy']} SYMLINK={c['symlink']}"
+        )
+        return 0
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Validate a staged PROMOTE.json contract and apply it to USER/ incrementally.
+
+All mappings are validated and boundary-resolved in one process before any
+file is written. Files are compared by size, then sha256, and only changed
+files are copied (temp file + rename). The per-file delta is recorded in the
+promotion receipt. With the content store (cas.py) enabled, promoted files are
+ingested and recorded as holders, and files whose stat is unchanged since the
+store last saw them are not hashed again.
+"""
+import argparse
+import json
+import os
+import stat
+import sys
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Optional, Tuple
+
+import cas
+import task_registry
+from tree_sync import iter_source_files, plain_copy, sha256_file
+
+
+class PromotionError(RuntimeError):
+    pass
+
+
+def normalize_rel(raw: Any, field_name: str) -> str:
+    val = str(raw or "").strip()
+    if not val:
+        raise ValueError(f"missing {field_name}")
+    p = PurePosixPath(val)
+    if p.is_absolute():
+        raise ValueError(f"{field_name} must be relative: {val}")
+    if any(part in {"", ".", ".."} for part in p.parts):
+        raise ValueError(f"{field_name} contains invalid segments: {val}")
+    return p.as_posix()
+
+
+def normalize_prefix(raw: Any) -> str:
+    val = normalize_rel(raw, "allowed_dst_prefix")
+    return val if val.endswith("/") else f"{val}/"
+
+
+def load_contract(promote_json: Path, task_id: str) -> Tuple[str, List[Tuple[str, str]]]:
+    src_required_prefix = f"GATE/staged/{task_id}/"
+    obj = json.loads(promote_json.read_text(encoding="utf-8"))
+    skill = str(obj.get("skill", "")).strip()
+    maps = obj.get("mappings", [])
+    raw_prefixes = obj.get("allowed_dst_prefixes", ["USER/"])
+    if not isinstance(raw_prefixes, list) or not raw_prefixes:
+        raise ValueError("allowed_dst_prefixes must be a non-empty list when present")
+    allowed_dst_prefixes = tuple(normalize_prefix(x) for x in raw_prefixes)
+    if not isinstance(maps, list):
+        maps = []
+    rows: List[Tuple[str, str]] = []
+    for m in maps:
+        if not isinstance(m, dict):
+            continue
+        src = normalize_rel(m.get("src", ""), "src")
+        dst = normalize_rel(m.get("dst", ""), "dst")
+        if not src.startswith(src_required_prefix):
+            raise ValueError(f"src outside staged task boundary: {src}")
+        if not any(dst.startswith(prefix) for prefix in allowed_dst_prefixes):
+            raise ValueError(f"dst outside allowed USER boundary: {dst}")
+        if not dst.startswith("USER/"):
+            raise ValueError(f"dst outside allowed USER boundary: {dst}")
+        rows.append((src, dst))
+    return skill, rows
+
+
+def within(path: Path, root: Path) -> bool:
+    return path == root or root in path.parents
+
+
+def resolve_planned(path: Path) -> Path:
+    """Resolve path through its nearest existing ancestor without creating anything."""
+    missing: List[str] = []
+    cur = path
+    while not os.path.lexists(cur):
+        missing.append(cur.name)
+        cur = cur.parent
+    base = cur.resolve(strict=True)
+    if missing and not base.is_dir():
+        raise PromotionError(f"Invalid promotion destination type: {cur}")
+    return base.joinpath(*reversed(missing))
+
+
+def digest_of(path: Path, store: Optional[cas.Store]) -> str:
+    known = store.known_digest(path) if store is not None else None
+    return known or sha256_file(path)
+
+
+def plan_mapping(
+    root: Path, stage_root: Path, user_root: Path, src_rel: str, dst_rel: str, store: Optional[cas.Store] = None
+) -> List[Dict[str, Any]]:
+    src = root / src_rel
+    dst = root / dst_rel
+    if not (src.is_file() or src.is_dir()):
+        raise PromotionError(f"Missing staged artifact: {src_rel}")
+    if not within(src.resolve(strict=True), stage_root):
+        raise PromotionError(f"Invalid promotion source resolution: {src_rel}")
+    if not within(resolve_planned(dst.parent), user_root):
+        raise PromotionError(f"Invalid promotion destination resolution: {dst_rel}")
+
+    ops: List[Dict[str, Any]] = []
+    for file_src, rel in iter_source_files(src, "."):
+        if file_src.is_symlink() and not within(file_src.resolve(), stage_root):
+            raise PromotionError(f"Invalid promotion source resolution: {src_rel}")
+        file_dst = dst if rel == "." else dst / rel[2:]
+        if not within(resolve_planned(file_dst.parent), user_root):
+            raise PromotionError(f"Invalid promotion destination resolution: {dst_rel}")
+        size = file_src.stat().st_size
+        action = "add"
+        digest = ""
+        if file_dst.is_file():
+            if file_dst.stat().st_size == size:
+                digest = digest_of(file_src, store)
+                action = "unchanged" if digest_of(file_dst, store) == digest else "update"
+            else:
+                action = "update"
+        elif file_dst.exists():
+            raise PromotionError(f"Invalid promotion destination type: {file_dst.relative_to(root).as_posix()}")
+        ops.append({"src": file_src, "dst": file_dst, "action": action, "bytes": size, "sha256": digest})
+    return ops
+
+
+def apply_ops(root: Path, ops: List[Dict[str, Any]], store: Optional[cas.Store] = None) -> List[Dict[str, Any]]:
+    delta: List[Dict[str, Any]] = []
+    for op in ops:
+        dst = op["dst"]
+        if op["action"] != "unchanged":
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            plain_copy(op["src"], dst)
+            # Staged files may be read-only store links; USER/ copies stay editable.
+            mode = dst.stat().st_mode
+            if not mode & stat.S_IWUSR:
+                os.chmod(dst, stat.S_IMODE(mode) | stat.S_IWUSR)
+        digest = op["sha256"] or digest_of(op["src"], store)
+        if store is not None:
+            store.add_ref(dst, digest)
+        delta.append(
+            {
+                "path": dst.relative_to(root).as_posix(),
+                "action": op["action"],
+                "bytes": op["bytes"],
+                "sha256": digest,
+            }
+        )
+    return delta
+
+
+def write_receipt(root: Path, task_id: str, skill: str, targets: List[str], delta: List[Dict[str, Any]]) -> Path:
+    receipt_dir = root / "USER" / "manifest" / "promotion_receipts"
+    receipt_dir.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    receipt = receipt_dir / f"{task_id}_{ts}.json"
+    summary = {action: sum(1 for d in delta if d["action"] == action) for action in ("add", "update", "unchanged")}
+    summary["bytes_written"] = sum(d["bytes"] for d in delta if d["action"] != "unchanged")
+    payload = {
+        "timestamp_utc": ts,
+        "task_id": task_id,
+        "skill": skill,
+        "from": f"GATE/staged/{task_id}",
+        "targets": targets,
+        "summary": summary,
+        "delta": delta,
+    }
+    tmp = receipt.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    tmp.replace(receipt)
+    return receipt
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="promote_apply")
+    parser.add_argument("--root", required=True)
+    parser.add_argument("--task", required=True)
+    args = parser.parse_args()
+
+    root = Path(args.root).resolve()
+    task_id = args.task
+    promote_json = root / "GATE" / "staged" / task_id / "PROMOTE.json"
+
+    try:
+        skill, rows = load_contract(promote_json, task_id)
+    except Exception as exc:
+        print(f"mapping_validation_error: {exc}", file=sys.stderr)
+        print(f"Invalid promotion contract: mapping validation failed: {promote_json}", file=sys.stderr)
+        return 2
+    if not skill:
+        print(f"Invalid promotion contract (missing skill): {promote_json}", file=sys.stderr)
+        return 2
+    if not rows:
+        print(f"Invalid promotion contract (no mappings): {promote_json}", file=sys.stderr)
+        return 2
+
+    with cas.open_store() or nullcontext() as store:
+        try:
+            stage_root = (root / "GATE" / "staged" / task_id).resolve(strict=True)
+            user_root = (root / "USER").resolve(strict=True)
+            plans = [plan_mapping(root, stage_root, user_root, src, dst, store) for src, dst in rows]
+        except (PromotionError, OSError) as exc:
+            print(str(exc), file=sys.stderr)
+            return 2
+
+        delta: List[Dict[str, Any]] = []
+        for ops in plans:
+            delta.extend(apply_ops(root, ops, store))
+    targets = [dst for _, dst in rows]
+    receipt = write_receipt(root, task_id, skill, targets, delta)
+    task_registry.record(root, task_id, promotion="promoted", receipt=receipt.relative_to(root).as_posix())
+
+    for target in targets:
+        print(f"PROMOTED_TARGET={target}")
+    changed = sum(1 for d in delta if d["action"] != "unchanged")
+    print(f"PROMOTED_FILES={changed} UNCHANGED_FILES={len(delta) - changed}")
+    print(f"PROMOTION_RECEIPT={receipt.relative_to(root).as_posix()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
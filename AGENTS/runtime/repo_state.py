@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Repository state for agenthub and skill checks, without walking AGENTS/tasks.
+
+Skills only need to know whether USER/ or GATE/ is dirty, so status() runs
+`git status --porcelain -- USER GATE` (pathspec-limited) with the untracked
+cache enabled and, where git ships a built-in fsmonitor daemon (macOS and
+Windows, git >= 2.36), fsmonitor as well.
+head() reads HEAD from .git directly and caches it per process, falling back
+to `git rev-parse HEAD` for layouts it does not understand. Shell scripts use
+the same flags through repo_state.sh.
+
+  python3 repo_state.py status --root R [PATH ...]   # porcelain lines; rc 2 if not a work tree
+  python3 repo_state.py head --root R
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+SCOPE = ("USER", "GATE")
+
+_HEADS: Dict[str, str] = {}
+_GIT_OPTS: Optional[List[str]] = None
+
+
+def _git_version() -> Tuple[int, ...]:
+    try:
+        words = subprocess.run(["git", "version"], text=True, capture_output=True).stdout.split()
+    except OSError:
+        return ()
+    # "git version 2.39.5" or "git version 2.45.1.windows.1"
+    nums: List[int] = []
+    for part in (words[2] if len(words) > 2 else "").split(".")[:3]:
+        if not part.isdigit():
+            break
+        nums.append(int(part))
+    return tuple(nums)
+
+
+def git_options() -> List[str]:
+    """-c options for status, computed once per process."""
+    global _GIT_OPTS
+    if _GIT_OPTS is None:
+        opts = ["-c", "core.untrackedCache=true"]
+        if sys.platform in {"darwin", "win32"} and _git_version() >= (2, 36):
+            opts += ["-c", "core.fsmonitor=true"]
+        _GIT_OPTS = opts
+    return list(_GIT_OPTS)
+
+
+def status(root: Path, paths: Sequence[str] = SCOPE) -> Optional[List[str]]:
+    """Porcelain status lines under paths, or None if git is missing or root is not a work tree."""
+    cmd = ["git", "-C", str(root), *git_options(), "status", "--porcelain", "--", *paths]
+    try:
+        cp = subprocess.run(cmd, text=True, capture_output=True)
+    except OSError:
+        return None
+    if cp.returncode != 0:
+        return None
+    return cp.stdout.splitlines()
+
+
+def _git_dirs(root: Path) -> Optional[Tuple[Path, Path]]:
+    """(git dir, common dir) for a plain checkout or a linked worktree."""
+    dotgit = root / ".git"
+    if dotgit.is_dir():
+        gitdir = dotgit
+    elif dotgit.is_file():
+        text = dotgit.read_text(encoding="utf-8").strip()
+        if not text.startswith("gitdir:"):
+            return None
+        gitdir = (root / text[len("gitdir:"):].strip()).resolve()
+    else:
+        return None
+    common = gitdir
+    commondir = gitdir / "commondir"
+    if commondir.is_file():
+        common = (gitdir / commondir.read_text(encoding="utf-8").strip()).resolve()
+    return gitdir, common
+
+
+def _read_head(root: Path) -> str:
+    dirs = _git_dirs(root)
+    if dirs is None:
+        return ""
+    gitdir, common = dirs
+    head = (gitdir / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref:"):
+        return head
+    ref = head[len("ref:"):].strip()
+    for base in (gitdir, common):
+        loose = base / ref
+        if loose.is_file():
+            return loose.read_text(encoding="utf-8").strip()
+    packed = common / "packed-refs"
+    if packed.is_file():
+        for line in packed.read_text(encoding="utf-8").splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref and not line.startswith(("#", "^")):
+                return sha
+    return ""
+
+
+def _is_sha(value: str) -> bool:
+    return len(value) in {40, 64} and all(c in "0123456789abcdef" for c in value)
+
+
+def head(root: Path) -> str:
+    """Commit id of HEAD ('' outside a repo or before the first commit), cached per process."""
+    key = str(Path(root).resolve())
+    if key in _HEADS:
+        return _HEADS[key]
+    try:
+        sha = _read_head(Path(key))
+    except OSError:
+        sha = ""
+    if not _is_sha(sha):
+        try:
+            cp = subprocess.run(["git", "rev-parse", "--verify", "-q", "HEAD"], cwd=key, text=True, capture_output=True)
+            sha = cp.stdout.strip() if cp.returncode == 0 else ""
+        except OSError:
+            sha = ""
+    _HEADS[key] = sha
+    return sha
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="repo_state")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    ps = sub.add_parser("status", help="Porcelain status limited to PATHs (default: USER GATE).")
+    ps.add_argument("--root", required=True)
+    ps.add_argument("paths", nargs="*")
+    ph = sub.add_parser("head", help="Print the commit id of HEAD.")
+    ph.add_argument("--root", required=True)
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    if args.cmd == "head":
+        print(head(root))
+        return 0
+    lines = status(root, args.paths or SCOPE)
+    if lines is None:
+        print("ERROR=git not available or repo missing", file=sys.stderr)
+        return 2
+    for line in lines:
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,38 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Scoped git status for skill scripts; same flags as repo_state.py.
+# usage: repo_status <root> [path ...]    # porcelain lines under path (default: USER GATE)
+# Returns 2 without output if git is missing or <root> is not a work tree.
+# REPO_STATUS_CMD holds the last command run, for command logs.
+
+REPO_GIT_OPTS=()
+REPO_STATUS_CMD=""
+
+repo_git_opts() {
+  [[ ${#REPO_GIT_OPTS[@]} -gt 0 ]] && return 0
+  REPO_GIT_OPTS=(-c core.untrackedCache=true)
+  case "$(uname -s 2>/dev/null)" in
+    Darwin|MINGW*|MSYS*|CYGWIN*)
+      local ver major minor
+      ver="$(git version 2>/dev/null | awk '{print $3}')"
+      IFS=. read -r major minor _ <<< "${ver:-0.0}"
+      if [[ "$major" =~ ^[0-9]+$ && "$minor" =~ ^[0-9]+$ ]] && (( major > 2 || (major == 2 && minor >= 36) )); then
+        REPO_GIT_OPTS+=(-c core.fsmonitor=true)
+      fi
+      ;;
+  esac
+}
+
+repo_status() {
+  local root="$1"
+  shift
+  [[ $# -gt 0 ]] || set -- USER GATE
+  command -v git >/dev/null 2>&1 || return 2
+  repo_git_opts
+  local cmd=(git -C "$root" "${REPO_GIT_OPTS[@]}" status --porcelain -- "$@")
+  REPO_STATUS_CMD="${cmd[*]}"
+  local out
+  out="$("${cmd[@]}" 2>/dev/null)" || return 2
+  [[ -z "$out" ]] || printf '%s\n' "$out"
+}
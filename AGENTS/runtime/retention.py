@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""Retention for finished tasks: pack AGENTS/tasks/<id> and GATE/staged/<id> into one archive.
+
+Candidates come from the task registry (task_registry.py) and are selected by
+last activity, state and promotion status; only finished tasks (completed or
+failed) qualify. Each archive is a tar stream, compressed with zstd when the
+optional `zstandard` module is installed and gzip otherwise, that starts with
+a manifest.json (path, sha256, size, mode, mtime per file) followed by one
+blobs/<sha256> member per distinct content, so the staged copy of a task's
+outputs costs nothing extra. The archive is read back and verified before the
+trees are removed; the task directory keeps meta.json and an ARCHIVED.json
+stub, and agenthub commands that take --task restore it on first use.
+
+Archives live in AGENTS/archive (TASK_ARCHIVE_DIR overrides).
+"""
+import hashlib
+import io
+import json
+import os
+import shutil
+import stat
+import tarfile
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import jsonio
+import task_registry
+from tree_sync import sha256_file
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+ARCHIVE_VERSION = 1
+DEFAULT_ARCHIVE_ROOT = Path(__file__).resolve().parents[1] / "archive"
+FINISHED_STATES = ["completed", "failed"]
+KEEP_FILES = ["meta.json"]
+ZSTD_LEVEL = 10
+
+
+class RetentionError(RuntimeError):
+    pass
+
+
+@dataclass
+class Candidate:
+    task_id: str
+    skill: str
+    state: str
+    promotion: str
+    last_activity: str
+    row: Dict[str, Any] = field(default_factory=dict)
+
+
+def archive_root_from_env() -> Path:
+    raw = os.environ.get("TASK_ARCHIVE_DIR", "").strip()
+    return Path(raw) if raw else DEFAULT_ARCHIVE_ROOT
+
+
+def archive_suffix() -> str:
+    return ".tar.zst" if zstandard is not None else ".tar.gz"
+
+
+def stub_path(root: Path, task_id: str) -> Path:
+    return root / "AGENTS" / "tasks" / task_id / task_registry.ARCHIVE_STUB
+
+
+def is_archived(root: Path, task_id: str) -> bool:
+    return stub_path(root, task_id).is_file()
+
+
+def task_trees(root: Path, task_id: str) -> List[str]:
+    """Repo-relative roots packed for a task."""
+    rels = [f"AGENTS/tasks/{task_id}", f"GATE/staged/{task_id}"]
+    return [r for r in rels if (root / r).is_dir()]
+
+
+def iter_entries(root: Path, rel: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """(repo-relative path, lstat) for rel and everything below it, parents first."""
+    base = root / rel
+    yield rel, os.lstat(base)
+    for dirpath, dirnames, filenames in os.walk(base):
+        dirnames.sort()
+        drel = Path(dirpath).relative_to(root).as_posix()
+        for name in dirnames + sorted(filenames):
+            path = f"{drel}/{name}"
+            yield path, os.lstat(root / path)
+
+
+def build_manifest(root: Path, task_id: str) -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    for rel in task_trees(root, task_id):
+        for path, st in iter_entries(root, rel):
+            if stat.S_ISDIR(st.st_mode):
+                entries.append(
+                    {"path": path, "type": "dir", "mode": stat.S_IMODE(st.st_mode), "mtime_ns": st.st_mtime_ns}
+                )
+            elif stat.S_ISLNK(st.st_mode):
+                entries.append(
+                    {"path": path, "type": "symlink", "target": os.readlink(root / path), "mtime_ns": st.st_mtime_ns}
+                )
+            elif stat.S_ISREG(st.st_mode):
+                entries.append(
+                    {
+                        "path": path,
+                        "type": "file",
+                        "sha256": sha256_file(root / path),
+                        "size": st.st_size,
+                        "mode": stat.S_IMODE(st.st_mode),
+                        "mtime_ns": st.st_mtime_ns,
+                    }
+                )
+    return entries
+
+
+def usage(root: Path, task_id: str, hash_files: bool) -> Tuple[int, int, int]:
+    """(files, bytes, unique content bytes); unique bytes equal bytes unless hash_files."""
+    files = total = 0
+    seen: Set[Any] = set()
+    unique = 0
+    for rel in task_trees(root, task_id):
+        for path, st in iter_entries(root, rel):
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            files += 1
+            total += st.st_size
+            key = sha256_file(root / path) if hash_files else (st.st_dev, st.st_ino)
+            if key not in seen:
+                seen.add(key)
+                unique += st.st_size
+    return files, total, unique
+
+
+def select(
+    root: Path,
+    older_than_days: float,
+    states: Sequence[str] = FINISHED_STATES,
+    promotion: Optional[str] = None,
+    task_ids: Sequence[str] = (),
+) -> List[Candidate]:
+    bad = [s for s in states if s not in FINISHED_STATES]
+    if bad:
+        raise RetentionError(f"only finished tasks can be archived, not: {', '.join(bad)}")
+    path = task_registry.registry_path_from_env()
+    if path is not None:
+        with closing(task_registry.connect(path)) as conn:
+            task_registry.sync(conn, root)
+            rows = task_registry.query(conn, states=states, promotion=promotion)
+    else:
+        tasks_root = root / "AGENTS" / "tasks"
+        names = sorted(p.name for p in tasks_root.iterdir() if p.is_dir()) if tasks_root.is_dir() else []
+        rows = [task_registry.scan_task(root, name) for name in names]
+        rows = [r for r in rows if r.get("state") in states and (promotion is None or r.get("promotion") == promotion)]
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    wanted = set(task_ids)
+    out: List[Candidate] = []
+    for row in rows:
+        task_id = str(row["task_id"])
+        if wanted and task_id not in wanted:
+            continue
+        if row.get("archive") or is_archived(root, task_id):
+            continue
+        last = max(str(row.get("updated_at") or ""), str(row.get("created_at") or ""))
+        if not last or last > cutoff:
+            continue
+        out.append(
+            Candidate(
+                task_id=task_id,
+                skill=str(row.get("skill", "")),
+                state=str(row.get("state", "")),
+                promotion=str(row.get("promotion", "none")),
+                last_activity=last,
+                row={k: v for k, v in row.items() if k not in {"task_id", "archive"}},
+            )
+        )
+    return out
+
+
+def _open_write(path: Path) -> Tuple[tarfile.TarFile, List[IO[bytes]]]:
+    fh = path.open("wb")
+    if zstandard is not None:
+        stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).stream_writer(fh, closefd=False)
+        return tarfile.open(fileobj=stream, mode="w|"), [stream, fh]
+    return tarfile.open(fileobj=fh, mode="w|gz"), [fh]
+
+
+def _open_read(path: Path) -> Tuple[tarfile.TarFile, List[IO[bytes]]]:
+    fh = path.open("rb")
+    if path.name.endswith(".tar.zst"):
+        if zstandard is None:
+            fh.close()
+            raise RetentionError(f"{path.name} needs the zstandard module")
+        stream = zstandard.ZstdDecompressor().stream_reader(fh, closefd=False)
+        return tarfile.open(fileobj=stream, mode="r|"), [stream, fh]
+    return tarfile.open(fileobj=fh, mode="r|gz"), [fh]
+
+
+def _close(tar: tarfile.TarFile, handles: List[IO[bytes]]) -> None:
+    tar.close()
+    for h in handles:
+        h.close()
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def write_archive(root: Path, path: Path, header: Dict[str, Any], entries: List[Dict[str, Any]]) -> None:
+    tar, handles = _open_write(path)
+    try:
+        _add_bytes(tar, "manifest.json", json.dumps({**header, "entries": entries}, indent=2).encode("utf-8"))
+        written: Set[str] = set()
+        for e in entries:
+            if e["type"] != "file" or e["sha256"] in written:
+                continue
+            written.add(e["sha256"])
+            info = tarfile.TarInfo(f"blobs/{e['sha256']}")
+            info.size = e["size"]
+            with (root / e["path"]).open("rb") as src:
+                tar.addfile(info, src)
+    finally:
+        _close(tar, handles)
+
+
+def iter_archive(path: Path) -> Iterator[Tuple[Dict[str, Any], Optional[str], Optional[IO[bytes]]]]:
+    """Yield (manifest, None, None) first, then (manifest, sha256, blob stream) per blob."""
+    tar, handles = _open_read(path)
+    try:
+        manifest: Optional[Dict[str, Any]] = None
+        for member in tar:
+            data = tar.extractfile(member)
+            if member.name == "manifest.json" and manifest is None and data is not None:
+                manifest = json.loads(data.read().decode("utf-8"))
+                yield manifest, None, None
+            elif manifest is not None and member.name.startswith("blobs/") and data is not None:
+                yield manifest, member.name[len("blobs/") :], data
+            else:
+                raise RetentionError(f"unexpected member {member.name} in {path.name}")
+    finally:
+        _close(tar, handles)
+
+
+def verify(path: Path) -> Dict[str, Any]:
+    """Re-read an archive end to end; every manifest hash must be present and match."""
+    manifest: Dict[str, Any] = {}
+    found: Set[str] = set()
+    for manifest, sha, data in iter_archive(path):
+        if data is None:
+            continue
+        h = hashlib.sha256()
+        for chunk in iter(lambda: data.read(1 << 20), b""):
+            h.update(chunk)
+        if h.hexdigest() != sha:
+            raise RetentionError(f"blob {sha} is corrupt in {path.name}")
+        found.add(sha)
+    if not manifest:
+        raise RetentionError(f"{path.name} has no manifest")
+    missing = {e["sha256"] for e in manifest["entries"] if e["type"] == "file"} - found
+    if missing:
+        raise RetentionError(f"{path.name} is missing {len(missing)} blobs")
+    return manifest
+
+
+def archive_task(root: Path, task_id: str, archive_dir: Path, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Pack, verify, then replace the task's trees with a stub; returns size statistics."""
+    entries = build_manifest(root, task_id)
+    files = [e for e in entries if e["type"] == "file"]
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    final = archive_dir / f"{task_id}{archive_suffix()}"
+    tmp = archive_dir / f".{task_id}.tmp.{os.getpid()}{archive_suffix()}"
+    header = {"version": ARCHIVE_VERSION, "task_id": task_id, "created_at": task_registry.now_utc(), "task": row}
+    try:
+        write_archive(root, tmp, header, entries)
+        verify(tmp)
+        os.replace(tmp, final)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+    try:
+        archive_rel = final.relative_to(root).as_posix()
+    except ValueError:
+        archive_rel = str(final)
+    tdir = root / "AGENTS" / "tasks" / task_id
+    kept = {name: (tdir / name).read_bytes() for name in KEEP_FILES if (tdir / name).is_file()}
+    for rel in task_trees(root, task_id):
+        shutil.rmtree(root / rel)
+    tdir.mkdir(parents=True, exist_ok=True)
+    for name, data in kept.items():
+        (tdir / name).write_bytes(data)
+    stats = {
+        "files": len(files),
+        "bytes": sum(e["size"] for e in files),
+        "unique_bytes": sum(e["size"] for e in {e["sha256"]: e for e in files}.values()),
+        "archive_bytes": final.stat().st_size,
+    }
+    jsonio.write_json(
+        tdir / task_registry.ARCHIVE_STUB,
+        {"task_id": task_id, "archive": archive_rel, "archived_at": header["created_at"], "task": row, **stats},
+    )
+    task_registry.record(root, task_id, archive=archive_rel)
+    return {**stats, "archive": archive_rel}
+
+
+def _safe_target(root: Path, rel: str, task_id: str) -> Path:
+    allowed = (f"AGENTS/tasks/{task_id}", f"GATE/staged/{task_id}")
+    if not any(rel == a or rel.startswith(a + "/") for a in allowed) or ".." in Path(rel).parts:
+        raise RetentionError(f"archive entry outside the task: {rel}")
+    return root / rel
+
+
+def restore_task(root: Path, task_id: str) -> str:
+    """Unpack an archived task back into place and drop its archive; returns the archive path."""
+    stub = jsonio.read_json(stub_path(root, task_id))
+    archive = Path(str(stub["archive"]))
+    archive = archive if archive.is_absolute() else root / archive
+    if not archive.is_file():
+        raise RetentionError(f"archive for {task_id} not found: {archive}")
+    first: Dict[str, Path] = {}
+    by_sha: Dict[str, List[Dict[str, Any]]] = {}
+    manifest: Dict[str, Any] = {}
+    for manifest, sha, data in iter_archive(archive):
+        if data is None:
+            for e in manifest["entries"]:
+                target = _safe_target(root, e["path"], task_id)
+                if e["type"] == "dir":
+                    target.mkdir(parents=True, exist_ok=True)
+                elif e["type"] == "symlink":
+                    if target.is_symlink() or target.exists():
+                        target.unlink()
+                    os.symlink(e["target"], target)
+                    os.utime(target, ns=(e["mtime_ns"], e["mtime_ns"]), follow_symlinks=False)
+            for e in manifest["entries"]:
+                if e["type"] == "file":
+                    by_sha.setdefault(e["sha256"], []).append(e)
+            continue
+        for i, e in enumerate(by_sha.get(sha or "", [])):
+            target = _safe_target(root, e["path"], task_id)
+            if i == 0:
+                with target.open("wb") as out:
+                    shutil.copyfileobj(data, out, 1 << 20)
+                first[sha or ""] = target
+            else:
+                shutil.copyfile(first[sha or ""], target)
+            os.chmod(target, e["mode"])
+            os.utime(target, ns=(e["mtime_ns"], e["mtime_ns"]))
+    stub_path(root, task_id).unlink()
+    # Deepest directories first, so setting a parent's mtime is not undone by its children.
+    for e in reversed(manifest["entries"]):
+        if e["type"] == "dir":
+            target = _safe_target(root, e["path"], task_id)
+            os.chmod(target, e["mode"])
+            os.utime(target, ns=(e["mtime_ns"], e["mtime_ns"]))
+    archive.unlink()
+    task_registry.record(root, task_id, archive="")
+    return str(stub["archive"])
+
+
+def ensure_restored(root: Path, task_id: str) -> Optional[str]:
+    """Restore task_id if it is archived; returns the archive it came from, else None."""
+    if not task_id or not is_archived(root, task_id):
+        return None
+    return restore_task(root, task_id)
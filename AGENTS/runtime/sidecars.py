@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Binary sidecars of compute backend payloads.
+
+A backend that produces large arrays writes them next to its payload instead
+of inlining them, and lists them in backend_payload.json:
+
+  "sidecars": {
+    "field": {"path": "sidecars/field.npy", "format": "npy"},
+    "trace": {"path": "sidecars/trace.bin", "format": "raw", "dtype": "<f8", "shape": [1000, 3]},
+    "table": {"path": "sidecars/table.arrow", "format": "arrow"}
+  }
+
+Paths are relative to the payload's directory (outputs/compute; the runner
+exports COMPUTE_SIDECAR_DIR for convenience) and must stay inside it. npy and
+raw little-endian blobs are memory-mapped and reduced in fixed-size chunks
+(NumPy when installed, memoryview otherwise), so summaries never hold the
+array in memory; Arrow IPC files are summarized when pyarrow is installed.
+result.json gets one record per sidecar: format, dtype, shape, bytes, sha256
+and the summary.
+"""
+import ast
+import hashlib
+import math
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pa_ipc = None
+
+FORMATS = ("npy", "raw", "arrow")
+CHUNK_ITEMS = 1 << 20
+NPY_MAGIC = b"\x93NUMPY"
+# Little-endian dtype codes the memoryview fallback can reduce.
+MEMORYVIEW_CODES = {
+    "b1": "?", "i1": "b", "u1": "B", "i2": "h", "u2": "H", "i4": "i", "u4": "I",
+    "i8": "q", "u8": "Q", "f4": "f", "f8": "d",
+}
+DTYPE_ALIASES = {
+    "bool": "|b1", "int8": "|i1", "uint8": "|u1", "int16": "<i2", "uint16": "<u2", "int32": "<i4",
+    "uint32": "<u4", "int64": "<i8", "uint64": "<u8", "float32": "<f4", "float64": "<f8",
+}
+
+
+class SidecarError(ValueError):
+    pass
+
+
+def normalize_dtype(dtype: str) -> str:
+    dtype = DTYPE_ALIASES.get(dtype, dtype)
+    if len(dtype) == 2:
+        dtype = ("|" if dtype[1] == "1" else "<") + dtype
+    if len(dtype) != 3 or dtype[0] not in "<|=" or dtype[1:] not in MEMORYVIEW_CODES:
+        raise SidecarError(f"unsupported dtype {dtype!r} (little-endian bool/int/uint/float only)")
+    return dtype
+
+
+def read_npy_header(path: Path) -> Tuple[str, List[int], int]:
+    """(dtype, shape, data offset) of a .npy file, without loading it."""
+    with path.open("rb") as f:
+        if f.read(6) != NPY_MAGIC:
+            raise SidecarError("not a .npy file")
+        major = f.read(2)[0]
+        size_fmt = "<H" if major == 1 else "<I"
+        (hlen,) = struct.unpack(size_fmt, f.read(struct.calcsize(size_fmt)))
+        header = ast.literal_eval(f.read(hlen).decode("latin1"))
+        offset = f.tell()
+    if header.get("fortran_order"):
+        raise SidecarError("fortran-ordered .npy is not supported")
+    return normalize_dtype(header["descr"]), list(header["shape"]), offset
+
+
+def resolve_path(base_dir: Path, ref: Dict[str, Any]) -> Path:
+    raw = str(ref.get("path", "")).strip()
+    if not raw:
+        raise SidecarError("missing path")
+    base = base_dir.resolve()
+    path = (base / raw).resolve()
+    if base not in path.parents:
+        raise SidecarError(f"path escapes {base_dir}: {raw}")
+    if not path.is_file():
+        raise SidecarError(f"file not found: {raw}")
+    return path
+
+
+def _reduce_chunks(chunks) -> Dict[str, Any]:
+    count = nonfinite = 0
+    lo = hi = None
+    total = 0.0
+    for chunk in chunks:
+        n, bad, cmin, cmax, csum = chunk
+        count += n
+        nonfinite += bad
+        if cmin is not None:
+            lo = cmin if lo is None else min(lo, cmin)
+            hi = cmax if hi is None else max(hi, cmax)
+            total += csum
+    finite = count - nonfinite
+    return {
+        "count": count,
+        "nonfinite": nonfinite,
+        "min": lo,
+        "max": hi,
+        "mean": total / finite if finite else None,
+    }
+
+
+def _numpy_chunks(arr):
+    flat = arr.reshape(-1)
+    for start in range(0, flat.size, CHUNK_ITEMS):
+        part = flat[start : start + CHUNK_ITEMS]
+        if part.dtype.kind == "f":
+            ok = np.isfinite(part)
+            good = part[ok]
+            bad = int(part.size - good.size)
+        else:
+            good = part
+            bad = 0
+        if good.size:
+            yield int(part.size), bad, good.min().item(), good.max().item(), float(good.sum(dtype=np.float64))
+        else:
+            yield int(part.size), bad, None, None, 0.0
+
+
+def _memoryview_chunks(view: memoryview):
+    for start in range(0, len(view), CHUNK_ITEMS):
+        part = view[start : start + CHUNK_ITEMS]
+        good = [v for v in part if not (isinstance(v, float) and not math.isfinite(v))]
+        if good:
+            yield len(part), len(part) - len(good), min(good), max(good), float(sum(good))
+        else:
+            yield len(part), len(part), None, None, 0.0
+
+
+def summarize_array(path: Path, dtype: str, shape: List[int], offset: int) -> Dict[str, Any]:
+    """Chunked count/min/max/mean/nonfinite of a memory-mapped little-endian array."""
+    itemsize = int(dtype[2:])
+    count = math.prod(shape)
+    need = offset + count * itemsize
+    size = path.stat().st_size
+    if size < need:
+        raise SidecarError(f"file has {size} bytes, shape {shape} of {dtype} needs {need}")
+    if count == 0:
+        return _reduce_chunks([])
+    if np is not None:
+        arr = np.memmap(path, dtype=np.dtype(dtype), mode="r", offset=offset, shape=(count,))
+        try:
+            return _reduce_chunks(_numpy_chunks(arr))
+        finally:
+            del arr
+    if sys.byteorder != "little":
+        raise SidecarError("summaries without NumPy need a little-endian host")
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        raw = memoryview(mm)[offset : offset + count * itemsize]
+        view = raw.cast(MEMORYVIEW_CODES[dtype[1:]])
+        try:
+            return _reduce_chunks(_memoryview_chunks(view))
+        finally:
+            view.release()
+            raw.release()
+
+
+def summarize_arrow(path: Path) -> Tuple[Dict[str, Any], List[int]]:
+    if pa_ipc is None:
+        return {"skipped": "pyarrow not installed"}, []
+    with pa.memory_map(str(path), "r") as source:
+        table = pa_ipc.open_file(source).read_all()
+        columns = [{"name": f.name, "type": str(f.type)} for f in table.schema]
+        return {"rows": table.num_rows, "columns": columns}, [table.num_rows, table.num_columns]
+
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def describe(base_dir: Path, name: str, ref: Dict[str, Any]) -> Dict[str, Any]:
+    """Result record for one sidecar reference; raises SidecarError when it is unusable."""
+    if not isinstance(ref, dict):
+        raise SidecarError("reference must be an object with path and format")
+    fmt = str(ref.get("format", "")).lower()
+    if fmt not in FORMATS:
+        raise SidecarError(f"unsupported format {fmt!r} (expected one of {', '.join(FORMATS)})")
+    path = resolve_path(base_dir, ref)
+    if fmt == "npy":
+        dtype, shape, offset = read_npy_header(path)
+        summary = summarize_array(path, dtype, shape, offset)
+    elif fmt == "raw":
+        dtype = normalize_dtype(str(ref.get("dtype", "")))
+        shape = [int(x) for x in ref.get("shape", [])]
+        if not shape:
+            raise SidecarError("raw sidecars need dtype and shape")
+        summary = summarize_array(path, dtype, shape, int(ref.get("offset", 0)))
+    else:
+        dtype = "arrow"
+        summary, shape = summarize_arrow(path)
+    return {
+        "name": name,
+        "path": path.relative_to(base_dir.resolve()).as_posix(),
+        "format": fmt,
+        "dtype": dtype,
+        "shape": shape,
+        "bytes": path.stat().st_size,
+        "sha256": sha256_file(path),
+        "summary": summary,
+    }
+
+
+def collect(base_dir: Path, payload: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Sidecar records and failed sanity checks for the payload's "sidecars" map."""
+    refs = payload.get("sidecars", {}) if isinstance(payload, dict) else {}
+    records: List[Dict[str, Any]] = []
+    failures: List[Dict[str, Any]] = []
+    if not isinstance(refs, dict):
+        failures.append({"name": "sidecars", "passed": False, "detail": "sidecars must map names to references"})
+        return records, failures
+    for name, ref in refs.items():
+        try:
+            records.append(describe(base_dir, str(name), ref))
+        except (SidecarError, OSError, ValueError, KeyError, SyntaxError) as exc:
+            failures.append({"name": f"sidecar:{name}", "passed": False, "detail": str(exc)})
+    return records, failures
+
+
+def sidecar_paths(base_dir: Path, records: Optional[List[Dict[str, Any]]]) -> List[Path]:
+    return [base_dir / r["path"] for r in records or [] if isinstance(r, dict) and r.get("path")]
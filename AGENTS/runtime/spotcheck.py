@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""Numeric verification of multistep plan results, with proofs only as a fallback.
+
+Each step is checked against its input expression by the relation its
+operation implies:
+
+  equal           Together, Simplify, FullSimplify, Refine, Factor, Apart,
+                  Expand, FunctionExpand, TrigReduce: result == input
+  antiderivative  Integrate: D[result, x] == input
+  derivative      D: result == D[input, x]
+  residual        Solve: input /. solution == 0
+
+Both sides are evaluated at many random sample points in one vectorized
+batch (NumPy; mpmath point by point when NumPy is missing), with sample
+domains following the simple assumptions (x>0 samples positive x). A
+verdict needs enough finite samples: all within tolerance -> True, a clear
+share beyond it -> False, anything else is inconclusive. Only inconclusive
+steps get a symbolic proof (SymPy simplify in-process, or FullSimplify
+through the Wolfram backend for Wolfram runs, all steps in one kernel
+session). Needs SymPy to parse step results; without it every step goes
+straight to the proof.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from sympy_engine import STEP_RE, available as sympy_available, parse_assumptions, parse_wl, sp, variable
+
+try:
+    import numpy as np
+except ImportError:  # mpmath fallback below
+    np = None
+
+DEFAULT_POINTS = 64
+DEFAULT_RTOL = 1e-8
+DEFAULT_ATOL = 1e-10
+MIN_VALID_SHARE = 0.25
+MISMATCH_SHARE = 0.1
+EQUAL_OPS = {"Together", "Simplify", "FullSimplify", "Refine", "Factor", "Apart", "Expand", "FunctionExpand", "TrigReduce"}
+DOMAINS = {
+    "positive": (0.1, 3.0),
+    "nonnegative": (0.0, 3.0),
+    "negative": (-3.0, -0.1),
+    "nonpositive": (-3.0, 0.0),
+}
+PROOF_WL = """jobs = Import[Environment["PROOF_JOBS"], "RawJSON"];
+assumptionText = Environment["PROOF_ASSUMPTIONS"];
+assumptions = If[StringLength[assumptionText] > 0, Quiet@Check[ToExpression[assumptionText], True], True];
+limit = ToExpression[Environment["PROOF_TIME_LIMIT"]];
+Do[
+  job = jobs[[i]];
+  r = Quiet@Check[TimeConstrained[FullSimplify[ToExpression[job["lhs"]] == ToExpression[job["rhs"]], assumptions], limit, "timeout"], "error"];
+  Print["PROOF ", i, " ", ToString[r, InputForm]],
+  {i, Length[jobs]}
+];
+"""
+PROOF_LINE_RE = re.compile(r"^PROOF (\d+) (\S+)$", re.MULTILINE)
+
+
+def relation_for(op: str) -> str:
+    if op in EQUAL_OPS:
+        return "equal"
+    return {"Integrate": "antiderivative", "D": "derivative", "Solve": "residual"}.get(op, "none")
+
+
+def step_op(step: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    m = STEP_RE.match(str(step.get("wl_code", "")))
+    return (m.group(1), m.group(4)) if m else ("", None)
+
+
+def sample_columns(symbols: List[Any], flags: Dict[str, Dict[str, bool]], n: int, seed: int) -> List[List[float]]:
+    rng = random.Random(seed)
+    cols = []
+    for s in symbols:
+        kind = next((k for k in DOMAINS if flags.get(s.name, {}).get(k)), "")
+        lo, hi = DOMAINS.get(kind, (-3.0, 3.0))
+        if flags.get(s.name, {}).get("integer"):
+            cols.append([float(rng.randint(int(lo), int(hi))) for _ in range(n)])
+        else:
+            cols.append([rng.uniform(lo, hi) for _ in range(n)])
+    return cols
+
+
+def evaluate(expr: Any, symbols: List[Any], cols: List[List[float]], n: int) -> Tuple[Any, str]:
+    """expr at every sample point (NaN where undefined): one NumPy call, or mpmath point by point."""
+    if np is not None:
+        fn = sp.lambdify(symbols, expr, modules="numpy")
+        with np.errstate(all="ignore"):
+            try:
+                return np.broadcast_to(np.asarray(fn(*[np.asarray(c, dtype=complex) for c in cols]), dtype=complex), (n,)), "numpy"
+            except (TypeError, ValueError, NameError, AttributeError, ZeroDivisionError, OverflowError):
+                return np.full(n, np.nan, dtype=complex), "numpy"
+    import mpmath
+
+    fn = sp.lambdify(symbols, expr, modules="mpmath")
+    out: List[complex] = []
+    for i in range(n):
+        try:
+            out.append(complex(fn(*[mpmath.mpc(c[i]) for c in cols])))
+        except (TypeError, ValueError, NameError, AttributeError, ZeroDivisionError, OverflowError):
+            out.append(complex("nan"))
+    return out, "mpmath"
+
+
+def mismatch_counts(a: Any, b: Any, rtol: float, atol: float) -> Tuple[int, int, float]:
+    """(evaluated, mismatched, max_abs_err) over the points where both sides are finite."""
+    if np is not None and isinstance(a, np.ndarray):
+        ok = np.isfinite(a) & np.isfinite(b)
+        if not ok.any():
+            return 0, 0, 0.0
+        err = np.abs(a[ok] - b[ok])
+        tol = atol + rtol * np.maximum(np.abs(a[ok]), np.abs(b[ok]))
+        return int(ok.sum()), int((err > tol).sum()), float(err.max())
+    evaluated = mismatched = 0
+    max_err = 0.0
+    for x, y in zip(a, b):
+        if not (x == x and y == y and abs(x) != float("inf") and abs(y) != float("inf")):
+            continue
+        evaluated += 1
+        err = abs(x - y)
+        max_err = max(max_err, err)
+        mismatched += err > atol + rtol * max(abs(x), abs(y))
+    return evaluated, mismatched, max_err
+
+
+def compare(lhs: Any, rhs: Any, flags: Dict[str, Dict[str, bool]], points: int, rtol: float, atol: float, seed: int) -> Dict[str, Any]:
+    symbols = sorted((lhs.free_symbols | rhs.free_symbols), key=lambda s: s.name)
+    cols = sample_columns(symbols, flags, points, seed)
+    a, backend = evaluate(lhs, symbols, cols, points)
+    b, _ = evaluate(rhs, symbols, cols, points)
+    evaluated, mismatched, max_err = mismatch_counts(a, b, rtol, atol)
+    if evaluated < max(4, int(points * MIN_VALID_SHARE)):
+        verdict = "inconclusive"
+    elif mismatched == 0:
+        verdict = "equal"
+    elif mismatched >= max(2, int(evaluated * MISMATCH_SHARE)):
+        verdict = "different"
+    else:
+        verdict = "inconclusive"
+    return {"verdict": verdict, "points": points, "evaluated": evaluated, "mismatched": mismatched,
+            "max_abs_err": max_err, "backend": backend}
+
+
+def sides(relation: str, result: Any, expr: Any, var: Any) -> List[Tuple[Any, Any]]:
+    """(lhs, rhs) pairs that must agree for the step to be correct."""
+    if relation == "equal":
+        return [(result, expr)]
+    if relation == "antiderivative":
+        return [(sp.diff(result, var), expr)]
+    if relation == "derivative":
+        return [(result, sp.diff(expr, var))]
+    if relation == "residual":
+        sols = result if isinstance(result, list) else [result]
+        return [(expr.subs(sol), sp.Integer(0)) for sol in sols if isinstance(sol, dict)]
+    return []
+
+
+def parse_result(text: str, assumptions: str) -> Any:
+    """Step result in InputForm -> SymPy; Solve results {{x -> a}, ...} become a list of dicts."""
+    text = text.strip()
+    if text.startswith("{") and "->" in text:
+        sols = []
+        for group in text.strip("{}").split("}, {"):
+            sol = {}
+            for rule in group.strip("{} ").split(","):
+                lhs, _, rhs = rule.partition("->")
+                sol[parse_wl(lhs.strip(), assumptions)[0]] = parse_wl(rhs.strip(), assumptions)[0]
+            sols.append(sol)
+        return sols
+    return parse_wl(text, assumptions)[0]
+
+
+def sympy_proof(pairs: List[Tuple[Any, Any]]) -> str:
+    """"True" when simplify reduces every difference to 0; a failed simplification proves nothing."""
+    try:
+        return "True" if pairs and all(sp.simplify(lhs - rhs) == 0 for lhs, rhs in pairs) else "unknown"
+    except Exception:  # proof attempts may hit NotImplementedError and friends
+        return "unknown"
+
+
+def proof_sides(result: str, expr_text: str, relation: str, var: str) -> Tuple[str, str]:
+    """InputForm (lhs, rhs) that FullSimplify must show equal; ("", "") when the relation has none."""
+    return {
+        "equal": (f"({result})", f"({expr_text})"),
+        "antiderivative": (f"D[({result}), {var}]", f"({expr_text})"),
+        "derivative": (f"({result})", f"D[({expr_text}), {var}]"),
+    }.get(relation, ("", ""))
+
+
+def wolfram_proofs(jobs: List[Tuple[str, str]], assumptions: str, time_limit: float) -> List[str]:
+    """FullSimplify every (lhs, rhs) in one kernel session; "True"/"False"/"unknown" per job."""
+    from wolfram_backend import resolve
+
+    answers = ["unknown"] * len(jobs)
+    backend = resolve()
+    todo = [i for i, (lhs, _) in enumerate(jobs) if lhs]
+    if backend is None or not todo:
+        return answers
+    with tempfile.TemporaryDirectory(prefix="spotcheck_proof_") as tmp:
+        script = Path(tmp) / "proof.wl"
+        script.write_text(PROOF_WL, encoding="utf-8")
+        jobs_path = Path(tmp) / "jobs.json"
+        jobs_path.write_text(json.dumps([{"lhs": jobs[i][0], "rhs": jobs[i][1]} for i in todo]), encoding="utf-8")
+        env = dict(os.environ, PROOF_JOBS=str(jobs_path), PROOF_ASSUMPTIONS=assumptions.replace(",", " &&"),
+                   PROOF_TIME_LIMIT=str(time_limit))
+        for key in ("STEP_OUTPUT_JSON", "RESULT_JSON", "COMPUTE_BACKEND_OUTPUT"):
+            env.pop(key, None)
+        try:
+            proc = subprocess.run(backend.command(script), env=env, capture_output=True, text=True,
+                                  timeout=time_limit * len(todo) + 30)
+            stdout = proc.stdout
+        except (OSError, subprocess.TimeoutExpired):
+            stdout = ""
+    for m in PROOF_LINE_RE.finditer(stdout):
+        k = int(m.group(1)) - 1
+        if 0 <= k < len(todo) and m.group(2) in ("True", "False"):
+            answers[todo[k]] = m.group(2)
+    return answers
+
+
+def verify(
+    op: str,
+    var_name: Optional[str],
+    expr_text: str,
+    result: Any,
+    assumptions: str = "",
+    points: int = DEFAULT_POINTS,
+    rtol: float = DEFAULT_RTOL,
+    atol: float = DEFAULT_ATOL,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Numeric verdict for one step; result is a SymPy value or an InputForm string."""
+    t0 = time.perf_counter()
+    relation = relation_for(op)
+    info: Dict[str, Any] = {"relation": relation, "method": "none", "verdict": "not_applicable"}
+    if relation == "none":
+        return info
+    flags, _ = parse_assumptions(assumptions)
+    try:
+        expr, local, _ = parse_wl(expr_text, assumptions)
+        value = parse_result(result, assumptions) if isinstance(result, str) else result
+        pairs = sides(relation, value, expr, variable(expr, local, var_name))
+    except Exception:  # unparseable InputForm (ConditionalExpression, Root, ...) -> proof
+        pairs = []
+    info["method"] = "numeric"
+    checks = [compare(lhs, rhs, flags, points, rtol, atol, seed + i) for i, (lhs, rhs) in enumerate(pairs)]
+    if not checks:
+        info.update(verdict="inconclusive", evaluated=0)
+    else:
+        verdicts = {c["verdict"] for c in checks}
+        verdict = "different" if "different" in verdicts else "inconclusive" if "inconclusive" in verdicts else "equal"
+        info.update(
+            verdict=verdict,
+            points=sum(c["points"] for c in checks),
+            evaluated=sum(c["evaluated"] for c in checks),
+            max_abs_err=max(c["max_abs_err"] for c in checks),
+            backend=checks[0]["backend"],
+        )
+    info["pairs"] = pairs
+    info["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+    return info
+
+
+def apply_to_record(record: Dict[str, Any], info: Dict[str, Any], check_level: str, proof: str = "") -> Dict[str, Any]:
+    """Fold a verification into a step_XX.json record (equivalence_check/spotcheck/verification)."""
+    verdict = info["verdict"]
+    if verdict == "equal":
+        record["equivalence_check"] = "True"
+    elif verdict == "different":
+        record["equivalence_check"] = "False"
+    elif verdict == "inconclusive":
+        record["equivalence_check"] = proof or "unknown"
+        info["method"] = "numeric+proof" if proof else info["method"]
+    else:
+        record["equivalence_check"] = "not_applicable"
+    if "spotcheck" in check_level.lower():
+        if verdict == "equal":
+            record["spotcheck"] = "0"
+        elif "max_abs_err" in info and info.get("evaluated"):
+            record["spotcheck"] = f"{info['max_abs_err']:.3g}"
+        else:
+            record["spotcheck"] = "not_run"
+    record["verification"] = {k: v for k, v in info.items() if k != "pairs"}
+    return record
+
+
+def verify_plan(plan: Dict[str, Any], request: Dict[str, Any], out_dir: Path, prove: str, points: int) -> List[str]:
+    policy = request.get("policy", {}) if isinstance(request.get("policy"), dict) else {}
+    inputs = request.get("inputs", {}) if isinstance(request.get("inputs"), dict) else {}
+    expr_text = str(inputs.get("expression", "x^2 + 2 x + 1"))
+    assumptions = str(policy.get("assumptions", ""))
+    check_level = str(policy.get("check_level", "equivalence"))
+    time_limit = float(policy.get("time_limit_sec_per_step", 10))
+    checked: List[Tuple[Path, Dict[str, Any], Dict[str, Any], str]] = []
+    for i, step in enumerate(plan.get("steps", []), start=1):
+        path = out_dir / f"step_{i:02d}.json"
+        if not path.is_file():
+            continue
+        record = json.loads(path.read_text(encoding="utf-8"))
+        if record.get("status") != "ok":
+            continue
+        op, var_name = step_op(step)
+        if sympy_available():
+            info = verify(op, var_name, expr_text, str(record.get("result", "")), assumptions, points, seed=i)
+        else:
+            info = {"relation": relation_for(op), "method": "none", "verdict": "inconclusive" if relation_for(op) != "none" else "not_applicable"}
+        checked.append((path, record, info, var_name or "x"))
+    proofs = [""] * len(checked)
+    pending = [k for k, (_, _, info, _) in enumerate(checked) if info["verdict"] == "inconclusive"]
+    if prove == "wolfram" and pending:
+        # One kernel start for every inconclusive step, not one per step.
+        jobs = [proof_sides(str(checked[k][1].get("result", "")), expr_text, checked[k][2]["relation"], checked[k][3])
+                if checked[k][1].get("result") else ("", "") for k in pending]
+        for k, answer in zip(pending, wolfram_proofs(jobs, assumptions, time_limit)):
+            proofs[k] = answer
+    elif prove == "sympy":
+        for k in pending:
+            if checked[k][2].get("pairs"):
+                proofs[k] = sympy_proof(checked[k][2]["pairs"])
+    lines = []
+    for (path, record, info, _), proof in zip(checked, proofs):
+        apply_to_record(record, info, check_level, proof)
+        path.write_text(json.dumps(record, indent=2), encoding="utf-8")
+        lines.append(
+            f"verify={path.stem} relation={info['relation']} verdict={info['verdict']} "
+            f"equivalence_check={record['equivalence_check']} elapsed_ms={info.get('elapsed_ms', 0)}"
+        )
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="spotcheck")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    pv = sub.add_parser("verify-plan", help="Verify every ok step_XX.json of a plan in place.")
+    pv.add_argument("--plan", required=True)
+    pv.add_argument("--request", required=True)
+    pv.add_argument("--out-dir", required=True)
+    pv.add_argument("--prove", choices=["wolfram", "sympy", "none"], default="none")
+    pv.add_argument("--points", type=int, default=DEFAULT_POINTS)
+    args = parser.parse_args()
+
+    plan = json.loads(Path(args.plan).read_text(encoding="utf-8"))
+    request = json.loads(Path(args.request).read_text(encoding="utf-8"))
+    for line in verify_plan(plan, request, Path(args.out_dir), args.prove, args.points):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,7 +4,11 @@ set -euo pipefail
 ROOT="${1:-}"
 TASK_ID="${2:-}"
 SKILL="${3:-}"
-APPROVAL_SH="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/approval.sh"
+RUNTIME_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+APPROVAL_SH="$RUNTIME_DIR/approval.sh"
+TREE_SYNC_PY="$RUNTIME_DIR/tree_sync.py"
+TRACE_SH="$RUNTIME_DIR/trace.sh"
+EVENTS_SH="$RUNTIME_DIR/events.sh"
 
 if [[ -z "$ROOT" || -z "$TASK_ID" || -z "$SKILL" ]]; then
   echo "Usage: stage_to_gate.sh <repo_root> <task_id> <skill_name>" >&2
@@ -16,10 +20,13 @@ GATE_BASE="$ROOT/GATE/staged"
 TASK_STAGE_DIR="$GATE_BASE/$TASK_ID"
 SKILL_STAGE_DIR="$TASK_STAGE_DIR/$SKILL"
 STAGE_MD="$TASK_STAGE_DIR/STAGE.md"
+STAGE_MANIFEST="$SKILL_STAGE_DIR/.stage_manifest.json"
 LOG_SKILL_DIR="$TDIR/logs/$SKILL"
 CONSENT_JSON="$LOG_SKILL_DIR/stage_consent.json"
 
 source "$APPROVAL_SH"
+source "$TRACE_SH"
+source "$EVENTS_SH"
 
 mkdir -p "$LOG_SKILL_DIR"
 
@@ -70,6 +77,7 @@ add_dir "$TDIR/deliverable/pptx" "deliverable/pptx"
 add_dir "$TDIR/deliverable/prd" "deliverable/prd"
 add_file "$TDIR/outputs/compute/result.json" "outputs/compute/result.json"
 add_file "$TDIR/outputs/paper_profile/paper_profile.json" "paper_profile.json"
+add_file "$TDIR/outputs/venue_check/comparison.json" "venue_check.json"
 add_file "$TDIR/logs/compute/consent.json" "logs/compute_consent.json"
 if [[ "$SKILL" == "compute_numerical" || "$SKILL" == "compute_algebraic" ]]; then
   add_dir "$TDIR/work" "work"
@@ -116,21 +124,16 @@ EOF2
 fi
 
 mkdir -p "$SKILL_STAGE_DIR"
-rm -rf "$SKILL_STAGE_DIR"/*
 
+# Incremental sync: reflink/hard-link/copy per file, skipping files whose
+# content hash is unchanged since the previous staging (see tree_sync.py).
 STAGED_LIST=""
+SYNC_ARGS=()
 for i in "${!SRC[@]}"; do
-  s="${SRC[$i]}"
-  d="${DST[$i]}"
-  out="$SKILL_STAGE_DIR/$d"
-  mkdir -p "$(dirname "$out")"
-  if [[ -d "$s" ]]; then
-    cp -R "$s" "$out"
-  else
-    cp "$s" "$out"
-  fi
-  STAGED_LIST+="- $SKILL/$d\n"
+  SYNC_ARGS+=(--item "${SRC[$i]}" "${DST[$i]}")
+  STAGED_LIST+="- $SKILL/${DST[$i]}\n"
 done
+SYNC_SUMMARY="$(trace_run stage_to_gate.sync python3 "$TREE_SYNC_PY" sync --dest "$SKILL_STAGE_DIR" --manifest "$STAGE_MANIFEST" "${SYNC_ARGS[@]}")"
 
 mkdir -p "$TASK_STAGE_DIR"
 cat > "$STAGE_MD" <<EOF2
@@ -143,6 +146,8 @@ cat > "$STAGE_MD" <<EOF2
 
 ## What was staged
 $(printf '%b' "$STAGED_LIST")
+- sync: $SYNC_SUMMARY
+- manifest: GATE/staged/$TASK_ID/$SKILL/.stage_manifest.json
 
 ## Manual Promotion Commands (USER is manual-only)
 - Patch-based update (if present):
@@ -266,4 +271,5 @@ cat > "$CONSENT_JSON" <<EOF2
 }
 EOF2
 
+events_emit artifact kind=staged_dir "path=GATE/staged/$TASK_ID/$SKILL"
 exit 0
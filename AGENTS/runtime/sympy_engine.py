@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""SymPy engine for the algebraic compute skills (optional dependency).
+
+Runs the same work as the generated Wolfram scripts when SymPy is installed:
+
+  run-plan   compute_algebraic_multistep: translates each plan step's wl_code
+             (Integrate, D, Solve, Together, Simplify/FullSimplify, Refine,
+             Factor, Apart, Expand) and executes the steps in a process pool,
+             writing the same step_XX.json records as step_XX.wl
+  algebraic  compute_algebraic: expand/factor/simplify/solve with the
+             INPUT_JSON/RESULT_JSON environment contract of main.wl
+
+As in the .wl template, every step starts from the request expression
+(stepResult = expr), so steps are independent and run concurrently. Each
+step is bounded by policy.time_limit_sec_per_step (SIGALRM inside the worker,
+plus a hard kill of workers that overrun it) and policy.max_leaf_count.
+Assumptions such as "x>0, a>=0, y in Reals" become symbol assumptions, the
+analogue of Assuming[...]; anything else is reported as ignored. Results are
+verified numerically by spotcheck.py, with simplify() only when inconclusive.
+"""
+import argparse
+import json
+import math
+import os
+import re
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import active_children
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import sympy as sp
+    from sympy.parsing.sympy_parser import (
+        convert_xor,
+        implicit_multiplication_application,
+        parse_expr,
+        standard_transformations,
+    )
+    from sympy.printing.mathematica import mathematica_code
+except ImportError:  # engine reports itself unavailable
+    sp = None
+
+EXIT_STEP_FAILED = 3
+BACKSTOP_GRACE_S = 2.0
+STEP_RE = re.compile(
+    r"^\s*stepResult\s*=\s*([A-Za-z]+)\[\s*(expr|stepResult)\s*(==\s*0)?\s*(?:,\s*([A-Za-z]\w*)\s*)?\]\s*;?\s*$"
+)
+WL_HEADS = {
+    "Sin": "sin", "Cos": "cos", "Tan": "tan", "Exp": "exp", "Log": "log", "Sqrt": "sqrt",
+    "Sinh": "sinh", "Cosh": "cosh", "Tanh": "tanh", "ArcSin": "asin", "ArcCos": "acos", "ArcTan": "atan",
+    "Abs": "Abs", "Gamma": "gamma", "Erf": "erf",
+}
+WL_HEAD_RE = re.compile(r"\b(" + "|".join(WL_HEADS) + r")\[")
+ASSUMPTION_RE = re.compile(r"^\s*([A-Za-z]\w*)\s*(>=|<=|>|<|!=)\s*0\s*$")
+ELEMENT_RE = re.compile(r"^\s*(?:Element\[\s*([A-Za-z]\w*)\s*,\s*(Reals|Integers)\s*\]|([A-Za-z]\w*)\s+in\s+(Reals|Integers))\s*$")
+ASSUMPTION_FLAGS = {">": "positive", ">=": "nonnegative", "<": "negative", "<=": "nonpositive", "!=": "nonzero"}
+
+
+class StepTimeout(Exception):
+    pass
+
+
+def available() -> bool:
+    return sp is not None
+
+
+def version() -> str:
+    return f"SymPy {sp.__version__}" if sp is not None else "unavailable"
+
+
+def wl_to_python(text: str) -> str:
+    text = WL_HEAD_RE.sub(lambda m: WL_HEADS[m.group(1)] + "(", text)
+    text = text.replace("[", "(").replace("]", ")")
+    return re.sub(r"\bPi\b", "pi", text)
+
+
+def parse_assumptions(text: str) -> Tuple[Dict[str, Dict[str, bool]], List[str]]:
+    flags: Dict[str, Dict[str, bool]] = {}
+    ignored: List[str] = []
+    for part in re.split(r",|&&", text or ""):
+        if not part.strip() or part.strip() == "True":
+            continue
+        m = ASSUMPTION_RE.match(part)
+        if m:
+            flags.setdefault(m.group(1), {})[ASSUMPTION_FLAGS[m.group(2)]] = True
+            continue
+        m = ELEMENT_RE.match(part)
+        if m:
+            name = m.group(1) or m.group(3)
+            domain = m.group(2) or m.group(4)
+            flags.setdefault(name, {})["integer" if domain == "Integers" else "real"] = True
+            continue
+        ignored.append(part.strip())
+    return flags, ignored
+
+
+def parse_wl(text: str, assumptions: str = "") -> Tuple[Any, Dict[str, Any], List[str]]:
+    flags, ignored = parse_assumptions(assumptions)
+    local = {name: sp.Symbol(name, **kw) for name, kw in flags.items()}
+    local.setdefault("E", sp.E)
+    local.setdefault("I", sp.I)
+    transforms = standard_transformations + (implicit_multiplication_application, convert_xor)
+    expr = parse_expr(wl_to_python(text), local_dict=local, transformations=transforms)
+    return expr, local, ignored
+
+
+def leaf_count(value: Any) -> int:
+    if isinstance(value, (list, tuple)):
+        return 1 + sum(leaf_count(v) for v in value)
+    if isinstance(value, dict):
+        return 1 + sum(leaf_count(k) + leaf_count(v) for k, v in value.items())
+    return sum(1 for _ in sp.preorder_traversal(value))
+
+
+def to_wl(value: Any) -> str:
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{to_wl(k)} -> {to_wl(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, (list, tuple)):
+        return "{" + ", ".join(to_wl(v) for v in value) + "}"
+    try:
+        return mathematica_code(value)
+    except Exception:  # heads without a Mathematica printer (Piecewise, Si, ...)
+        return sp.sstr(value)
+
+
+def variable(expr: Any, local: Dict[str, Any], name: Optional[str]) -> Any:
+    if name:
+        return local.get(name) or next((s for s in expr.free_symbols if s.name == name), sp.Symbol(name))
+    syms = sorted(expr.free_symbols, key=lambda s: s.name)
+    return next((s for s in syms if s.name == "x"), syms[0] if syms else sp.Symbol("x"))
+
+
+def apply_op(op: str, expr: Any, var: Any) -> Any:
+    if op == "Integrate":
+        return sp.integrate(expr, var)
+    if op == "D":
+        return sp.diff(expr, var)
+    if op in ("Solve", "Reduce"):
+        return sp.solve(sp.Eq(expr, 0), var, dict=True)
+    if op == "Together":
+        return sp.together(expr)
+    if op in ("Simplify", "FullSimplify"):
+        return sp.simplify(expr)
+    if op == "Refine":
+        return sp.refine(expr)
+    if op == "Factor":
+        return sp.factor(expr)
+    if op == "Apart":
+        return sp.apart(expr, var)
+    if op == "Expand":
+        return sp.expand(expr)
+    if op == "FunctionExpand":
+        return sp.expand_func(expr)
+    if op == "TrigReduce":
+        return sp.trigsimp(expr)
+    raise ValueError(f"unsupported_op:{op}")
+
+
+def _on_alarm(signum: int, frame: Any) -> None:
+    raise StepTimeout()
+
+
+def run_step(job: Dict[str, Any]) -> Dict[str, Any]:
+    """One plan step; job carries the step, request inputs and limits. Returns the step_XX.json record."""
+    t0 = time.perf_counter()
+    step = job["step"]
+    record: Dict[str, Any] = {
+        "intent": str(step.get("intent", "")),
+        "status": "ok",
+        "message": "",
+        "leaf_count": -1,
+        "result": "",
+        "equivalence_check": "not_run",
+        "spotcheck": "not_run",
+        "engine": "sympy",
+    }
+    m = STEP_RE.match(str(step.get("wl_code", "")))
+    if not m:
+        record.update(status="failed", message="unsupported_step")
+        return record
+    op = m.group(1)
+    if job["allowlist_ops"] and op not in job["allowlist_ops"]:
+        record.update(status="failed", message=f"op_not_allowed:{op}")
+        return record
+
+    from spotcheck import apply_to_record, sympy_proof, verify
+
+    old = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, float(job["time_limit"]))
+    try:
+        expr, local, ignored = parse_wl(job["expression"], job["assumptions"])
+        if ignored:
+            record["assumptions_ignored"] = ignored
+        result = apply_op(op, expr, variable(expr, local, m.group(4)))
+        leaves = leaf_count(result)
+        record["leaf_count"] = leaves
+        if leaves > int(job["max_leaf"]):
+            record.update(status="failed", message="leaf_count_exceeded")
+        else:
+            record["result"] = to_wl(result)
+            info = verify(op, m.group(4), job["expression"], result, job["assumptions"], seed=job["index"])
+            proof = sympy_proof(info["pairs"]) if info["verdict"] == "inconclusive" and info.get("pairs") else ""
+            apply_to_record(record, info, job["check_level"], proof)
+    except StepTimeout:
+        record.update(status="failed", message="step_failed_or_timeout", leaf_count=-1)
+    except ValueError as err:
+        record.update(status="failed", message=str(err) if str(err).startswith("unsupported_op") else "expression_parse_failed")
+    except (SyntaxError, TypeError, sp.SympifyError):
+        record.update(status="failed", message="expression_parse_failed")
+    except Exception as err:  # SymPy raises NotImplementedError and friends on hard cases
+        record.update(status="failed", message=f"step_failed:{type(err).__name__}")
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old)
+    record["elapsed_s"] = round(time.perf_counter() - t0, 6)
+    return record
+
+
+def plan_jobs(plan: Dict[str, Any], request: Dict[str, Any]) -> List[Dict[str, Any]]:
+    policy = request.get("policy", {}) if isinstance(request.get("policy"), dict) else {}
+    inputs = request.get("inputs", {}) if isinstance(request.get("inputs"), dict) else {}
+    base = {
+        "expression": str(inputs.get("expression", "x^2 + 2 x + 1")),
+        "assumptions": str(policy.get("assumptions", "")),
+        "time_limit": max(0.001, float(policy.get("time_limit_sec_per_step", 10))),
+        "max_leaf": int(policy.get("max_leaf_count", 50000)),
+        "check_level": str(policy.get("check_level", "equivalence")),
+        "allowlist_ops": list(policy.get("allowlist_ops") or []),
+    }
+    steps = [step for step in plan.get("steps", []) if isinstance(step, dict)]
+    return [dict(base, step=step, index=i) for i, step in enumerate(steps, start=1)]
+
+
+def run_plan(plan: Dict[str, Any], request: Dict[str, Any], workers: int) -> List[Dict[str, Any]]:
+    jobs = plan_jobs(plan, request)
+    if not jobs:
+        return []
+    workers = max(1, min(workers, len(jobs)))
+    if workers == 1:
+        return [run_step(job) for job in jobs]
+    limit = max(job["time_limit"] for job in jobs)
+    budget = math.ceil(len(jobs) / workers) * (limit + BACKSTOP_GRACE_S)
+    timed_out = {"status": "failed", "message": "step_failed_or_timeout", "leaf_count": -1, "result": "",
+                 "equivalence_check": "not_run", "spotcheck": "not_run", "engine": "sympy"}
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(run_step, job) for job in jobs]
+        done, pending = wait(futures, timeout=budget)
+        if pending:
+            for child in active_children():
+                child.kill()
+        records = []
+        for job, fut in zip(jobs, futures):
+            if fut in done and fut.exception() is None:
+                records.append(fut.result())
+            else:
+                records.append(dict(timed_out, intent=str(job["step"].get("intent", ""))))
+        return records
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_algebraic(data: Dict[str, Any]) -> Dict[str, Any]:
+    inputs = data.get("inputs", {}) if isinstance(data.get("inputs"), dict) else {}
+    operation = str(inputs.get("operation", "simplify")).lower()
+    expr_text = str(inputs.get("expression", "(x^2-1)/(x-1)"))
+    assumptions = str(inputs.get("assumptions", "True"))
+    expr, local, _ = parse_wl(expr_text, assumptions)
+    var = variable(expr, local, str(inputs.get("solve_variable", "x")))
+    op = {"expand": "Expand", "factor": "Factor", "solve": "Solve"}.get(operation, "FullSimplify")
+    return {
+        "goal": str(data.get("goal", "")),
+        "operation": operation,
+        "expression": expr_text,
+        "assumptions": assumptions,
+        "result": to_wl(apply_op(op, expr, var)),
+        "figure": "",
+        "engine": "sympy",
+    }
+
+
+def read_json(path: Path) -> Dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data if isinstance(data, dict) else {}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="sympy_engine")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("check", help="Exit 0 when SymPy is importable.")
+    pp = sub.add_parser("run-plan")
+    pp.add_argument("--plan", required=True)
+    pp.add_argument("--request", required=True)
+    pp.add_argument("--out-dir", required=True)
+    pp.add_argument("--workers", type=int, default=int(os.environ.get("SYMPY_WORKERS", "0") or 0))
+    sub.add_parser("algebraic", help="main.wl equivalent; reads INPUT_JSON, writes RESULT_JSON.")
+    args = parser.parse_args()
+
+    if args.cmd == "check":
+        print(f"SYMPY_VERSION={version()}")
+    if not available():
+        print("SymPy is not installed (pip install sympy).", file=sys.stderr)
+        return 2
+    if args.cmd == "check":
+        return 0
+
+    if args.cmd == "algebraic":
+        input_path = os.environ.get("INPUT_JSON", "")
+        result_path = os.environ.get("RESULT_JSON", "")
+        if not input_path or not result_path:
+            print("missing required environment variables INPUT_JSON/RESULT_JSON", file=sys.stderr)
+            return 2
+        payload = run_algebraic(read_json(Path(input_path)))
+        Path(result_path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"operation={payload['operation']}")
+        print(f"result_path={result_path}")
+        return 0
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    records = run_plan(read_json(Path(args.plan)), read_json(Path(args.request)), workers)
+    failed = 0
+    for i, record in enumerate(records, start=1):
+        (out_dir / f"step_{i:02d}.json").write_text(json.dumps(record, indent=2), encoding="utf-8")
+        failed += record["status"] != "ok"
+    print(f"SYMPY_STEPS={len(records)}")
+    print(f"SYMPY_FAILED={failed}")
+    return 0 if failed == 0 else EXIT_STEP_FAILED
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
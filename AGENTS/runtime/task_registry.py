@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""SQLite index of AGENTS/tasks for listing and filtering without walking it.
+
+One row per task with its skill, lifecycle state, request step, promotion
+status and creation time, kept in AGENTS/cache/task_registry/tasks.sqlite.
+agenthub start/request-set/run/plan-revise/review-accept and promote_apply
+update the row transactionally as a task moves along; the task directories
+stay authoritative. A query first reconciles the table with the directory
+names (one scandir), so tasks created or deleted behind agenthub's back are
+picked up; `tasks --reindex` rescans every task from its files. Tasks packed
+by retention.py keep their row, with `archive` naming the archive. TASK_REGISTRY
+points the database elsewhere; "off" disables it.
+
+  state:      created, paused_for_input, ready, running, awaiting_review, completed, failed
+  promotion:  none, staged, promoted
+"""
+import os
+import sqlite3
+import sys
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import jsonio
+
+SCHEMA_VERSION = 2
+DEFAULT_REGISTRY_PATH = Path(__file__).resolve().parents[1] / "cache" / "task_registry" / "tasks.sqlite"
+ARCHIVE_STUB = "ARCHIVED.json"
+STATES = ["created", "paused_for_input", "ready", "running", "awaiting_review", "completed", "failed"]
+PROMOTION = ["none", "staged", "promoted"]
+COLUMNS = [
+    "task_id",
+    "skill",
+    "state",
+    "request_step",
+    "promotion",
+    "created_at",
+    "updated_at",
+    "staged_dir",
+    "report",
+    "receipt",
+    "archive",
+]
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id      TEXT PRIMARY KEY,
+    skill        TEXT NOT NULL DEFAULT '',
+    state        TEXT NOT NULL DEFAULT 'created',
+    request_step TEXT NOT NULL DEFAULT '',
+    promotion    TEXT NOT NULL DEFAULT 'none',
+    created_at   TEXT NOT NULL DEFAULT '',
+    updated_at   TEXT NOT NULL DEFAULT '',
+    staged_dir   TEXT NOT NULL DEFAULT '',
+    report       TEXT NOT NULL DEFAULT '',
+    receipt      TEXT NOT NULL DEFAULT '',
+    archive      TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS tasks_created ON tasks (created_at);
+CREATE INDEX IF NOT EXISTS tasks_skill ON tasks (skill, created_at);
+CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, created_at);
+CREATE INDEX IF NOT EXISTS tasks_promotion ON tasks (promotion, created_at);
+"""
+
+
+def now_utc() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def registry_path_from_env() -> Optional[Path]:
+    raw = os.environ.get("TASK_REGISTRY", "").strip()
+    if raw.lower() in {"off", "0", "none"}:
+        return None
+    return Path(raw) if raw else DEFAULT_REGISTRY_PATH
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS tasks")
+            conn.executescript(SCHEMA)
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    return conn
+
+
+def _read(path: Path, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    try:
+        obj = jsonio.read_json(path, fields=fields)
+    except (OSError, ValueError):
+        return {}
+    return obj if isinstance(obj, dict) else {}
+
+
+def receipts_by_task(root: Path) -> Dict[str, str]:
+    """Latest promotion receipt per task id (receipts are named <task_id>_<UTC stamp>.json)."""
+    out: Dict[str, str] = {}
+    rdir = root / "USER" / "manifest" / "promotion_receipts"
+    try:
+        names = sorted(e.name for e in os.scandir(rdir) if e.name.endswith(".json"))
+    except OSError:
+        return out
+    for name in names:
+        task_id = name[: -len(".json")].rsplit("_", 1)[0]
+        out[task_id] = f"USER/manifest/promotion_receipts/{name}"
+    return out
+
+
+def scan_task(root: Path, task_id: str, receipts: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Registry row reconstructed from a task's files, for tasks agenthub has not recorded."""
+    tdir = root / "AGENTS" / "tasks" / task_id
+    stub = _read(tdir / ARCHIVE_STUB)
+    if isinstance(stub.get("task"), dict):
+        return {**stub["task"], "task_id": task_id, "archive": str(stub.get("archive", ""))}
+    meta = _read(tdir / "meta.json", ["skill", "created_at_utc"])
+    skill = str(meta.get("skill", "") or "")
+    created = str(meta.get("created_at_utc", "") or "")
+    if not created:
+        try:
+            created = datetime.fromtimestamp(os.stat(tdir).st_mtime, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        except OSError:
+            created = ""
+    row: Dict[str, Any] = {"task_id": task_id, "skill": skill, "created_at": created, "state": "created"}
+
+    progress = _read(tdir / "request_progress.json", ["current_step", "review_ready_for_execute"])
+    step = str(progress.get("current_step", "") or "")
+    if step:
+        row["request_step"] = step
+        row["state"] = "ready" if step == "done" else "paused_for_input"
+    if (tdir / "review" / "error.md").exists():
+        row["state"] = "failed"
+        row["report"] = f"AGENTS/tasks/{task_id}/review/error.md"
+    staged = root / "GATE" / "staged" / task_id
+    if skill and (staged / skill).is_dir():
+        row["staged_dir"] = f"GATE/staged/{task_id}/{skill}"
+        row["promotion"] = "staged"
+        if row["state"] != "failed":
+            row["state"] = "completed"
+    receipt = (receipts if receipts is not None else receipts_by_task(root)).get(task_id)
+    if receipt:
+        row["promotion"] = "promoted"
+        row["receipt"] = receipt
+    return row
+
+
+def _insert(conn: sqlite3.Connection, row: Dict[str, Any]) -> None:
+    cols = [c for c in COLUMNS if c in row]
+    conn.execute(
+        f"INSERT OR REPLACE INTO tasks ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})",
+        [row[c] for c in cols],
+    )
+
+
+def update(conn: sqlite3.Connection, root: Path, task_id: str, fields: Dict[str, Any]) -> None:
+    """Apply fields to a task's row in one transaction, creating the row from disk if needed."""
+    fields = {k: ("" if v is None else str(v)) for k, v in fields.items() if k in COLUMNS and k != "task_id"}
+    with conn:
+        if conn.execute("SELECT 1 FROM tasks WHERE task_id = ?", (task_id,)).fetchone() is None:
+            row = scan_task(root, task_id)
+            row.update(fields)
+            row["updated_at"] = now_utc()
+            _insert(conn, row)
+            return
+        fields["updated_at"] = now_utc()
+        assignments = ", ".join(f"{k} = ?" for k in fields)
+        conn.execute(f"UPDATE tasks SET {assignments} WHERE task_id = ?", [*fields.values(), task_id])
+
+
+def record(root: Path, task_id: str, **fields: Any) -> None:
+    """Best-effort update for command hooks: a registry failure never fails the command."""
+    path = registry_path_from_env()
+    if path is None or not task_id:
+        return
+    try:
+        with closing(connect(path)) as conn:
+            update(conn, root, task_id, fields)
+    except sqlite3.Error as exc:
+        print(f"WARN=task registry not updated: {exc}", file=sys.stderr)
+
+
+def sync(conn: sqlite3.Connection, root: Path, full: bool = False) -> Dict[str, int]:
+    """Reconcile rows with AGENTS/tasks: add unknown task dirs, drop vanished ones (full=True rescans all)."""
+    tasks_root = root / "AGENTS" / "tasks"
+    try:
+        on_disk = {e.name for e in os.scandir(tasks_root) if e.is_dir() and not e.name.startswith(".")}
+    except OSError:
+        on_disk = set()
+    known = {r[0] for r in conn.execute("SELECT task_id FROM tasks")}
+    added = on_disk if full else on_disk - known
+    removed = known - on_disk
+    if added or removed:
+        receipts = receipts_by_task(root)
+        with conn:
+            conn.executemany("DELETE FROM tasks WHERE task_id = ?", [(t,) for t in removed])
+            for task_id in sorted(added):
+                _insert(conn, scan_task(root, task_id, receipts))
+    return {"added": len(added), "removed": len(removed)}
+
+
+def query(
+    conn: sqlite3.Connection,
+    skill: Optional[str] = None,
+    states: Iterable[str] = (),
+    promotion: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Rows newest first; skill accepts shell globs (compute_*), since/until compare ISO timestamps."""
+    where: List[str] = []
+    params: List[Any] = []
+    if skill:
+        where.append("skill GLOB ?")
+        params.append(skill)
+    states = list(states)
+    if states:
+        where.append(f"state IN ({', '.join('?' for _ in states)})")
+        params.extend(states)
+    if promotion:
+        where.append("promotion = ?")
+        params.append(promotion)
+    if since:
+        where.append("created_at >= ?")
+        params.append(since)
+    if until:
+        # A bare date includes the whole day.
+        where.append("created_at <= ?")
+        params.append(until + "T99" if len(until) == 10 else until)
+    sql = "SELECT * FROM tasks"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY created_at DESC, task_id DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return [dict(r) for r in conn.execute(sql, params)]
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Shared parsed-document model for LaTeX papers.
+
+`load_model(paper_root)` picks the main .tex, walks the \\input/\\include graph
+and parses it once into a plain dict (sections, environments, citations,
+labels, figure paths, word counts, frontmatter). Models are cached as JSON
+under AGENTS/cache/tex_model/ keyed by the content hash of the include graph,
+so a shadow copy and USER/paper share one parse and every skill reading the
+same sources starts from a finished model.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import jsonio
+
+MODEL_VERSION = 2
+MAX_INCLUDE_DEPTH = 20
+DEFAULT_CACHE_ROOT = Path(__file__).resolve().parents[1] / "cache" / "tex_model"
+INCLUDE_RE = re.compile(r"\\(?:input|include)\{([^}]+)\}")
+CITE_RE = re.compile(r"\\cite[a-zA-Z*]*\s*(?:\[[^\]]*\]\s*)*\{([^}]+)\}")
+SECTION_RE = re.compile(r"\\(section|subsection|subsubsection)(\*?)\s*(?:\[[^\]]*\]\s*)?\{")
+ENV_RE = re.compile(r"\\begin\{([^}]+)\}")
+WORD_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9'\-]*")
+NON_TEXT_ENVS = (
+    "equation", "equation*", "align", "align*", "eqnarray", "eqnarray*", "gather", "gather*",
+    "multline", "multline*", "figure", "figure*", "table", "table*", "thebibliography", "abstract",
+)
+
+
+def slurp(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="ignore") if path.exists() else ""
+
+
+def strip_comments(text: str) -> str:
+    return re.sub(r"(?<!\\)%.*", "", text)
+
+
+def braced_arg(text: str, start: int) -> Tuple[str, int]:
+    """Return the balanced {...} argument starting at text[start] == '{' and the index after it."""
+    depth = 0
+    for i in range(start, len(text)):
+        c = text[i]
+        if c == "{" and (i == 0 or text[i - 1] != "\\"):
+            depth += 1
+        elif c == "}" and text[i - 1] != "\\":
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:i], i + 1
+    return text[start + 1:], len(text)
+
+
+def macro_args(text: str, name: str) -> List[str]:
+    out: List[str] = []
+    for m in re.finditer(rf"\\{name}\*?\s*(?:\[[^\]]*\]\s*)*(?=\{{)", text):
+        arg, _ = braced_arg(text, m.end())
+        out.append(arg)
+    return out
+
+
+def squash(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def choose_main_tex(tex_files: List[Path]) -> Path:
+    names = {p.name: p for p in tex_files}
+    if "main.tex" in names:
+        return names["main.tex"]
+    for p in tex_files:
+        if re.search(r"\\documentclass|\\begin\{document\}", slurp(p)):
+            return p
+    return sorted(tex_files)[0]
+
+
+def resolve_include(base: Path, ref: str, root: Path) -> Path:
+    """LaTeX resolves \\input paths against the main file's directory; fall back to the including file's."""
+    ref = ref.strip().strip('"').strip("'")
+    candidates = [root / ref, base.parent / ref]
+    candidates = [p.with_suffix(".tex") if p.suffix == "" else p for p in candidates]
+    return next((p.resolve() for p in candidates if p.is_file()), candidates[0].resolve())
+
+
+def include_graph(main_tex: Path) -> List[Tuple[Path, str]]:
+    """Include graph in depth-first order as (resolved path, comment-stripped text)."""
+    visited: Set[Path] = set()
+    ordered: List[Tuple[Path, str]] = []
+
+    def walk(p: Path, depth: int) -> None:
+        if depth > MAX_INCLUDE_DEPTH:
+            return
+        rp = p.resolve()
+        if rp in visited or not rp.exists() or rp.suffix.lower() != ".tex":
+            return
+        visited.add(rp)
+        txt = strip_comments(slurp(rp))
+        ordered.append((rp, txt))
+        for m in INCLUDE_RE.finditer(txt):
+            walk(resolve_include(rp, m.group(1), root), depth + 1)
+
+    root = main_tex.resolve().parent
+    walk(main_tex, 0)
+    return ordered
+
+
+def flatten(graph: List[Tuple[Path, str]]) -> str:
+    if not graph:
+        return ""
+    texts = {p: t for p, t in graph}
+    root = graph[0][0].parent
+    seen: Set[Path] = set()
+
+    def inline(p: Path, depth: int) -> str:
+        if p in seen or p not in texts or depth > MAX_INCLUDE_DEPTH:
+            return ""
+        seen.add(p)
+        return INCLUDE_RE.sub(lambda m: inline(resolve_include(p, m.group(1), root), depth + 1), texts[p])
+
+    return inline(graph[0][0], 0)
+
+
+def plain_words(text: str) -> int:
+    t = text
+    for env in NON_TEXT_ENVS:
+        e = re.escape(env)
+        t = re.sub(rf"\\begin\{{{e}\}}[\s\S]*?\\end\{{{e}\}}", " ", t)
+    t = re.sub(r"\\\[[\s\S]*?\\\]", " ", t)
+    t = re.sub(r"\$\$[\s\S]*?\$\$", " ", t)
+    t = re.sub(r"\$[^$]*\$", " x ", t)
+    t = re.sub(
+        r"\\(?:cite[a-zA-Z*]*|ref|eqref|label|bibliography|bibliographystyle|includegraphics)\s*(?:\[[^\]]*\])*\{[^}]*\}",
+        " ",
+        t,
+    )
+    t = re.sub(r"\\[a-zA-Z@]+\*?", " ", t)
+    t = re.sub(r"[{}\[\]~^\\]", " ", t)
+    return len(WORD_RE.findall(t))
+
+
+def rel_to(root: Path, p: Path) -> str:
+    return os.path.relpath(p, root).replace(os.sep, "/")
+
+
+def parse(paper_root: Path, graph: List[Tuple[Path, str]]) -> Dict[str, Any]:
+    text = flatten(graph)
+    body_m = re.search(r"\\begin\{document\}([\s\S]*?)(?:\\end\{document\}|$)", text)
+    body = body_m.group(1) if body_m else text
+    preamble = text[: body_m.start()] if body_m else text
+
+    ma = re.search(r"\\begin\{abstract\}([\s\S]*?)\\end\{abstract\}", text)
+    abstract_raw = ma.group(1) if ma else (macro_args(text, "abstract") or [""])[0]
+    abstract = squash(re.sub(r"\\[a-zA-Z@]+\*?|[{}$~]", " ", abstract_raw))
+
+    sections: List[Dict[str, Any]] = []
+    matches = list(SECTION_RE.finditer(body))
+    for i, m in enumerate(matches):
+        title, end = braced_arg(body, m.end() - 1)
+        stop = matches[i + 1].start() if i + 1 < len(matches) else len(body)
+        sections.append(
+            {
+                "level": m.group(1),
+                "starred": bool(m.group(2)),
+                "title": squash(title),
+                "words": plain_words(body[end:stop]),
+            }
+        )
+
+    cite_keys: List[str] = []
+    for _, txt in graph:
+        for m in CITE_RE.finditer(txt):
+            for k in m.group(1).split(","):
+                k = k.strip()
+                if k and k not in cite_keys:
+                    cite_keys.append(k)
+
+    environments: Dict[str, int] = {}
+    for m in ENV_RE.finditer(body):
+        environments[m.group(1)] = environments.get(m.group(1), 0) + 1
+
+    packages: List[str] = []
+    for arg in macro_args(preamble, "usepackage"):
+        packages.extend(p.strip() for p in arg.split(",") if p.strip())
+    bib_files: List[str] = []
+    for arg in macro_args(text, "bibliography") + macro_args(text, "addbibresource"):
+        bib_files.extend(b.strip() for b in arg.split(",") if b.strip())
+    keywords: List[str] = []
+    for arg in macro_args(text, "keywords"):
+        keywords.extend(squash(k) for k in re.split(r"[,;]", arg) if k.strip())
+
+    dc = re.search(r"\\documentclass\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}", preamble)
+    bib_style = re.search(r"\\bibliographystyle\s*\{([^}]+)\}", text)
+    bibitems = len(re.findall(r"\\bibitem\b", text))
+    figures = sum(v for k, v in environments.items() if k in {"figure", "figure*"})
+    tables = sum(v for k, v in environments.items() if k in {"table", "table*"})
+
+    return {
+        "version": MODEL_VERSION,
+        "found": True,
+        "main_tex": rel_to(paper_root, graph[0][0]),
+        "files": [rel_to(paper_root, p) for p, _ in graph],
+        "documentclass": dc.group(1).strip() if dc else "",
+        "packages": packages,
+        "title": squash((macro_args(text, "title") or [""])[0]),
+        "abstract": abstract,
+        "abstract_words": len(WORD_RE.findall(abstract)),
+        "abstract_chars": len(abstract),
+        "has_abstract_env": bool(ma),
+        "keywords": keywords,
+        "sections": sections,
+        "environments": environments,
+        "labels": [squash(x) for x in macro_args(body, "label")],
+        "cite_keys": cite_keys,
+        "references": max(len(cite_keys), bibitems),
+        "bib_files": bib_files,
+        "bib_style": bib_style.group(1).strip() if bib_style else "",
+        "figures": figures,
+        "tables": tables,
+        "graphics": [squash(x) for x in macro_args(body, "includegraphics")],
+        "word_count": plain_words(body),
+        "macros": sorted(set(re.findall(r"\\([a-zA-Z]+)", text))),
+    }
+
+
+def content_key(paper_root: Path, graph: List[Tuple[Path, str]]) -> str:
+    h = hashlib.sha256(f"tex_model:{MODEL_VERSION}\n".encode("utf-8"))
+    for p, _ in graph:
+        h.update(rel_to(paper_root, p).encode("utf-8") + b"\0")
+        h.update(hashlib.sha256(p.read_bytes()).digest())
+    return h.hexdigest()
+
+
+def cache_root_from_env() -> Optional[Path]:
+    raw = os.environ.get("TEX_MODEL_CACHE", "").strip()
+    if raw.lower() in {"off", "0", "none"}:
+        return None
+    return Path(raw) if raw else DEFAULT_CACHE_ROOT
+
+
+def load_model(paper_root: Path, main_tex: Optional[Path] = None, cache_root: Optional[Path] = None) -> Dict[str, Any]:
+    """Parsed model of the paper under paper_root, served from the content-hash cache when possible."""
+    paper_root = paper_root.resolve()
+    if main_tex is None:
+        candidates = sorted(p for p in paper_root.rglob("*.tex") if p.is_file()) if paper_root.is_dir() else []
+        if not candidates:
+            return {"version": MODEL_VERSION, "found": False, "main_tex": "", "files": []}
+        main_tex = choose_main_tex(candidates)
+    graph = include_graph(main_tex)
+    if not graph:
+        return {"version": MODEL_VERSION, "found": False, "main_tex": "", "files": []}
+
+    root = cache_root if cache_root is not None else cache_root_from_env()
+    key = content_key(paper_root, graph)
+    cached = root / f"{key}.json" if root is not None else None
+    if cached is not None and cached.is_file():
+        try:
+            model = jsonio.read_json(cached)
+            if model.get("version") == MODEL_VERSION:
+                return model
+        except Exception:
+            pass
+    model = parse(paper_root, graph)
+    model["key"] = key
+    if cached is not None:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        jsonio.write_json(cached, model, compact=True)
+    return model
+
+
+def has_section(model: Dict[str, Any], title: str, level: str = "section") -> bool:
+    want = title.strip().lower()
+    return any(s.get("level") == level and s.get("title", "").lower() == want for s in model.get("sections", []))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="tex_model")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    ps = sub.add_parser("show")
+    ps.add_argument("--paper", required=True)
+    ps.add_argument("--main", default="", help="Main .tex relative to --paper; default auto-detect.")
+    ps.add_argument("--field", default="")
+    ph = sub.add_parser("has-section")
+    ph.add_argument("--paper", required=True)
+    ph.add_argument("--main", default="", help="Main .tex relative to --paper; default auto-detect.")
+    ph.add_argument("title")
+    pm = sub.add_parser("summary")
+    pm.add_argument("--paper", required=True)
+    pm.add_argument("--main", default="", help="Main .tex relative to --paper; default auto-detect.")
+    args = parser.parse_args()
+
+    paper = Path(args.paper)
+    main_tex = paper / args.main if args.main else None
+    if main_tex is not None and not main_tex.is_file():
+        model: Dict[str, Any] = {"version": MODEL_VERSION, "found": False, "main_tex": "", "files": []}
+    else:
+        model = load_model(paper, main_tex=main_tex)
+    if args.cmd == "show":
+        value = model.get(args.field) if args.field else model
+        print(json.dumps(value, indent=2) if isinstance(value, (dict, list)) else value)
+        return 0
+    if args.cmd == "has-section":
+        return 0 if has_section(model, args.title) else 1
+    if args.cmd == "summary":
+        if not model.get("found"):
+            print("- no .tex sources found")
+            return 0
+        print(f"- main_tex: {model['main_tex']} ({len(model['files'])} files)")
+        print(f"- words: {model['word_count']} (abstract {model['abstract_words']})")
+        print(f"- figures: {model['figures']}, tables: {model['tables']}, citations: {len(model['cite_keys'])}")
+        for s in model["sections"]:
+            indent = {"section": "", "subsection": "  ", "subsubsection": "    "}.get(s["level"], "")
+            print(f"{indent}- {s['title']} ({s['words']} words)")
+        return 0
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
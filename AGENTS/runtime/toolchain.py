@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Toolchain version registry shared by the compute entry points.
+
+Version strings are cached in AGENTS/cache/toolchain/versions.json, keyed by
+the resolved binary (plus any script or module file the probe runs) and its
+mtime/inode/size, so an upgrade or a different binary on PATH re-probes while
+warm runs spawn nothing. Cold probes run in parallel. TOOLCHAIN_CACHE points
+the cache elsewhere; "off" disables it.
+
+  python3 toolchain.py get python matplotlib    # one version per line
+  python3 toolchain.py versions                 # name=version for every known tool
+"""
+import argparse
+import datetime as dt
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import jsonio
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_ROOT = Path(__file__).resolve().parents[1] / "cache" / "toolchain"
+PROBE_TIMEOUT_SEC = 60
+SIM_PY = Path(__file__).resolve().parent / "wolfram_sim.py"
+
+
+@dataclass
+class Probe:
+    argv: List[str]
+    stamps: List[str] = field(default_factory=list)
+
+
+def module_probe(module: str) -> Optional[Probe]:
+    """Probe of an importable module's __version__, keyed by its __init__ file; None if not installed."""
+    spec = importlib.util.find_spec(module)
+    if spec is None or not spec.origin:
+        return None
+    code = f"import {module}; print({module}.__version__)"
+    return Probe([sys.executable, "-c", code], [spec.origin])
+
+
+def known_probes() -> Dict[str, Optional[Probe]]:
+    return {
+        "python": Probe([sys.executable, "--version"]),
+        "wolframscript": Probe(["wolframscript", "-version"]),
+        "WolframKernel": Probe(["WolframKernel", "-version"]),
+        "sim": Probe([sys.executable, str(SIM_PY), "-version"]),
+        "matplotlib": module_probe("matplotlib"),
+    }
+
+
+def cache_root_from_env() -> Optional[Path]:
+    raw = os.environ.get("TOOLCHAIN_CACHE", "").strip()
+    if raw.lower() in {"off", "0", "none"}:
+        return None
+    return Path(raw) if raw else DEFAULT_CACHE_ROOT
+
+
+def fingerprint(probe: Probe) -> Optional[str]:
+    """Stat-based identity of a probe, or None when its binary is not installed."""
+    binary = shutil.which(probe.argv[0])
+    if binary is None:
+        return None
+    files = [binary] + [a for a in probe.argv[1:] if os.path.isfile(a)] + probe.stamps
+    parts = []
+    for f in files:
+        real = os.path.realpath(f)
+        try:
+            st = os.stat(real)
+        except OSError:
+            return None
+        parts.append(f"{real}:{st.st_mtime_ns}:{st.st_ino}:{st.st_size}")
+    return "|".join(parts + [" ".join(probe.argv[1:])])
+
+
+def run_probe(argv: List[str]) -> str:
+    try:
+        out = subprocess.run(argv, check=False, capture_output=True, text=True, timeout=PROBE_TIMEOUT_SEC)
+    except (OSError, subprocess.TimeoutExpired):
+        return "unavailable"
+    lines = (out.stdout or out.stderr).strip().splitlines()
+    return lines[0].strip() if lines else "unknown"
+
+
+def _load(path: Path) -> Dict[str, Dict[str, str]]:
+    try:
+        data = jsonio.read_json(path)
+    except Exception:
+        return {}
+    if data.get("version") != CACHE_VERSION or not isinstance(data.get("entries"), dict):
+        return {}
+    return data["entries"]
+
+
+def _store(path: Path, fresh: Dict[str, Dict[str, str]]) -> None:
+    # Re-read before writing so concurrent runs merge instead of clobbering each other.
+    entries = _load(path)
+    entries.update(fresh)
+    jsonio.write_json(path, {"version": CACHE_VERSION, "entries": entries}, compact=True)
+
+
+def probe_versions(probes: Dict[str, Optional[Probe]], cache_root: Optional[Path] = None) -> Dict[str, str]:
+    """Version string per name; "unavailable" for missing tools. Cached probes do not spawn anything."""
+    root = cache_root if cache_root is not None else cache_root_from_env()
+    cache_path = root / "versions.json" if root is not None else None
+    entries = _load(cache_path) if cache_path is not None else {}
+
+    out: Dict[str, str] = {}
+    cold: Dict[str, str] = {}
+    for name, probe in probes.items():
+        key = fingerprint(probe) if probe is not None else None
+        if key is None:
+            out[name] = "unavailable"
+        elif key in entries:
+            out[name] = entries[key]["version"]
+        else:
+            cold[name] = key
+    if cold:
+        with ThreadPoolExecutor(max_workers=len(cold)) as pool:
+            found = dict(zip(cold, pool.map(lambda n: run_probe(probes[n].argv), cold)))
+        out.update(found)
+        if cache_path is not None:
+            now = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+            fresh = {
+                cold[name]: {"name": name, "version": ver, "probed_at_utc": now}
+                for name, ver in found.items()
+                if ver != "unavailable"
+            }
+            try:
+                _store(cache_path, fresh)
+            except OSError:
+                pass
+    return {name: out[name] for name in probes}
+
+
+def versions(names: List[str], cache_root: Optional[Path] = None) -> Dict[str, str]:
+    probes = known_probes()
+    return probe_versions({name: probes.get(name) for name in names}, cache_root)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="toolchain")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    pg = sub.add_parser("get", help="Print the version of each named tool, one per line.")
+    pg.add_argument("names", nargs="+")
+    sub.add_parser("versions", help="Print name=version for every known tool.")
+    args = parser.parse_args()
+
+    if args.cmd == "get":
+        for ver in versions(args.names).values():
+            print(ver)
+        return 0
+    for name, ver in versions(list(known_probes())).items():
+        print(f"{name}={ver}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Child spans for skill scripts; same record format as tracing.py, wall time only.
+# No-op passthrough unless AGENTHUB_TRACE_FILE is set by the parent run.
+
+trace_now_us() {
+  if [[ -n "${EPOCHREALTIME:-}" ]]; then
+    local t="${EPOCHREALTIME//[.,]/}"
+    printf '%s\n' "$t"
+  else
+    printf '%s\n' "$(( $(date +%s%N) / 1000 ))"
+  fi
+}
+
+trace_json_str() {
+  local s="${1//\\/\\\\}"
+  s="${s//\"/\\\"}"
+  printf '"%s"' "$s"
+}
+
+trace_cmd_name() {
+  # usage: trace_cmd_name <cmd> [args...] -> e.g. "python3 paper_shadow.py snapshot"
+  local name="${1##*/}"
+  case "$name" in
+    python|python3|bash|sh)
+      [[ $# -ge 2 ]] && name="$name ${2##*/}"
+      [[ $# -ge 3 && "${3:0:1}" != "-" ]] && name="$name $3"
+      ;;
+    git)
+      local a
+      for a in "${@:2}"; do
+        [[ "${a:0:1}" == "-" || "$a" == */* ]] && continue
+        name="git $a"
+        break
+      done
+      ;;
+  esac
+  printf '%s\n' "$name"
+}
+
+trace_run() {
+  # usage: trace_run <span_name> <cmd> [args...]
+  local name="$1"
+  shift
+  if [[ -z "${AGENTHUB_TRACE_FILE:-}" ]]; then
+    "$@"
+    return
+  fi
+  local sid parent t0 t1 rc=0 status="ok"
+  sid="$(printf '%04x%04x%04x%04x' "$RANDOM" "$RANDOM" "$RANDOM" "$$")"
+  parent="${AGENTHUB_TRACE_PARENT:-}"
+  t0="$(trace_now_us)"
+  AGENTHUB_TRACE_PARENT="$sid" "$@" || rc=$?
+  t1="$(trace_now_us)"
+  [[ "$rc" -eq 0 ]] || status="fail"
+  printf '{"trace_id":%s,"span_id":"%s","parent_id":%s,"name":%s,"pid":%s,"start_unix":%s.%06d,"wall_s":%s.%06d,"cpu_s":null,"child_cpu_s":null,"rss_kb":null,"status":"%s","attrs":{"rc":%s}}\n' \
+    "$(trace_json_str "${AGENTHUB_TRACE_ID:-}")" "$sid" \
+    "$( [[ -n "$parent" ]] && trace_json_str "$parent" || printf 'null' )" \
+    "$(trace_json_str "$name")" "$$" \
+    "$(( t0 / 1000000 ))" "$(( t0 % 1000000 ))" \
+    "$(( (t1 - t0) / 1000000 ))" "$(( (t1 - t0) % 1000000 ))" \
+    "$status" "$rc" >> "$AGENTHUB_TRACE_FILE"
+  return "$rc"
+}
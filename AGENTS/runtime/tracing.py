@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Lightweight span tracing for agenthub runs and skill scripts.
+
+Spans are appended as JSON lines (one write per line, O_APPEND) to the file
+named by AGENTHUB_TRACE_FILE, normally AGENTS/tasks/<id>/logs/trace.jsonl.
+Each span records wall time, CPU time of the process and of its reaped
+children, and resident memory. Child processes join the trace through the
+environment: AGENTHUB_TRACE_ID names the trace and AGENTHUB_TRACE_PARENT the
+span they run under. Bash scripts use trace.sh; Python scripts call span().
+With no trace file configured every call here is a no-op.
+"""
+import argparse
+import json
+import os
+import resource
+import secrets
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+ENV_FILE = "AGENTHUB_TRACE_FILE"
+ENV_TRACE_ID = "AGENTHUB_TRACE_ID"
+ENV_PARENT = "AGENTHUB_TRACE_PARENT"
+_STACK: List["Span"] = []
+_BASE_PARENT = os.environ.get(ENV_PARENT, "")
+_PAGE_KB = os.sysconf("SC_PAGE_SIZE") // 1024 if hasattr(os, "sysconf") else 4
+
+
+def new_id() -> str:
+    return secrets.token_hex(8)
+
+
+def enabled() -> bool:
+    return bool(os.environ.get(ENV_FILE, "").strip())
+
+
+def configure(trace_file: Path, trace_id: Optional[str] = None) -> str:
+    """Point this process (and children inheriting os.environ) at trace_file; returns the trace id."""
+    trace_file.parent.mkdir(parents=True, exist_ok=True)
+    tid = trace_id or os.environ.get(ENV_TRACE_ID) or new_id()
+    os.environ[ENV_FILE] = str(trace_file)
+    os.environ[ENV_TRACE_ID] = tid
+    return tid
+
+
+def rss_kb() -> int:
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_KB
+    except (OSError, IndexError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def write_record(record: Dict[str, Any]) -> None:
+    path = os.environ.get(ENV_FILE, "").strip()
+    if not path:
+        return
+    data = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _export_parent() -> None:
+    """Keep AGENTHUB_TRACE_PARENT on the innermost open span so any subprocess inherits it."""
+    if _STACK:
+        os.environ[ENV_PARENT] = _STACK[-1].span_id
+    elif _BASE_PARENT:
+        os.environ[ENV_PARENT] = _BASE_PARENT
+    else:
+        os.environ.pop(ENV_PARENT, None)
+
+
+class Span:
+    def __init__(self, name: str, attrs: Dict[str, Any]) -> None:
+        self.name = name
+        self.attrs = attrs
+        self.span_id = new_id()
+        self.trace_id = os.environ.get(ENV_TRACE_ID) or new_id()
+        self.parent_id = _STACK[-1].span_id if _STACK else (os.environ.get(ENV_PARENT) or None)
+        self.start_unix = time.time()
+        self._t0 = time.perf_counter()
+        self._self0 = resource.getrusage(resource.RUSAGE_SELF)
+        self._child0 = resource.getrusage(resource.RUSAGE_CHILDREN)
+        self.closed = False
+
+    def end(self, status: str = "ok", **attrs: Any) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if self in _STACK:
+            _STACK.remove(self)
+        _export_parent()
+        self_ru = resource.getrusage(resource.RUSAGE_SELF)
+        child_ru = resource.getrusage(resource.RUSAGE_CHILDREN)
+        self.attrs.update(attrs)
+        write_record(
+            {
+                "trace_id": self.trace_id,
+                "span_id": self.span_id,
+                "parent_id": self.parent_id,
+                "name": self.name,
+                "pid": os.getpid(),
+                "start_unix": round(self.start_unix, 6),
+                "wall_s": round(time.perf_counter() - self._t0, 6),
+                "cpu_s": round(
+                    (self_ru.ru_utime - self._self0.ru_utime) + (self_ru.ru_stime - self._self0.ru_stime), 6
+                ),
+                "child_cpu_s": round(
+                    (child_ru.ru_utime - self._child0.ru_utime) + (child_ru.ru_stime - self._child0.ru_stime), 6
+                ),
+                "rss_kb": rss_kb(),
+                "max_rss_kb": self_ru.ru_maxrss,
+                "child_max_rss_kb": child_ru.ru_maxrss,
+                "status": status,
+                "attrs": self.attrs,
+            }
+        )
+
+
+def start_span(name: str, **attrs: Any) -> Optional[Span]:
+    if not enabled():
+        return None
+    s = Span(name, attrs)
+    _STACK.append(s)
+    _export_parent()
+    return s
+
+
+def end_span(s: Optional[Span], status: str = "ok", **attrs: Any) -> None:
+    if s is not None:
+        s.end(status, **attrs)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Optional[Span]]:
+    s = start_span(name, **attrs)
+    try:
+        yield s
+    except BaseException as err:
+        end_span(s, "error", error=type(err).__name__)
+        raise
+    end_span(s)
+
+
+def child_env(env: Dict[str, str]) -> Dict[str, str]:
+    """A copied env updated so a subprocess records its spans under the innermost open span."""
+    if not enabled():
+        return env
+    env[ENV_FILE] = os.environ[ENV_FILE]
+    env[ENV_TRACE_ID] = os.environ.get(ENV_TRACE_ID, "")
+    if _STACK:
+        env[ENV_PARENT] = _STACK[-1].span_id
+    return env
+
+
+class PhaseSpans:
+    """Sequential phase spans under one root span; entering a phase closes the previous one."""
+
+    def __init__(self, name: str, **attrs: Any) -> None:
+        self.root = start_span(name, **attrs)
+        self.current: Optional[Span] = None
+
+    def enter(self, name: str, **attrs: Any) -> None:
+        end_span(self.current)
+        self.current = start_span(name, **attrs)
+
+    def finish(self, status: str = "ok", **attrs: Any) -> None:
+        end_span(self.current, status)
+        self.current = None
+        end_span(self.root, status, **attrs)
+
+
+def load_records(trace_file: Path) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    if not trace_file.exists():
+        return out
+    for line in trace_file.read_text(encoding="utf-8", errors="replace").splitlines():
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(rec, dict) and rec.get("span_id"):
+            out.append(rec)
+    return out
+
+
+def _fmt_s(v: Any) -> str:
+    return "-" if v is None else f"{float(v):.3f}"
+
+
+def render_profile(records: List[Dict[str, Any]], width: int = 30) -> List[str]:
+    """Flame-style text: one block per trace, children indented under parents with a wall-time bar."""
+    by_id = {r["span_id"]: r for r in records}
+    children: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    for r in records:
+        parent = r.get("parent_id") if r.get("parent_id") in by_id else None
+        children.setdefault(parent, []).append(r)
+    for kids in children.values():
+        kids.sort(key=lambda r: float(r.get("start_unix") or 0))
+
+    lines: List[str] = []
+    for root in children.get(None, []):
+        total = float(root.get("wall_s") or 0) or 1e-9
+        if lines:
+            lines.append("")
+        lines.append(f"TRACE {root.get('trace_id', '')} started {time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(float(root.get('start_unix') or 0)))}")
+        lines.append(f"{'wall_s':>9} {'cpu_s':>8} {'child_cpu':>9} {'rss_mb':>7}  {'':<{width}}  span")
+
+        def walk(r: Dict[str, Any], depth: int) -> None:
+            wall = float(r.get("wall_s") or 0)
+            bar = "#" * max(1 if wall > 0 else 0, round(width * wall / total))
+            rss = r.get("rss_kb")
+            status = "" if r.get("status", "ok") == "ok" else f" [{r.get('status')}]"
+            lines.append(
+                f"{wall:9.3f} {_fmt_s(r.get('cpu_s')):>8} {_fmt_s(r.get('child_cpu_s')):>9} "
+                f"{(f'{rss / 1024:.1f}' if isinstance(rss, (int, float)) else '-'):>7}  "
+                f"{bar:<{width}}  {'  ' * depth}{r.get('name', '?')}{status}"
+            )
+            for c in children.get(r["span_id"], []):
+                walk(c, depth + 1)
+
+        walk(root, 0)
+    return lines
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="tracing")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    pe = sub.add_parser("exec", help="Run a command as a child span of the current trace.")
+    pe.add_argument("--name", required=True)
+    pe.add_argument("argv", nargs=argparse.REMAINDER)
+    pr = sub.add_parser("render")
+    pr.add_argument("--trace", required=True)
+    args = parser.parse_args()
+
+    if args.cmd == "exec":
+        argv = args.argv[1:] if args.argv[:1] == ["--"] else args.argv
+        if not argv:
+            print("tracing exec: missing command", file=sys.stderr)
+            return 2
+        s = start_span(args.name, argv=argv[:4])
+        rc = subprocess.call(argv, env=child_env(os.environ.copy()))
+        end_span(s, "ok" if rc == 0 else "fail", rc=rc)
+        return rc
+    if args.cmd == "render":
+        for line in render_profile(load_records(Path(args.trace))):
+            print(line)
+        return 0
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Incremental tree materialization for GATE staging.
+
+Files are placed with a copy-on-write reflink when the filesystem supports it,
+with a hard link when the source is an immutable (read-only) artifact, and with
+a plain copy otherwise. A content-hash manifest kept next to the destination
+lets re-staging skip files that did not change since the previous run.
+With a content store (cas.py), changed files are placed from their stored
+object instead of from the source, so identical read-only files share one
+inode. Every staged file keeps its source's permission bits; a mode change
+alone re-places the file.
+"""
+import argparse
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+MANIFEST_VERSION = 1
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+FICLONE = 0x40049409
+_UNSUPPORTED_ERRNOS = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EPERM}
+_reflink_unsupported: Set[Tuple[int, int]] = set()
+
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def is_immutable(st: os.stat_result) -> bool:
+    return not (st.st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+def _tmp_path(dst: Path) -> Path:
+    return dst.with_name(f".{dst.name}.sync.{os.getpid()}")
+
+
+def try_reflink(src: Path, dst: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    dev_key = (src.stat().st_dev, dst.parent.stat().st_dev)
+    if dev_key in _reflink_unsupported:
+        return False
+    tmp = _tmp_path(dst)
+    try:
+        with src.open("rb") as s, tmp.open("wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    except OSError as exc:
+        tmp.unlink(missing_ok=True)
+        if exc.errno in _UNSUPPORTED_ERRNOS:
+            _reflink_unsupported.add(dev_key)
+            return False
+        raise
+    shutil.copymode(src, tmp)
+    os.replace(tmp, dst)
+    return True
+
+
+def try_hardlink(src: Path, dst: Path) -> bool:
+    tmp = _tmp_path(dst)
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError as exc:
+        if exc.errno in _UNSUPPORTED_ERRNOS or exc.errno == errno.EMLINK:
+            return False
+        raise
+    os.replace(tmp, dst)
+    return True
+
+
+def plain_copy(src: Path, dst: Path) -> None:
+    tmp = _tmp_path(dst)
+    try:
+        shutil.copyfile(src, tmp)
+        shutil.copymode(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def place_file(src: Path, dst: Path, mode: str = "auto") -> str:
+    """Materialize src at dst and return the method used (reflink/hardlink/copy)."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if mode in {"auto", "reflink"} and try_reflink(src, dst):
+        return "reflink"
+    if mode == "hardlink" or (mode == "auto" and is_immutable(src.stat())):
+        if try_hardlink(src, dst):
+            return "hardlink"
+    plain_copy(src, dst)
+    return "copy"
+
+
+def place_symlink(src: Path, dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _tmp_path(dst)
+    tmp.unlink(missing_ok=True)
+    os.symlink(os.readlink(src), tmp)
+    os.replace(tmp, dst)
+
+
+def iter_source_dirs(src: Path, rel: str) -> Iterator[str]:
+    if not src.is_dir() or src.is_symlink():
+        return
+    for dirpath, dirnames, _ in os.walk(src):
+        dirnames[:] = sorted(d for d in dirnames if not (Path(dirpath) / d).is_symlink())
+        sub = Path(dirpath).relative_to(src).as_posix()
+        yield rel if sub == "." else f"{rel}/{sub}"
+
+
+def iter_source_files(src: Path, rel: str) -> Iterator[Tuple[Path, str]]:
+    if not src.is_dir() or src.is_symlink():
+        yield src, rel
+        return
+    for dirpath, dirnames, filenames in os.walk(src):
+        dirnames.sort()
+        base = Path(dirpath)
+        sub = base.relative_to(src).as_posix()
+        prefix = rel if sub == "." else f"{rel}/{sub}"
+        for name in sorted(filenames):
+            yield base / name, f"{prefix}/{name}"
+        for name in dirnames:
+            p = base / name
+            if p.is_symlink():
+                yield p, f"{prefix}/{name}"
+
+
+def load_manifest(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        obj = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(obj, dict) or obj.get("version") != MANIFEST_VERSION:
+        return {}
+    files = obj.get("files", {})
+    return files if isinstance(files, dict) else {}
+
+
+def write_manifest(path: Path, files: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps({"version": MANIFEST_VERSION, "files": files}, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _unchanged(prev: Optional[Dict[str, Any]], st: os.stat_result, dst: Path) -> Tuple[bool, str]:
+    if not prev or not dst.is_file() or dst.is_symlink():
+        return False, ""
+    dst_st = dst.stat()
+    if dst_st.st_size != st.st_size or dst_st.st_mtime_ns != prev.get("dst_mtime_ns"):
+        return False, ""
+    if stat.S_IMODE(dst_st.st_mode) != stat.S_IMODE(st.st_mode):
+        return False, ""
+    if prev.get("size") == st.st_size and prev.get("src_mtime_ns") == st.st_mtime_ns:
+        return True, str(prev.get("sha256", ""))
+    return False, ""
+
+
+def prune(dest: Path, keep: Set[str], keep_dirs: Set[str], protected: Set[Path]) -> int:
+    removed = 0
+    if not dest.exists():
+        return 0
+    for dirpath, dirnames, filenames in os.walk(dest, topdown=False):
+        base = Path(dirpath)
+        for name in filenames + [d for d in dirnames if (base / d).is_symlink()]:
+            p = base / name
+            if p in protected:
+                continue
+            rel = p.relative_to(dest).as_posix()
+            if rel not in keep:
+                p.unlink()
+                removed += 1
+        if base != dest and base.relative_to(dest).as_posix() not in keep_dirs:
+            try:
+                base.rmdir()
+            except OSError:
+                pass
+    return removed
+
+
+def sync_items(
+    items: List[Tuple[Path, str]],
+    dest: Path,
+    manifest_path: Path,
+    mode: str = "auto",
+    do_prune: bool = True,
+    store: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """Mirror (source, relative destination) items into dest, rewriting only changed files."""
+    if mode not in LINK_MODES:
+        raise ValueError(f"unsupported link mode: {mode}")
+    dest.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(manifest_path)
+    files: Dict[str, Any] = {}
+    keep_dirs: Set[str] = set()
+    counts = {"reflink": 0, "hardlink": 0, "copy": 0, "symlink": 0, "unchanged": 0, "removed": 0}
+    for src_root, rel_root in items:
+        for rel_dir in iter_source_dirs(src_root, rel_root.strip("/")):
+            (dest / rel_dir).mkdir(parents=True, exist_ok=True)
+            keep_dirs.add(rel_dir)
+        for src, rel in iter_source_files(src_root, rel_root.strip("/")):
+            dst = dest / rel
+            if src.is_symlink():
+                place_symlink(src, dst)
+                files[rel] = {"symlink": os.readlink(src)}
+                counts["symlink"] += 1
+                continue
+            st = src.stat()
+            same, digest = _unchanged(previous.get(rel), st, dst)
+            if same:
+                method = str(previous[rel].get("method", "copy"))
+                counts["unchanged"] += 1
+            else:
+                digest = sha256_file(src)
+                prev = previous.get(rel) or {}
+                if (
+                    prev.get("sha256") == digest
+                    and dst.is_file()
+                    and dst.stat().st_size == st.st_size
+                    and dst.stat().st_mtime_ns == prev.get("dst_mtime_ns")
+                    and stat.S_IMODE(dst.stat().st_mode) == stat.S_IMODE(st.st_mode)
+                ):
+                    method = str(prev.get("method", "copy"))
+                    counts["unchanged"] += 1
+                else:
+                    if dst.is_dir() and not dst.is_symlink():
+                        shutil.rmtree(dst)
+                    if store is not None:
+                        method = store.stage(src, dst, digest, mode, stat.S_IMODE(st.st_mode))
+                    else:
+                        method = place_file(src, dst, mode)
+                    counts[method] += 1
+            files[rel] = {
+                "size": st.st_size,
+                "sha256": digest,
+                "method": method,
+                "src_mtime_ns": st.st_mtime_ns,
+                "dst_mtime_ns": dst.stat().st_mtime_ns,
+            }
+    if do_prune:
+        counts["removed"] = prune(dest, set(files), keep_dirs, {manifest_path})
+        if store is not None:
+            store.drop_refs(dest / rel for rel in previous if rel not in files)
+    write_manifest(manifest_path, files)
+    return {"files": files, "counts": counts}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="tree_sync")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    ps = sub.add_parser("sync")
+    ps.add_argument("--dest", required=True)
+    ps.add_argument("--manifest", required=True)
+    ps.add_argument("--mode", default=os.environ.get("STAGE_LINK_MODE", "auto"), choices=LINK_MODES)
+    ps.add_argument("--item", nargs=2, action="append", default=[], metavar=("SRC", "REL"))
+    ps.add_argument("--no-prune", action="store_true")
+    args = parser.parse_args()
+
+    if args.cmd == "sync":
+        items = [(Path(src), rel) for src, rel in args.item]
+        missing = [str(src) for src, _ in items if not src.exists() and not src.is_symlink()]
+        if missing:
+            print(f"tree_sync: missing source: {missing[0]}", file=sys.stderr)
+            return 2
+        import cas
+
+        with cas.open_store() or nullcontext() as store:
+            out = sync_items(
+                items, Path(args.dest), Path(args.manifest), mode=args.mode, do_prune=not args.no_prune, store=store
+            )
+        c = out["counts"]
+        print(
+            f"SYNC_FILES={len(out['files'])} REFLINK={c['reflink']} HARDLINK={c['hardlink']} "
+            f"COPY={c['copy']} UNCHANGED={c['unchanged']} REMOVED={c['removed']}"
+        )
+        return 0
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
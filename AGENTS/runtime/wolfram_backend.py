@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Wolfram execution backends behind one selection point.
+
+Every Wolfram path (compute_algebraic, compute_algebraic_multistep and the
+wolfram backend of compute_runner) runs a .wl script with its inputs and
+outputs passed through the environment (INPUT_JSON/RESULT_JSON/FIG_DIR,
+REQUEST_JSON_PATH/STEP_OUTPUT_JSON/STEP_TIME_LIMIT/STEP_MAX_LEAF/
+STEP_CHECK_LEVEL, COMPUTE_SPEC_JSON/COMPUTE_BACKEND_OUTPUT). A backend only
+decides which program runs the script:
+
+  wolframscript   wolframscript -file <script>
+  WolframKernel   WolframKernel -noprompt -script <script>
+  sim             wolfram_sim.py -file <script>  (offline stand-in, see there)
+
+WOLFRAM_BACKEND selects one by name; unset or "auto" takes the first real
+backend on PATH. The simulator is never chosen implicitly.
+Bash callers source wolfram_backend.sh instead of parsing this module.
+"""
+import argparse
+import os
+import shutil
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from toolchain import Probe, probe_versions
+
+ENV_BACKEND = "WOLFRAM_BACKEND"
+SIM_PY = Path(__file__).resolve().parent / "wolfram_sim.py"
+AUTO_ORDER = ("wolframscript", "WolframKernel")
+
+
+@dataclass
+class WolframBackend:
+    label: str
+    argv_prefix: List[str]
+    version_argv: List[str] = field(default_factory=list)
+
+    def command(self, script: Path) -> List[str]:
+        return [*self.argv_prefix, str(script)]
+
+    def version(self) -> str:
+        if not self.version_argv:
+            return "unknown"
+        return probe_versions({self.label: Probe(self.version_argv)})[self.label]
+
+
+def _factories() -> Dict[str, WolframBackend]:
+    return {
+        "wolframscript": WolframBackend("wolframscript", ["wolframscript", "-file"], ["wolframscript", "-version"]),
+        "WolframKernel": WolframBackend(
+            "WolframKernel", ["WolframKernel", "-noprompt", "-script"], ["WolframKernel", "-version"]
+        ),
+        "sim": WolframBackend("sim", [sys.executable, str(SIM_PY), "-file"], [sys.executable, str(SIM_PY), "-version"]),
+    }
+
+
+def names() -> List[str]:
+    return list(_factories())
+
+
+def available(name: str) -> bool:
+    if name == "sim":
+        return SIM_PY.is_file()
+    return shutil.which(name) is not None
+
+
+def resolve(preference: Optional[str] = None) -> Optional[WolframBackend]:
+    """The backend named by preference (default $WOLFRAM_BACKEND), or the first real one on PATH."""
+    choice = (preference if preference is not None else os.environ.get(ENV_BACKEND, "")).strip() or "auto"
+    backends = _factories()
+    if choice.lower() == "auto":
+        for name in AUTO_ORDER:
+            if available(name):
+                return backends[name]
+        return None
+    for name, backend in backends.items():
+        if name.lower() == choice.lower():
+            return backend if available(name) else None
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="wolfram_backend")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    pr = sub.add_parser("resolve", help="Print label, version and argv prefix, one per line.")
+    pr.add_argument("--backend", default=None)
+    pr.add_argument("--no-version", action="store_true")
+    sub.add_parser("list")
+    args = parser.parse_args()
+
+    if args.cmd == "list":
+        for name in names():
+            print(f"{name}={'available' if available(name) else 'missing'}")
+        return 0
+    backend = resolve(args.backend)
+    if backend is None:
+        choice = args.backend or os.environ.get(ENV_BACKEND, "") or "auto"
+        print(f"No Wolfram backend available for {ENV_BACKEND}={choice} (expected wolframscript or WolframKernel).", file=sys.stderr)
+        return 1
+    print(backend.label)
+    print("unavailable" if args.no_version else backend.version())
+    for part in backend.argv_prefix:
+        print(part)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
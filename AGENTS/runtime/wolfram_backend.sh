@@ -0,0 +1,21 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Backend selection for skill scripts that run .wl files; see wolfram_backend.py.
+# usage: wolfram_backend_resolve [--no-version]
+#   sets WOLFRAM_LABEL, WOLFRAM_VERSION and the array WOLFRAM_CMD (append the script path);
+#   returns 1 with an explanation on stderr when no backend is available.
+
+WOLFRAM_BACKEND_PY="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/wolfram_backend.py"
+
+wolfram_backend_resolve() {
+  local lines=()
+  WOLFRAM_LABEL=""
+  WOLFRAM_VERSION="unavailable"
+  WOLFRAM_CMD=()
+  mapfile -t lines < <(python3 "$WOLFRAM_BACKEND_PY" resolve "$@" || true)
+  [[ "${#lines[@]}" -ge 3 ]] || return 1
+  WOLFRAM_LABEL="${lines[0]}"
+  WOLFRAM_VERSION="${lines[1]}"
+  WOLFRAM_CMD=("${lines[@]:2}")
+}
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Offline stand-in for wolframscript (WOLFRAM_BACKEND=sim).
+
+Accepts the wolframscript command line used by the skills (-file <script>,
+-code <expr>, -version) and honours the same environment contract as the
+generated .wl scripts, so the surrounding pipeline runs unchanged:
+
+  STEP_OUTPUT_JSON set     multistep step: reads REQUEST_JSON_PATH, enforces
+                           STEP_MAX_LEAF, sleeps out STEP_TIME_LIMIT on a
+                           simulated timeout, writes the step record, exit 0/3
+  RESULT_JSON set          compute_algebraic: reads INPUT_JSON, writes result
+  COMPUTE_BACKEND_OUTPUT   compute_runner: writes a results/sanity_checks payload
+
+Nothing is evaluated: results echo the input expression and carry
+"simulated": true. Leaf counts approximate LeafCount from the expression text.
+
+Load-test knobs (all optional):
+  WOLFRAM_SIM_STARTUP_MS   per-process start cost, "ms" or "min:max"
+  WOLFRAM_SIM_LATENCY_MS   per-evaluation cost, "ms" or "min:max"
+  WOLFRAM_SIM_FAIL_RATE    probability of a clean failure record
+  WOLFRAM_SIM_TIMEOUT_RATE probability of a timeout (sleeps the step limit)
+  WOLFRAM_SIM_CRASH_RATE   probability of exiting 1 without writing output
+  WOLFRAM_SIM_HANG_RATE    probability of never returning (for outer timeouts)
+  WOLFRAM_SIM_FAIL_MATCH   substring of the script path that always fails
+  WOLFRAM_SIM_SEED         makes the draws reproducible per script and output
+  WOLFRAM_SIM_LOG          JSONL file with one record per invocation
+"""
+import json
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SIM_VERSION = "WolframScript 1.10.0 (wolfram_sim)"
+LEAF_RE = re.compile(r"[A-Za-z$][A-Za-z0-9$]*|\d+(?:\.\d+)?|[-+*/^=<>!]+|\[")
+INTENT_RE = re.compile(r"^\(\*\s*(.*?)\s*\*\)")
+DEFAULT_TIMEOUT_S = 10.0
+EXIT_STEP_FAILED = 3
+
+
+def env_float(name: str, default: float = 0.0) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def duration_ms(rng: random.Random, name: str) -> float:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return 0.0
+    lo, _, hi = raw.partition(":")
+    try:
+        a = float(lo)
+        b = float(hi) if hi else a
+    except ValueError:
+        return 0.0
+    return rng.uniform(min(a, b), max(a, b))
+
+
+def leaf_count(expr: str) -> int:
+    """Rough LeafCount: atoms, operators and function heads in the input text."""
+    return max(1, len(LEAF_RE.findall(expr)))
+
+
+def read_json(path: str) -> Dict[str, Any]:
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_json(path: str, payload: Dict[str, Any]) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def script_intent(script: Optional[Path]) -> str:
+    if script is None or not script.is_file():
+        return "simulated"
+    first = script.read_text(encoding="utf-8", errors="replace").lstrip().splitlines()[:1]
+    m = INTENT_RE.match(first[0]) if first else None
+    return m.group(1) if m else script.stem
+
+
+def draw_outcome(rng: random.Random, script: Optional[Path]) -> str:
+    match = os.environ.get("WOLFRAM_SIM_FAIL_MATCH", "")
+    if match and script is not None and match in str(script):
+        return "fail"
+    roll = rng.random()
+    for outcome, knob in (
+        ("hang", "WOLFRAM_SIM_HANG_RATE"),
+        ("crash", "WOLFRAM_SIM_CRASH_RATE"),
+        ("timeout", "WOLFRAM_SIM_TIMEOUT_RATE"),
+        ("fail", "WOLFRAM_SIM_FAIL_RATE"),
+    ):
+        p = env_float(knob)
+        if roll < p:
+            return outcome
+        roll -= p
+    return "ok"
+
+
+def run_step(outcome: str, script: Optional[Path]) -> int:
+    request = read_json(os.environ.get("REQUEST_JSON_PATH", ""))
+    inputs = request.get("inputs", {}) if isinstance(request.get("inputs"), dict) else {}
+    expr = str(inputs.get("expression", "x^2 + 2 x + 1"))
+    max_leaf = int(env_float("STEP_MAX_LEAF", 50000))
+    check_level = os.environ.get("STEP_CHECK_LEVEL", "equivalence").lower()
+
+    status, message, leaves = "ok", "", leaf_count(expr)
+    if outcome == "timeout":
+        time.sleep(env_float("STEP_TIME_LIMIT", DEFAULT_TIMEOUT_S))
+        status, message, leaves = "failed", "step_failed_or_timeout", -1
+    elif outcome == "fail":
+        status, message, leaves = "failed", "simulated_failure", -1
+    elif leaves > max_leaf:
+        status, message = "failed", "leaf_count_exceeded"
+    write_json(
+        os.environ["STEP_OUTPUT_JSON"],
+        {
+            "intent": script_intent(script),
+            "status": status,
+            "message": message,
+            "leaf_count": leaves,
+            "result": expr if status == "ok" else "",
+            "equivalence_check": "True" if status == "ok" else "not_run",
+            "spotcheck": "0" if status == "ok" and "spotcheck" in check_level else "not_run",
+            "simulated": True,
+        },
+    )
+    return 0 if status == "ok" else EXIT_STEP_FAILED
+
+
+def run_algebraic(outcome: str) -> int:
+    data = read_json(os.environ.get("INPUT_JSON", ""))
+    inputs = data.get("inputs", {}) if isinstance(data.get("inputs"), dict) else {}
+    if outcome == "timeout":
+        time.sleep(env_float("WOLFRAM_SIM_TIMEOUT_S", DEFAULT_TIMEOUT_S))
+    if outcome in ("fail", "timeout"):
+        print(f"wolfram_sim: simulated {outcome}", file=sys.stderr)
+        return 1
+    operation = str(inputs.get("operation", "simplify")).lower()
+    expr = str(inputs.get("expression", "(x^2-1)/(x-1)"))
+    result_path = os.environ["RESULT_JSON"]
+    write_json(
+        result_path,
+        {
+            "goal": str(data.get("goal", "")),
+            "operation": operation,
+            "expression": expr,
+            "assumptions": str(inputs.get("assumptions", "True")),
+            "result": expr,
+            "figure": "",
+            "simulated": True,
+        },
+    )
+    print(f"operation={operation}")
+    print(f"result_path={result_path}")
+    return 0
+
+
+def run_compute(outcome: str) -> int:
+    if outcome == "timeout":
+        time.sleep(env_float("WOLFRAM_SIM_TIMEOUT_S", DEFAULT_TIMEOUT_S))
+    if outcome in ("fail", "timeout"):
+        print(f"wolfram_sim: simulated {outcome}", file=sys.stderr)
+        return 1
+    try:
+        spec = json.loads(os.environ.get("COMPUTE_SPEC_JSON", "") or "{}")
+    except ValueError:
+        spec = {}
+    write_json(
+        os.environ["COMPUTE_BACKEND_OUTPUT"],
+        {
+            "results": {"simulated": True, "params": spec.get("params", {}) if isinstance(spec, dict) else {}},
+            "sanity_checks": [{"name": "simulated_backend", "passed": True, "detail": SIM_VERSION}],
+        },
+    )
+    return 0
+
+
+def log_invocation(record: Dict[str, Any]) -> None:
+    path = os.environ.get("WOLFRAM_SIM_LOG", "").strip()
+    if not path:
+        return
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def main(argv: List[str]) -> int:
+    if "-version" in argv:
+        print(SIM_VERSION)
+        return 0
+    script: Optional[Path] = None
+    if "-file" in argv and argv.index("-file") + 1 < len(argv):
+        script = Path(argv[argv.index("-file") + 1])
+        if not script.is_file():
+            print(f"wolfram_sim: file not found: {script}", file=sys.stderr)
+            return 1
+    elif "-code" not in argv:
+        print("usage: wolfram_sim.py -file <script> | -code <expr> | -version", file=sys.stderr)
+        return 2
+
+    started = time.time()
+    t0 = time.perf_counter()
+    out_target = os.environ.get("STEP_OUTPUT_JSON") or os.environ.get("RESULT_JSON") or os.environ.get("COMPUTE_BACKEND_OUTPUT", "")
+    seed = os.environ.get("WOLFRAM_SIM_SEED", "")
+    rng = random.Random(f"{seed}:{script}:{out_target}") if seed else random.Random()
+
+    time.sleep(duration_ms(rng, "WOLFRAM_SIM_STARTUP_MS") / 1000.0)
+    outcome = draw_outcome(rng, script)
+    time.sleep(duration_ms(rng, "WOLFRAM_SIM_LATENCY_MS") / 1000.0)
+
+    rc = 0
+    if outcome == "hang":
+        log_invocation({"pid": os.getpid(), "script": str(script or ""), "start_unix": round(started, 6), "outcome": "hang"})
+        while True:
+            time.sleep(3600)
+    if outcome == "crash":
+        print("wolfram_sim: simulated kernel crash", file=sys.stderr)
+        rc = 1
+    elif os.environ.get("STEP_OUTPUT_JSON"):
+        rc = run_step(outcome, script)
+    elif os.environ.get("RESULT_JSON"):
+        rc = run_algebraic(outcome)
+    elif os.environ.get("COMPUTE_BACKEND_OUTPUT"):
+        rc = run_compute(outcome)
+    else:
+        print("Null")
+
+    log_invocation(
+        {
+            "pid": os.getpid(),
+            "script": str(script or ""),
+            "start_unix": round(started, 6),
+            "wall_s": round(time.perf_counter() - t0, 6),
+            "outcome": outcome,
+            "rc": rc,
+        }
+    )
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
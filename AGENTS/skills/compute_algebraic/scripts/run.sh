@@ -230,18 +230,23 @@ Print["result_path=" <> resultPath];
 If[StringLength[figurePath] > 0, Print["figure=" <> figurePath]];
 WL
 
+# COMPUTE_ENGINE=auto (default) prefers a Wolfram backend and falls back to SymPy when installed.
+source "$ROOT/AGENTS/runtime/wolfram_backend.sh"
+SYMPY_ENGINE_PY="$ROOT/AGENTS/runtime/sympy_engine.py"
+ENGINE_PREF="${COMPUTE_ENGINE:-auto}"
 BACKEND_LABEL=""
 BACKEND_VERSION="unavailable"
-if command -v wolframscript >/dev/null 2>&1; then
-  BACKEND_LABEL="wolframscript"
-  BACKEND_VERSION="$(wolframscript -version 2>&1 | head -n 1 | tr -d '\r')"
-  RUN_CMD=(wolframscript -file "$MAIN_WL")
-elif command -v WolframKernel >/dev/null 2>&1; then
-  BACKEND_LABEL="WolframKernel"
-  BACKEND_VERSION="$(WolframKernel -version 2>&1 | head -n 1 | tr -d '\r' || true)"
-  RUN_CMD=(WolframKernel -noprompt -script "$MAIN_WL")
+REPRO_TARGET="AGENTS/tasks/$TASK_ID/work/src/main.wl"
+if [[ "$ENGINE_PREF" != "sympy" ]] && wolfram_backend_resolve 2>"$STDERR_PATH"; then
+  BACKEND_LABEL="$WOLFRAM_LABEL"
+  BACKEND_VERSION="$WOLFRAM_VERSION"
+  RUN_CMD=("${WOLFRAM_CMD[@]}" "$MAIN_WL")
+elif [[ "$ENGINE_PREF" != "wolfram" ]] && SYMPY_CHECK="$(python3 "$SYMPY_ENGINE_PY" check 2>>"$STDERR_PATH")"; then
+  BACKEND_LABEL="sympy"
+  BACKEND_VERSION="${SYMPY_CHECK#SYMPY_VERSION=}"
+  RUN_CMD=(python3 "$SYMPY_ENGINE_PY" algebraic)
+  REPRO_TARGET="AGENTS/runtime/sympy_engine.py algebraic"
 else
-  echo "No Wolfram backend found (expected wolframscript or WolframKernel)." >"$STDERR_PATH"
   : > "$STDOUT_PATH"
   RUN_RC=2
 fi
@@ -262,7 +267,7 @@ if [[ -f "$RESULT_JSON" ]]; then
   RESULT_PREVIEW="$(cat "$RESULT_JSON")"
 fi
 
-REPRO_CMD="$BACKEND_LABEL with INPUT_JSON/RESULT_JSON/FIG_DIR environment against AGENTS/tasks/$TASK_ID/work/src/main.wl"
+REPRO_CMD="$BACKEND_LABEL with INPUT_JSON/RESULT_JSON/FIG_DIR environment against $REPRO_TARGET"
 
 cat > "$REPORT_PATH" <<EOF
 # Compute Algebraic Report
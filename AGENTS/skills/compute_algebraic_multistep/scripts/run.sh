@@ -195,11 +195,9 @@ If[status === "ok",
 ];
 leafCount = If[status === "ok", LeafCount[stepResult], -1];
 If[leafCount > maxLeaf, status = "failed"; message = "leaf_count_exceeded"];
-equiv = If[status === "ok", Quiet@Check[ToString[FullSimplify[stepResult == stepResult]], "unknown"], "not_run"];
+(* Verification runs after the step: spotcheck.py verify-plan (numeric, FullSimplify only if inconclusive). *)
+equiv = If[status === "ok", "pending", "not_run"];
 spot = "not_run";
-If[status === "ok" && StringContainsQ[ToLowerCase[checkLevel], "spotcheck"],
-  spot = Quiet@Check[ToString[Chop[N[(stepResult - stepResult) /. x -> 1]]], "spotcheck_failed"];
-];
 Export[
   outputPath,
   <|
@@ -259,17 +257,21 @@ if [[ "$EXECUTE_MODE" != "1" ]]; then
   exit 0
 fi
 
+# COMPUTE_ENGINE=auto (default) prefers a Wolfram backend and falls back to SymPy when installed.
+source "$ROOT/AGENTS/runtime/wolfram_backend.sh"
+SYMPY_ENGINE_PY="$ROOT/AGENTS/runtime/sympy_engine.py"
+ENGINE_PREF="${COMPUTE_ENGINE:-auto}"
 BACKEND=""
-if command -v wolframscript >/dev/null 2>&1; then
-  BACKEND="wolframscript"
-elif command -v WolframKernel >/dev/null 2>&1; then
-  BACKEND="WolframKernel"
+if [[ "$ENGINE_PREF" != "sympy" ]] && wolfram_backend_resolve --no-version 2>/dev/null; then
+  BACKEND="$WOLFRAM_LABEL"
+elif [[ "$ENGINE_PREF" != "wolfram" ]] && python3 "$SYMPY_ENGINE_PY" check >/dev/null 2>&1; then
+  BACKEND="sympy"
 fi
 if [[ -z "$BACKEND" ]]; then
   cat > "$REPORT_EXECUTE" <<EOF
 # Execute Report
 
-Execution failed: missing Wolfram backend (wolframscript/WolframKernel).
+Execution failed: missing compute engine (wolframscript/WolframKernel, or SymPy with COMPUTE_ENGINE=auto|sympy).
 EOF
   cat "$REPORT_PLAN" "$REPORT_EXECUTE" > "$REPORT_MD"
   echo "Execution backend missing" >&2
@@ -306,18 +308,21 @@ check_level: $CHECK_LEVEL
 EOF
 
 FAIL=0
+if [[ "$BACKEND" == "sympy" ]]; then
+  # All steps at once in a process pool; the loop below only reads the step records.
+  rm -f "$OUT_DIR"/step_*.json
+  python3 "$SYMPY_ENGINE_PY" run-plan --plan "$PLAN_JSON" --request "$REQ_JSON" --out-dir "$OUT_DIR" \
+    >"$OUT_DIR/sympy_engine.stdout.txt" 2>"$OUT_DIR/sympy_engine.stderr.txt" || FAIL=1
+fi
 for step_file in "$STEPS_DIR"/step_*.wl; do
   [[ -f "$step_file" ]] || continue
   step_name="$(basename "$step_file" .wl)"
   step_out="$OUT_DIR/${step_name}.json"
   step_stdout="$OUT_DIR/${step_name}.stdout.txt"
   step_stderr="$OUT_DIR/${step_name}.stderr.txt"
-  if [[ "$BACKEND" == "wolframscript" ]]; then
-    REQUEST_JSON_PATH="$REQ_JSON" STEP_OUTPUT_JSON="$step_out" STEP_TIME_LIMIT="$STEP_LIMIT" STEP_MAX_LEAF="$MAX_LEAF" STEP_CHECK_LEVEL="$CHECK_LEVEL" \
-      wolframscript -file "$step_file" >"$step_stdout" 2>"$step_stderr" || FAIL=1
-  else
+  if [[ "$BACKEND" != "sympy" ]]; then
     REQUEST_JSON_PATH="$REQ_JSON" STEP_OUTPUT_JSON="$step_out" STEP_TIME_LIMIT="$STEP_LIMIT" STEP_MAX_LEAF="$MAX_LEAF" STEP_CHECK_LEVEL="$CHECK_LEVEL" \
-      WolframKernel -script "$step_file" >"$step_stdout" 2>"$step_stderr" || FAIL=1
+      "${WOLFRAM_CMD[@]}" "$step_file" >"$step_stdout" 2>"$step_stderr" || FAIL=1
   fi
 
   if [[ ! -f "$step_out" ]]; then
@@ -348,6 +353,30 @@ PY
   fi
 done
 
+if [[ "$BACKEND" != "sympy" ]]; then
+  # SymPy steps verify in their workers; Wolfram steps are checked here in one batch.
+  set +e
+  python3 "$ROOT/AGENTS/runtime/spotcheck.py" verify-plan --plan "$PLAN_JSON" --request "$REQ_JSON" --out-dir "$OUT_DIR" --prove wolfram \
+    >> "$REPORT_EXECUTE" 2>"$OUT_DIR/verify.stderr.txt"
+  VERIFY_RC=$?
+  set -e
+  if [[ "$VERIFY_RC" -ne 0 ]]; then
+    # Records still "pending" were never checked; say so instead of shipping them as-is.
+    python3 - <<PY >> "$REPORT_EXECUTE"
+import json
+from pathlib import Path
+for path in sorted(Path("$OUT_DIR").glob("step_*.json")):
+    obj = json.loads(path.read_text(encoding="utf-8"))
+    if obj.get("equivalence_check") == "pending":
+        obj["equivalence_check"] = "verification_failed"
+        path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+        print(f"verify={path.stem} equivalence_check=verification_failed")
+PY
+    echo "verify_status=failed rc=$VERIFY_RC stderr=$(basename "$OUT_DIR")/verify.stderr.txt" >> "$REPORT_EXECUTE"
+    FAIL=1
+  fi
+fi
+
 cat "$REPORT_PLAN" "$REPORT_EXECUTE" > "$REPORT_MD"
 if [[ "$FAIL" -ne 0 ]]; then
   echo "EXECUTION_STATUS=FAILED"
@@ -32,6 +32,12 @@ if [[ ! -d "$TDIR" ]]; then
   echo "Task folder does not exist: $TDIR" >&2
   exit 2
 fi
+
+mapfile -t TOOL_VERS < <(python3 "$ROOT/AGENTS/runtime/toolchain.py" get python matplotlib)
+PY_VER="${TOOL_VERS[0]:-unknown}"
+MPL_VER="${TOOL_VERS[1]:-unavailable}"
+[[ "$MPL_VER" != "unavailable" ]] || MPL_VER="not-installed"
+
 if [[ ! -f "$REQ_JSON" ]]; then
   mkdir -p "$REVIEW_DIR"
   cat > "$NEED_INPUT_MD" <<EOF
@@ -73,7 +79,7 @@ Run aborted because request schema is incomplete.
 
 ## Runtime metadata
 - timestamp_utc: $(date -u +"%Y-%m-%dT%H:%M:%SZ")
-- python_version: $(python3 --version 2>&1 | tr -d '\r')
+- python_version: $PY_VER
 EOF
   echo "REQUEST_COMPLETE=false"
   echo "REQUEST_STEP=goal"
@@ -157,7 +163,7 @@ Run aborted because request schema is incomplete.
 
 ## Runtime metadata
 - timestamp_utc: $(date -u +"%Y-%m-%dT%H:%M:%SZ")
-- python_version: $(python3 --version 2>&1 | tr -d '\r')
+- python_version: $PY_VER
 EOF
   echo "REQUEST_COMPLETE=false"
   echo "REQUEST_STEP=goal"
@@ -277,15 +283,6 @@ RUN_RC=$?
 set -e
 
 TS="$(date -u +"%Y-%m-%dT%H:%M:%SZ")"
-PY_VER="$(python3 --version 2>&1 | tr -d '\r')"
-MPL_VER="$(python3 - <<'PY'
-try:
-    import matplotlib  # type: ignore
-    print(matplotlib.__version__)
-except Exception:
-    print("not-installed")
-PY
-)"
 FIG_LIST="$(find "$FIG_DIR" -maxdepth 1 -type f | sort | sed "s#^$ROOT/##")"
 [[ -n "$FIG_LIST" ]] || FIG_LIST="(none)"
 
@@ -25,6 +25,8 @@ CMD_LOG="$LOG_DIR/commands.txt"
 STDOUT_LOG="$LOG_DIR/${SKILL}.stdout.log"
 STDERR_LOG="$LOG_DIR/${SKILL}.stderr.log"
 GIT_STATUS_LOG="$LOG_DIR/git_status.txt"
+SHADOW_PY="$ROOT/AGENTS/runtime/paper_shadow.py"
+JOURNAL_PY="$ROOT/AGENTS/runtime/edit_journal.py"
 RES_DIR="$ROOT/AGENTS/skills/jhep_writer/resources"
 META_DIR="$RES_DIR/meta"
 
@@ -40,9 +42,12 @@ mkdir -p "$REVIEW_DIR" "$PATCH_DIR" "$LOG_DIR" "$SHADOW_ROOT" "$VENDOR_JHEP"
 
 exec >> "$STDOUT_LOG" 2>> "$STDERR_LOG"
 
+source "$ROOT/AGENTS/runtime/trace.sh"
+source "$ROOT/AGENTS/runtime/repo_state.sh"
+
 run_cmd() {
   printf '%s\n' "$*" >> "$CMD_LOG"
-  "$@"
+  trace_run "$(trace_cmd_name "$@")" "$@"
 }
 
 if [[ ! -d "$USER_PAPER" ]]; then
@@ -50,7 +55,7 @@ if [[ ! -d "$USER_PAPER" ]]; then
   exit 2
 fi
 
-run_cmd rsync -a --delete "$USER_PAPER/" "$SHADOW_PAPER/"
+run_cmd python3 "$SHADOW_PY" snapshot --src "$USER_PAPER" --dest "$SHADOW_PAPER"
 
 if [[ ! -d "$META_DIR" || -z "$(find "$META_DIR" -maxdepth 1 -name '*.json' -print -quit 2>/dev/null)" ]]; then
   echo "Resources metadata not found. Run: bash AGENTS/skills/jhep_writer/scripts/fetch_resources.sh" >> "$STDOUT_LOG"
@@ -135,6 +140,8 @@ if [[ -n "$ENTRY_TEX" ]]; then
     mv "$TMP_FILE" "$ENTRY_TEX"
     MAIN_CHANGE_TYPE="edit"
     ENTRY_REL="${ENTRY_TEX#$SHADOW_PAPER/}"
+    run_cmd python3 "$JOURNAL_PY" record --dest "$SHADOW_PAPER" --path "$ENTRY_REL" \
+      --change-type edit --purpose "Insert deterministic jhep_writer placeholder header"
     echo "- Added placeholder header to existing entry tex: $ENTRY_REL" >> "$REPORT"
   else
     echo "- Existing entry tex already marked with placeholder header" >> "$REPORT"
@@ -184,46 +191,16 @@ Placeholder conclusion text.
 \end{document}
 EOF2
   MAIN_CHANGE_TYPE="add"
+  run_cmd python3 "$JOURNAL_PY" record --dest "$SHADOW_PAPER" --path main.tex \
+    --change-type add --purpose "Create minimal JHEP placeholder starter in shadow tree"
   echo "- Created placeholder main.tex in shadow because USER/paper/main.tex is absent" >> "$REPORT"
 fi
 
-printf '%s\n' "diff -ruN $USER_PAPER $SHADOW_PAPER > $PATCH_FILE" >> "$CMD_LOG"
-set +e
-diff -ruN "$USER_PAPER" "$SHADOW_PAPER" > "$PATCH_FILE"
-DIFF_RC=$?
-set -e
-if [[ "$DIFF_RC" -ne 0 && "$DIFF_RC" -ne 1 ]]; then
-  echo "diff failed with exit code $DIFF_RC" >&2
-  exit "$DIFF_RC"
-fi
-
 if [[ "$MAIN_CHANGE_TYPE" == "edit" ]]; then
-  if [[ -n "${ENTRY_TEX:-}" ]]; then
-    ENTRY_PATH="${ENTRY_TEX#$SHADOW_PAPER/}"
-  else
-    ENTRY_PATH="main.tex"
-  fi
-  EDITED_JSON='[
-    {
-      "path": "'"$ENTRY_PATH"'",
-      "change_type": "edit",
-      "purpose": "Insert deterministic jhep_writer placeholder header",
-      "risk_level": "low"
-    }
-  ]'
   NOTES='Placeholder mode with existing main.tex: added single non-semantic comment header.'
 elif [[ "$MAIN_CHANGE_TYPE" == "add" ]]; then
-  EDITED_JSON='[
-    {
-      "path": "main.tex",
-      "change_type": "add",
-      "purpose": "Create minimal JHEP placeholder starter in shadow tree",
-      "risk_level": "low"
-    }
-  ]'
   NOTES='Placeholder mode without main.tex: created minimal starter main.tex in shadow tree.'
 else
-  EDITED_JSON='[]'
   NOTES='No content edits were required during placeholder mode.'
 fi
 
@@ -234,7 +211,7 @@ cat > "$MANIFEST" <<EOF2
   "journal": "JHEP",
   "input_paper_root": "USER/paper",
   "shadow_root": "AGENTS/tasks/$TASK_ID/work/paper_shadow/paper",
-  "edited_files": $EDITED_JSON,
+  "edited_files": [],
   "jhep_fit_notes": {
     "frontmatter_items": "title, author, affiliation, emailAdd, abstract, keywords, arxivnumber",
     "toc_policy": "No forced TOC; keep structure concise unless user requests otherwise.",
@@ -253,6 +230,9 @@ cat > "$MANIFEST" <<EOF2
 }
 EOF2
 
+run_cmd python3 "$JOURNAL_PY" emit --src "$USER_PAPER" --dest "$SHADOW_PAPER" \
+  --patch "$PATCH_FILE" --manifest "$MANIFEST"
+
 {
   echo
   echo "## Resources Cached"
@@ -282,9 +262,8 @@ EOF2
   echo "- manifest: AGENTS/tasks/$TASK_ID/deliverable/patchset/files_manifest.json"
 } >> "$REPORT"
 
-if command -v git >/dev/null 2>&1 && git -C "$ROOT" rev-parse --is-inside-work-tree >/dev/null 2>&1; then
-  run_cmd git -C "$ROOT" status --porcelain
-  git -C "$ROOT" status --porcelain > "$GIT_STATUS_LOG"
+if trace_run "git status" repo_status "$ROOT" > "$GIT_STATUS_LOG"; then
+  printf '%s\n' "$REPO_STATUS_CMD" >> "$CMD_LOG"
 else
   echo "git not available or repo missing" > "$GIT_STATUS_LOG"
 fi
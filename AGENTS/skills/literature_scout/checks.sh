@@ -26,8 +26,9 @@ for f in "${req[@]}"; do
   [[ -f "$f" ]] || { echo "ERROR: missing $f" >&2; exit 1; }
 done
 
+source "$ROOT/AGENTS/runtime/repo_state.sh"
 if command -v git >/dev/null 2>&1; then
-  BAD="$(git -C "$ROOT" status --porcelain USER GATE || true)"
+  BAD="$(repo_status "$ROOT" || true)"
   [[ -z "$BAD" ]] || { echo "ERROR: USER/GATE modified" >&2; echo "$BAD" >&2; exit 1; }
 fi
 
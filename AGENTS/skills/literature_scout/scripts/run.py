@@ -1,5 +1,4 @@
 #!/usr/bin/env python3
-import json
 import os
 import re
 import sys
@@ -16,6 +15,7 @@ RUNTIME_DIR = Path(__file__).resolve().parents[3] / "runtime"
 if str(RUNTIME_DIR) not in sys.path:
     sys.path.insert(0, str(RUNTIME_DIR))
 
+import jsonio
 from approval import clarify_text
 
 
@@ -76,15 +76,12 @@ def parse_request_md(text: str) -> Dict[str, Any]:
 
 
 def safe_json(path: Path, obj: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    jsonio.write_json(path, obj)
 
 
 def append_jsonl(path: Path, rows: List[Dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, ensure_ascii=True) + "\n")
+    # Machine-only candidate dump: compact rows, fast encoder when available.
+    jsonio.write_jsonl(path, rows)
 
 
 def http_json(url: str, headers: Dict[str, str] | None = None, timeout: float = 15.0) -> Tuple[bool, Any, str]:
@@ -92,7 +89,7 @@ def http_json(url: str, headers: Dict[str, str] | None = None, timeout: float =
     try:
         with urllib.request.urlopen(req, timeout=timeout) as resp:
             data = resp.read().decode("utf-8", errors="replace")
-        return True, json.loads(data), ""
+        return True, jsonio.loads(data), ""
     except Exception as e:
         return False, None, str(e)
 
@@ -294,13 +291,9 @@ def external_search(ctx: Ctx, dossier_dir: Path, budget: Dict[str, int]) -> List
             continue
         try:
             if p.suffix == ".jsonl":
-                for line in p.read_text(encoding="utf-8").splitlines():
-                    line = line.strip()
-                    if not line:
-                        continue
-                    cands.append(json.loads(line))
+                cands.extend(jsonio.iter_jsonl(p))
             else:
-                data = json.loads(p.read_text(encoding="utf-8"))
+                data = jsonio.read_json(p)
                 if isinstance(data, list):
                     cands.extend(data)
                 elif isinstance(data, dict) and isinstance(data.get("results"), list):
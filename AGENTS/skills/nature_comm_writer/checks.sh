@@ -25,8 +25,9 @@ PATCH_STATUS="fail"
 LATEXMK_STATUS="skipped"
 SECTION_STATUS="fail"
 
-if command -v git >/dev/null 2>&1 && git -C "$ROOT" rev-parse --is-inside-work-tree >/dev/null 2>&1; then
-  if git -C "$ROOT" status --porcelain | rg -q '^(.. )?(USER/|GATE/)'; then
+source "$ROOT/AGENTS/runtime/repo_state.sh"
+if USER_GATE_CHANGES="$(repo_status "$ROOT")"; then
+  if [[ -n "$USER_GATE_CHANGES" ]]; then
     USER_GATE_STATUS="fail"
   else
     USER_GATE_STATUS="ok"
@@ -39,15 +40,13 @@ fi
 
 if command -v latexmk >/dev/null 2>&1; then
   if [[ -d "$SHADOW_PAPER" && -f "$MAIN_TEX" ]]; then
-    set +e
-    (cd "$SHADOW_PAPER" && latexmk -pdf main.tex) > "$LATEXMK_LOG" 2>&1
-    RC=$?
-    set -e
-    if [[ "$RC" -eq 0 ]]; then
-      LATEXMK_STATUS="ok"
-    else
-      LATEXMK_STATUS="fail"
-    fi
+    # Seeded from the shared per-paper build cache; records time/passes in build_checks.
+    LATEXMK_STATUS="$(python3 "$ROOT/AGENTS/runtime/latex_build.py" build \
+      --paper "$SHADOW_PAPER" --main main.tex --paper-id "$ROOT/USER/paper" \
+      --cache-root "$ROOT/AGENTS/cache/latex" --log "$LATEXMK_LOG" \
+      --manifest "$TDIR/deliverable/patchset/files_manifest.json" \
+      --log-rel "AGENTS/tasks/$TASK_ID/logs/latexmk.log" | sed -n 's/^LATEXMK_STATUS=//p')"
+    LATEXMK_STATUS="${LATEXMK_STATUS:-fail}"
   fi
 else
   echo "latexmk not found; skipped" > "$LATEXMK_LOG"
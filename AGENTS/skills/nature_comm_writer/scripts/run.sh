@@ -25,6 +25,9 @@ CMD_LOG="$LOG_DIR/commands.txt"
 STDOUT_LOG="$LOG_DIR/${SKILL}.stdout.log"
 STDERR_LOG="$LOG_DIR/${SKILL}.stderr.log"
 GIT_STATUS_LOG="$LOG_DIR/git_status.txt"
+SHADOW_PY="$ROOT/AGENTS/runtime/paper_shadow.py"
+JOURNAL_PY="$ROOT/AGENTS/runtime/edit_journal.py"
+TEX_MODEL_PY="$ROOT/AGENTS/runtime/tex_model.py"
 RES_DIR="$ROOT/AGENTS/skills/nature_comm_writer/resources"
 META_DIR="$RES_DIR/meta"
 
@@ -44,12 +47,15 @@ mkdir -p "$REVIEW_DIR" "$PATCH_DIR" "$LOG_DIR" "$SHADOW_ROOT" "$VENDOR_NATURE"
 
 exec >> "$STDOUT_LOG" 2>> "$STDERR_LOG"
 
+source "$ROOT/AGENTS/runtime/trace.sh"
+source "$ROOT/AGENTS/runtime/repo_state.sh"
+
 run_cmd() {
   printf '%s\n' "$*" >> "$CMD_LOG"
-  "$@"
+  trace_run "$(trace_cmd_name "$@")" "$@"
 }
 
-run_cmd rsync -a --delete "$USER_PAPER/" "$SHADOW_PAPER/"
+run_cmd python3 "$SHADOW_PY" snapshot --src "$USER_PAPER" --dest "$SHADOW_PAPER"
 
 if [[ ! -d "$META_DIR" || -z "$(find "$META_DIR" -maxdepth 1 -name '*.json' -print -quit 2>/dev/null)" ]]; then
   echo "Resources metadata not found. Run: bash AGENTS/skills/nature_comm_writer/scripts/fetch_resources.sh" >> "$STDOUT_LOG"
@@ -81,6 +87,8 @@ if [[ -f "$MAIN_TEX" ]]; then
       cat "$MAIN_TEX"
     } > "$TMP_FILE"
     mv "$TMP_FILE" "$MAIN_TEX"
+    run_cmd python3 "$JOURNAL_PY" record --dest "$SHADOW_PAPER" --path main.tex \
+      --change-type edit --purpose "Insert deterministic placeholder comment at top of existing main.tex"
     EDITED=true
   fi
 else
@@ -115,49 +123,24 @@ TBD.
 TBD.
 EOF2
   CREATED=true
+  run_cmd python3 "$JOURNAL_PY" record --dest "$SHADOW_PAPER" --path main.tex \
+    --change-type add --purpose "Create minimal Nature Communications placeholder skeleton in shadow tree"
 fi
 
 HAS_RESULTS="false"
 HAS_DISCUSSION="false"
-if rg -q '\\section\*?\{[Rr]esults\}' "$MAIN_TEX"; then
+if python3 "$TEX_MODEL_PY" has-section --paper "$SHADOW_PAPER" --main main.tex Results; then
   HAS_RESULTS="true"
 fi
-if rg -q '\\section\*?\{[Dd]iscussion\}' "$MAIN_TEX"; then
+if python3 "$TEX_MODEL_PY" has-section --paper "$SHADOW_PAPER" --main main.tex Discussion; then
   HAS_DISCUSSION="true"
 fi
 
-printf '%s\n' "diff -ruN $USER_PAPER $SHADOW_PAPER > $PATCH_FILE" >> "$CMD_LOG"
-set +e
-diff -ruN "$USER_PAPER" "$SHADOW_PAPER" > "$PATCH_FILE"
-DIFF_RC=$?
-set -e
-if [[ "$DIFF_RC" -ne 0 && "$DIFF_RC" -ne 1 ]]; then
-  echo "diff failed with exit code $DIFF_RC" >&2
-  exit "$DIFF_RC"
-fi
-
 if [[ "$CREATED" == "true" ]]; then
-  EDITED_JSON='[
-    {
-      "path": "main.tex",
-      "change_type": "add",
-      "purpose": "Create minimal Nature Communications placeholder skeleton in shadow tree",
-      "risk_level": "low"
-    }
-  ]'
   NOTES='Placeholder mode with missing main.tex: created a minimal skeleton and no semantic edits.'
 elif [[ "$EDITED" == "true" ]]; then
-  EDITED_JSON='[
-    {
-      "path": "main.tex",
-      "change_type": "edit",
-      "purpose": "Insert deterministic placeholder comment at top of existing main.tex",
-      "risk_level": "low"
-    }
-  ]'
   NOTES='Placeholder mode: inserted one header comment, no semantic edits.'
 else
-  EDITED_JSON='[]'
   NOTES='Placeholder mode: no changes required (header already present).'
 fi
 
@@ -168,7 +151,7 @@ cat > "$MANIFEST" <<EOF2
   "journal": "Nature Communications",
   "input_paper_root": "USER/paper",
   "shadow_root": "AGENTS/tasks/$TASK_ID/work/paper_shadow/paper",
-  "edited_files": $EDITED_JSON,
+  "edited_files": [],
   "narrative_notes": {
     "accessibility_actions": "Placeholder audit only: identify jargon/acronym density and define simplification pass.",
     "motivation_actions": "Placeholder audit only: strengthen why-now framing for broad audience.",
@@ -191,6 +174,9 @@ cat > "$MANIFEST" <<EOF2
 }
 EOF2
 
+run_cmd python3 "$JOURNAL_PY" emit --src "$USER_PAPER" --dest "$SHADOW_PAPER" \
+  --patch "$PATCH_FILE" --manifest "$MANIFEST"
+
 {
   echo "# nature_comm_writer Report"
   echo
@@ -244,9 +230,8 @@ EOF2
   fi
 } > "$REPORT"
 
-if command -v git >/dev/null 2>&1 && git -C "$ROOT" rev-parse --is-inside-work-tree >/dev/null 2>&1; then
-  run_cmd git -C "$ROOT" status --porcelain
-  git -C "$ROOT" status --porcelain > "$GIT_STATUS_LOG"
+if trace_run "git status" repo_status "$ROOT" > "$GIT_STATUS_LOG"; then
+  printf '%s\n' "$REPO_STATUS_CMD" >> "$CMD_LOG"
 else
   echo "git not available or repo missing" > "$GIT_STATUS_LOG"
 fi
@@ -53,8 +53,9 @@ print("PROFILE_SCHEMA=ok")
 PY
 fi
 
+source "$ROOT/AGENTS/runtime/repo_state.sh"
 if command -v git >/dev/null 2>&1; then
-  BAD="$(git -C "$ROOT" status --porcelain USER GATE | rg -v '^\?\? GATE/staged/' || true)"
+  BAD="$(repo_status "$ROOT" | rg -v '^\?\? GATE/staged/' || true)"
   if [[ -n "$BAD" ]]; then
     echo "ERROR: unexpected USER/GATE modifications:" >&2
     echo "$BAD" >&2
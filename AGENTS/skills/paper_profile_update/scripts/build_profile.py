@@ -15,6 +15,17 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+RUNTIME_DIR = Path(__file__).resolve().parents[3] / "runtime"
+if str(RUNTIME_DIR) not in sys.path:
+    sys.path.insert(0, str(RUNTIME_DIR))
+
+import jsonio  # noqa: E402
+from bib_index import RawBibEntry, iter_raw_entries, load_index, lookup, parse_fields  # noqa: E402
+from tex_model import load_model  # noqa: E402
+
+# Keys read from .json reference records; everything else in them is skipped while decoding.
+REF_JSON_FIELDS = ("title", "abstract", "keywords", "note", "comment", "doi", "arxiv", "authors", "year")
+
 LATEX_STOPWORDS = {
     "begin", "end", "newcommand", "section", "subsection", "ref", "eq", "fig", "table",
     "appendix", "documentclass", "usepackage", "label", "cite", "item", "textbf", "textit",
@@ -44,6 +55,7 @@ STOPWORDS = {
 STOPWORDS |= LATEX_STOPWORDS | META_FIELD_STOPWORDS | DEMO_STOPWORDS
 
 DF_RATIO_MAX = 0.85
+BIB_FULL_PARSE_MAX_BYTES = 2 * 1024 * 1024
 DF_MIN = 1
 TOP_K_KEYWORDS = 30
 TOP_K_BIGRAMS = 20
@@ -54,7 +66,6 @@ MIN_COMPLETE_SEEDS = 3
 MIN_KEYWORD_PHRASES = 3
 MIN_DOMAIN_TOKENS = 8
 MAX_FIELDNAME_KEYWORD_RATIO = 0.05
-MAX_INCLUDE_DEPTH = 20
 TOKEN_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9_+\-]{2,}")
 URL_RE = re.compile(r"^https?://", re.I)
 ARXIV_ID_RE = re.compile(r"(?:arxiv:)?\s*(\d{4}\.\d{4,5}(?:v\d+)?)", re.I)
@@ -132,45 +143,6 @@ def tokenize(text: str) -> List[str]:
     return [t for t in toks if t not in STOPWORDS]
 
 
-def choose_main_tex(tex_files: List[Path]) -> Path:
-    names = {p.name: p for p in tex_files}
-    if "main.tex" in names:
-        return names["main.tex"]
-    for p in tex_files:
-        txt = slurp(p)
-        if re.search(r"\\documentclass|\\begin\{document\}", txt):
-            return p
-    return sorted(tex_files)[0]
-
-
-def resolve_include(base: Path, ref: str) -> Path:
-    ref = ref.strip().strip('"').strip("'")
-    p = (base.parent / ref)
-    if p.suffix == "":
-        p = p.with_suffix(".tex")
-    return p.resolve()
-
-
-def expand_tex_graph(main_tex: Path) -> List[Path]:
-    visited: Set[Path] = set()
-    ordered: List[Path] = []
-
-    def walk(p: Path, depth: int) -> None:
-        if depth > MAX_INCLUDE_DEPTH:
-            return
-        rp = p.resolve()
-        if rp in visited or not rp.exists() or rp.suffix.lower() != ".tex":
-            return
-        visited.add(rp)
-        ordered.append(rp)
-        txt = strip_comments(slurp(rp))
-        for m in re.finditer(r"\\(?:input|include)\{([^}]+)\}", txt):
-            walk(resolve_include(rp, m.group(1)), depth + 1)
-
-    walk(main_tex.resolve(), 0)
-    return ordered
-
-
 def discover_bib_files(tex_files: List[Path], paper_root: Path) -> List[Path]:
     found: List[Path] = []
     for tex in tex_files:
@@ -206,24 +178,6 @@ def discover_bib_files(tex_files: List[Path], paper_root: Path) -> List[Path]:
     return out
 
 
-def collect_cite_keys(tex_files: List[Path]) -> List[str]:
-    keys: List[str] = []
-    for tex in tex_files:
-        txt = strip_comments(slurp(tex))
-        for m in re.finditer(r"\\cite[a-zA-Z*]*\s*(?:\[[^\]]*\]\s*)*\{([^}]+)\}", txt):
-            for k in m.group(1).split(","):
-                k = k.strip()
-                if k:
-                    keys.append(k)
-    out: List[str] = []
-    seen: Set[str] = set()
-    for k in keys:
-        if k not in seen:
-            seen.add(k)
-            out.append(k)
-    return out
-
-
 def extract_structured_phrases(tex_files: List[Path]) -> List[str]:
     items: List[str] = []
     for tex in tex_files:
@@ -257,45 +211,18 @@ def extract_blocks(main_text: str) -> Dict[str, str]:
     return {"title": title, "abstract": abstract, "introduction": intro}
 
 
-def parse_bib_entries(text: str, source_path: str) -> List[BibEntry]:
-    entries: List[BibEntry] = []
-    i = 0
-    n = len(text)
-    while i < n:
-        at = text.find("@", i)
-        if at == -1:
-            break
-        m = re.match(r"@\s*([A-Za-z]+)\s*\{", text[at:])
-        if not m:
-            i = at + 1
-            continue
-        entry_type = m.group(1).lower()
-        start = at + m.end()
-        depth = 1
-        j = start
-        while j < n and depth > 0:
-            if text[j] == "{":
-                depth += 1
-            elif text[j] == "}":
-                depth -= 1
-            j += 1
-        body = text[start:j - 1].strip()
-        i = j
-        if "," not in body:
-            continue
-        key, fields_blob = body.split(",", 1)
-        bibkey = key.strip()
-        fields: Dict[str, str] = {}
-        for fm in re.finditer(r"([A-Za-z][A-Za-z0-9_\-]*)\s*=\s*(\{(?:[^{}]|\{[^{}]*\})*\}|\"(?:[^\"\\]|\\.)*\"|[^,]+)", fields_blob, flags=re.S):
-            k = fm.group(1).lower()
-            raw = fm.group(2).strip().strip(",")
-            if raw.startswith("{") and raw.endswith("}"):
-                raw = raw[1:-1]
-            elif raw.startswith('"') and raw.endswith('"'):
-                raw = raw[1:-1]
-            fields[k] = re.sub(r"\s+", " ", clean_latex_text(raw)).strip()
-        entries.append(BibEntry(bibkey=bibkey, entry_type=entry_type, fields=fields, source_path=source_path))
-    return entries
+def bib_entry_from_raw(raw: RawBibEntry, source_path: str) -> BibEntry:
+    fields = {k: re.sub(r"\s+", " ", clean_latex_text(v)).strip() for k, v in parse_fields(raw).items()}
+    return BibEntry(bibkey=raw.bibkey, entry_type=raw.entry_type, fields=fields, source_path=source_path)
+
+
+def read_bib_entries(bib: Path, source_path: str, cite_keys: List[str], warnings: List[str]) -> List[BibEntry]:
+    """All entries of a paper-sized .bib; only the cited keys of a large shared library, via its offset index."""
+    if bib.stat().st_size <= BIB_FULL_PARSE_MAX_BYTES:
+        return [bib_entry_from_raw(r, source_path) for r in iter_raw_entries(bib)]
+    index = load_index(bib)
+    warnings.append(f"bib_large_library_cited_only:{source_path}:{len(index['entries'])}")
+    return [bib_entry_from_raw(r, source_path) for r in lookup(bib, cite_keys, index)]
 
 
 def parse_authors(raw: str) -> List[str]:
@@ -586,7 +513,7 @@ def discover_reference_candidates(ref_root: Path, warnings: List[str], label: st
 
         try:
             if suffix == ".json":
-                obj = json.loads(slurp(p))
+                obj = jsonio.loads_fields(slurp(p).encode("utf-8"), REF_JSON_FIELDS)
                 # Structured: only semantic values, never field names.
                 semantic_vals: List[str] = []
                 for k in ["title", "abstract", "keywords", "note", "comment"]:
@@ -651,7 +578,7 @@ def discover_reference_candidates(ref_root: Path, warnings: List[str], label: st
                         break
                 if sidecar is not None:
                     if sidecar.suffix.lower() == ".json":
-                        obj = json.loads(slurp(sidecar))
+                        obj = jsonio.loads_fields(slurp(sidecar).encode("utf-8"), REF_JSON_FIELDS)
                         semantic_vals: List[str] = []
                         for k in ["title", "abstract", "keywords", "note", "comment"]:
                             if obj.get(k):
@@ -1206,9 +1133,9 @@ def try_complete_online(
             legacy_cache = cache_dir / f"{doi}.json"
         try:
             if cache_path.exists():
-                lookup_meta = json.loads(cache_path.read_text(encoding="utf-8"))
+                lookup_meta = jsonio.read_json(cache_path)
             elif legacy_cache is not None and legacy_cache.exists():
-                lookup_meta = json.loads(legacy_cache.read_text(encoding="utf-8"))
+                lookup_meta = jsonio.read_json(legacy_cache)
             else:
                 if backend == "arxiv":
                     lookup_meta = arxiv_lookup(arxiv_id)
@@ -1216,7 +1143,7 @@ def try_complete_online(
                     lookup_meta = crossref_lookup(doi)
                 else:
                     lookup_meta = inspire_lookup(title, row.get("authors", []) if isinstance(row.get("authors"), list) else [])
-                cache_path.write_text(json.dumps(lookup_meta, indent=2), encoding="utf-8")
+                jsonio.write_json(cache_path, lookup_meta, compact=True)
         except Exception as e:
             msg = str(e)
             if failfast:
@@ -1363,12 +1290,12 @@ def build_profile(
                 pass
             ref_candidates_secondary.append(rc)
 
-    tex_candidates = sorted([p for p in user_paper.rglob("*.tex") if p.is_file()]) if user_paper.exists() else []
+    doc = load_model(user_paper) if user_paper.exists() else {"found": False}
     tex_files: List[Path] = []
     main_tex: Optional[Path] = None
-    if tex_candidates:
-        main_tex = choose_main_tex(tex_candidates)
-        tex_files = expand_tex_graph(main_tex)
+    if doc.get("found"):
+        main_tex = (user_paper / str(doc["main_tex"])).resolve()
+        tex_files = [(user_paper / str(rel)).resolve() for rel in doc["files"]]
 
     bib_files = discover_bib_files(tex_files, user_paper) if tex_files else sorted(
         [p.resolve() for p in user_paper.rglob("*.bib") if p.is_file()]
@@ -1380,7 +1307,7 @@ def build_profile(
 
     note_files = discover_notes(user_notes)
     note_ref_candidates = discover_note_reference_candidates(note_files)
-    cite_keys = collect_cite_keys(tex_files)
+    cite_keys = [str(k) for k in doc.get("cite_keys", [])]
     cite_set = set(cite_keys)
     structured_phrases = extract_structured_phrases(tex_files)
 
@@ -1399,7 +1326,7 @@ def build_profile(
     bib_entries: List[BibEntry] = []
     for b in bib_files:
         try:
-            bib_entries.extend(parse_bib_entries(slurp(b), source_path=to_rel(root, b)))
+            bib_entries.extend(read_bib_entries(b, to_rel(root, b), cite_keys, warnings))
         except Exception as e:
             warnings.append(f"bib_parse_failed:{to_rel(root,b)}:{e}")
 
@@ -2062,12 +1989,10 @@ def build_profile(
         "stop_reason": "Completed with warning-only policy; no hard content gates applied.",
         "timestamp_utc": now_utc(),
     }
-    resolved_json.parent.mkdir(parents=True, exist_ok=True)
-    resolved_json.write_text(json.dumps(resolved, indent=2), encoding="utf-8")
+    jsonio.write_json(resolved_json, resolved)
 
     validate_output_payload(payload)
-    out_json.parent.mkdir(parents=True, exist_ok=True)
-    out_json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    jsonio.write_json(out_json, payload)
     out_report.parent.mkdir(parents=True, exist_ok=True)
     out_report.write_text("\n".join(report) + "\n", encoding="utf-8")
     return 0
@@ -23,8 +23,9 @@ HEADERS_STATUS="fail"
 REQ_UNIQUE_STATUS="fail"
 AC_MAP_STATUS="fail"
 
-if command -v git >/dev/null 2>&1 && git -C "$ROOT" rev-parse --is-inside-work-tree >/dev/null 2>&1; then
-  if git -C "$ROOT" status --porcelain | rg -q '^(.. )?(USER/|GATE/)'; then
+source "$ROOT/AGENTS/runtime/repo_state.sh"
+if USER_GATE_CHANGES="$(repo_status "$ROOT")"; then
+  if [[ -n "$USER_GATE_CHANGES" ]]; then
     USER_GATE_STATUS="fail"
   else
     USER_GATE_STATUS="ok"
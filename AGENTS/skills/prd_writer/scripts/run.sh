@@ -43,9 +43,12 @@ mkdir -p "$DELIV_DIR" "$REVIEW_DIR" "$LOG_DIR"
 
 exec >> "$STDOUT_LOG" 2>> "$STDERR_LOG"
 
+source "$ROOT/AGENTS/runtime/trace.sh"
+source "$ROOT/AGENTS/runtime/repo_state.sh"
+
 run_cmd() {
   printf '%s\n' "$*" >> "$CMD_LOG"
-  "$@"
+  trace_run "$(trace_cmd_name "$@")" "$@"
 }
 
 json_escape() {
@@ -317,9 +320,8 @@ done)
 }
 EOF2
 
-if command -v git >/dev/null 2>&1 && git -C "$ROOT" rev-parse --is-inside-work-tree >/dev/null 2>&1; then
-  run_cmd git -C "$ROOT" status --porcelain
-  git -C "$ROOT" status --porcelain > "$GIT_STATUS_LOG"
+if trace_run "git status" repo_status "$ROOT" > "$GIT_STATUS_LOG"; then
+  printf '%s\n' "$REPO_STATUS_CMD" >> "$CMD_LOG"
 else
   echo "git not available or repo missing" > "$GIT_STATUS_LOG"
 fi
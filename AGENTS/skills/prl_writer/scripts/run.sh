@@ -24,6 +24,8 @@ CMD_LOG="$LOG_DIR/commands.txt"
 STDOUT_LOG="$LOG_DIR/${SKILL}.stdout.log"
 STDERR_LOG="$LOG_DIR/${SKILL}.stderr.log"
 GIT_STATUS_LOG="$LOG_DIR/git_status.txt"
+SHADOW_PY="$ROOT/AGENTS/runtime/paper_shadow.py"
+JOURNAL_PY="$ROOT/AGENTS/runtime/edit_journal.py"
 
 if [[ ! -d "$TDIR" ]]; then
   echo "Task folder does not exist: $TDIR" >&2
@@ -37,9 +39,12 @@ mkdir -p "$REVIEW_DIR" "$PATCH_DIR" "$LOG_DIR" "$SHADOW_ROOT"
 
 exec >> "$STDOUT_LOG" 2>> "$STDERR_LOG"
 
+source "$ROOT/AGENTS/runtime/trace.sh"
+source "$ROOT/AGENTS/runtime/repo_state.sh"
+
 run_cmd() {
   printf '%s\n' "$*" >> "$CMD_LOG"
-  "$@"
+  trace_run "$(trace_cmd_name "$@")" "$@"
 }
 
 if [[ ! -d "$USER_PAPER" ]]; then
@@ -47,7 +52,7 @@ if [[ ! -d "$USER_PAPER" ]]; then
   exit 2
 fi
 
-run_cmd rsync -a --delete "$USER_PAPER/" "$SHADOW_PAPER/"
+run_cmd python3 "$SHADOW_PY" snapshot --src "$USER_PAPER" --dest "$SHADOW_PAPER"
 
 cat > "$REPORT" <<EOF2
 # prl_writer Report
@@ -83,6 +88,8 @@ if [[ -f "$MAIN_TEX" ]]; then
       cat "$MAIN_TEX"
     } > "$TMP_FILE"
     mv "$TMP_FILE" "$MAIN_TEX"
+    run_cmd python3 "$JOURNAL_PY" record --dest "$SHADOW_PAPER" --path main.tex \
+      --change-type edit --purpose "Insert deterministic placeholder marker for prl_writer run"
     EDITED=true
     echo "- Added placeholder comment to main.tex" >> "$REPORT"
   else
@@ -92,28 +99,9 @@ else
   echo "- main.tex not found in shadow tree; no edit applied" >> "$REPORT"
 fi
 
-printf '%s\n' "diff -ruN $USER_PAPER $SHADOW_PAPER > $PATCH_FILE" >> "$CMD_LOG"
-set +e
-diff -ruN "$USER_PAPER" "$SHADOW_PAPER" > "$PATCH_FILE"
-DIFF_RC=$?
-set -e
-if [[ "$DIFF_RC" -ne 0 && "$DIFF_RC" -ne 1 ]]; then
-  echo "diff failed with exit code $DIFF_RC" >&2
-  exit "$DIFF_RC"
-fi
-
 if [[ "$EDITED" == "true" ]]; then
-  EDITED_JSON='[
-    {
-      "path": "main.tex",
-      "change_type": "edit",
-      "purpose": "Insert deterministic placeholder marker for prl_writer run",
-      "risk_level": "low"
-    }
-  ]'
   NOTES='Placeholder mode: no semantic text edits were attempted; added one comment line in main.tex.'
 else
-  EDITED_JSON='[]'
   NOTES='Placeholder mode: no edits applied (main.tex missing or already marked).'
 fi
 
@@ -123,7 +111,7 @@ cat > "$MANIFEST" <<EOF2
   "skill": "$SKILL",
   "input_paper_root": "USER/paper",
   "shadow_root": "AGENTS/tasks/$TASK_ID/work/paper_shadow/paper",
-  "edited_files": $EDITED_JSON,
+  "edited_files": [],
   "build_checks": [
     {
       "name": "latexmk",
@@ -136,6 +124,9 @@ cat > "$MANIFEST" <<EOF2
 }
 EOF2
 
+run_cmd python3 "$JOURNAL_PY" emit --src "$USER_PAPER" --dest "$SHADOW_PAPER" \
+  --patch "$PATCH_FILE" --manifest "$MANIFEST"
+
 {
   echo "## Outputs"
   echo "- report: AGENTS/tasks/$TASK_ID/review/${SKILL}_report.md"
@@ -143,9 +134,8 @@ EOF2
   echo "- manifest: AGENTS/tasks/$TASK_ID/deliverable/patchset/files_manifest.json"
 } >> "$REPORT"
 
-if command -v git >/dev/null 2>&1 && git -C "$ROOT" rev-parse --is-inside-work-tree >/dev/null 2>&1; then
-  run_cmd git -C "$ROOT" status --porcelain
-  git -C "$ROOT" status --porcelain > "$GIT_STATUS_LOG"
+if trace_run "git status" repo_status "$ROOT" > "$GIT_STATUS_LOG"; then
+  printf '%s\n' "$REPO_STATUS_CMD" >> "$CMD_LOG"
 else
   echo "git not available or repo missing" > "$GIT_STATUS_LOG"
 fi
@@ -12,8 +12,9 @@ fi
 TDIR="$ROOT/AGENTS/tasks/$TASK_ID"
 [[ -d "$TDIR" ]] || { echo "Task folder missing: $TDIR" >&2; exit 2; }
 
+source "$ROOT/AGENTS/runtime/repo_state.sh"
 if command -v git >/dev/null 2>&1; then
-  BAD="$(git -C "$ROOT" status --porcelain USER GATE || true)"
+  BAD="$(repo_status "$ROOT" || true)"
   [[ -z "$BAD" ]] || { echo "ERROR: USER/GATE modified" >&2; echo "$BAD" >&2; exit 1; }
 fi
 
@@ -17,5 +17,13 @@ cat > "$TDIR/review/referee_report.md" <<'EOF2'
 - ...
 EOF2
 
+if [[ -d "$ROOT/USER/paper" ]]; then
+  {
+    echo
+    echo "## Manuscript structure (parsed from USER/paper)"
+    python3 "$ROOT/AGENTS/runtime/tex_model.py" summary --paper "$ROOT/USER/paper"
+  } >> "$TDIR/review/referee_report.md"
+fi
+
 echo "referee_redteam_prl stub wrote:"
 echo "  $TDIR/review/referee_report.md"
@@ -15,8 +15,9 @@ if [[ ! -d "$TDIR" ]]; then
   exit 2
 fi
 
+source "$ROOT/AGENTS/runtime/repo_state.sh"
 if command -v git >/dev/null 2>&1; then
-  BAD="$(git -C "$ROOT" status --porcelain USER GATE || true)"
+  BAD="$(repo_status "$ROOT" || true)"
   if [[ -n "$BAD" ]]; then
     echo "ERROR: USER/ or GATE/ changed:" >&2
     echo "$BAD" >&2
@@ -13,7 +13,9 @@ RUNTIME_DIR = Path(__file__).resolve().parents[3] / "runtime"
 if str(RUNTIME_DIR) not in sys.path:
     sys.path.insert(0, str(RUNTIME_DIR))
 
+import jsonio
 from approval import clarify_text, confirm
+from tex_model import load_model
 
 
 def now_utc() -> str:
@@ -215,6 +217,21 @@ def collect_figures(root: Path, fig_dir: str | None) -> List[str]:
     return [str(x.relative_to(root)) if root in x.parents else str(x) for x in files[:12]]
 
 
+def paper_model(root: Path, paper_paths: List[str]) -> Dict[str, Any]:
+    """Parsed model of the first request paper path that resolves to LaTeX sources."""
+    for raw in paper_paths:
+        p = Path(raw) if Path(raw).is_absolute() else root / raw
+        if p.is_file() and p.suffix == ".tex":
+            model = load_model(p.parent, main_tex=p)
+        elif p.is_dir():
+            model = load_model(p)
+        else:
+            continue
+        if model.get("found"):
+            return model
+    return {"found": False}
+
+
 def write_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(content, encoding="utf-8")
@@ -330,8 +347,12 @@ def main() -> int:
     duration = ensure_int(req["talk"].get("duration_min"), 20)
     req["talk"]["duration_min"] = duration
 
+    paper = paper_model(root, [str(x) for x in req["project_context"].get("paper_paths") or []])
+    if paper.get("found"):
+        commands.append(f"parse {paper['main_tex']} ({len(paper['files'])} tex files)")
+
     if not req["talk"].get("title"):
-        req["talk"]["title"] = f"Talk for {task_id}"
+        req["talk"]["title"] = paper.get("title") or f"Talk for {task_id}"
 
     slide_target = infer_slide_count(duration, req["deck"].get("slide_count_target"))
     req["deck"]["slide_count_target"] = slide_target
@@ -345,7 +366,7 @@ def main() -> int:
         req["deck"]["constraints"] = constraints
 
     resolved_path = logs_skill / "resolved_request.json"
-    resolved_path.write_text(json.dumps(req, indent=2), encoding="utf-8")
+    jsonio.write_json(resolved_path, req)
     commands.append(f"write {resolved_path}")
 
     sections, timing = section_plan(duration, slide_target)
@@ -396,6 +417,12 @@ def main() -> int:
         fig_lines.append("### Reusable local figures detected")
         fig_lines.append("- none detected; mark where a new figure is needed")
 
+    if paper.get("graphics"):
+        fig_lines.append("")
+        fig_lines.append(f"### Figures used in the manuscript ({paper['main_tex']})")
+        for g in paper["graphics"][:12]:
+            fig_lines.append(f"- {g}")
+
     templates = root / "AGENTS" / "skills" / "slide_preparation" / "templates"
     deck_outline = render_template(
         templates / "deck_outline.md.tpl",
@@ -548,7 +575,7 @@ def main() -> int:
         "generated_pptx": generated_pptx,
         "pptx_note": pptx_note,
     }
-    write_text(logs_skill / "consent.json", json.dumps(consent, indent=2) + "\n")
+    jsonio.write_json(logs_skill / "consent.json", consent, trailing_newline=True)
 
     scratch_removed = False
     build_removed = False
@@ -571,7 +598,7 @@ def main() -> int:
             "build_removed": build_removed,
         },
     }
-    write_text(logs_skill / "run_manifest.json", json.dumps(manifest, indent=2) + "\n")
+    jsonio.write_json(logs_skill / "run_manifest.json", manifest, trailing_newline=True)
 
     cmd_log = logs_root / "commands.txt"
     with cmd_log.open("a", encoding="utf-8") as f:
@@ -51,9 +51,8 @@ EOF2
   exit 1
 fi
 
-if command -v git >/dev/null 2>&1; then
-  git -C "$ROOT" status --porcelain > "$LOG_DIR/git_status.txt" || true
-fi
+source "$ROOT/AGENTS/runtime/repo_state.sh"
+repo_status "$ROOT" > "$LOG_DIR/git_status.txt" || true
 
 bash "$ROOT/AGENTS/runtime/stage_to_gate.sh" "$ROOT" "$TASK_ID" "$SKILL"
 
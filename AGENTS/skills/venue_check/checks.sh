@@ -0,0 +1,68 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="${1:-}"
+TASK_ID="${2:-}"
+SKILL="venue_check"
+
+if [[ -z "$ROOT" || -z "$TASK_ID" ]]; then
+  echo "Usage: checks.sh <repo_root> <task_id>" >&2
+  exit 2
+fi
+
+TDIR="$ROOT/AGENTS/tasks/$TASK_ID"
+SHADOW_PAPER="$TDIR/work/paper_shadow/paper"
+LOG_DIR="$TDIR/logs"
+REPORT="$TDIR/review/${SKILL}_report.md"
+COMPARISON_JSON="$TDIR/outputs/venue_check/comparison.json"
+LATEXMK_LOG="$LOG_DIR/latexmk.log"
+
+mkdir -p "$LOG_DIR"
+
+USER_GATE_STATUS="skipped"
+REPORT_STATUS="fail"
+LATEXMK_STATUS="skipped"
+
+source "$ROOT/AGENTS/runtime/repo_state.sh"
+if USER_GATE_CHANGES="$(repo_status "$ROOT")"; then
+  if [[ -n "$USER_GATE_CHANGES" ]]; then
+    USER_GATE_STATUS="fail"
+  else
+    USER_GATE_STATUS="ok"
+  fi
+fi
+
+if [[ -f "$REPORT" && -f "$COMPARISON_JSON" ]]; then
+  REPORT_STATUS="ok"
+fi
+
+# A single build of the shared shadow covers every venue.
+if command -v latexmk >/dev/null 2>&1; then
+  if [[ -d "$SHADOW_PAPER" && -f "$SHADOW_PAPER/main.tex" ]]; then
+    LATEXMK_STATUS="$(python3 "$ROOT/AGENTS/runtime/latex_build.py" build \
+      --paper "$SHADOW_PAPER" --main main.tex --paper-id "$ROOT/USER/paper" \
+      --cache-root "$ROOT/AGENTS/cache/latex" --log "$LATEXMK_LOG" | sed -n 's/^LATEXMK_STATUS=//p')"
+    LATEXMK_STATUS="${LATEXMK_STATUS:-fail}"
+  fi
+else
+  echo "latexmk not found; skipped" > "$LATEXMK_LOG"
+fi
+
+if [[ -f "$REPORT" ]]; then
+  {
+    echo
+    echo "## checks.sh"
+    echo "- USER/GATE unchanged check: $USER_GATE_STATUS"
+    echo "- report + comparison.json exist: $REPORT_STATUS"
+    echo "- latexmk in shadow: $LATEXMK_STATUS"
+  } >> "$REPORT"
+fi
+
+echo "USER_GATE_STATUS=$USER_GATE_STATUS"
+echo "REPORT_STATUS=$REPORT_STATUS"
+echo "LATEXMK_STATUS=$LATEXMK_STATUS"
+
+if [[ "$USER_GATE_STATUS" == "fail" || "$REPORT_STATUS" == "fail" ]]; then
+  exit 1
+fi
+exit 0
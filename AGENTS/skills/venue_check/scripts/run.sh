@@ -0,0 +1,71 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="${1:-}"
+TASK_ID="${2:-}"
+SKILL="venue_check"
+
+if [[ -z "$ROOT" || -z "$TASK_ID" ]]; then
+  echo "Usage: run.sh <repo_root> <task_id>" >&2
+  exit 2
+fi
+
+TDIR="$ROOT/AGENTS/tasks/$TASK_ID"
+USER_PAPER="$ROOT/USER/paper"
+SHADOW_ROOT="$TDIR/work/paper_shadow"
+SHADOW_PAPER="$SHADOW_ROOT/paper"
+REVIEW_DIR="$TDIR/review"
+OUT_DIR="$TDIR/outputs/venue_check"
+LOG_DIR="$TDIR/logs"
+REPORT="$REVIEW_DIR/${SKILL}_report.md"
+COMPARISON_JSON="$OUT_DIR/comparison.json"
+CMD_LOG="$LOG_DIR/commands.txt"
+STDOUT_LOG="$LOG_DIR/${SKILL}.stdout.log"
+STDERR_LOG="$LOG_DIR/${SKILL}.stderr.log"
+SHADOW_PY="$ROOT/AGENTS/runtime/paper_shadow.py"
+CHECK_PY="$ROOT/AGENTS/skills/venue_check/scripts/venue_check.py"
+
+if [[ ! -d "$TDIR" ]]; then
+  echo "Task folder does not exist: $TDIR" >&2
+  exit 2
+fi
+
+mkdir -p "$REVIEW_DIR" "$OUT_DIR" "$LOG_DIR" "$SHADOW_ROOT"
+: > "$CMD_LOG"
+: > "$STDOUT_LOG"
+: > "$STDERR_LOG"
+
+exec >> "$STDOUT_LOG" 2>> "$STDERR_LOG"
+
+source "$ROOT/AGENTS/runtime/trace.sh"
+
+run_cmd() {
+  printf '%s\n' "$*" >> "$CMD_LOG"
+  trace_run "$(trace_cmd_name "$@")" "$@"
+}
+
+if [[ ! -d "$USER_PAPER" ]]; then
+  echo "Missing required input directory: $USER_PAPER" >&2
+  exit 2
+fi
+
+# Optional venue filter: env VENUE_CHECK_VENUES or a "Venues: PRL, JHEP" line in request.md.
+VENUES="${VENUE_CHECK_VENUES:-}"
+if [[ -z "$VENUES" && -f "$TDIR/request.md" ]]; then
+  VENUES="$(sed -n 's/^[[:space:]]*[Vv]enues:[[:space:]]*//p' "$TDIR/request.md" | head -n 1)"
+fi
+
+# One shadow snapshot and one parsed model serve every venue rule set.
+run_cmd python3 "$SHADOW_PY" snapshot --src "$USER_PAPER" --dest "$SHADOW_PAPER"
+run_cmd python3 "$CHECK_PY" \
+  --paper "$SHADOW_PAPER" \
+  --skills-root "$ROOT/AGENTS/skills" \
+  --task-id "$TASK_ID" \
+  --report "$REPORT" \
+  --out-json "$COMPARISON_JSON" \
+  --venues "$VENUES"
+
+bash "$ROOT/AGENTS/runtime/stage_to_gate.sh" "$ROOT" "$TASK_ID" "$SKILL"
+
+echo "$SKILL completed for task $TASK_ID"
+exit 0
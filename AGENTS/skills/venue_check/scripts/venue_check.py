@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+RUNTIME_DIR = Path(__file__).resolve().parents[3] / "runtime"
+if str(RUNTIME_DIR) not in sys.path:
+    sys.path.insert(0, str(RUNTIME_DIR))
+
+from tex_model import load_model  # noqa: E402
+
+
+def now_utc() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def check(name: str, status: str, detail: str) -> Dict[str, str]:
+    return {"check": name, "status": status, "detail": detail}
+
+
+def evaluate_venue(model: Dict[str, Any], rules: Dict[str, Any]) -> Dict[str, Any]:
+    results: List[Dict[str, str]] = []
+    length = rules.get("length", {}) or {}
+    limits = [
+        ("max_words", "main text words", model["word_count"]),
+        ("max_abstract_words", "abstract words", model["abstract_words"]),
+        ("max_abstract_chars", "abstract characters", model["abstract_chars"]),
+        ("max_display_items", "figures + tables", model["figures"] + model["tables"]),
+        ("max_figures", "figures", model["figures"]),
+        ("max_references", "references", model["references"]),
+    ]
+    for key, label, value in limits:
+        if key in length:
+            limit = int(length[key])
+            results.append(check(key, "ok" if value <= limit else "fail", f"{label}: {value} (limit {limit})"))
+
+    titles = {s["title"].lower() for s in model["sections"]}
+    for sec in rules.get("required_sections", []) or []:
+        present = sec.lower() in titles
+        results.append(check(f"section:{sec}", "ok" if present else "fail", "present" if present else "missing"))
+
+    macros = set(model["macros"])
+    for item in rules.get("frontmatter", []) or []:
+        present = (model["abstract"] != "") if item == "abstract" else item in macros
+        results.append(check(f"frontmatter:{item}", "ok" if present else "fail", "present" if present else "missing"))
+
+    classes = rules.get("documentclass", []) or []
+    if classes:
+        ok = model["documentclass"] in classes
+        results.append(check("documentclass", "ok" if ok else "fail", f"{model['documentclass'] or 'none'} (expected {', '.join(classes)})"))
+    for pkg in rules.get("packages", []) or []:
+        ok = pkg in model["packages"]
+        results.append(check(f"package:{pkg}", "ok" if ok else "fail", "loaded" if ok else "not loaded"))
+
+    bib = rules.get("bib_style", {}) or {}
+    accepted = bib.get("accepted", []) or []
+    if accepted:
+        style = model["bib_style"]
+        if not style:
+            status = "ok" if bib.get("allow_missing") else "fail"
+            results.append(check("bib_style", status, f"no \\bibliographystyle (expected {', '.join(accepted)})"))
+        else:
+            results.append(check("bib_style", "ok" if style in accepted else "fail", f"{style} (expected {', '.join(accepted)})"))
+
+    failed = sum(1 for r in results if r["status"] == "fail")
+    return {
+        "venue": rules.get("venue", ""),
+        "skill": rules.get("skill", ""),
+        "status": "ok" if failed == 0 else "fail",
+        "failed": failed,
+        "checks": results,
+        "maintained_by": rules.get("maintained_by", "hand"),
+        "reference_urls": rules.get("reference_urls", []) or [],
+    }
+
+
+def load_rule_sets(skills_root: Path, venues: List[str]) -> List[Dict[str, Any]]:
+    wanted = {v.lower() for v in venues}
+    out: List[Dict[str, Any]] = []
+    for p in sorted(skills_root.glob("*/resources/venue_rules.json")):
+        rules = json.loads(p.read_text(encoding="utf-8"))
+        if wanted and rules.get("venue", "").lower() not in wanted and rules.get("skill", "").lower() not in wanted:
+            continue
+        out.append(rules)
+    return out
+
+
+def render_report(task_id: str, model: Dict[str, Any], venues: List[Dict[str, Any]]) -> str:
+    lines = [
+        "# venue_check Report",
+        "",
+        f"- task_id: {task_id}",
+        "- skill: venue_check",
+        f"- main_tex: {model.get('main_tex') or 'not found'}",
+        f"- generated_at_utc: {now_utc()}",
+        "",
+        "## Document",
+        f"- main text words: {model.get('word_count', 0)}",
+        f"- abstract: {model.get('abstract_words', 0)} words / {model.get('abstract_chars', 0)} chars",
+        f"- figures: {model.get('figures', 0)}, tables: {model.get('tables', 0)}",
+        f"- references: {model.get('references', 0)}",
+        f"- documentclass: {model.get('documentclass') or 'none'}",
+        f"- bibliographystyle: {model.get('bib_style') or 'none'}",
+        "",
+        "## Comparison",
+        "| venue | status | failed checks |",
+        "|---|---|---|",
+    ]
+    for v in venues:
+        failed = [c["check"] for c in v["checks"] if c["status"] == "fail"]
+        lines.append(f"| {v['venue']} | {v['status']} | {', '.join(failed) or '-'} |")
+    for v in venues:
+        lines += ["", f"## {v['venue']} ({v['skill']})"]
+        for c in v["checks"]:
+            lines.append(f"- [{c['status']}] {c['check']}: {c['detail']}")
+        lines.append(f"- limits maintained by {v['maintained_by']} in AGENTS/skills/{v['skill']}/resources/venue_rules.json")
+        for url in v["reference_urls"]:
+            lines.append(f"- check against: {url}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paper", required=True)
+    parser.add_argument("--skills-root", required=True)
+    parser.add_argument("--task-id", required=True)
+    parser.add_argument("--report", required=True)
+    parser.add_argument("--out-json", required=True)
+    parser.add_argument("--venues", default="", help="Comma-separated venue or skill names; default all.")
+    args = parser.parse_args()
+
+    paper = Path(args.paper)
+    model = load_model(paper)
+    if not model.get("found"):
+        print(f"No main .tex found under {paper}", file=sys.stderr)
+        return 2
+    rule_sets = load_rule_sets(Path(args.skills_root), [v.strip() for v in args.venues.split(",") if v.strip()])
+    if not rule_sets:
+        print("No venue rule sets found (AGENTS/skills/*/resources/venue_rules.json)", file=sys.stderr)
+        return 2
+
+    venues = [evaluate_venue(model, rules) for rules in rule_sets]
+
+    Path(args.report).write_text(render_report(args.task_id, model, venues), encoding="utf-8")
+    out = Path(args.out_json)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"task_id": args.task_id, "generated_at_utc": now_utc(), "document": model, "venues": venues}
+    out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    for v in venues:
+        print(f"VENUE={v['venue']} STATUS={v['status']} FAILED={v['failed']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
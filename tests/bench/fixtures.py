@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Synthetic inputs for the benchmark suites.
+
+Everything is generated deterministically from a seed so that runs on
+different commits see byte-identical fixtures: LaTeX papers split over
+\\input files, .bib libraries, plain-text reference notes, figure blobs and
+large binary compute inputs.
+"""
+import os
+import random
+import shutil
+from pathlib import Path
+from typing import Dict, List
+
+PROFILES: Dict[str, Dict[str, int]] = {
+    "small": {
+        "tex_files": 1, "sections": 6, "paragraphs": 3, "figures": 2, "figure_kb": 16,
+        "bib_entries": 40, "ref_docs": 8, "compute_input_mb": 4,
+    },
+    "medium": {
+        "tex_files": 12, "sections": 48, "paragraphs": 6, "figures": 24, "figure_kb": 256,
+        "bib_entries": 2500, "ref_docs": 120, "compute_input_mb": 256,
+    },
+    "huge": {
+        "tex_files": 60, "sections": 320, "paragraphs": 8, "figures": 160, "figure_kb": 1024,
+        "bib_entries": 20000, "ref_docs": 1200, "compute_input_mb": 3072,
+    },
+}
+
+VOCAB = (
+    "dark matter halo axion ultralight field scalar density profile soliton core relaxation "
+    "gravitational potential wave interference granule dynamical heating stellar stream "
+    "constraint likelihood posterior spectrum power suppression small scale structure "
+    "simulation resolution numerical convergence boundary condition perturbation theory "
+    "cosmological background expansion redshift linear growth transfer function mass"
+).split()
+COPY_EXCLUDES = {".git", "__pycache__", "tasks", "staged", "cache", "results"}
+
+
+def words(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(VOCAB) for _ in range(n))
+
+
+def title_case(rng: random.Random, n: int) -> str:
+    return " ".join(w.capitalize() for w in words(rng, n).split())
+
+
+def bib_entry(rng: random.Random, i: int) -> str:
+    authors = " and ".join(f"{title_case(rng, 1)}, {chr(65 + rng.randrange(26))}." for _ in range(rng.randint(1, 5)))
+    return (
+        f"@article{{ref{i:06d},\n"
+        f"  title = {{{{{title_case(rng, rng.randint(5, 12))}}} in $\\Lambda$CDM}},\n"
+        f"  author = {{{authors}}},\n"
+        f"  journal = {{Phys. Rev. D}},\n"
+        f"  year = {{{1990 + i % 35}}},\n"
+        f"  eprint = {{{2000 + i % 25:04d}.{i % 100000:05d}}},\n"
+        f"  doi = {{10.1103/PhysRevD.{100 + i % 9}.{i:06d}}},\n"
+        f"  abstract = {{{words(rng, rng.randint(40, 120))}}},\n"
+        f"  keywords = {{{', '.join(words(rng, 4).split())}}}\n"
+        f"}}\n\n"
+    )
+
+
+def write_bib(path: Path, n: int, seed: int = 0) -> Path:
+    rng = random.Random(seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        f.write("% synthetic bibliography\n@string{prd = \"Phys. Rev. D\"}\n\n")
+        for i in range(n):
+            f.write(bib_entry(rng, i))
+    return path
+
+
+def tex_section(rng: random.Random, s: int, paragraphs: int, n_bib: int, fig: int) -> str:
+    out: List[str] = [f"\\section{{{title_case(rng, 3)} {s}}}\n\\label{{sec:s{s}}}\n"]
+    for p in range(paragraphs):
+        cites = ",".join(f"ref{rng.randrange(max(n_bib, 1)):06d}" for _ in range(rng.randint(1, 3)))
+        out.append(f"{words(rng, 120)} \\cite{{{cites}}} with $m_a \\sim 10^{{-22}}$ eV. {words(rng, 60)}\n")
+        if p == 1:
+            out.append(f"\\begin{{equation}}\\rho(r) = \\frac{{\\rho_c}}{{(1 + (r/r_c)^2)^8}}\\label{{eq:s{s}p{p}}}\\end{{equation}}\n")
+    if fig >= 0:
+        out.append(
+            f"\\begin{{figure}}\\includegraphics[width=\\linewidth]{{figs/fig{fig:04d}.png}}"
+            f"\\caption{{{words(rng, 20)}}}\\label{{fig:{fig}}}\\end{{figure}}\n"
+        )
+    return "\n".join(out) + "\n"
+
+
+def write_paper(paper: Path, profile: Dict[str, int], seed: int = 0) -> Dict[str, int]:
+    rng = random.Random(seed)
+    if paper.exists():
+        shutil.rmtree(paper)
+    (paper / "sections").mkdir(parents=True)
+    (paper / "figs").mkdir()
+    n_bib = profile["bib_entries"]
+    n_files = max(1, profile["tex_files"])
+    per_file = max(1, profile["sections"] // n_files)
+    fig = 0
+    includes: List[str] = []
+    for k in range(n_files):
+        chunks = []
+        for s in range(k * per_file, (k + 1) * per_file):
+            with_fig = fig if fig < profile["figures"] and s % max(1, profile["sections"] // max(profile["figures"], 1)) == 0 else -1
+            if with_fig >= 0:
+                fig += 1
+            chunks.append(tex_section(rng, s, profile["paragraphs"], n_bib, with_fig))
+        if n_files == 1:
+            includes.append("".join(chunks))
+        else:
+            (paper / "sections" / f"part{k:03d}.tex").write_text("".join(chunks), encoding="utf-8")
+            includes.append(f"\\input{{sections/part{k:03d}}}\n")
+    main = (
+        "\\documentclass[aps,prd,twocolumn]{revtex4-2}\n"
+        "\\usepackage{graphicx,amsmath,hyperref}\n"
+        "\\begin{document}\n"
+        f"\\title{{{title_case(rng, 8)}}}\n"
+        "\\author{A. Bench}\n"
+        f"\\begin{{abstract}}{words(rng, 150)}\\end{{abstract}}\n"
+        f"\\keywords{{{', '.join(words(rng, 5).split())}}}\n"
+        "\\maketitle\n"
+        + "".join(includes)
+        + "\\bibliographystyle{apsrev4-2}\n\\bibliography{refs}\n\\end{document}\n"
+    )
+    (paper / "main.tex").write_text(main, encoding="utf-8")
+    write_bib(paper / "refs.bib", n_bib, seed)
+    block = bytes(rng.randrange(256) for _ in range(1024))
+    for i in range(max(fig, profile["figures"])):
+        (paper / "figs" / f"fig{i:04d}.png").write_bytes(b"\x89PNG\r\n\x1a\n" + block * profile["figure_kb"])
+    return {"tex_files": n_files + 1, "figures": max(fig, profile["figures"]), "bib_entries": n_bib}
+
+
+def write_references(refs: Path, n_docs: int, seed: int = 0) -> None:
+    rng = random.Random(seed + 1)
+    for sub in ("", "for_seeds"):
+        (refs / sub).mkdir(parents=True, exist_ok=True)
+    for i in range(n_docs):
+        target = refs / ("for_seeds" if i % 4 == 0 else "") / f"note_{i:05d}.md"
+        target.write_text(
+            f"# {title_case(rng, 7)}\n\nAuthors: {title_case(rng, 2)}, {title_case(rng, 2)}\n"
+            f"arXiv: {2000 + i % 25:04d}.{i:05d}\nYear: {1995 + i % 30}\n\nAbstract: {words(rng, 150)}\n",
+            encoding="utf-8",
+        )
+    write_bib(refs / "library.bib", n_docs * 10, seed + 2)
+
+
+def write_blob(path: Path, size_mb: int, seed: int = 0) -> Path:
+    """size_mb MiB of non-repeating-per-MiB data, written in 1 MiB blocks (real pages, not sparse)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    base = random.Random(seed).randbytes(1 << 20)
+    with path.open("wb") as f:
+        for i in range(size_mb):
+            f.write(i.to_bytes(8, "little") + base[8:])
+    return path
+
+
+def copy_repo(src: Path, dest: Path) -> None:
+    """Copy the workflow tree (bin, AGENTS, USER, GATE, bart) without task state, caches or git data."""
+
+    def ignore(dirpath: str, names: List[str]) -> List[str]:
+        return [n for n in names if n in COPY_EXCLUDES or n.endswith(".pyc")]
+
+    dest.mkdir(parents=True, exist_ok=True)
+    for name in ("bin", "AGENTS", "USER", "GATE"):
+        if (src / name).exists():
+            shutil.copytree(src / name, dest / name, symlinks=True, ignore=ignore)
+    for name in ("bart", "README.md"):
+        if (src / name).exists():
+            shutil.copy2(src / name, dest / name)
+    (dest / "AGENTS" / "tasks").mkdir(parents=True, exist_ok=True)
+    (dest / "GATE" / "staged").mkdir(parents=True, exist_ok=True)
+
+
+def write_stub_bin(bin_dir: Path) -> Path:
+    """Offline stand-ins on PATH: wolframscript answers every -file/-code call with a fixed result."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    wolfram = bin_dir / "wolframscript"
+    wolfram.write_text(
+        "#!/usr/bin/env bash\n"
+        "set -euo pipefail\n"
+        'if [[ "${1:-}" == "-version" ]]; then echo "WolframScript 1.10.0 (bench stub)"; exit 0; fi\n'
+        'if [[ -n "${STEP_OUTPUT_JSON:-}" ]]; then\n'
+        "  cat > \"$STEP_OUTPUT_JSON\" <<JSON\n"
+        '{"intent":"bench","status":"ok","message":"","leaf_count":5,"result":"x^2+2 x+1","equivalence_check":"True","spotcheck":"0"}\n'
+        "JSON\n"
+        "fi\n"
+        'echo "bench_wolframscript_ok"\n',
+        encoding="utf-8",
+    )
+    os.chmod(wolfram, 0o755)
+    return bin_dir
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Microbenchmarks for the paper_profile_update extraction primitives.
+
+Each primitive runs on generated corpora of increasing size (--scales) and is
+reported with its best and median wall time over --repeat runs, throughput
+(MB/s and items/s) and tracemalloc peak memory from one separate run:
+
+  clean_latex_text, bib_full_parse (streaming .bib parse + field cleanup, the
+  read_bib_entries path for paper-sized files), bib_cited_lookup (the offset
+  index path for large shared libraries), tfidf_terms, ngrams_from_blocks,
+  filter_tokens, discover_reference_candidates
+
+  python3 tests/bench/micro_profile.py --scales 1,4,16
+  python3 tests/bench/micro_profile.py --baseline tests/bench/results/<old>.json
+
+Corpora are seeded, so results from different commits are directly
+comparable. Exit status is 1 when any throughput falls below
+baseline / max_regression_ratio (tests/bench/thresholds.json).
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import fixtures
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parents[1]
+sys.path.insert(0, str(REPO_ROOT / "AGENTS" / "skills" / "paper_profile_update" / "scripts"))
+
+import build_profile as bp  # noqa: E402
+from bib_index import iter_raw_entries, load_index, lookup  # noqa: E402
+
+RESULTS_VERSION = "bench_micro_profile_v1"
+# Per unit of scale.
+BASE_TEX_SECTIONS = 20
+BASE_BIB_ENTRIES = 500
+BASE_DOCS = 40
+BASE_DOC_TOKENS = 400
+BASE_REF_DOCS = 25
+LOOKUP_KEYS = 50
+# Numeric suffixes widen the fixture vocabulary to a realistic term-table size.
+TOKEN_VARIANTS = 200
+
+Case = Tuple[Callable[[], Any], int, int]  # (fn, bytes processed, items processed)
+
+
+def now_utc() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def token_docs(rng: random.Random, n_docs: int, n_tokens: int) -> List[List[str]]:
+    docs = []
+    for _ in range(n_docs):
+        text = " ".join(f"{w}{rng.randrange(TOKEN_VARIANTS)}" for w in fixtures.words(rng, n_tokens).split())
+        docs.append(bp.tokenize(text))
+    return docs
+
+
+def build_cases(work: Path, scale: int) -> Dict[str, Case]:
+    rng = random.Random(scale)
+    cases: Dict[str, Case] = {}
+
+    tex = "".join(fixtures.tex_section(rng, s, 4, 1000, s) for s in range(BASE_TEX_SECTIONS * scale))
+    cases["clean_latex_text"] = (lambda: bp.clean_latex_text(tex), len(tex.encode("utf-8")), len(tex.split()))
+
+    n_bib = BASE_BIB_ENTRIES * scale
+    bib = fixtures.write_bib(work / f"lib_{scale}.bib", n_bib, seed=scale).resolve()
+    size = bib.stat().st_size
+    cases["bib_full_parse"] = (lambda: [bp.bib_entry_from_raw(r, "lib.bib") for r in iter_raw_entries(bib)], size, n_bib)
+
+    index = load_index(bib)
+    keys = [f"ref{rng.randrange(n_bib):06d}" for _ in range(LOOKUP_KEYS)]
+    cases["bib_cited_lookup"] = (
+        lambda: [bp.bib_entry_from_raw(r, "lib.bib") for r in lookup(bib, keys, index)],
+        0,
+        LOOKUP_KEYS,
+    )
+
+    docs = token_docs(rng, BASE_DOCS * scale, BASE_DOC_TOKENS)
+    n_tokens = sum(len(d) for d in docs)
+    doc_bytes = sum(len(t) + 1 for d in docs for t in d)
+    cases["tfidf_terms"] = (lambda: bp.tfidf_terms(docs), doc_bytes, n_tokens)
+    cases["ngrams_from_blocks"] = (lambda: bp.ngrams_from_blocks(docs, 2, bp.TOP_K_BIGRAMS), doc_bytes, n_tokens)
+
+    flat = [t for d in docs for t in d]
+    authors = {f"{w}{i}" for w in fixtures.VOCAB[::7] for i in range(TOKEN_VARIANTS)}
+    caps = {f"{w}{i}" for w in fixtures.VOCAB[::5] for i in range(TOKEN_VARIANTS)}
+    cases["filter_tokens"] = (
+        lambda: bp.filter_tokens(flat, "references", authors, caps, {}),
+        doc_bytes,
+        len(flat),
+    )
+
+    refs = work / f"refs_{scale}"
+    fixtures.write_references(refs, BASE_REF_DOCS * scale, seed=scale)
+    (refs / "library.bib").unlink()
+    ref_bytes = sum(p.stat().st_size for p in refs.rglob("*") if p.is_file())
+    n_refs = sum(1 for p in refs.rglob("*") if p.is_file())
+    cases["discover_reference_candidates"] = (lambda: bp.discover_reference_candidates(refs, []), ref_bytes, n_refs)
+    return cases
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    fn()  # warm caches (regex compilation, page cache)
+    times: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"best_s": min(times), "median_s": statistics.median(times), "peak_kb": peak / 1024}
+
+
+def rate(amount: float, seconds: float) -> float:
+    return round(amount / seconds, 3) if seconds > 0 else 0.0
+
+
+def compare(results: Dict[str, Dict[str, Dict[str, Any]]], baseline: Dict[str, Any], ratio: float) -> List[Dict[str, Any]]:
+    problems: List[Dict[str, Any]] = []
+    for prim, by_scale in results.items():
+        for scale, stats in by_scale.items():
+            old = baseline.get("primitives", {}).get(prim, {}).get(scale)
+            if not old:
+                continue
+            key = "items_per_s"
+            if old.get(key) and stats[key] < old[key] / ratio:
+                problems.append(
+                    {"primitive": prim, "scale": scale, "detail": f"{key} {old[key]:.1f} -> {stats[key]:.1f} (< /{ratio})"}
+                )
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="micro_profile")
+    parser.add_argument("--scales", default="1,4,16", help="Comma-separated corpus size multipliers.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default="", help="Comma-separated subset of primitives.")
+    parser.add_argument("--out", default="")
+    parser.add_argument("--baseline", default="")
+    parser.add_argument("--thresholds", default=str(BENCH_DIR / "thresholds.json"))
+    args = parser.parse_args()
+
+    scales = [int(x) for x in args.scales.split(",") if x.strip()]
+    only = {x.strip() for x in args.only.split(",") if x.strip()}
+    work = Path(tempfile.mkdtemp(prefix="bench_micro."))
+    os.environ["BIB_INDEX_CACHE"] = str(work / "bib_index")
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    try:
+        for scale in scales:
+            for name, (fn, nbytes, nitems) in build_cases(work, scale).items():
+                if only and name not in only:
+                    continue
+                m = measure(fn, args.repeat)
+                results.setdefault(name, {})[str(scale)] = {
+                    "bytes": nbytes,
+                    "items": nitems,
+                    "best_s": round(m["best_s"], 6),
+                    "median_s": round(m["median_s"], 6),
+                    "mb_per_s": rate(nbytes / (1024 * 1024), m["best_s"]),
+                    "items_per_s": rate(nitems, m["best_s"]),
+                    "peak_kb": round(m["peak_kb"], 1),
+                }
+                print(f"[micro] {name} x{scale} done", file=sys.stderr)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    problems: List[Dict[str, Any]] = []
+    if args.baseline:
+        thresholds = json.loads(Path(args.thresholds).read_text(encoding="utf-8")) if Path(args.thresholds).is_file() else {}
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        problems = compare(results, baseline, float(thresholds.get("max_regression_ratio", 1.3)))
+
+    head = subprocess.run(["git", "-C", str(REPO_ROOT), "rev-parse", "HEAD"], text=True, capture_output=True)
+    payload = {
+        "version": RESULTS_VERSION,
+        "generated_at_utc": now_utc(),
+        "git_head": head.stdout.strip() if head.returncode == 0 else "",
+        "host": {"platform": platform.platform(), "python": platform.python_version(), "cpu_count": os.cpu_count()},
+        "repeat": args.repeat,
+        "scales": scales,
+        "primitives": results,
+        "baseline": args.baseline or None,
+        "problems": problems,
+        "status": "ok" if not problems else "regression",
+    }
+    out = Path(args.out) if args.out else BENCH_DIR / "results" / f"micro_profile_{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    print(f"{'primitive':<30} {'scale':>5} {'best_s':>9} {'MB/s':>9} {'items/s':>12} {'peak_kb':>10}")
+    for name, by_scale in results.items():
+        for scale, st in by_scale.items():
+            print(f"{name:<30} {scale:>5} {st['best_s']:9.4f} {st['mb_per_s']:9.2f} {st['items_per_s']:12.1f} {st['peak_kb']:10.1f}")
+    for p in problems:
+        print(f"PROBLEM primitive={p['primitive']} scale={p['scale']} {p['detail']}")
+    print(f"BENCH_RESULTS={out}")
+    print(f"BENCH_STATUS={payload['status']}")
+    return 0 if not problems else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
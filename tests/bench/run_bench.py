@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""End-to-end benchmarks for the bart -> agenthub -> skill pipeline.
+
+Builds a throwaway copy of the workflow tree with a synthetic USER/paper,
+reference library and compute input of the chosen size profile, puts an
+offline wolframscript stub first on PATH, points all HTTP proxies at a closed
+local port, and times each CLI entry point over several iterations:
+
+  bart_suggest, agenthub_index, agenthub_start, writer_run, venue_check_run,
+  profile_run, scout_run, compute_run, stage_rerun, promote
+
+Results are written as JSON (per-case samples, median, p90, ...) and checked
+against tests/bench/thresholds.json and, optionally, a previous results file:
+
+  python3 tests/bench/run_bench.py --profile small --iterations 5
+  python3 tests/bench/run_bench.py --profile medium --baseline tests/bench/results/<old>.json
+
+Exit status is 1 when a threshold or baseline comparison fails.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import fixtures
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parents[1]
+RESULTS_VERSION = "bench_e2e_v1"
+CASES = (
+    "bart_suggest", "agenthub_index", "agenthub_start", "writer_run", "venue_check_run",
+    "profile_run", "scout_run", "compute_run", "stage_rerun", "promote",
+)
+WRITER_SKILL = "prl_writer"
+COMPUTE_FIELDS = (
+    ("goal", "Benchmark quadratic scan."),
+    ("inputs", '{"mode":"quadratic_scan","x_values":[-2,-1,0,1,2],"coefficients":{"a":1.0,"b":0.0,"c":-1.0},"make_plot":false}'),
+    ("expected_outputs", '{"result_file":"result.json"}'),
+    ("constraints", '["No network"]'),
+    ("preferred_formats", '["json"]'),
+)
+
+
+def now_utc() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def git_head() -> str:
+    cp = subprocess.run(["git", "-C", str(REPO_ROOT), "rev-parse", "HEAD"], text=True, capture_output=True)
+    return cp.stdout.strip() if cp.returncode == 0 else ""
+
+
+def bench_env(stub_bin: Path) -> Dict[str, str]:
+    env = os.environ.copy()
+    env["PATH"] = f"{stub_bin}{os.pathsep}{env.get('PATH', '')}"
+    for k in ("http_proxy", "https_proxy", "HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "all_proxy"):
+        env[k] = "http://127.0.0.1:9"
+    env.pop("no_proxy", None)
+    env.pop("NO_PROXY", None)
+    env["ONLINE_LOOKUP"] = "0"
+    env["NET_ALLOWED"] = "0"
+    env["APPROVAL_INTERACTIVE"] = "0"
+    env["GIT_AUTHOR_NAME"] = env["GIT_COMMITTER_NAME"] = "bench"
+    env["GIT_AUTHOR_EMAIL"] = env["GIT_COMMITTER_EMAIL"] = "bench@localhost"
+    return env
+
+
+class Runner:
+    def __init__(self, root: Path, env: Dict[str, str], verbose: bool) -> None:
+        self.root = root
+        self.env = env
+        self.verbose = verbose
+
+    def run(self, argv: List[str], extra_env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+        env = dict(self.env)
+        env.update(extra_env or {})
+        cp = subprocess.run(argv, cwd=str(self.root), env=env, text=True, capture_output=True, stdin=subprocess.DEVNULL)
+        if cp.returncode != 0 and self.verbose:
+            print(f"[bench] rc={cp.returncode}: {' '.join(argv)}\n{cp.stdout[-2000:]}{cp.stderr[-2000:]}", file=sys.stderr)
+        return cp
+
+    def timed(self, argv: List[str], extra_env: Optional[Dict[str, str]] = None) -> Tuple[float, subprocess.CompletedProcess]:
+        t0 = time.perf_counter()
+        cp = self.run(argv, extra_env)
+        return time.perf_counter() - t0, cp
+
+
+def build_fixture(work: Path, profile_name: str, with_git: bool) -> Tuple[Path, Dict[str, Any]]:
+    profile = fixtures.PROFILES[profile_name]
+    root = work / "repo"
+    fixtures.copy_repo(REPO_ROOT, root)
+    paper_stats = fixtures.write_paper(root / "USER" / "paper", profile)
+    fixtures.write_references(root / "USER" / "references", profile["ref_docs"])
+    (root / "USER" / "notes").mkdir(parents=True, exist_ok=True)
+    (root / "USER" / "notes" / "ideas.md").write_text("# Notes\n\nSoliton core scaling checks.\n", encoding="utf-8")
+    req = root / "AGENTS" / "requests" / "bench" / "request.md"
+    req.parent.mkdir(parents=True, exist_ok=True)
+    req.write_text("# Request\n\nGoal:\nBenchmark run over the synthetic paper.\n", encoding="utf-8")
+    if with_git:
+        subprocess.run(["git", "init", "-q"], cwd=str(root), check=True)
+        subprocess.run(["git", "add", "-A"], cwd=str(root), check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=bench", "-c", "user.email=bench@localhost", "commit", "-q", "-m", "bench fixture"],
+            cwd=str(root),
+            check=True,
+        )
+    return root, {"profile": profile, "paper": paper_stats}
+
+
+def run_iteration(
+    r: Runner, i: int, profile: Dict[str, int], want: Set[str], samples: Dict[str, List[float]], failures: Dict[str, int]
+) -> None:
+    """One pass over the wanted cases; setup steps a case depends on run untimed."""
+    req = "AGENTS/requests/bench/request.md"
+
+    def record(case: str, seconds: float, cp: subprocess.CompletedProcess) -> None:
+        samples[case].append(seconds)
+        if cp.returncode != 0:
+            failures[case] += 1
+
+    if "bart_suggest" in want:
+        record("bart_suggest", *r.timed(["./bart", "revise my paper for PRL submission"]))
+    if "agenthub_index" in want:
+        record("agenthub_index", *r.timed(["./bin/agenthub", "index"]))
+
+    if want & {"agenthub_start", "writer_run"}:
+        task = f"bench_writer_{i}"
+        dt, cp = r.timed(["./bin/agenthub", "start", "--skill", WRITER_SKILL, "--task-name", task, "--request", req])
+        if "agenthub_start" in want:
+            record("agenthub_start", dt, cp)
+        if "writer_run" in want:
+            record("writer_run", *r.timed(["./bin/agenthub", "run", "--task", task, "--yes"]))
+
+    for case, skill in (("venue_check_run", "venue_check"), ("profile_run", "paper_profile_update"), ("scout_run", "literature_scout")):
+        if case not in want:
+            continue
+        task = f"bench_{skill}_{i}"
+        r.run(["./bin/agenthub", "start", "--skill", skill, "--task-name", task, "--request", req])
+        record(case, *r.timed(["./bin/agenthub", "run", "--task", task, "--yes"]))
+
+    if want & {"compute_run", "stage_rerun", "promote"}:
+        task = f"bench_compute_{i}"
+        r.run(["./bin/agenthub", "start", "--skill", "compute_numerical", "--task-name", task, "--request", req])
+        for field, value in COMPUTE_FIELDS:
+            r.run(["./bin/agenthub", "request-set", "--task", task, "--field", field, "--value", value])
+        blob = r.root / "AGENTS" / "tasks" / task / "work" / "src" / "data" / "input.bin"
+        fixtures.write_blob(blob, profile["compute_input_mb"], seed=i)
+        dt, cp = r.timed(["./bin/agenthub", "run", "--task", task, "--yes"])
+        if "compute_run" in want:
+            record("compute_run", dt, cp)
+        if "stage_rerun" in want:
+            stage = ["bash", "AGENTS/runtime/stage_to_gate.sh", str(r.root), task, "compute_numerical"]
+            record("stage_rerun", *r.timed(stage, {"APPROVAL_MODE": "yes"}))
+        if "promote" in want:
+            record("promote", *r.timed(["./bin/agenthub", "promote", "--task", task, "--yes", "--allow-user-write-noninteractive"]))
+
+
+def cleanup_iteration(root: Path, i: int) -> None:
+    for d in (root / "AGENTS" / "tasks").glob(f"bench_*_{i}"):
+        shutil.rmtree(d, ignore_errors=True)
+    for d in (root / "GATE" / "staged").glob(f"bench_*_{i}"):
+        shutil.rmtree(d, ignore_errors=True)
+    for d in (root / "USER").rglob(f"bench_compute_{i}"):
+        shutil.rmtree(d, ignore_errors=True)
+
+
+def summarize(values: List[float]) -> Dict[str, Any]:
+    if not values:
+        return {"n": 0}
+    ordered = sorted(values)
+    p90 = ordered[min(len(ordered) - 1, int(round(0.9 * (len(ordered) - 1))))]
+    return {
+        "n": len(values),
+        "samples_s": [round(v, 6) for v in values],
+        "median_s": round(statistics.median(values), 6),
+        "p90_s": round(p90, 6),
+        "mean_s": round(statistics.fmean(values), 6),
+        "stdev_s": round(statistics.stdev(values), 6) if len(values) > 1 else 0.0,
+        "min_s": round(ordered[0], 6),
+        "max_s": round(ordered[-1], 6),
+    }
+
+
+def check_thresholds(
+    profile: str, cases: Dict[str, Dict[str, Any]], thresholds: Dict[str, Any], baseline: Optional[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    problems: List[Dict[str, Any]] = []
+    limits = thresholds.get("profiles", {}).get(profile, {})
+    for case, stats in cases.items():
+        if stats.get("failures"):
+            problems.append({"case": case, "kind": "failures", "detail": f"{stats['failures']} non-zero exits"})
+        limit = limits.get(case, {}).get("max_median_s")
+        if limit is not None and stats.get("median_s", 0) > float(limit):
+            problems.append({"case": case, "kind": "threshold", "detail": f"median {stats['median_s']:.3f}s > {float(limit):.3f}s"})
+    if baseline:
+        ratio = float(thresholds.get("max_regression_ratio", 1.3))
+        floor = float(thresholds.get("min_regression_s", 0.05))
+        for case, stats in cases.items():
+            old = baseline.get("cases", {}).get(case, {}).get("median_s")
+            new = stats.get("median_s")
+            if old is None or new is None:
+                continue
+            if new > old * ratio and new - old > floor:
+                problems.append({"case": case, "kind": "regression", "detail": f"median {old:.3f}s -> {new:.3f}s (> x{ratio})"})
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="run_bench")
+    parser.add_argument("--profile", choices=sorted(fixtures.PROFILES), default="small")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--cases", default="", help="Comma-separated subset of: " + ", ".join(CASES))
+    parser.add_argument("--out", default="", help="Results JSON path; default tests/bench/results/e2e_<profile>_<utc>.json")
+    parser.add_argument("--baseline", default="", help="Previous results JSON to compare medians against.")
+    parser.add_argument("--thresholds", default=str(BENCH_DIR / "thresholds.json"))
+    parser.add_argument("--workdir", default="", help="Keep the fixture tree here instead of a temp dir.")
+    parser.add_argument("--no-git", action="store_true", help="Do not make the fixture a git repository.")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    wanted = [c.strip() for c in args.cases.split(",") if c.strip()] or list(CASES)
+    unknown = sorted(set(wanted) - set(CASES))
+    if unknown:
+        print(f"Unknown cases: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+    if baseline is not None and baseline.get("profile") != args.profile:
+        print(f"Baseline profile {baseline.get('profile')} does not match --profile {args.profile}", file=sys.stderr)
+        return 2
+
+    work = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="bench_e2e."))
+    try:
+        t0 = time.perf_counter()
+        root, fixture_info = build_fixture(work, args.profile, with_git=not args.no_git)
+        stub_bin = fixtures.write_stub_bin(work / "stub_bin")
+        fixture_info["build_s"] = round(time.perf_counter() - t0, 3)
+        r = Runner(root, bench_env(stub_bin), args.verbose)
+
+        samples: Dict[str, List[float]] = {c: [] for c in CASES}
+        failures: Dict[str, int] = {c: 0 for c in CASES}
+        for i in range(args.warmup + args.iterations):
+            it_samples: Dict[str, List[float]] = {c: [] for c in CASES}
+            it_failures: Dict[str, int] = {c: 0 for c in CASES}
+            run_iteration(r, i, fixture_info["profile"], set(wanted), it_samples, it_failures)
+            cleanup_iteration(root, i)
+            if i < args.warmup:
+                continue
+            for c in CASES:
+                samples[c].extend(it_samples[c])
+                failures[c] += it_failures[c]
+            print(f"[bench] iteration {i - args.warmup + 1}/{args.iterations} done", file=sys.stderr)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(work, ignore_errors=True)
+
+    cases: Dict[str, Dict[str, Any]] = {}
+    for c in wanted:
+        cases[c] = summarize(samples[c])
+        cases[c]["failures"] = failures[c]
+
+    thresholds = json.loads(Path(args.thresholds).read_text(encoding="utf-8")) if Path(args.thresholds).is_file() else {}
+    problems = check_thresholds(args.profile, cases, thresholds, baseline)
+
+    payload = {
+        "version": RESULTS_VERSION,
+        "generated_at_utc": now_utc(),
+        "git_head": git_head(),
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+        "profile": args.profile,
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "fixture": fixture_info,
+        "cases": cases,
+        "baseline": args.baseline or None,
+        "problems": problems,
+        "status": "ok" if not problems else "regression",
+    }
+    out = Path(args.out) if args.out else BENCH_DIR / "results" / f"e2e_{args.profile}_{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    print(f"{'case':<18} {'median_s':>9} {'p90_s':>9} {'fail':>5}")
+    for c, stats in cases.items():
+        print(f"{c:<18} {stats.get('median_s', 0):9.3f} {stats.get('p90_s', 0):9.3f} {stats['failures']:5d}")
+    for p in problems:
+        print(f"PROBLEM case={p['case']} kind={p['kind']} {p['detail']}")
+    print(f"BENCH_RESULTS={out}")
+    print(f"BENCH_STATUS={payload['status']}")
+    return 0 if not problems else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+SKILL="test_events_skill_$STAMP"
+TASK="test_events_$STAMP"
+TMP="$(mktemp -d /tmp/agenthub_events.XXXXXX)"
+cleanup() {
+  rm -rf "$TMP" "AGENTS/skills/$SKILL" "AGENTS/tasks/$TASK" "GATE/staged/$TASK"
+}
+trap cleanup EXIT
+
+mkdir -p "AGENTS/skills/$SKILL/scripts" "AGENTS/tasks/$TASK/review"
+cat > "AGENTS/skills/$SKILL/skill.yaml" <<YAML
+name: $SKILL
+title: Events probe
+description: Regression probe for the event stream.
+run: scripts/run.sh
+YAML
+cat > "AGENTS/skills/$SKILL/scripts/run.sh" <<'SH'
+#!/usr/bin/env bash
+set -euo pipefail
+ROOT="$1"
+TASK_ID="$2"
+SKILL="$(basename "$SKILL_DIR")"
+source "$ROOT/AGENTS/runtime/events.sh"
+echo "# probe" > "$ROOT/AGENTS/tasks/$TASK_ID/review/probe_report.md"
+events_emit artifact kind=report "path=AGENTS/tasks/$TASK_ID/review/probe_report.md"
+echo "PROBE_STATUS=done"
+echo "STOP_REASON=probe_finished"
+SH
+chmod +x "AGENTS/skills/$SKILL/scripts/run.sh"
+printf '{"task_id": "%s", "skill": "%s"}\n' "$TASK" "$SKILL" > "AGENTS/tasks/$TASK/meta.json"
+
+echo "[case a] run phases, skill markers and artifacts arrive on the events fd"
+./bin/agenthub --events jsonl run --task "$TASK" --skill "$SKILL" --yes </dev/null >"$TMP/out.txt" 2>"$TMP/err.txt" 3>"$TMP/events.jsonl"
+python3 - "$TMP/events.jsonl" "$TASK" "$SKILL" <<'PY'
+import json
+import sys
+
+recs = [json.loads(line) for line in open(sys.argv[1], encoding="utf-8")]
+task, skill = sys.argv[2], sys.argv[3]
+kinds = [r["event"] for r in recs]
+assert kinds[0] == "run_start" and kinds[-1] == "run_end", kinds
+assert recs[-1]["status"] == "ok" and recs[-1]["duration_ms"] >= 0, recs[-1]
+starts = [r["phase"] for r in recs if r["event"] == "phase_start"]
+ends = [r["phase"] for r in recs if r["event"] == "phase_end"]
+assert starts == ends == ["route", "preflight", "skill_run", "stage", "summary", "promotion_preview"], (starts, ends)
+markers = {r["key"]: r["value"] for r in recs if r["event"] == "marker"}
+assert markers.get("PROBE_STATUS") == "done", markers
+assert [r["reason"] for r in recs if r["event"] == "stop"] == ["probe_finished"], recs
+skill_art = [r for r in recs if r["event"] == "artifact" and r["source"] == f"skill:{skill}"]
+assert skill_art and skill_art[0]["path"] == f"AGENTS/tasks/{task}/review/probe_report.md", skill_art
+hub_art = {r["kind"]: r["path"] for r in recs if r["event"] == "artifact" and r["source"] == "agenthub"}
+assert hub_art["report"] == f"AGENTS/tasks/{task}/review/probe_report.md", hub_art
+assert "promote_plan" in hub_art, hub_art
+assert all(r["v"] == 1 and r["ts"].endswith("Z") for r in recs), recs
+PY
+grep -q '^STOP_REASON=probe_finished$' "$TMP/out.txt" || { echo "FAIL: stdout lost the skill markers"; exit 1; }
+
+echo "[case b] a failing run ends with an error_report artifact"
+cat > "AGENTS/skills/$SKILL/scripts/run.sh" <<'SH'
+#!/usr/bin/env bash
+echo "boom" >&2
+exit 3
+SH
+set +e
+./bin/agenthub --events jsonl --events-fd 7 run --task "$TASK" --skill "$SKILL" --yes </dev/null >/dev/null 2>&1 7>"$TMP/fail.jsonl"
+rc=$?
+set -e
+[[ "$rc" -eq 2 ]] || { echo "FAIL: expected exit 2, got $rc"; exit 1; }
+python3 - "$TMP/fail.jsonl" <<'PY'
+import json
+import sys
+
+recs = [json.loads(line) for line in open(sys.argv[1], encoding="utf-8")]
+assert recs[-1]["event"] == "run_end" and recs[-1]["status"] == "error", recs[-1]
+assert sum(1 for r in recs if r["event"] == "run_end") == 1, recs
+assert any(r["event"] == "artifact" and r["kind"] == "error_report" for r in recs), recs
+PY
+
+echo "[case c] an unopened events fd is rejected"
+set +e
+./bin/agenthub --events jsonl --events-fd 9 index >/dev/null 2>"$TMP/bad_fd.txt"
+rc=$?
+set -e
+[[ "$rc" -eq 2 ]] && grep -q '^ERROR=--events-fd 9 is not open' "$TMP/bad_fd.txt" || { echo "FAIL: bad fd accepted"; exit 1; }
+
+echo "PASS: agenthub event stream checks passed"
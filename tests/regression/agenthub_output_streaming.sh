@@ -0,0 +1,68 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+SKILL="test_stream_skill_$STAMP"
+TASK="test_output_streaming_$STAMP"
+TMP="$(mktemp -d /tmp/agenthub_streaming.XXXXXX)"
+cleanup() {
+  rm -rf "$TMP" "AGENTS/skills/$SKILL" "AGENTS/tasks/$TASK" "GATE/staged/$TASK"
+}
+trap cleanup EXIT
+
+mkdir -p "AGENTS/skills/$SKILL/scripts" "AGENTS/tasks/$TASK/review"
+cat > "AGENTS/skills/$SKILL/skill.yaml" <<YAML
+name: $SKILL
+title: Streaming probe
+description: Regression probe for incremental output.
+run: scripts/run.sh
+YAML
+cat > "AGENTS/skills/$SKILL/scripts/run.sh" <<SH
+#!/usr/bin/env bash
+echo ""
+echo "FIRST_LINE"
+for _ in \$(seq 1 200); do
+  [[ -f "$TMP/release" ]] && break
+  sleep 0.1
+done
+[[ -f "$TMP/release" ]] || { echo "never released" >&2; exit 1; }
+echo 'to=functions.exec_command {"cmd": "ls"}'
+echo '{"tool_uses": []}'
+echo "网站 line"
+echo ""
+echo "LAST_LINE"
+echo ""
+SH
+chmod +x "AGENTS/skills/$SKILL/scripts/run.sh"
+printf '{"task_id": "%s", "skill": "%s"}\n' "$TASK" "$SKILL" > "AGENTS/tasks/$TASK/meta.json"
+
+echo "[case a] skill output reaches the terminal before the skill exits"
+./bin/agenthub run --task "$TASK" --skill "$SKILL" --yes </dev/null >"$TMP/out.txt" 2>"$TMP/err.txt" &
+RUN_PID=$!
+for _ in $(seq 1 100); do
+  grep -q '^FIRST_LINE$' "$TMP/out.txt" && break
+  sleep 0.1
+done
+grep -q '^FIRST_LINE$' "$TMP/out.txt" || { kill "$RUN_PID" 2>/dev/null || true; echo "FAIL: no output while the skill was running"; exit 1; }
+touch "$TMP/release"
+wait "$RUN_PID" || true
+
+echo "[case b] trace lines are dropped and logged, blank edges trimmed"
+python3 - "$TMP/out.txt" "AGENTS/tasks/$TASK/review/trace_debug.log" <<'PY'
+import sys
+
+out = open(sys.argv[1], encoding="utf-8").read().splitlines()
+first = out.index("FIRST_LINE")
+last = out.index("LAST_LINE")
+assert first == 0, out
+assert out[first + 1 : last] == [""], out
+assert "exec_command" not in "\n".join(out) and "tool_uses" not in "\n".join(out), out
+log = open(sys.argv[2], encoding="utf-8").read().splitlines()
+reasons = [line.split(" ", 2)[1] for line in log]
+assert reasons == ["[tool_trace]", "[tool_trace]", "[non_business]"], log
+PY
+
+echo "PASS: agenthub output streaming checks passed"
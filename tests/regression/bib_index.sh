@@ -0,0 +1,123 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+TMP="$(mktemp -d /tmp/bib_index.XXXXXX)"
+cleanup() {
+  rm -rf "$TMP"
+}
+trap cleanup EXIT
+export BIB_INDEX_CACHE="$TMP/cache"
+
+BIB="$TMP/refs.bib"
+cat > "$BIB" <<'BIB'
+% shared library
+@string{prl = "Phys. Rev. Lett."}
+@article{Smith2020,
+  author = {Smith, A. and Jones, B.},
+  title = {A {Nested} Title},
+  journal = prl,
+  year = 2020
+}
+@comment{ignored {entry}}
+@Book{Doe:book,
+  author = "Doe, J.",
+  title = "Quoted \"Title\"",
+  year = {1999},
+}
+@inproceedings{ Lee-2021 , title={Conference}, year={2021}}
+BIB
+# Pad with filler entries so the index covers more than one read chunk in case a.
+for i in $(seq 1 40); do
+  printf '@misc{fill%02d,\n  title = {Filler %02d with {braces}},\n  note = {%s}\n}\n' "$i" "$i" "$(head -c 60 /dev/zero | tr '\0' x)" >> "$BIB"
+done
+
+echo "[case a] indexed lookup matches a full streaming parse"
+python3 - "$BIB" <<'PY'
+import sys
+from pathlib import Path
+
+sys.path.insert(0, "AGENTS/runtime")
+import bib_index
+
+bib = Path(sys.argv[1]).resolve()
+full = list(bib_index.iter_raw_entries(bib))
+small = list(bib_index.iter_raw_entries(bib, chunk_size=64))
+keys = [e.bibkey for e in full]
+assert keys[:3] == ["Smith2020", "Doe:book", "Lee-2021"], keys[:3]
+assert len(keys) == 43, len(keys)
+assert [(e.bibkey, e.offset, e.length, e.body) for e in small] == [(e.bibkey, e.offset, e.length, e.body) for e in full], "chunked parse differs"
+
+idx = bib_index.load_index(bib)
+assert sorted(idx["entries"]) == sorted(keys), "index keys differ from full parse"
+found = bib_index.lookup(bib, reversed(keys), index=idx)
+assert [e.bibkey for e in found] == keys, "lookup not in file order"
+for a, b in zip(found, full):
+    assert (a.entry_type, a.offset, a.length, a.body) == (b.entry_type, b.offset, b.length, b.body), a.bibkey
+    assert bib_index.parse_fields(a) == bib_index.parse_fields(b), a.bibkey
+fields = bib_index.parse_fields(found[1])
+assert fields["title"] == 'Quoted \\"Title\\"' and fields["year"] == "1999", fields
+assert bib_index.lookup(bib, ["Lee-2021", "nope"], index=idx)[0].bibkey == "Lee-2021"
+PY
+OUT="$(python3 AGENTS/runtime/bib_index.py lookup --bib "$BIB" Smith2020 missing-key)"
+grep -q '"key": "Smith2020"' <<< "$OUT" || { echo "FAIL: CLI lookup missed Smith2020"; exit 1; }
+grep -q '^MISSING=missing-key$' <<< "$OUT" || { echo "FAIL: CLI did not report the missing key"; exit 1; }
+
+INDEX="$(python3 AGENTS/runtime/bib_index.py index --bib "$BIB" | sed -n 's/^BIB_INDEX=//p')"
+[[ -f "$INDEX" ]] || { echo "FAIL: index not written under BIB_INDEX_CACHE"; exit 1; }
+
+# Plant a key the .bib does not contain, so a reused index is detectable.
+mark_index() {
+  python3 - "$INDEX" <<'PY'
+import json
+import sys
+
+path = sys.argv[1]
+idx = json.load(open(path, encoding="utf-8"))
+idx["entries"]["stale-marker"] = [0, 1, "misc"]
+json.dump(idx, open(path, "w", encoding="utf-8"))
+PY
+}
+# lookup drops spans that do not start with an entry header, so read the index itself.
+index_has_marker() {
+  python3 - "$BIB" <<'PY'
+import sys
+from pathlib import Path
+
+sys.path.insert(0, "AGENTS/runtime")
+import bib_index
+
+raise SystemExit(0 if "stale-marker" in bib_index.load_index(Path(sys.argv[1]))["entries"] else 1)
+PY
+}
+
+echo "[case b] an unchanged .bib reuses the cached index"
+mark_index
+index_has_marker || { echo "FAIL: index rebuilt although the .bib is unchanged"; exit 1; }
+
+echo "[case c] an mtime change with the same size rebuilds the index"
+sed -i.bak 's/year = 2020/year = 2021/' "$BIB" && rm -f "$BIB.bak"
+python3 - "$BIB" <<'PY'
+import os
+import sys
+
+st = os.stat(sys.argv[1])
+os.utime(sys.argv[1], ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+PY
+! index_has_marker || { echo "FAIL: stale index served after an mtime change"; exit 1; }
+OUT="$(python3 AGENTS/runtime/bib_index.py lookup --bib "$BIB" Smith2020)"
+grep -q '"year": "2021"' <<< "$OUT" || { echo "FAIL: lookup returned stale fields"; exit 1; }
+
+echo "[case d] a size change rebuilds the index even when mtime is restored"
+mark_index
+index_has_marker || { echo "FAIL: marker not picked up"; exit 1; }
+MTIME="$(python3 -c 'import os,sys; print(os.stat(sys.argv[1]).st_mtime_ns)' "$BIB")"
+printf '@article{Added2024, title={New}, year={2024}}\n' >> "$BIB"
+python3 -c 'import os,sys; os.utime(sys.argv[1], ns=(int(sys.argv[2]), int(sys.argv[2])))' "$BIB" "$MTIME"
+! index_has_marker || { echo "FAIL: stale index served after a size change"; exit 1; }
+OUT="$(python3 AGENTS/runtime/bib_index.py lookup --bib "$BIB" Added2024)"
+grep -q '"key": "Added2024"' <<< "$OUT" || { echo "FAIL: appended entry not indexed"; exit 1; }
+
+echo "PASS: bib_index lookup and invalidation"
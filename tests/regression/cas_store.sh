@@ -0,0 +1,132 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+TASK="test_cas_store_$STAMP"
+SKILL="compute_numerical"
+TMP="$(mktemp -d /tmp/cas_store.XXXXXX)"
+REPORT_DST="USER/reports/compute/$TASK.md"
+cleanup() {
+  chmod -R u+w "$TMP" 2>/dev/null || true
+  rm -rf "$TMP" "GATE/staged/$TASK" "$REPORT_DST" USER/reports/compute/"${TASK}"_* USER/manifest/promotion_receipts/"${TASK}"_*.json
+}
+trap cleanup EXIT
+export CAS_STORE="$TMP/cas"
+
+mkdir -p "$TMP/src/sub"
+head -c 100000 /dev/urandom > "$TMP/src/data.bin"
+cp "$TMP/src/data.bin" "$TMP/src/sub/data_copy.bin"
+chmod 0444 "$TMP/src/data.bin" "$TMP/src/sub/data_copy.bin"
+echo "report" > "$TMP/src/report.md"
+
+echo "[case a] read-only staged files share one object; writable ones are copied without one"
+for dest in one two; do
+  python3 AGENTS/runtime/tree_sync.py sync --dest "$TMP/$dest" --manifest "$TMP/$dest.manifest.json" --item "$TMP/src" src >/dev/null
+done
+OUT="$(python3 AGENTS/runtime/cas.py stats)"
+grep -q '^CAS_OBJECTS=1 .* CAS_HOLDERS=6$' <<< "$OUT" || { echo "$OUT"; echo "FAIL: stats"; exit 1; }
+python3 - "$TMP" <<'PY'
+import os
+import sys
+
+tmp = sys.argv[1]
+a = os.stat(f"{tmp}/one/src/data.bin")
+b = os.stat(f"{tmp}/two/src/sub/data_copy.bin")
+# Hard links share the object's inode; reflinks share extents under a new one.
+assert a.st_ino == b.st_ino or a.st_nlink == b.st_nlink == 1, (a, b)
+objects = [os.path.join(d, f) for d, _, fs in os.walk(f"{tmp}/cas/objects") for f in fs]
+assert len(objects) == 1 and all(not os.stat(o).st_mode & 0o222 for o in objects), objects
+# A writable file would need its own copy anyway; no object duplicates it.
+assert os.stat(f"{tmp}/one/src/report.md").st_nlink == 1
+assert os.stat(objects[0]).st_size == a.st_size, "only the 0444 content is stored"
+PY
+
+echo "[case b] verify hashes only holders whose stat changed"
+OUT="$(python3 AGENTS/runtime/cas.py verify)"
+grep -q '^CAS_VERIFY_REHASHED=0 MISSING=0 MODIFIED=0$' <<< "$OUT" || { echo "FAIL: clean verify"; exit 1; }
+rm "$TMP/two/src/report.md"
+echo "tampered" > "$TMP/two/src/report.md"
+set +e
+python3 AGENTS/runtime/cas.py verify >"$TMP/verify.txt"
+rc=$?
+set -e
+[[ "$rc" -eq 1 ]] && grep -q "^MODIFIED=$TMP/two/src/report.md$" "$TMP/verify.txt" \
+  && grep -q '^CAS_VERIFY_REHASHED=1 ' "$TMP/verify.txt" || { cat "$TMP/verify.txt"; echo "FAIL: tamper not detected"; exit 1; }
+
+echo "[case c] gc drops objects once no holder references them"
+rm -rf "$TMP/one" "$TMP/two"
+OUT="$(python3 AGENTS/runtime/cas.py gc)"
+grep -q '^CAS_GC_OBJECTS=1 ' <<< "$OUT" || { echo "FAIL: gc"; exit 1; }
+
+echo "[case d] promotion keeps USER copies editable and records their hashes"
+mkdir -p "GATE/staged/$TASK/$SKILL/work"
+python3 AGENTS/runtime/tree_sync.py sync --dest "GATE/staged/$TASK/$SKILL" --manifest "$TMP/stage.manifest.json" \
+  --item "$TMP/src/report.md" work/report.md >/dev/null
+cat > "GATE/staged/$TASK/PROMOTE.json" <<JSON
+{
+  "kind": "promotion_contract",
+  "skill": "$SKILL",
+  "mappings": [{"src": "GATE/staged/$TASK/$SKILL/work/report.md", "dst": "$REPORT_DST"}],
+  "allowed_dst_prefixes": ["USER/reports/compute/"]
+}
+JSON
+python3 AGENTS/runtime/promote_apply.py --root "$ROOT" --task "$TASK" >"$TMP/promote.txt"
+[[ -w "$REPORT_DST" ]] || { echo "FAIL: promoted file is read-only"; exit 1; }
+cmp -s "$REPORT_DST" "$TMP/src/report.md" || { echo "FAIL: promoted content"; exit 1; }
+OUT="$(python3 AGENTS/runtime/cas.py verify --prefix "$REPORT_DST")"
+grep -q '^CAS_VERIFY_REHASHED=0 MISSING=0 MODIFIED=0$' <<< "$OUT" || { echo "FAIL: promoted file not recorded"; exit 1; }
+RECEIPT="$(sed -n 's/^PROMOTION_RECEIPT=//p' "$TMP/promote.txt")"
+python3 - "$RECEIPT" "$REPORT_DST" <<'PY'
+import hashlib
+import json
+import sys
+
+receipt = json.load(open(sys.argv[1], encoding="utf-8"))
+want = hashlib.sha256(open(sys.argv[2], "rb").read()).hexdigest()
+assert [d["sha256"] for d in receipt["delta"]] == [want], receipt["delta"]
+PY
+
+echo "[case e] staged and promoted files keep their source mode"
+mkdir -p "$TMP/modes"
+printf '#!/usr/bin/env bash\necho run\n' > "$TMP/modes/run.sh"
+echo "notes" > "$TMP/modes/notes.txt"
+echo "frozen" > "$TMP/modes/frozen.txt"
+chmod 0755 "$TMP/modes/run.sh"
+chmod 0644 "$TMP/modes/notes.txt"
+chmod 0444 "$TMP/modes/frozen.txt"
+STAGE="GATE/staged/$TASK/$SKILL"
+sync_modes() {
+  python3 AGENTS/runtime/tree_sync.py sync --dest "$STAGE" --manifest "$TMP/modes.manifest.json" --item "$TMP/modes" work/modes
+}
+mode_of() {
+  python3 -c 'import os, sys; print(oct(os.stat(sys.argv[1]).st_mode & 0o777)[2:])' "$1"
+}
+sync_modes >/dev/null
+for f in run.sh notes.txt frozen.txt; do
+  [[ "$(mode_of "$STAGE/work/modes/$f")" == "$(mode_of "$TMP/modes/$f")" ]] \
+    || { echo "FAIL: staged $f is $(mode_of "$STAGE/work/modes/$f"), source is $(mode_of "$TMP/modes/$f")"; exit 1; }
+done
+[[ "$(python3 -c 'import os, sys; print(os.stat(sys.argv[1]).st_nlink)' "$STAGE/work/modes/run.sh")" == "1" ]] || { echo "FAIL: executable shares an inode with the 0444 object"; exit 1; }
+chmod 0700 "$TMP/modes/notes.txt"
+OUT="$(sync_modes)"
+grep -q '\bUNCHANGED=2\b' <<<"$OUT" || { echo "FAIL: mode-only change not re-placed: $OUT"; exit 1; }
+[[ "$(mode_of "$STAGE/work/modes/notes.txt")" == "700" ]] || { echo "FAIL: staged mode did not follow chmod"; exit 1; }
+cat > "GATE/staged/$TASK/PROMOTE.json" <<JSON
+{
+  "kind": "promotion_contract",
+  "skill": "$SKILL",
+  "mappings": [
+    {"src": "$STAGE/work/modes/run.sh", "dst": "USER/reports/compute/${TASK}_run.sh"},
+    {"src": "$STAGE/work/modes/notes.txt", "dst": "USER/reports/compute/${TASK}_notes.txt"}
+  ],
+  "allowed_dst_prefixes": ["USER/reports/compute/"]
+}
+JSON
+python3 AGENTS/runtime/promote_apply.py --root "$ROOT" --task "$TASK" >/dev/null
+[[ "$(mode_of "USER/reports/compute/${TASK}_run.sh")" == "755" ]] || { echo "FAIL: promoted script lost its exec bit"; exit 1; }
+[[ "$(mode_of "USER/reports/compute/${TASK}_notes.txt")" == "700" ]] || { echo "FAIL: promoted file mode differs from source"; exit 1; }
+
+echo "PASS: content store checks passed"
@@ -252,6 +252,54 @@ printf '%s\n' "$RUN_EXEC_FAIL"
 [[ "$RUN_EXEC_FAIL_RC" -ne 0 ]] || { echo "FAIL: expected execute failure on leaf cap"; exit 1; }
 grep -q 'EXECUTION_STATUS=FAILED' <<<"$RUN_EXEC_FAIL" || { echo "FAIL: missing failure execution status"; exit 1; }
 
+echo "[case g2] a crashed verifier fails execute and marks pending steps"
+VERIFY_BIN_DIR="$MOCK_BIN_DIR/verify_crash"
+mkdir -p "$VERIFY_BIN_DIR"
+cat > "$VERIFY_BIN_DIR/wolframscript" <<'EOF'
+#!/usr/bin/env bash
+set -euo pipefail
+cat > "${STEP_OUTPUT_JSON:?}" <<JSON
+{"intent":"mock","status":"ok","message":"","leaf_count":5,"result":"x+1","equivalence_check":"pending","spotcheck":"not_run"}
+JSON
+exit 0
+EOF
+# Exec the resolved interpreter: version-manager shims would put their own python3 back first on PATH.
+cat > "$VERIFY_BIN_DIR/python3" <<EOF
+#!/usr/bin/env bash
+case "\${1:-}" in
+  *spotcheck.py) echo "spotcheck: simulated crash" >&2; exit 1 ;;
+esac
+exec "$(python3 -c 'import sys; print(sys.executable)')" "\$@"
+EOF
+chmod +x "$VERIFY_BIN_DIR/wolframscript" "$VERIFY_BIN_DIR/python3"
+TASK_VF="test_compute_multistep_verifyfail_$(date -u +%Y%m%dT%H%M%SZ)"
+./bin/agenthub start --skill compute_algebraic_multistep --task-name "$TASK_VF" --request AGENTS/skills/compute_algebraic_multistep/templates/request.json.template >/tmp/multi_verifyfail_start.out </dev/null
+./bin/agenthub request-set --task "$TASK_VF" --field goal --value "Derive a symbolic simplification pipeline." >/dev/null
+./bin/agenthub request-set --task "$TASK_VF" --field inputs --value '{"expression":"(x^2-1)/(x-1)","variables":{"x":"real"},"assumptions":"x!=1"}' >/dev/null
+./bin/agenthub request-set --task "$TASK_VF" --field expected_outputs --value '{"symbolic_result":"simplified_expression"}' >/dev/null
+./bin/agenthub request-set --task "$TASK_VF" --field constraints --value '["No internet"]' >/dev/null
+./bin/agenthub request-set --task "$TASK_VF" --field preferred_formats --value '["json"]' >/dev/null
+./bin/agenthub request-set --task "$TASK_VF" --field policy_customize --value no >/dev/null
+./bin/agenthub run --task "$TASK_VF" --yes </dev/null >/tmp/multi_verifyfail_plan.out
+./bin/agenthub review-accept --task "$TASK_VF" --token "$(tr -d '\r\n' < "AGENTS/tasks/$TASK_VF/work/review_token.txt")" >/dev/null
+set +e
+RUN_EXEC_VF="$(PATH="$VERIFY_BIN_DIR:$PATH" WOLFRAM_BACKEND=wolframscript ./bin/agenthub run --task "$TASK_VF" --execute --yes </dev/null 2>&1)"
+RUN_EXEC_VF_RC=$?
+set -e
+printf '%s\n' "$RUN_EXEC_VF"
+[[ "$RUN_EXEC_VF_RC" -ne 0 ]] || { echo "FAIL: expected execute failure when verification crashes"; exit 1; }
+grep -q 'EXECUTION_STATUS=FAILED' <<<"$RUN_EXEC_VF" || { echo "FAIL: missing failure status for crashed verification"; exit 1; }
+grep -q '^verify_status=failed rc=1 ' "AGENTS/tasks/$TASK_VF/work/report_execute.md" || { echo "FAIL: report does not record the verifier failure"; exit 1; }
+python3 - <<PY
+import json
+from pathlib import Path
+records = sorted(Path("AGENTS/tasks/$TASK_VF/work/out").glob("step_*.json"))
+assert records, "no step records"
+for p in records:
+    rec = json.loads(p.read_text(encoding="utf-8"))
+    assert rec["equivalence_check"] == "verification_failed", (p.name, rec)
+PY
+
 echo "[case h] promote purity blocks invalid dst prefixes"
 PROMOTE_JSON="GATE/staged/$TASK_ID/PROMOTE.json"
 [[ -f "$PROMOTE_JSON" ]] || { echo "FAIL: missing PROMOTE.json"; exit 1; }
@@ -0,0 +1,73 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+CACHE_DIR="$(mktemp -d /tmp/compute_run_cache.XXXXXX)"
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+TASK_A="test_compute_run_cache_a_$STAMP"
+TASK_B="test_compute_run_cache_b_$STAMP"
+TASK_C="test_compute_run_cache_c_$STAMP"
+cleanup() {
+  rm -rf "$CACHE_DIR" "AGENTS/tasks/$TASK_A" "AGENTS/tasks/$TASK_B" "AGENTS/tasks/$TASK_C"
+}
+trap cleanup EXIT
+export COMPUTE_RUN_CACHE="$CACHE_DIR"
+
+new_compute_task() {
+  local task="$1" scale="$2"
+  mkdir -p "AGENTS/tasks/$task/work/compute"
+  printf '{"job_name": "cache_probe", "backend": "python", "params": {"scale": %s}}\n' "$scale" \
+    > "AGENTS/tasks/$task/work/compute/spec.yaml"
+  cat > "AGENTS/tasks/$task/work/compute/main.py" <<'PY'
+import json
+import os
+
+spec = json.loads(os.environ["COMPUTE_SPEC_JSON"])
+payload = {"results": {"value": 2 * spec["params"]["scale"]}, "sanity_checks": [{"name": "ran", "passed": True}]}
+with open(os.environ["COMPUTE_BACKEND_OUTPUT"], "w", encoding="utf-8") as f:
+    json.dump(payload, f)
+PY
+}
+
+echo "[case a] a successful run is stored in the run cache"
+new_compute_task "$TASK_A" 3
+bash AGENTS/runtime/compute_runner.sh --task "$TASK_A"
+grep -q '^COMPUTE_RUN_CACHE=stored' "AGENTS/tasks/$TASK_A/logs/compute/runner.stdout.log" || { echo "FAIL: run not stored"; exit 1; }
+
+echo "[case b] --reuse materializes the cached result with provenance"
+new_compute_task "$TASK_B" 3
+bash AGENTS/runtime/compute_runner.sh --task "$TASK_B" --reuse
+grep -q "^COMPUTE_RUN_CACHE=hit .*from_task=$TASK_A$" "AGENTS/tasks/$TASK_B/logs/compute/runner.stdout.log" || { echo "FAIL: expected cache hit"; exit 1; }
+[[ ! -f "AGENTS/tasks/$TASK_B/logs/compute/backend.stdout.log" ]] || { echo "FAIL: backend ran on a cache hit"; exit 1; }
+python3 - "AGENTS/tasks/$TASK_B/outputs/compute" "$TASK_A" "$TASK_B" <<'PY'
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+out, origin, task = Path(sys.argv[1]), sys.argv[2], sys.argv[3]
+result = json.loads((out / "result.json").read_text(encoding="utf-8"))
+assert result["results"] == {"value": 6}, result
+assert result["meta"]["task_id"] == task, result["meta"]
+assert result["meta"]["reused_from"]["task_id"] == origin, result["meta"]
+assert result["meta"]["reused_from"]["result"] == f"AGENTS/tasks/{origin}/outputs/compute/result.json"
+hashes = json.loads((out / "hashes.json").read_text(encoding="utf-8"))
+for item in hashes["outputs"]:
+    assert item["sha256"] == hashlib.sha256(Path(item["path"]).read_bytes()).hexdigest(), item
+PY
+
+echo "[case c] a changed spec misses the cache"
+new_compute_task "$TASK_C" 4
+bash AGENTS/runtime/compute_runner.sh --task "$TASK_C" --reuse
+grep -q '^COMPUTE_RUN_CACHE=stored' "AGENTS/tasks/$TASK_C/logs/compute/runner.stdout.log" || { echo "FAIL: changed spec must run the backend"; exit 1; }
+grep -q '"value": 8' "AGENTS/tasks/$TASK_C/outputs/compute/result.json" || { echo "FAIL: wrong result after miss"; exit 1; }
+
+echo "[case d] eviction keeps the cache within COMPUTE_RUN_CACHE_MAX"
+rm -rf "AGENTS/tasks/$TASK_A/outputs"
+COMPUTE_RUN_CACHE_MAX=1 bash AGENTS/runtime/compute_runner.sh --task "$TASK_A"
+COUNT="$(find "$CACHE_DIR" -name provenance.json | wc -l | tr -d ' ')"
+[[ "$COUNT" == "1" ]] || { echo "FAIL: expected 1 cache entry after eviction, got $COUNT"; exit 1; }
+
+echo "PASS: compute run cache checks passed"
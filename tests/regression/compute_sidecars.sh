@@ -0,0 +1,122 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+CACHE_DIR="$(mktemp -d /tmp/compute_sidecars.XXXXXX)"
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+TASK_OK="test_compute_sidecars_ok_$STAMP"
+TASK_REUSE="test_compute_sidecars_reuse_$STAMP"
+TASK_BAD="test_compute_sidecars_bad_$STAMP"
+cleanup() {
+  rm -rf "$CACHE_DIR" "AGENTS/tasks/$TASK_OK" "AGENTS/tasks/$TASK_REUSE" "AGENTS/tasks/$TASK_BAD"
+}
+trap cleanup EXIT
+export COMPUTE_RUN_CACHE="$CACHE_DIR"
+
+new_sidecar_task() {
+  local task="$1" trace_path="$2"
+  mkdir -p "AGENTS/tasks/$task/work/compute"
+  printf '{"job_name": "sidecar_probe", "backend": "python", "params": {"trace_path": "%s"}}\n' "$trace_path" \
+    > "AGENTS/tasks/$task/work/compute/spec.yaml"
+  cat > "AGENTS/tasks/$task/work/compute/main.py" <<'PY'
+import array
+import json
+import os
+import struct
+
+spec = json.loads(os.environ["COMPUTE_SPEC_JSON"])
+sidecar_dir = os.environ["COMPUTE_SIDECAR_DIR"]
+os.makedirs(sidecar_dir, exist_ok=True)
+
+trace = array.array("d", (float(i) for i in range(100000)))
+trace[5] = float("nan")
+with open(os.path.join(sidecar_dir, "trace.bin"), "wb") as f:
+    f.write(trace.tobytes())
+
+header = "{'descr': '<i4', 'fortran_order': False, 'shape': (10, 3), }"
+header += " " * (63 - (10 + len(header)) % 64) + "\n"
+grid = array.array("i", range(30))
+with open(os.path.join(sidecar_dir, "grid.npy"), "wb") as f:
+    f.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1") + grid.tobytes())
+
+payload = {
+    "results": {"trace_points": len(trace)},
+    "sidecars": {
+        "trace": {"path": spec["params"]["trace_path"], "format": "raw", "dtype": "<f8", "shape": [len(trace)]},
+        "grid": {"path": "sidecars/grid.npy", "format": "npy"},
+    },
+}
+with open(os.environ["COMPUTE_BACKEND_OUTPUT"], "w", encoding="utf-8") as f:
+    json.dump(payload, f)
+PY
+}
+
+echo "[case a] sidecars are summarized and hashed, not inlined"
+new_sidecar_task "$TASK_OK" "sidecars/trace.bin"
+bash AGENTS/runtime/compute_runner.sh --task "$TASK_OK"
+python3 - "AGENTS/tasks/$TASK_OK/outputs/compute" <<'PY'
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+out = Path(sys.argv[1])
+result = json.loads((out / "result.json").read_text(encoding="utf-8"))
+assert result["meta"]["status"] == "ok", result["sanity_checks"]
+side = {r["name"]: r for r in result["sidecars"]}
+trace = side["trace"]
+assert trace["dtype"] == "<f8" and trace["shape"] == [100000] and trace["bytes"] == 800000, trace
+assert trace["summary"]["count"] == 100000 and trace["summary"]["nonfinite"] == 1, trace
+assert trace["summary"]["min"] == 0.0 and trace["summary"]["max"] == 99999.0, trace
+grid = side["grid"]
+assert grid["dtype"] == "<i4" and grid["shape"] == [10, 3], grid
+assert grid["summary"]["min"] == 0 and grid["summary"]["max"] == 29 and grid["summary"]["mean"] == 14.5, grid
+hashes = {Path(o["path"]).name: o["sha256"] for o in json.loads((out / "hashes.json").read_text(encoding="utf-8"))["outputs"]}
+for name in ("trace.bin", "grid.npy"):
+    assert hashes[name] == hashlib.sha256((out / "sidecars" / name).read_bytes()).hexdigest(), name
+assert (out / "result.json").stat().st_size < 10000
+PY
+
+echo "[case b] the memoryview fallback matches the NumPy summaries"
+python3 - "AGENTS/tasks/$TASK_OK/outputs/compute" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, "AGENTS/runtime")
+import sidecars
+
+out = Path(sys.argv[1])
+result = json.loads((out / "result.json").read_text(encoding="utf-8"))
+payload = json.loads((out / "backend_payload.json").read_text(encoding="utf-8"))
+sidecars.np = None
+records, failures = sidecars.collect(out, payload)
+assert not failures, failures
+got = {r["name"]: r["summary"] for r in records}
+want = {r["name"]: r["summary"] for r in result["sidecars"]}
+assert got == want, (got, want)
+PY
+
+echo "[case c] cached runs bring their sidecars along"
+new_sidecar_task "$TASK_REUSE" "sidecars/trace.bin"
+bash AGENTS/runtime/compute_runner.sh --task "$TASK_REUSE" --reuse
+grep -q '^COMPUTE_RUN_CACHE=hit' "AGENTS/tasks/$TASK_REUSE/logs/compute/runner.stdout.log" || { echo "FAIL: expected cache hit"; exit 1; }
+cmp -s "AGENTS/tasks/$TASK_OK/outputs/compute/sidecars/trace.bin" "AGENTS/tasks/$TASK_REUSE/outputs/compute/sidecars/trace.bin" \
+  || { echo "FAIL: reused sidecar differs"; exit 1; }
+
+echo "[case d] a sidecar outside the outputs directory fails the run"
+new_sidecar_task "$TASK_BAD" "../../work/compute/spec.yaml"
+bash AGENTS/runtime/compute_runner.sh --task "$TASK_BAD"
+python3 - "AGENTS/tasks/$TASK_BAD/outputs/compute/result.json" <<'PY'
+import json
+import sys
+
+result = json.loads(open(sys.argv[1], encoding="utf-8").read())
+assert result["meta"]["status"] == "failed", result["meta"]
+failed = [c for c in result["sanity_checks"] if c["name"] == "sidecar:trace"]
+assert failed and "escapes" in failed[0]["detail"], result["sanity_checks"]
+PY
+
+echo "PASS: compute sidecar checks passed"
@@ -0,0 +1,82 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+if ! python3 AGENTS/runtime/sympy_engine.py check >/dev/null 2>&1; then
+  echo "SKIP: sympy not installed; compute_sympy_engine checks not run"
+  exit 0
+fi
+
+new_multistep_task() {
+  local task="$1" expression="$2" max_leaf="$3"
+  ./bin/agenthub start --skill compute_algebraic_multistep --task-name "$task" --request AGENTS/skills/compute_algebraic_multistep/templates/request.json.template >/dev/null
+  ./bin/agenthub request-set --task "$task" --field goal --value "Integrate, differentiate and solve the expression." >/dev/null
+  ./bin/agenthub request-set --task "$task" --field inputs --value "{\"expression\":\"$expression\"}" >/dev/null
+  ./bin/agenthub request-set --task "$task" --field expected_outputs --value '{"symbolic_result":"simplified_expression"}' >/dev/null
+  ./bin/agenthub request-set --task "$task" --field constraints --value '["No internet"]' >/dev/null
+  ./bin/agenthub request-set --task "$task" --field preferred_formats --value '["json"]' >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_customize --value yes >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_max_steps --value 6 >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_time_limit_sec_per_step --value 20 >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_max_leaf_count --value "$max_leaf" >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_overrides --value '{"assumptions":"x>0","check_level":"equivalence+spotcheck"}' >/dev/null
+  ./bin/agenthub run --task "$task" --yes </dev/null >/dev/null
+  ./bin/agenthub review-accept --task "$task" --token "$(tr -d '\r\n' < "AGENTS/tasks/$task/work/review_token.txt")" >/dev/null
+}
+
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+
+echo "[case a] multistep plan executes on the SymPy engine"
+TASK_OK="test_compute_sympy_ok_$STAMP"
+new_multistep_task "$TASK_OK" "x^2 - 1" 500
+RUN_OK="$(COMPUTE_ENGINE=sympy ./bin/agenthub run --task "$TASK_OK" --execute --yes </dev/null)"
+grep -q '^EXECUTION_STATUS=COMPLETED$' <<<"$RUN_OK" || { printf '%s\n' "$RUN_OK"; echo "FAIL: sympy execute did not complete"; exit 1; }
+grep -q '^backend: sympy$' "AGENTS/tasks/$TASK_OK/work/report_execute.md" || { echo "FAIL: report missing sympy backend"; exit 1; }
+python3 - "AGENTS/tasks/$TASK_OK" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+task = Path(sys.argv[1])
+plan = json.loads((task / "work/src/plan.json").read_text(encoding="utf-8"))
+outs = sorted((task / "work/out").glob("step_*.json"))
+assert len(outs) == len(plan["steps"]) == 6, (outs, plan["steps"])
+by_intent = {}
+relations = {}
+for p in outs:
+    rec = json.loads(p.read_text(encoding="utf-8"))
+    assert {"intent", "status", "message", "leaf_count", "result", "equivalence_check", "spotcheck"} <= set(rec), rec
+    assert rec["status"] == "ok" and rec["engine"] == "sympy", rec
+    assert rec["equivalence_check"] == "True" and rec["spotcheck"] == "0", rec
+    assert rec["verification"]["method"] == "numeric" and rec["verification"]["verdict"] == "equal", rec
+    by_intent[rec["intent"]] = rec["result"]
+    relations[rec["intent"]] = rec["verification"]["relation"]
+assert by_intent["Integrate expression under assumptions"] == "(1/3)*x^3 - x", by_intent
+assert by_intent["Differentiate expression"] == "2*x", by_intent
+assert by_intent["Solve equation for x"] == "{{x -> 1}}", by_intent
+assert relations["Integrate expression under assumptions"] == "antiderivative", relations
+assert relations["Solve equation for x"] == "residual", relations
+PY
+
+echo "[case b] leaf cap is enforced per step"
+TASK_LEAF="test_compute_sympy_leaf_$STAMP"
+new_multistep_task "$TASK_LEAF" "x^2 - 1" 2
+set +e
+RUN_LEAF="$(COMPUTE_ENGINE=sympy ./bin/agenthub run --task "$TASK_LEAF" --execute --yes </dev/null 2>&1)"
+set -e
+grep -q 'EXECUTION_STATUS=FAILED' <<<"$RUN_LEAF" || { echo "FAIL: leaf cap not enforced"; exit 1; }
+grep -q '"message": "leaf_count_exceeded"' "AGENTS/tasks/$TASK_LEAF/work/out/step_01.json" || { echo "FAIL: missing leaf_count_exceeded"; exit 1; }
+
+echo "[case c] COMPUTE_ENGINE=wolfram never falls back to SymPy"
+TASK_WL="test_compute_sympy_wlonly_$STAMP"
+new_multistep_task "$TASK_WL" "x^2 - 1" 500
+set +e
+RUN_WL="$(PATH="$(dirname "$(command -v python3)"):/usr/bin:/bin" COMPUTE_ENGINE=wolfram ./bin/agenthub run --task "$TASK_WL" --execute --yes </dev/null 2>&1)"
+RUN_WL_RC=$?
+set -e
+[[ "$RUN_WL_RC" -ne 0 ]] || { echo "FAIL: wolfram-only run must fail without a Wolfram backend"; exit 1; }
+[[ ! -f "AGENTS/tasks/$TASK_WL/work/out/step_01.json" ]] || { echo "FAIL: wolfram-only run produced step output"; exit 1; }
+
+echo "PASS: compute sympy engine checks passed"
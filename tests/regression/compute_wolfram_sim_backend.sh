@@ -0,0 +1,98 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+SIM_LOG="$(mktemp /tmp/wolfram_sim_log.XXXXXX)"
+cleanup() {
+  rm -f "$SIM_LOG"
+}
+trap cleanup EXIT
+
+new_multistep_task() {
+  local task="$1" max_leaf="$2"
+  ./bin/agenthub start --skill compute_algebraic_multistep --task-name "$task" --request AGENTS/skills/compute_algebraic_multistep/templates/request.json.template >/dev/null
+  ./bin/agenthub request-set --task "$task" --field goal --value "Derive a symbolic simplification pipeline." >/dev/null
+  ./bin/agenthub request-set --task "$task" --field inputs --value '{"expression":"(x^2-1)/(x-1)","variables":{"x":"real"}}' >/dev/null
+  ./bin/agenthub request-set --task "$task" --field expected_outputs --value '{"symbolic_result":"simplified_expression"}' >/dev/null
+  ./bin/agenthub request-set --task "$task" --field constraints --value '["No internet"]' >/dev/null
+  ./bin/agenthub request-set --task "$task" --field preferred_formats --value '["json"]' >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_customize --value yes >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_max_steps --value 3 >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_time_limit_sec_per_step --value 5 >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_max_leaf_count --value "$max_leaf" >/dev/null
+  ./bin/agenthub request-set --task "$task" --field policy_overrides --value '{"check_level":"equivalence+spotcheck"}' >/dev/null
+  ./bin/agenthub run --task "$task" --yes </dev/null >/dev/null
+  ./bin/agenthub review-accept --task "$task" --token "$(tr -d '\r\n' < "AGENTS/tasks/$task/work/review_token.txt")" >/dev/null
+}
+
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+
+echo "[case a] backend registry resolves the simulator only on request"
+LIST_OUT="$(WOLFRAM_BACKEND=sim python3 AGENTS/runtime/wolfram_backend.py list)"
+grep -q '^sim=available$' <<<"$LIST_OUT" || { echo "FAIL: simulator not listed as available"; exit 1; }
+RESOLVE_OUT="$(WOLFRAM_BACKEND=sim python3 AGENTS/runtime/wolfram_backend.py resolve)"
+[[ "$(sed -n 1p <<<"$RESOLVE_OUT")" == "sim" ]] || { echo "FAIL: WOLFRAM_BACKEND=sim did not resolve to sim"; exit 1; }
+grep -q 'wolfram_sim' <<<"$(sed -n 2p <<<"$RESOLVE_OUT")" || { echo "FAIL: missing simulator version"; exit 1; }
+
+echo "[case b] multistep execute completes on the simulator"
+TASK_OK="test_compute_wolfram_sim_ok_$STAMP"
+new_multistep_task "$TASK_OK" 100
+RUN_OK="$(WOLFRAM_BACKEND=sim WOLFRAM_SIM_LOG="$SIM_LOG" WOLFRAM_SIM_LATENCY_MS=5:20 WOLFRAM_SIM_SEED=1 ./bin/agenthub run --task "$TASK_OK" --execute --yes </dev/null)"
+grep -q '^EXECUTION_STATUS=COMPLETED$' <<<"$RUN_OK" || { printf '%s\n' "$RUN_OK"; echo "FAIL: simulated execute did not complete"; exit 1; }
+grep -q '^backend: sim$' "AGENTS/tasks/$TASK_OK/work/report_execute.md" || { echo "FAIL: report missing sim backend"; exit 1; }
+python3 - "AGENTS/tasks/$TASK_OK/work/out" "$SIM_LOG" <<'PY'
+import json
+import sys
+from pathlib import Path
+
+outs = sorted(Path(sys.argv[1]).glob("step_*.json"))
+assert len(outs) == 3, outs
+for p in outs:
+    rec = json.loads(p.read_text(encoding="utf-8"))
+    assert rec["status"] == "ok" and rec["simulated"] is True, rec
+    assert {"intent", "message", "leaf_count", "result", "equivalence_check", "spotcheck"} <= set(rec), rec
+    assert rec["spotcheck"] == "0", rec
+log = [json.loads(line) for line in Path(sys.argv[2]).read_text(encoding="utf-8").splitlines()]
+assert len(log) == 3 and all(r["outcome"] == "ok" for r in log), log
+PY
+
+echo "[case c] injected failure stops execution"
+TASK_FAIL="test_compute_wolfram_sim_fail_$STAMP"
+new_multistep_task "$TASK_FAIL" 100
+set +e
+RUN_FAIL="$(WOLFRAM_BACKEND=sim WOLFRAM_SIM_FAIL_MATCH=step_02 ./bin/agenthub run --task "$TASK_FAIL" --execute --yes </dev/null 2>&1)"
+set -e
+grep -q 'EXECUTION_STATUS=FAILED' <<<"$RUN_FAIL" || { printf '%s\n' "$RUN_FAIL"; echo "FAIL: injected failure not reported"; exit 1; }
+grep -q '^step=step_01 status=ok' "AGENTS/tasks/$TASK_FAIL/work/report_execute.md" || { echo "FAIL: step_01 should pass"; exit 1; }
+grep -q '^step=step_02 status=failed' "AGENTS/tasks/$TASK_FAIL/work/report_execute.md" || { echo "FAIL: step_02 should fail"; exit 1; }
+[[ ! -f "AGENTS/tasks/$TASK_FAIL/work/out/step_03.json" ]] || { echo "FAIL: execution must stop after a failed step"; exit 1; }
+
+echo "[case d] STEP_MAX_LEAF is enforced by the simulator"
+TASK_LEAF="test_compute_wolfram_sim_leaf_$STAMP"
+new_multistep_task "$TASK_LEAF" 2
+set +e
+RUN_LEAF="$(WOLFRAM_BACKEND=sim ./bin/agenthub run --task "$TASK_LEAF" --execute --yes </dev/null 2>&1)"
+set -e
+grep -q 'EXECUTION_STATUS=FAILED' <<<"$RUN_LEAF" || { echo "FAIL: leaf cap not enforced"; exit 1; }
+grep -q '"message": "leaf_count_exceeded"' "AGENTS/tasks/$TASK_LEAF/work/out/step_01.json" || { echo "FAIL: missing leaf_count_exceeded"; exit 1; }
+
+echo "[case e] without SymPy all inconclusive steps share one proof kernel"
+PROOF_DIR="$(mktemp -d /tmp/wolfram_sim_proof.XXXXXX)"
+cp "AGENTS/tasks/$TASK_OK/work/out/"step_*.json "$PROOF_DIR/"
+: > "$SIM_LOG"
+VERIFY_OUT="$(WOLFRAM_BACKEND=sim WOLFRAM_SIM_LOG="$SIM_LOG" python3 -c '
+import sys
+sys.modules["sympy"] = None  # verify as on a Wolfram machine without SymPy
+sys.path.insert(0, "AGENTS/runtime")
+import spotcheck
+sys.argv[0] = "spotcheck"
+raise SystemExit(spotcheck.main())
+' verify-plan --plan "AGENTS/tasks/$TASK_OK/work/src/plan.json" --request "AGENTS/tasks/$TASK_OK/request.json" \
+  --out-dir "$PROOF_DIR" --prove wolfram)"
+rm -rf "$PROOF_DIR"
+[[ "$(grep -c 'verdict=inconclusive' <<<"$VERIFY_OUT")" -eq 3 ]] || { printf '%s\n' "$VERIFY_OUT"; echo "FAIL: steps not sent to the proof"; exit 1; }
+[[ "$(wc -l < "$SIM_LOG")" -eq 1 ]] || { cat "$SIM_LOG"; echo "FAIL: expected one kernel start for all proofs"; exit 1; }
+
+echo "PASS: compute wolfram simulator backend checks passed"
@@ -0,0 +1,148 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+TMP="$(mktemp -d /tmp/edit_journal_patch.XXXXXX)"
+cleanup() {
+  rm -rf "$TMP"
+}
+trap cleanup EXIT
+
+PAPER="$TMP/USER/paper"
+SHADOW="$TMP/task/work/paper_shadow/paper"
+PATCH="$TMP/patch.diff"
+MANIFEST="$TMP/files_manifest.json"
+mkdir -p "$PAPER/sections"
+python3 - "$PAPER" <<'PY'
+import sys
+
+paper = sys.argv[1]
+lines = [f"Line {i} of the introduction.\n" for i in range(1, 41)]
+open(f"{paper}/main.tex", "w").write("\\documentclass{article}\n\\begin{document}\n" + "".join(lines) + "\\end{document}\n")
+open(f"{paper}/sections/old.tex", "w").write("Obsolete section.\n")
+PY
+echo '{"shadow_root": "x"}' > "$MANIFEST"
+journal() {
+  python3 AGENTS/runtime/edit_journal.py "$@"
+}
+
+echo "[case a] emitted hunks match diff -u and apply to USER/paper"
+python3 AGENTS/runtime/paper_shadow.py snapshot --src "$PAPER" --dest "$SHADOW" >/dev/null
+python3 - "$SHADOW/main.tex" <<'PY'
+import sys
+
+path = sys.argv[1]
+lines = open(path).readlines()
+lines[5] = "Line 4, rewritten.\n"
+lines.insert(20, "An inserted sentence.\n")
+del lines[35]
+with open(path, "w") as f:
+    f.writelines(lines)
+PY
+journal record --dest "$SHADOW" --path main.tex --change-type edit --purpose "Rewrite intro" >/dev/null
+printf 'New section.\nSecond line without newline' > "$SHADOW/sections/new.tex"
+journal record --dest "$SHADOW" --path sections/new.tex --change-type add --purpose "Add section" >/dev/null
+rm "$SHADOW/sections/old.tex"
+journal record --dest "$SHADOW" --path sections/old.tex --change-type delete --purpose "Drop section" >/dev/null
+OUT="$(journal emit --src "$PAPER" --dest "$SHADOW" --patch "$PATCH" --manifest "$MANIFEST")"
+[[ "$OUT" == "PATCH_FILES=3 EDITED_FILES=3" ]] || { echo "$OUT"; echo "FAIL: emit counts"; exit 1; }
+hunks() {
+  grep -v -e '^diff ' -e '^--- ' -e '^+++ '
+}
+for rel in main.tex sections/new.tex sections/old.tex; do
+  a="$PAPER/$rel"
+  b="$SHADOW/$rel"
+  [[ -e "$a" ]] || a=/dev/null
+  [[ -e "$b" ]] || b=/dev/null
+  want="$(diff -u "$a" "$b" | hunks || true)"
+  got="$(python3 - "$PATCH" "$rel" <<'PY' | hunks || true
+import sys
+
+patch, rel = sys.argv[1:]
+chunks = open(patch).read().split("diff -ruN ")
+print("".join(c.split("\n", 1)[1] for c in chunks if c.startswith(f"a/USER/paper/{rel} ")), end="")
+PY
+)"
+  [[ "$want" == "$got" ]] || { diff <(echo "$want") <(echo "$got"); echo "FAIL: hunks differ for $rel"; exit 1; }
+done
+mkdir -p "$TMP/repo"
+cp -a "$TMP/USER" "$TMP/repo/USER"
+git -C "$TMP/repo" init -q
+git -C "$TMP/repo" apply --check "$PATCH" || { echo "FAIL: git apply --check"; exit 1; }
+git -C "$TMP/repo" apply "$PATCH"
+diff -r "$TMP/repo/USER/paper" "$SHADOW" || { echo "FAIL: applied patch differs from shadow"; exit 1; }
+python3 - "$MANIFEST" <<'PY'
+import json
+import sys
+
+edited = json.load(open(sys.argv[1]))["edited_files"]
+assert [(e["path"], e["change_type"]) for e in edited] == [
+    ("main.tex", "edit"), ("sections/new.tex", "add"), ("sections/old.tex", "delete")], edited
+PY
+
+echo "[case b] a new snapshot starts a new journal"
+python3 AGENTS/runtime/paper_shadow.py snapshot --src "$PAPER" --dest "$SHADOW" >/dev/null
+OUT="$(journal emit --src "$PAPER" --dest "$SHADOW" --patch "$PATCH" --manifest "$MANIFEST")"
+[[ "$OUT" == "PATCH_FILES=0 EDITED_FILES=0" && ! -s "$PATCH" ]] || { echo "$OUT"; echo "FAIL: stale journal replayed"; exit 1; }
+
+echo "[case c] unjournaled shadow changes are only walked for on request"
+echo "% unjournaled" >> "$SHADOW/main.tex"
+OUT="$(journal emit --src "$PAPER" --dest "$SHADOW" --patch "$PATCH" --manifest "$MANIFEST")"
+[[ "$OUT" == "PATCH_FILES=0 EDITED_FILES=0" ]] || { echo "$OUT"; echo "FAIL: emit walked the shadow by default"; exit 1; }
+OUT="$(journal emit --src "$PAPER" --dest "$SHADOW" --patch "$PATCH" --manifest "$MANIFEST" --check-unjournaled 2>"$TMP/err.txt")"
+[[ "$OUT" == "PATCH_FILES=1 EDITED_FILES=1" ]] || { echo "$OUT"; echo "FAIL: unjournaled edit missed"; exit 1; }
+grep -q 'unjournaled shadow change: main.tex' "$TMP/err.txt" || { echo "FAIL: unjournaled edit not reported"; exit 1; }
+grep -q '^+% unjournaled$' "$PATCH" || { echo "FAIL: unjournaled edit not patched"; exit 1; }
+
+echo "[case d] random edits and a full rewrite round-trip through patch(1) quickly"
+FUZZ="$TMP/fuzz"
+mkdir -p "$FUZZ/USER/paper"
+python3 - "$FUZZ/USER/paper" <<'PY'
+import random
+import sys
+
+rng = random.Random(7)
+paper = sys.argv[1]
+for i in range(12):
+    lines = [f"{rng.choice(['alpha', 'beta', 'gamma', ''])} {rng.randrange(20)}\n" for _ in range(rng.randrange(400))]
+    open(f"{paper}/f{i:02d}.tex", "w").write("".join(lines))
+open(f"{paper}/big.tex", "w").write("".join(f"Original line {i}\n" for i in range(3000)))
+PY
+python3 AGENTS/runtime/paper_shadow.py snapshot --src "$FUZZ/USER/paper" --dest "$FUZZ/shadow" >/dev/null
+python3 - "$FUZZ/shadow" <<'PY'
+import random
+import sys
+
+rng = random.Random(11)
+shadow = sys.argv[1]
+for i in range(12):
+    path = f"{shadow}/f{i:02d}.tex"
+    lines = open(path).readlines()
+    for _ in range(rng.randrange(1, 60)):
+        at = rng.randrange(len(lines) + 1)
+        op = rng.choice(["insert", "delete", "replace"]) if at < len(lines) else "insert"
+        if op == "insert":
+            lines.insert(at, f"new {rng.randrange(20)}\n")
+        elif op == "delete":
+            del lines[at]
+        else:
+            lines[at] = f"changed {rng.randrange(20)}\n"
+    if lines and rng.random() < 0.3:
+        lines[-1] = lines[-1].rstrip("\n")
+    open(path, "w").writelines(lines)
+open(f"{shadow}/big.tex", "w").write("".join(f"Rewritten line {i}\n" for i in range(3000)))
+PY
+for f in "$FUZZ"/shadow/*.tex; do
+  journal record --dest "$FUZZ/shadow" --path "$(basename "$f")" --change-type edit --purpose "Fuzz" >/dev/null
+done
+echo '{}' > "$FUZZ/files_manifest.json"
+START_MS="$(python3 -c 'import time; print(int(time.time() * 1000))')"
+journal emit --src "$FUZZ/USER/paper" --dest "$FUZZ/shadow" --patch "$FUZZ/patch.diff" --manifest "$FUZZ/files_manifest.json" >/dev/null
+ELAPSED_MS="$(( $(python3 -c 'import time; print(int(time.time() * 1000))') - START_MS ))"
+[[ "$ELAPSED_MS" -lt 5000 ]] || { echo "FAIL: emit took ${ELAPSED_MS} ms"; exit 1; }
+patch -s -d "$FUZZ" -p1 < "$FUZZ/patch.diff" || { echo "FAIL: patch rejected the emitted diff"; exit 1; }
+diff -r "$FUZZ/USER/paper" "$FUZZ/shadow" || { echo "FAIL: patched USER/paper differs from the shadow"; exit 1; }
+
+echo "PASS: edit journal patch checks passed"
@@ -0,0 +1,109 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+SKILL="latex_writer"
+PAPER="USER/paper"
+TMP="$(mktemp -d /tmp/latex_build_cache.XXXXXX)"
+TASKS=()
+FIXTURES=(main.tex main.aux main.pdf figures)
+for f in "${FIXTURES[@]}"; do
+  [[ ! -e "$PAPER/$f" ]] || { echo "SKIP: $PAPER/$f already exists; refusing to overwrite"; exit 0; }
+done
+SLOT="$(cd AGENTS/runtime && python3 -c 'import sys; from pathlib import Path; import latex_build; print(latex_build.slot_dir(Path(sys.argv[1]), str(Path(sys.argv[2]).resolve()), "main.tex"))' "$ROOT/AGENTS/cache/latex" "$ROOT/$PAPER")"
+cleanup() {
+  for f in "${FIXTURES[@]}"; do
+    rm -rf "$PAPER/$f"
+  done
+  for t in "${TASKS[@]}"; do
+    rm -rf "AGENTS/tasks/$t" "GATE/staged/$t"
+  done
+  rm -rf "$TMP" "$SLOT"
+}
+trap cleanup EXIT
+rm -rf "$SLOT"
+
+# Stub latexmk: rewrites its outputs in place, as latexmk/pdflatex do.
+mkdir -p "$TMP/bin"
+cat > "$TMP/bin/latexmk" <<'SH'
+#!/usr/bin/env bash
+main="${@: -1}"
+stem="${main%.tex}"
+echo run >> "$LATEXMK_STUB_CALLS"
+echo "Run number 1 of rule 'pdflatex'"
+printf '\\relax stub build\n' > "$stem.aux"
+printf '%%PDF-1.4 stub build\n' > "$stem.pdf"
+SH
+chmod +x "$TMP/bin/latexmk"
+export PATH="$TMP/bin:$PATH"
+export LATEXMK_STUB_CALLS="$TMP/calls.txt"
+: > "$LATEXMK_STUB_CALLS"
+
+printf '\\documentclass{article}\n\\begin{document}\nHello.\n\\end{document}\n' > "$PAPER/main.tex"
+printf '\\relax user aux\n' > "$PAPER/main.aux"
+printf '%%PDF-1.4 user build\n' > "$PAPER/main.pdf"
+mkdir -p "$PAPER/figures"
+echo "FIGURE v1" > "$PAPER/figures/plot.pdf"
+cp -a "$PAPER" "$TMP/baseline"
+echo "Tighten the introduction." > "$TMP/request.md"
+
+run_checks() {
+  local task
+  task="$(./bin/agenthub start --skill "$SKILL" --request "$TMP/request.md" </dev/null | sed -n 's/^TASK=\([^ ]*\).*/\1/p')"
+  TASKS+=("$task")
+  ./bin/agenthub run --task "$task" --yes </dev/null >"$TMP/run_$task.out" 2>&1
+  bash "AGENTS/skills/$SKILL/checks.sh" "$ROOT" "$task" >"$TMP/checks_$task.out" 2>&1 || true
+  grep -q '^LATEXMK_STATUS=ok$' "$TMP/checks_$task.out" || { cat "$TMP/checks_$task.out"; echo "FAIL: latexmk status"; exit 1; }
+  CACHE="$(python3 -c 'import json, sys; print(next(c["cache"] for c in json.load(open(sys.argv[1]))["build_checks"] if c["name"] == "latexmk"))' \
+    "AGENTS/tasks/$task/deliverable/patchset/files_manifest.json")"
+}
+
+echo "[case a] checks.sh builds in the shadow without touching USER/paper"
+run_checks
+[[ "$CACHE" == "cold" ]] || { echo "FAIL: first build cache=$CACHE"; exit 1; }
+[[ "$(wc -l < "$LATEXMK_STUB_CALLS")" -eq 1 ]] || { echo "FAIL: latexmk not run"; exit 1; }
+diff -r "$TMP/baseline" "$PAPER" || { echo "FAIL: USER/paper modified by the build"; exit 1; }
+[[ -z "$(git status --porcelain -- "$PAPER" | grep -v '^??' || true)" ]] || { echo "FAIL: tracked USER/paper files modified"; exit 1; }
+
+echo "[case b] a second run with unchanged sources hits the cache"
+run_checks
+[[ "$CACHE" == "hit" ]] || { echo "FAIL: second build cache=$CACHE"; exit 1; }
+[[ "$(wc -l < "$LATEXMK_STUB_CALLS")" -eq 1 ]] || { echo "FAIL: latexmk rerun on a cache hit"; exit 1; }
+grep -q 'stub build' "AGENTS/tasks/${TASKS[1]}/work/paper_shadow/paper/main.pdf" || { echo "FAIL: cached PDF not seeded"; exit 1; }
+diff -r "$TMP/baseline" "$PAPER" || { echo "FAIL: USER/paper modified by the cache hit"; exit 1; }
+python3 - "$SLOT/state.json" "$PAPER/figures/plot.pdf" <<'PY'
+import json
+import os
+import sys
+
+state = json.load(open(sys.argv[1]))
+st = os.stat(sys.argv[2])
+sig = state["stat_cache"]["figures/plot.pdf"]["sig"]
+assert sig == [st.st_ino, st.st_size, st.st_mtime_ns], "digest cache not keyed on the USER/paper stat"
+PY
+
+echo "[case c] a changed PDF figure is a source: it rebuilds and is never seeded over"
+echo "FIGURE v2" > "$PAPER/figures/plot.pdf"
+rm -rf "$TMP/baseline" && cp -a "$PAPER" "$TMP/baseline"
+run_checks
+[[ "$CACHE" == "seeded" ]] || { echo "FAIL: changed figure gave cache=$CACHE"; exit 1; }
+[[ "$(wc -l < "$LATEXMK_STUB_CALLS")" -eq 2 ]] || { echo "FAIL: latexmk not rerun after a figure change"; exit 1; }
+grep -q 'FIGURE v2' "AGENTS/tasks/${TASKS[2]}/work/paper_shadow/paper/figures/plot.pdf" || { echo "FAIL: stale figure seeded into the shadow"; exit 1; }
+diff -r "$TMP/baseline" "$PAPER" || { echo "FAIL: USER/paper modified by the rebuild"; exit 1; }
+
+echo "[case d] outputs symlinked into USER/paper are detached before a rebuild"
+SHADOW="AGENTS/tasks/${TASKS[1]}/work/paper_shadow/paper"
+for f in main.aux main.pdf; do
+  ln -sf "$ROOT/$PAPER/$f" "$SHADOW/$f"
+done
+echo "% force a rebuild" >> "$SHADOW/main.tex"
+OUT="$(python3 AGENTS/runtime/latex_build.py build --paper "$SHADOW" --main main.tex --paper-id "$ROOT/$PAPER" \
+  --cache-root "$ROOT/AGENTS/cache/latex" --log "$TMP/latexmk.log")"
+grep -q '^LATEXMK_STATUS=ok$' <<< "$OUT" || { echo "$OUT"; echo "FAIL: rebuild"; exit 1; }
+[[ "$(wc -l < "$LATEXMK_STUB_CALLS")" -eq 3 ]] || { echo "FAIL: latexmk not rerun after a source change"; exit 1; }
+diff -r "$TMP/baseline" "$PAPER" || { echo "FAIL: USER/paper modified through a symlink"; exit 1; }
+[[ ! -L "$SHADOW/main.pdf" ]] || { echo "FAIL: symlinked output left in place"; exit 1; }
+
+echo "PASS: latex build cache checks passed"
@@ -0,0 +1,83 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+TMP="$(mktemp -d /tmp/paper_shadow_isolation.XXXXXX)"
+cleanup() {
+  rm -rf "$TMP"
+}
+trap cleanup EXIT
+
+PAPER="$TMP/USER/paper"
+SHADOW="$TMP/task/work/paper_shadow/paper"
+mkdir -p "$PAPER/figures"
+printf '\\documentclass{article}\n\\begin{document}\nHello.\n\\end{document}\n' > "$PAPER/main.tex"
+printf '\\relax\n' > "$PAPER/main.aux"
+head -c 20000 /dev/urandom > "$PAPER/main.pdf"
+head -c 50000 /dev/urandom > "$PAPER/figures/plot.png"
+cp -a "$PAPER" "$TMP/baseline"
+
+echo "[case a] no shadow file shares an inode with USER/paper"
+OUT="$(python3 AGENTS/runtime/paper_shadow.py snapshot --src "$PAPER" --dest "$SHADOW")"
+grep -q '^SHADOW_FILES=4 ' <<< "$OUT" || { echo "$OUT"; echo "FAIL: snapshot"; exit 1; }
+python3 - "$PAPER" "$SHADOW" <<'PY'
+import os
+import sys
+
+paper, shadow = sys.argv[1:]
+for dirpath, _, names in os.walk(paper):
+    for name in names:
+        src = os.path.join(dirpath, name)
+        dst = os.path.join(shadow, os.path.relpath(src, paper))
+        assert os.stat(src).st_ino != os.stat(dst).st_ino, dst
+        assert os.stat(src).st_nlink == 1, src
+PY
+
+echo "[case b] in-place writes through the shadow leave USER/paper untouched"
+python3 - "$SHADOW" <<'PY'
+import sys
+
+shadow = sys.argv[1]
+for rel in ("main.pdf", "main.aux"):
+    with open(f"{shadow}/{rel}", "wb") as f:
+        f.write(b"rebuilt by latexmk\n")
+with open(f"{shadow}/figures/plot.png", "r+b") as f:
+    f.write(b"\x89PNG overwritten")
+with open(f"{shadow}/main.tex", "a", encoding="utf-8") as f:
+    f.write("% appended\n")
+PY
+diff -r "$TMP/baseline" "$PAPER" >/dev/null || { diff -r "$TMP/baseline" "$PAPER" | head; echo "FAIL: USER/paper modified through the shadow"; exit 1; }
+
+echo "[case c] the snapshot manifest reports exactly the touched files"
+touch "$SHADOW/new.tex"
+rm "$SHADOW/figures/plot.png"
+python3 - "$SHADOW" <<'PY'
+import sys
+from pathlib import Path
+
+sys.path.insert(0, "AGENTS/runtime")
+import paper_shadow
+
+dest = Path(sys.argv[1])
+touched = paper_shadow.touched_files(paper_shadow.load_manifest(paper_shadow.default_manifest(dest)))
+assert touched == [
+    ("figures/plot.png", "delete"), ("main.aux", "edit"), ("main.pdf", "edit"),
+    ("main.tex", "edit"), ("new.tex", "add"),
+], touched
+PY
+
+echo "[case d] snapshot refuses a destination that would remove the source or the cwd"
+for bad in "$PAPER" "$TMP/USER" "$PAPER/sub" "$ROOT"; do
+  if python3 AGENTS/runtime/paper_shadow.py snapshot --src "$PAPER" --dest "$bad" >/dev/null 2>&1; then
+    echo "FAIL: snapshot accepted --dest $bad"; exit 1
+  fi
+done
+if python3 AGENTS/runtime/paper_shadow.py snapshot --src "$PAPER" --dest "" >/dev/null 2>&1; then
+  echo "FAIL: snapshot accepted an empty --dest"; exit 1
+fi
+diff -r "$TMP/baseline" "$PAPER" >/dev/null || { echo "FAIL: USER/paper modified by a refused snapshot"; exit 1; }
+[[ -f "$ROOT/AGENTS/runtime/paper_shadow.py" ]] || { echo "FAIL: repository removed"; exit 1; }
+
+echo "PASS: paper shadow isolation checks passed"
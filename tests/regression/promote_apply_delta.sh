@@ -0,0 +1,83 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+TASK="test_promote_apply_delta_$STAMP"
+SKILL="compute_numerical"
+TMP="$(mktemp -d /tmp/promote_apply_delta.XXXXXX)"
+STAGE="GATE/staged/$TASK"
+DST="USER/reports/compute/$TASK"
+LINK="USER/reports/compute/${TASK}_link"
+cleanup() {
+  rm -rf "$TMP" "$STAGE" "$DST" "$LINK" USER/manifest/promotion_receipts/"${TASK}"_*.json
+}
+trap cleanup EXIT
+export CAS_STORE="$TMP/cas"
+
+mkdir -p "$STAGE/$SKILL/out/sub" "$TMP/outside"
+echo "alpha" > "$STAGE/$SKILL/out/a.txt"
+echo "beta" > "$STAGE/$SKILL/out/sub/b.txt"
+ln -s "$TMP/outside" "$LINK"
+
+write_contract() {
+  python3 - "$STAGE/PROMOTE.json" "$SKILL" "$@" <<'PY'
+import json
+import sys
+
+path, skill, *pairs = sys.argv[1:]
+maps = [{"src": pairs[i], "dst": pairs[i + 1]} for i in range(0, len(pairs), 2)]
+json.dump({"kind": "promotion_contract", "skill": skill, "mappings": maps,
+           "allowed_dst_prefixes": ["USER/reports/compute/"]}, open(path, "w", encoding="utf-8"), indent=2)
+PY
+}
+user_snapshot() {
+  find USER -path USER/manifest/promotion_receipts -prune -o -print0 | sort -z | xargs -0 ls -ld --time-style=+%s.%N | md5sum
+}
+
+echo "[case a] one bad mapping leaves USER/ untouched"
+write_contract "$STAGE/$SKILL/out" "$DST/new/dir" "$STAGE/$SKILL/out/a.txt" "$LINK/deep/evil.txt"
+BEFORE="$(user_snapshot)"
+set +e
+python3 AGENTS/runtime/promote_apply.py --root "$ROOT" --task "$TASK" >"$TMP/bad.out" 2>&1
+rc=$?
+set -e
+[[ "$rc" -eq 2 ]] && grep -q "Invalid promotion destination resolution" "$TMP/bad.out" || { cat "$TMP/bad.out"; echo "FAIL: bad mapping accepted"; exit 1; }
+[[ "$(user_snapshot)" == "$BEFORE" ]] || { echo "FAIL: USER/ changed by a rejected promotion"; exit 1; }
+[[ ! -e "$DST" && -z "$(ls -A "$TMP/outside")" ]] || { echo "FAIL: directories created"; exit 1; }
+ls USER/manifest/promotion_receipts/"${TASK}"_*.json >/dev/null 2>&1 && { echo "FAIL: receipt written"; exit 1; }
+
+echo "[case b] receipt delta records add, then unchanged and update"
+write_contract "$STAGE/$SKILL/out" "$DST/out"
+python3 AGENTS/runtime/promote_apply.py --root "$ROOT" --task "$TASK" >"$TMP/first.out"
+grep -q '^PROMOTED_FILES=2 UNCHANGED_FILES=0$' "$TMP/first.out" || { cat "$TMP/first.out"; echo "FAIL: first promotion"; exit 1; }
+cmp -s "$STAGE/$SKILL/out/sub/b.txt" "$DST/out/sub/b.txt" || { echo "FAIL: promoted content"; exit 1; }
+# Receipts are named by the second; keep the two promotions apart.
+sleep 1
+echo "beta, revised" > "$STAGE/$SKILL/out/sub/b.txt"
+python3 AGENTS/runtime/promote_apply.py --root "$ROOT" --task "$TASK" >"$TMP/second.out"
+grep -q '^PROMOTED_FILES=1 UNCHANGED_FILES=1$' "$TMP/second.out" || { cat "$TMP/second.out"; echo "FAIL: second promotion"; exit 1; }
+python3 - "$(sed -n 's/^PROMOTION_RECEIPT=//p' "$TMP/first.out")" "$(sed -n 's/^PROMOTION_RECEIPT=//p' "$TMP/second.out")" "$DST" <<'PY'
+import hashlib
+import json
+import sys
+
+first, second, dst = sys.argv[1:]
+
+
+def sha(path: str) -> str:
+    return hashlib.sha256(open(path, "rb").read()).hexdigest()
+
+
+r1 = json.load(open(first, encoding="utf-8"))
+r2 = json.load(open(second, encoding="utf-8"))
+assert [(d["path"], d["action"]) for d in r1["delta"]] == [(f"{dst}/out/a.txt", "add"), (f"{dst}/out/sub/b.txt", "add")], r1["delta"]
+assert r1["summary"] == {"add": 2, "update": 0, "unchanged": 0, "bytes_written": 11}, r1["summary"]
+assert [(d["path"], d["action"]) for d in r2["delta"]] == [(f"{dst}/out/a.txt", "unchanged"), (f"{dst}/out/sub/b.txt", "update")], r2["delta"]
+assert r2["summary"] == {"add": 0, "update": 1, "unchanged": 1, "bytes_written": 14}, r2["summary"]
+assert all(d["sha256"] == sha(d["path"]) for d in r2["delta"]), r2["delta"]
+PY
+
+echo "PASS: promote apply delta checks passed"
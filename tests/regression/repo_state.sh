@@ -0,0 +1,77 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+TMP="$(mktemp -d /tmp/repo_state.XXXXXX)"
+cleanup() {
+  rm -rf "$TMP"
+}
+trap cleanup EXIT
+
+source "$ROOT/AGENTS/runtime/repo_state.sh"
+REPO="$TMP/repo"
+mkdir -p "$REPO/USER" "$REPO/GATE" "$REPO/AGENTS/tasks"
+git -C "$REPO" init -q
+git -C "$REPO" config user.email t@example.com
+git -C "$REPO" config user.name t
+echo a > "$REPO/USER/a.txt"
+echo g > "$REPO/GATE/.keep"
+git -C "$REPO" add -A
+git -C "$REPO" commit -qm init
+
+echo "[case a] status is limited to USER and GATE"
+mkdir -p "$REPO/AGENTS/tasks/t1"
+echo x > "$REPO/AGENTS/tasks/t1/out.txt"
+echo tracked > "$REPO/tracked_elsewhere.txt"
+[[ -z "$(repo_status "$REPO")" ]] || { echo "FAIL: task churn reported"; exit 1; }
+[[ -z "$(python3 AGENTS/runtime/repo_state.py status --root "$REPO")" ]] || { echo "FAIL: py task churn reported"; exit 1; }
+echo b >> "$REPO/USER/a.txt"
+mkdir -p "$REPO/GATE/staged/t1"
+echo s > "$REPO/GATE/staged/t1/f"
+repo_status "$REPO" > "$TMP/status.txt"
+OUT="$(cat "$TMP/status.txt")"
+grep -q '^ M USER/a.txt$' <<< "$OUT" && grep -q '^?? GATE/staged/$' <<< "$OUT" || { echo "$OUT"; echo "FAIL: USER/GATE changes"; exit 1; }
+[[ "$OUT" == "$(python3 AGENTS/runtime/repo_state.py status --root "$REPO")" ]] || { echo "FAIL: sh and py disagree"; exit 1; }
+grep -q -- '-c core.untrackedCache=true status --porcelain -- USER GATE$' <<< "$REPO_STATUS_CMD" || { echo "FAIL: $REPO_STATUS_CMD"; exit 1; }
+
+echo "[case b] outside a work tree"
+mkdir -p "$TMP/plain"
+set +e
+repo_status "$TMP/plain" >/dev/null
+rc_sh=$?
+python3 AGENTS/runtime/repo_state.py status --root "$TMP/plain" >/dev/null 2>&1
+rc_py=$?
+set -e
+[[ "$rc_sh" -eq 2 && "$rc_py" -eq 2 ]] || { echo "FAIL: rc sh=$rc_sh py=$rc_py"; exit 1; }
+[[ -z "$(python3 AGENTS/runtime/repo_state.py head --root "$TMP/plain")" ]] || { echo "FAIL: head outside repo"; exit 1; }
+
+echo "[case c] HEAD is read from loose refs, packed refs, detached HEAD and worktrees"
+check_head() {
+  local dir="$1" want got
+  want="$(git -C "$dir" rev-parse HEAD)"
+  got="$(python3 AGENTS/runtime/repo_state.py head --root "$dir")"
+  [[ "$got" == "$want" ]] || { echo "FAIL: head $dir ($2): $got != $want"; exit 1; }
+}
+check_head "$REPO" loose
+git -C "$REPO" pack-refs --all
+check_head "$REPO" packed
+git -C "$REPO" worktree add -q "$TMP/wt" -b side
+git -C "$TMP/wt" commit -q --allow-empty -m side
+check_head "$TMP/wt" worktree
+git -C "$REPO" checkout -q --detach
+check_head "$REPO" detached
+python3 - "$REPO" <<'PY'
+import sys
+from pathlib import Path
+
+sys.path.insert(0, "AGENTS/runtime")
+import repo_state
+
+first = repo_state.head(Path(sys.argv[1]))
+(Path(sys.argv[1]) / ".git" / "HEAD").write_text("0" * 40 + "\n", encoding="utf-8")
+assert repo_state.head(Path(sys.argv[1])) == first, "HEAD should be cached per process"
+PY
+
+echo "PASS: repo state checks passed"
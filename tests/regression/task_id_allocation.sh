@@ -0,0 +1,56 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+REQ="AGENTS/requests/regression/task_id_allocation.md"
+mkdir -p "$(dirname "$REQ")"
+cat > "$REQ" <<'EOF'
+# Request
+
+Goal:
+Task id allocation regression.
+EOF
+
+SKILL="diffpack"
+N=24
+OUT_DIR="$(mktemp -d "/tmp/task_id_allocation.XXXXXX")"
+
+echo "[case a] parallel starts allocate unique <skill>_<timestamp> ids without sleeping"
+T0="$(date +%s)"
+for i in $(seq 1 "$N"); do
+  ./bin/agenthub start --skill "$SKILL" --request "$REQ" >"$OUT_DIR/start_$i.out" 2>&1 &
+done
+wait
+T1="$(date +%s)"
+
+IDS="$(sed -n 's/^TASK=\([^ ]*\).*/\1/p' "$OUT_DIR"/start_*.out | sort)"
+COUNT="$(printf '%s\n' "$IDS" | grep -c . || true)"
+UNIQUE="$(printf '%s\n' "$IDS" | sort -u | grep -c . || true)"
+cleanup() {
+  while IFS= read -r id; do
+    [[ -n "$id" ]] && rm -rf "AGENTS/tasks/$id"
+  done <<<"$IDS"
+  rm -rf "$OUT_DIR"
+}
+trap cleanup EXIT
+
+[[ "$COUNT" -eq "$N" ]] || { echo "FAIL: expected $N started tasks, got $COUNT"; cat "$OUT_DIR"/start_*.out; exit 1; }
+[[ "$UNIQUE" -eq "$N" ]] || { echo "FAIL: duplicate task ids allocated"; exit 1; }
+while IFS= read -r id; do
+  grep -Eq "^${SKILL}_[0-9]{8}T[0-9]{6}Z(_[0-9]{3,})?$" <<<"$id" || { echo "FAIL: unexpected task id shape: $id"; exit 1; }
+  [[ -f "AGENTS/tasks/$id/meta.json" ]] || { echo "FAIL: missing meta.json for $id"; exit 1; }
+done <<<"$IDS"
+[[ $((T1 - T0)) -lt "$N" ]] || { echo "FAIL: allocation appears serialized ($((T1 - T0))s for $N starts)"; exit 1; }
+
+echo "[case b] explicit --task-name collision is rejected"
+FIRST="$(printf '%s\n' "$IDS" | head -n1)"
+set +e
+OUT_B="$(./bin/agenthub start --skill "$SKILL" --task-name "$FIRST" --request "$REQ" 2>&1)"
+RC_B=$?
+set -e
+[[ "$RC_B" -ne 0 ]] || { echo "FAIL: expected collision failure"; exit 1; }
+grep -q "^ERROR=Task already exists: $FIRST$" <<<"$OUT_B" || { echo "FAIL: missing collision message"; exit 1; }
+
+echo "PASS: task id allocation checks passed"
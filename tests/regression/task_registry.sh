@@ -0,0 +1,85 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+SKILL="test_registry_skill_$STAMP"
+TASK_REQ="test_registry_req_$STAMP"
+TASK_RUN="test_registry_run_$STAMP"
+TASK_SIDE="test_registry_side_$STAMP"
+TMP="$(mktemp -d /tmp/task_registry.XXXXXX)"
+RECEIPT="USER/manifest/promotion_receipts/${TASK_SIDE}_20260101T000000Z.json"
+cleanup() {
+  rm -rf "$TMP" "AGENTS/skills/$SKILL" "GATE/staged/$TASK_RUN" "$RECEIPT"
+  rm -rf "AGENTS/tasks/$TASK_REQ" "AGENTS/tasks/$TASK_RUN" "AGENTS/tasks/$TASK_SIDE"
+}
+trap cleanup EXIT
+export TASK_REGISTRY="$TMP/tasks.sqlite"
+
+row() {
+  ./bin/agenthub tasks --json | python3 -c '
+import json, sys
+rows = {r["task_id"]: r for r in map(json.loads, sys.stdin)}
+print(json.dumps(rows.get(sys.argv[1], {})))' "$1"
+}
+
+expect() {
+  local task="$1" key="$2" want="$3" got
+  got="$(row "$task" | python3 -c 'import json, sys; print(json.load(sys.stdin).get(sys.argv[1], ""))' "$key")"
+  [[ "$got" == "$want" ]] || { echo "FAIL: $task $key=$got, expected $want"; exit 1; }
+}
+
+echo "[case a] start and request-set move a compute task through its request steps"
+echo "registry probe" > "$TMP/request.md"
+./bin/agenthub start --skill compute_numerical --task-name "$TASK_REQ" --request "$TMP/request.md" </dev/null >/dev/null
+expect "$TASK_REQ" state paused_for_input
+expect "$TASK_REQ" request_step goal
+./bin/agenthub request-set --task "$TASK_REQ" --field goal --value "integrate something" >/dev/null
+expect "$TASK_REQ" request_step inputs
+
+echo "[case b] a successful run is recorded as completed and staged"
+mkdir -p "AGENTS/skills/$SKILL/scripts" "AGENTS/tasks/$TASK_RUN/review"
+cat > "AGENTS/skills/$SKILL/skill.yaml" <<YAML
+name: $SKILL
+title: Registry probe
+description: Regression probe for the task registry.
+run: scripts/run.sh
+YAML
+cat > "AGENTS/skills/$SKILL/scripts/run.sh" <<'SH'
+#!/usr/bin/env bash
+echo "# probe" > "$1/AGENTS/tasks/$2/review/probe_report.md"
+SH
+chmod +x "AGENTS/skills/$SKILL/scripts/run.sh"
+printf '{"task_id": "%s", "skill": "%s", "created_at_utc": "2026-01-02T00:00:00Z"}\n' "$TASK_RUN" "$SKILL" \
+  > "AGENTS/tasks/$TASK_RUN/meta.json"
+./bin/agenthub run --task "$TASK_RUN" --skill "$SKILL" --yes </dev/null >/dev/null
+expect "$TASK_RUN" state completed
+expect "$TASK_RUN" promotion staged
+expect "$TASK_RUN" staged_dir "GATE/staged/$TASK_RUN/$SKILL"
+
+echo "[case c] filters combine skill globs, state, promotion and dates"
+./bin/agenthub tasks --skill "test_registry_*" --promotion staged --since 2026-01-02 --until 2026-01-02 >"$TMP/list.txt"
+grep -q "^TASKS=1$" "$TMP/list.txt" && grep -q "^$TASK_RUN	" "$TMP/list.txt" || { cat "$TMP/list.txt"; echo "FAIL: filter"; exit 1; }
+./bin/agenthub tasks --skill "compute_*" --state paused_for_input --limit 1 >"$TMP/list.txt"
+grep -q "^TASKS=1$" "$TMP/list.txt" || { cat "$TMP/list.txt"; echo "FAIL: limit"; exit 1; }
+
+echo "[case d] tasks created or removed outside agenthub are reconciled"
+mkdir -p "AGENTS/tasks/$TASK_SIDE" "$(dirname "$RECEIPT")"
+printf '{"task_id": "%s", "skill": "prl_writer", "created_at_utc": "2026-01-01T00:00:00Z"}\n' "$TASK_SIDE" \
+  > "AGENTS/tasks/$TASK_SIDE/meta.json"
+echo '{}' > "$RECEIPT"
+expect "$TASK_SIDE" promotion promoted
+expect "$TASK_SIDE" receipt "$RECEIPT"
+rm -rf "AGENTS/tasks/$TASK_REQ"
+[[ "$(row "$TASK_REQ")" == "{}" ]] || { echo "FAIL: removed task still listed"; exit 1; }
+
+echo "[case e] TASK_REGISTRY=off disables the registry"
+set +e
+TASK_REGISTRY=off ./bin/agenthub tasks >/dev/null 2>&1
+rc=$?
+set -e
+[[ "$rc" -eq 2 ]] || { echo "FAIL: expected exit 2 with the registry off, got $rc"; exit 1; }
+
+echo "PASS: task registry checks passed"
@@ -0,0 +1,98 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+STAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+SKILL="test_retention_skill_$STAMP"
+TASK_DONE="test_retention_done_$STAMP"
+TASK_OPEN="test_retention_open_$STAMP"
+TMP="$(mktemp -d /tmp/task_retention.XXXXXX)"
+cleanup() {
+  rm -rf "$TMP" "AGENTS/skills/$SKILL" "GATE/staged/$TASK_DONE" "AGENTS/tasks/$TASK_DONE" "AGENTS/tasks/$TASK_OPEN"
+}
+trap cleanup EXIT
+export TASK_REGISTRY="$TMP/tasks.sqlite"
+export TASK_ARCHIVE_DIR="$TMP/archive"
+
+snapshot() {
+  python3 - "$TASK_DONE" <<'PY'
+import hashlib
+import os
+import sys
+
+task = sys.argv[1]
+for base in (f"AGENTS/tasks/{task}", f"GATE/staged/{task}"):
+    for dirpath, dirnames, filenames in sorted(os.walk(base)):
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            st = os.lstat(path)
+            digest = hashlib.sha256(open(path, "rb").read()).hexdigest()
+            print(path, oct(st.st_mode), st.st_mtime_ns, digest)
+PY
+}
+
+mkdir -p "AGENTS/skills/$SKILL/scripts" "AGENTS/tasks/$TASK_DONE/review"
+cat > "AGENTS/skills/$SKILL/skill.yaml" <<YAML
+name: $SKILL
+title: Retention probe
+description: Regression probe for task archival.
+run: scripts/run.sh
+YAML
+cat > "AGENTS/skills/$SKILL/scripts/run.sh" <<'SH'
+#!/usr/bin/env bash
+mkdir -p "$1/AGENTS/tasks/$2/work"
+head -c 200000 /dev/urandom > "$1/AGENTS/tasks/$2/work/blob.bin"
+cp "$1/AGENTS/tasks/$2/work/blob.bin" "$1/AGENTS/tasks/$2/work/blob_copy.bin"
+chmod 0600 "$1/AGENTS/tasks/$2/work/blob_copy.bin"
+ln -s blob.bin "$1/AGENTS/tasks/$2/work/latest"
+echo "# probe" > "$1/AGENTS/tasks/$2/review/probe_report.md"
+SH
+chmod +x "AGENTS/skills/$SKILL/scripts/run.sh"
+printf '{"task_id": "%s", "skill": "%s", "created_at_utc": "2020-01-01T00:00:00Z"}\n' "$TASK_DONE" "$SKILL" \
+  > "AGENTS/tasks/$TASK_DONE/meta.json"
+./bin/agenthub run --task "$TASK_DONE" --skill "$SKILL" --yes </dev/null >/dev/null
+echo "open" > "$TMP/request.md"
+./bin/agenthub start --skill compute_numerical --task-name "$TASK_OPEN" --request "$TMP/request.md" </dev/null >/dev/null
+snapshot > "$TMP/before.txt"
+
+echo "[case a] dry run reports finished tasks only and changes nothing"
+./bin/agenthub archive --older-than-days 0 --dry-run --task "$TASK_DONE" --task "$TASK_OPEN" >"$TMP/dry.txt"
+grep -q "^ARCHIVE_CANDIDATE=$TASK_DONE " "$TMP/dry.txt" || { cat "$TMP/dry.txt"; echo "FAIL: finished task not listed"; exit 1; }
+! grep -q "$TASK_OPEN" "$TMP/dry.txt" || { echo "FAIL: unfinished task listed"; exit 1; }
+python3 - "$TMP/dry.txt" <<'PY'
+import re
+import sys
+
+text = open(sys.argv[1], encoding="utf-8").read()
+least = int(re.search(r"BYTES_RECLAIMABLE_AT_LEAST=(\d+)", text).group(1))
+assert least >= 200000, text
+PY
+snapshot | cmp -s - "$TMP/before.txt" || { echo "FAIL: dry run modified the task"; exit 1; }
+
+echo "[case b] archiving leaves a stub and one deduplicated archive"
+./bin/agenthub archive --older-than-days 0 --task "$TASK_DONE" --task "$TASK_OPEN" >"$TMP/apply.txt"
+grep -q "^ARCHIVED=$TASK_DONE " "$TMP/apply.txt" || { cat "$TMP/apply.txt"; echo "FAIL: not archived"; exit 1; }
+[[ ! -e "GATE/staged/$TASK_DONE" ]] || { echo "FAIL: staged copy kept"; exit 1; }
+[[ "$(ls "AGENTS/tasks/$TASK_DONE")" == "$(printf 'ARCHIVED.json\nmeta.json')" ]] || { ls "AGENTS/tasks/$TASK_DONE"; echo "FAIL: stub"; exit 1; }
+python3 - "$TMP/archive" "$TASK_DONE" <<'PY'
+import sys
+from pathlib import Path
+
+archives = list(Path(sys.argv[1]).iterdir())
+assert [a.name.split(".tar.")[0] for a in archives] == [sys.argv[2]], archives
+assert archives[0].stat().st_size < 2 * 200000, archives[0].stat().st_size
+PY
+./bin/agenthub tasks --reindex --json >"$TMP/tasks.json" 2>/dev/null
+grep -q "\"task_id\":\"$TASK_DONE\".*\"state\":\"completed\".*\"archive\":\"" "$TMP/tasks.json" \
+  || { echo "FAIL: registry lost the archived task"; exit 1; }
+
+echo "[case c] a command naming the task restores it byte for byte"
+./bin/agenthub profile --task "$TASK_DONE" >/dev/null 2>"$TMP/restore.txt"
+grep -q "^RESTORED=$TASK_DONE " "$TMP/restore.txt" || { cat "$TMP/restore.txt"; echo "FAIL: no restore"; exit 1; }
+snapshot | cmp -s - "$TMP/before.txt" || { snapshot | diff - "$TMP/before.txt" || true; echo "FAIL: restored tree differs"; exit 1; }
+[[ "$(readlink "AGENTS/tasks/$TASK_DONE/work/latest")" == "blob.bin" ]] || { echo "FAIL: symlink"; exit 1; }
+[[ -z "$(ls -A "$TMP/archive")" ]] || { echo "FAIL: archive left behind after restore"; exit 1; }
+
+echo "PASS: task retention checks passed"
@@ -0,0 +1,61 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+TMP="$(mktemp -d /tmp/tex_model_cache.XXXXXX)"
+cleanup() {
+  rm -rf "$TMP"
+}
+trap cleanup EXIT
+export TEX_MODEL_CACHE="$TMP/cache"
+
+PAPER="$TMP/paper"
+mkdir -p "$PAPER/sections"
+cat > "$PAPER/main.tex" <<'TEX'
+\documentclass{article}
+\begin{document}
+\input{sections/intro}
+\end{document}
+TEX
+printf '\\section{Introduction}\nWe study a model.\n' > "$PAPER/sections/intro.tex"
+
+field() {
+  python3 AGENTS/runtime/tex_model.py show --paper "$PAPER" --field "$1"
+}
+entries() {
+  find "$TEX_MODEL_CACHE" -name '*.json' | wc -l | tr -d ' '
+}
+
+echo "[case a] an unchanged include graph is served from the cache"
+KEY1="$(field key)"
+[[ "$(entries)" == "1" ]] || { echo "FAIL: cache not written"; exit 1; }
+python3 - "$TEX_MODEL_CACHE/$KEY1.json" <<'PY'
+import json
+import sys
+
+path = sys.argv[1]
+model = json.load(open(path, encoding="utf-8"))
+model["word_count"] = 999999
+json.dump(model, open(path, "w", encoding="utf-8"))
+PY
+[[ "$(field word_count)" == "999999" ]] || { echo "FAIL: model reparsed although sources are unchanged"; exit 1; }
+
+echo "[case b] editing an \\input file invalidates the cached model"
+printf '\\section{Introduction}\nWe study a model.\n\\section{Results}\nIt works.\n' > "$PAPER/sections/intro.tex"
+KEY2="$(field key)"
+[[ "$KEY2" != "$KEY1" && "$(entries)" == "2" ]] || { echo "FAIL: key unchanged after include edit"; exit 1; }
+[[ "$(field word_count)" != "999999" ]] || { echo "FAIL: stale model served"; exit 1; }
+python3 AGENTS/runtime/tex_model.py has-section --paper "$PAPER" Results || { echo "FAIL: new section missing"; exit 1; }
+
+echo "[case c] a newly included file joins the key"
+printf '\\input{sections/methods}\n' >> "$PAPER/sections/intro.tex"
+printf '\\section{Methods}\nDetails.\n' > "$PAPER/sections/methods.tex"
+KEY3="$(field key)"
+[[ "$KEY3" != "$KEY2" ]] || { echo "FAIL: nested include ignored"; exit 1; }
+printf '\\section{Methods}\nMore details.\n' > "$PAPER/sections/methods.tex"
+[[ "$(field key)" != "$KEY3" ]] || { echo "FAIL: nested include edit ignored"; exit 1; }
+python3 AGENTS/runtime/tex_model.py has-section --paper "$PAPER" Methods || { echo "FAIL: nested section missing"; exit 1; }
+
+echo "PASS: tex model cache checks passed"
@@ -0,0 +1,55 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+TMP="$(mktemp -d /tmp/toolchain_cache.XXXXXX)"
+cleanup() {
+  rm -rf "$TMP"
+}
+trap cleanup EXIT
+export TOOLCHAIN_CACHE="$TMP/cache"
+
+mkdir -p "$TMP/bin"
+cat > "$TMP/bin/wolframscript" <<SH
+#!/usr/bin/env bash
+echo probe >> "$TMP/calls.log"
+echo "WolframScript 9.9.9 for Test"
+SH
+chmod +x "$TMP/bin/wolframscript"
+export PATH="$TMP/bin:$PATH"
+
+probe_count() {
+  wc -l < "$TMP/calls.log" | tr -d ' '
+}
+
+echo "[case a] cold cache probes, warm cache does not"
+OUT="$(python3 AGENTS/runtime/toolchain.py get wolframscript python)"
+[[ "$(sed -n 1p <<<"$OUT")" == "WolframScript 9.9.9 for Test" ]] || { echo "FAIL: wrong wolframscript version: $OUT"; exit 1; }
+grep -q '^Python 3' <<<"$(sed -n 2p <<<"$OUT")" || { echo "FAIL: wrong python version: $OUT"; exit 1; }
+python3 AGENTS/runtime/toolchain.py get wolframscript >/dev/null
+python3 AGENTS/runtime/wolfram_backend.py resolve --backend wolframscript >/dev/null
+[[ "$(probe_count)" == "1" ]] || { echo "FAIL: warm cache re-probed ($(probe_count) calls)"; exit 1; }
+
+echo "[case b] a changed binary is re-probed"
+sed -i 's/9.9.9/9.9.10/' "$TMP/bin/wolframscript"
+OUT="$(python3 AGENTS/runtime/toolchain.py get wolframscript)"
+[[ "$OUT" == "WolframScript 9.9.10 for Test" ]] || { echo "FAIL: stale version after upgrade: $OUT"; exit 1; }
+[[ "$(probe_count)" == "2" ]] || { echo "FAIL: expected a second probe"; exit 1; }
+
+echo "[case c] missing tools are unavailable and never cached"
+OUT="$(python3 AGENTS/runtime/toolchain.py get WolframKernel)"
+[[ "$OUT" == "unavailable" ]] || { echo "FAIL: expected unavailable, got $OUT"; exit 1; }
+if grep -q '"WolframKernel"' "$TOOLCHAIN_CACHE/versions.json"; then
+  echo "FAIL: missing tool was cached"
+  exit 1
+fi
+
+echo "[case d] compute entry points read versions from the registry only"
+if grep -nE '(python3?|wolframscript|WolframKernel) +-{1,2}version\b' AGENTS/skills/compute_*/scripts/*.sh; then
+  echo "FAIL: compute skill probes a tool version directly instead of toolchain.py get"
+  exit 1
+fi
+
+echo "PASS: toolchain version cache checks passed"
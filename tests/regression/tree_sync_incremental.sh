@@ -0,0 +1,65 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+TMP="$(mktemp -d /tmp/tree_sync_incremental.XXXXXX)"
+cleanup() {
+  chmod -R u+w "$TMP" 2>/dev/null || true
+  rm -rf "$TMP"
+}
+trap cleanup EXIT
+# Exercise tree_sync's own placement; cas_store.sh covers the store-backed path.
+export CAS_STORE=off
+
+SRC="$TMP/src"
+DEST="$TMP/dest"
+MANIFEST="$TMP/manifest.json"
+mkdir -p "$SRC/sub"
+echo "writable" > "$SRC/notes.txt"
+echo "frozen" > "$SRC/sub/frozen.bin"
+chmod 0444 "$SRC/sub/frozen.bin"
+echo "goes away" > "$SRC/sub/gone.txt"
+
+sync_tree() {
+  python3 AGENTS/runtime/tree_sync.py sync --dest "$DEST" --manifest "$MANIFEST" --item "$SRC" src
+}
+count() {
+  sed -n "s/.*\b$1=\([0-9]*\).*/\1/p" <<< "$2"
+}
+inode() {
+  python3 -c 'import os, sys; print(os.stat(sys.argv[1]).st_ino)' "$1"
+}
+
+echo "[case a] read-only sources are hard-linked, writable ones copied"
+OUT="$(sync_tree)"
+if [[ "$(count REFLINK "$OUT")" == "0" ]]; then
+  [[ "$(count HARDLINK "$OUT")" == "1" && "$(count COPY "$OUT")" == "2" ]] || { echo "$OUT"; echo "FAIL: methods"; exit 1; }
+  [[ "$(inode "$SRC/sub/frozen.bin")" == "$(inode "$DEST/src/sub/frozen.bin")" ]] || { echo "FAIL: frozen not linked"; exit 1; }
+  [[ "$(inode "$SRC/notes.txt")" != "$(inode "$DEST/src/notes.txt")" ]] || { echo "FAIL: writable file linked"; exit 1; }
+fi
+cmp -s "$SRC/notes.txt" "$DEST/src/notes.txt" || { echo "FAIL: content"; exit 1; }
+[[ -f "$MANIFEST" ]] || { echo "FAIL: manifest missing"; exit 1; }
+
+echo "[case b] unchanged files are skipped via the manifest"
+OUT="$(sync_tree)"
+[[ "$(count UNCHANGED "$OUT")" == "3" && "$(count COPY "$OUT")" == "0" ]] || { echo "$OUT"; echo "FAIL: rewrite on unchanged tree"; exit 1; }
+echo "edited" >> "$SRC/notes.txt"
+OUT="$(sync_tree)"
+[[ "$(count UNCHANGED "$OUT")" == "2" ]] || { echo "$OUT"; echo "FAIL: edit not picked up"; exit 1; }
+cmp -s "$SRC/notes.txt" "$DEST/src/notes.txt" || { echo "FAIL: edited content"; exit 1; }
+
+echo "[case c] removed sources are pruned"
+rm "$SRC/sub/gone.txt"
+OUT="$(sync_tree)"
+[[ "$(count REMOVED "$OUT")" == "1" && ! -e "$DEST/src/sub/gone.txt" ]] || { echo "$OUT"; echo "FAIL: prune"; exit 1; }
+python3 - "$MANIFEST" <<'PY'
+import json
+import sys
+
+files = json.load(open(sys.argv[1], encoding="utf-8"))["files"]
+assert sorted(files) == ["src/notes.txt", "src/sub/frozen.bin"], sorted(files)
+PY
+
+echo "PASS: tree sync incremental checks passed"
@@ -0,0 +1,81 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+cd "$ROOT"
+
+SKILL="venue_check"
+PAPER="USER/paper"
+TMP="$(mktemp -d /tmp/venue_check.XXXXXX)"
+TASK=""
+[[ ! -e "$PAPER/main.tex" ]] || { echo "SKIP: $PAPER/main.tex already exists; refusing to overwrite"; exit 0; }
+cleanup() {
+  rm -f "$PAPER/main.tex"
+  [[ -z "$TASK" ]] || rm -rf "AGENTS/tasks/$TASK" "GATE/staged/$TASK"
+  rm -rf "$TMP"
+}
+trap cleanup EXIT
+export TEX_MODEL_CACHE="$TMP/tex_model"
+
+write_paper() {
+  cat > "$1" <<TEX
+\\documentclass[aps,prl,twocolumn]{revtex4-2}
+\\begin{document}
+\\title{A Short Letter}
+\\author{A. Author}
+\\begin{abstract}
+$2
+\\end{abstract}
+\\maketitle
+\\section{Introduction}
+We study a model.
+\\bibliographystyle{apsrev4-2}
+\\end{document}
+TEX
+}
+
+echo "[case a] one run compares the paper against every venue"
+write_paper "$PAPER/main.tex" "We report a measurement."
+echo "Check venues." > "$TMP/request.md"
+TASK="$(./bin/agenthub start --skill "$SKILL" --request "$TMP/request.md" </dev/null | sed -n 's/^TASK=\([^ ]*\).*/\1/p')"
+./bin/agenthub run --task "$TASK" --yes </dev/null >"$TMP/run.out" 2>&1 || { cat "$TMP/run.out"; echo "FAIL: run"; exit 1; }
+COMPARISON="AGENTS/tasks/$TASK/outputs/$SKILL/comparison.json"
+python3 - "$COMPARISON" <<'PY'
+import json
+import sys
+
+venues = {v["venue"]: v for v in json.load(open(sys.argv[1], encoding="utf-8"))["venues"]}
+assert set(venues) == {"PRL", "JHEP", "JCAP", "Nature Communications"}, sorted(venues)
+assert venues["PRL"]["status"] == "ok", venues["PRL"]["checks"]
+failed = {c["check"] for c in venues["JHEP"]["checks"] if c["status"] == "fail"}
+assert "package:jheppub" in failed and "bib_style" in failed, failed
+failed = {c["check"] for c in venues["Nature Communications"]["checks"] if c["status"] == "fail"}
+assert "section:Results" in failed, failed
+assert all(v["maintained_by"] == "hand" and v["reference_urls"] for v in venues.values()), venues
+PY
+REPORT="AGENTS/tasks/$TASK/review/${SKILL}_report.md"
+grep -q '^- limits maintained by hand in AGENTS/skills/prl_writer/resources/venue_rules.json$' "$REPORT" || { echo "FAIL: report provenance"; exit 1; }
+grep -q 'source \[' "$REPORT" && { echo "FAIL: report still cites fetch metadata"; exit 1; }
+
+echo "[case b] rule files cite reference URLs, not fetch metadata"
+python3 - <<'PY'
+import glob
+import json
+
+paths = sorted(glob.glob("AGENTS/skills/*/resources/venue_rules.json"))
+assert len(paths) == 4, paths
+for path in paths:
+    rules = json.load(open(path, encoding="utf-8"))
+    assert "sources" not in rules and rules["maintained_by"] == "hand", path
+    assert all(u.startswith("https://") for u in rules["reference_urls"]), path
+PY
+
+echo "[case c] limits are enforced and the venue filter applies"
+mkdir -p "$TMP/paper"
+write_paper "$TMP/paper/main.tex" "$(printf 'An abstract sentence that keeps going. %.0s' {1..20})"
+VENUE_OUT="$(python3 AGENTS/skills/venue_check/scripts/venue_check.py --paper "$TMP/paper" --skills-root AGENTS/skills \
+  --task-id "$TASK" --report "$TMP/report.md" --out-json "$TMP/comparison.json" --venues PRL)"
+[[ "$VENUE_OUT" == "VENUE=PRL STATUS=fail FAILED=1" ]] || { echo "$VENUE_OUT"; echo "FAIL: filtered run"; exit 1; }
+grep -q '^- \[fail\] max_abstract_chars: abstract characters: ' "$TMP/report.md" || { echo "FAIL: abstract limit"; exit 1; }
+
+echo "PASS: venue check checks passed"